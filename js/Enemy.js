@@ -1,5 +1,38 @@
+// 移動パターンの種類コード (tools/movement_patterns.py の KIND_* と同じ値)
+const MOVE_PATH = 0;    // Linear / Wave: 焼き込み済みの揺れ表を引くだけ
+const MOVE_HOMING = 1;
+const MOVE_REFLECT = 2;
+
+/**
+ * GAME_BALANCE_DATA.MOVEMENT_TABLES (update_settings.py がビルド時に生成) の参照
+ * 揺れ表は base64 の Int16 配列で届くので、初めて使う時に Float32Array に展開してキャッシュする。
+ */
+const MovementTables = {
+    waves: [],
+    FALLBACK: { kind: MOVE_PATH, vx: 0, vy: 1, ampX: 0, ampY: 0, wave: -1 }, // 直進(上から下)
+
+    get: (mpId) => {
+        const tables = GAME_BALANCE_DATA.MOVEMENT_TABLES;
+        return (tables && tables.patterns[mpId]) || MovementTables.FALLBACK;
+    },
+
+    wave: (index) => {
+        if (index < 0) return null;
+        if (!MovementTables.waves[index]) {
+            const entry = GAME_BALANCE_DATA.MOVEMENT_TABLES.waves[index];
+            const bytes = atob(entry.data);
+            const view = new DataView(new ArrayBuffer(bytes.length));
+            for (let i = 0; i < bytes.length; i++) view.setUint8(i, bytes.charCodeAt(i));
+            const table = new Float32Array(entry.length);
+            for (let i = 0; i < entry.length; i++) table[i] = view.getInt16(i * 2, true) / 32767;
+            MovementTables.waves[index] = table;
+        }
+        return MovementTables.waves[index];
+    }
+};
+
 class Enemy {
-    constructor(tierData, tierId, x, y) {
+    constructor(tierData, tierId, x, y, mpId = null) {
         this.tierId = tierId;
         this.tierData = tierData;
 
@@ -18,7 +51,9 @@ class Enemy {
         this.baseSpeed = tierData.speed || 2; // Y-axis speed
         this.speed = this.baseSpeed;
         this.turn = tierData.turn || 2; // X-axis/Turn speed
-        this.mpId = tierData.movementPattern || tierData.mpId || 'MPID001';
+        this.mpId = mpId || tierData.movementPattern || tierData.mpId || 'MPID001'; // mpId: 出現表の指定
+        this.pattern = MovementTables.get(this.mpId);
+        this.wave = MovementTables.wave(this.pattern.wave);
 
         // Combat
         this.eqId = tierData.eq || tierData.eqId || 'EQID001';
@@ -73,71 +108,33 @@ class Enemy {
     }
 
     handleMovement(playerPos) {
-        // Look up pattern logic if needed, or switch on MPID
-        // Simply implementing based on MPID for now.
-        const pid = this.mpId;
-        const t = this.time;
-
-        // Basic Directions
-        if (pid === 'MPID001') { // Straight Down
-            this.y += this.speed;
-        }
-        else if (pid === 'MPID002') { // Straight Up
-            this.y -= this.speed;
-        }
-        else if (pid === 'MPID003') { // Straight Right->Left
-            this.x -= this.speed; // User said Right->Left, assuming speed is positive
-        }
-        else if (pid === 'MPID004') { // Straight Left->Right
-            this.x += this.speed;
-        }
-
-        // ZigZag
-        else if (pid === 'MPID005' || pid === 'MPID006') { // Y-axis ZigZag
-            this.y += (pid === 'MPID005' ? 1 : -1) * this.speed;
-            this.x += Math.sin(t * 0.05) * this.turn;
-        }
-        else if (pid === 'MPID007' || pid === 'MPID008') { // X-axis ZigZag
-            this.x += (pid === 'MPID008' ? 1 : -1) * this.speed;
-            this.y += Math.sin(t * 0.05) * this.turn;
-        }
+        const p = this.pattern;
 
-        // Homing
-        else if (pid.startsWith('MPID009') || pid.startsWith('MPID010') || pid.startsWith('MPID011') || pid.startsWith('MPID012')) {
-            // Simple homing
+        if (p.kind === MOVE_HOMING) {
+            // Move toward the player at |(vx, vy)| * speed
             const dx = playerPos.x - this.x;
             const dy = playerPos.y - this.y;
             const angle = Math.atan2(dy, dx);
-            this.x += Math.cos(angle) * (this.speed * 0.5); // Slower homing
-            this.y += Math.sin(angle) * (this.speed * 0.5);
+            const v = Math.hypot(p.vx, p.vy) * this.speed;
+            this.x += Math.cos(angle) * v;
+            this.y += Math.sin(angle) * v;
         }
-
-        // Reflect (Simple implementation: bounce off walls)
-        else if (pid.startsWith('MPID013')) {
-            // .. logic to init vx/vy once then bounce
-            if (this.time === 1) { this.vy = this.speed; this.vx = this.turn; }
+        else if (p.kind === MOVE_REFLECT) {
+            // Bounce off the side walls
+            if (this.time === 1) { this.vx = p.vx * this.turn; this.vy = p.vy * this.speed; }
             this.x += this.vx;
             this.y += this.vy;
             if (this.x < 0 || this.x > 600) this.vx *= -1;
-            // Only bounce Y if strictly Reflect Y?
-            // User said "MovementPattern... Reflect".
-            // We'll keep it simple: Bounce X
-        }
-
-        // Wave / Spiral
-        else if (pid.startsWith('MPID017')) { // Wave Down
-            this.y += this.speed;
-            this.x += Math.cos(t * 0.1) * (this.turn * 2);
-        }
-        else if (pid.startsWith('MPID021')) { // Spiral Down
-            this.y += this.speed;
-            this.x += Math.cos(t * 0.1) * (this.turn * 2);
-            // Spiral usually implies growing radius or 2D circular motion while moving
         }
-
-        // Default
         else {
-            this.y += this.speed;
+            // Linear / Wave: velocity + baked sin table (indexed by frame)
+            this.x += p.vx * this.speed;
+            this.y += p.vy * this.speed;
+            if (this.wave) {
+                const w = this.wave[this.time % this.wave.length];
+                this.x += p.ampX * this.turn * w;
+                this.y += p.ampY * this.turn * w;
+            }
         }
     }
 
@@ -0,0 +1,101 @@
+/**
+ * バランスデータの遅延読み込み
+ * settings_data.js が分割形式 (update_settings.py --chunked) の場合、起動に不要なセクションは
+ * GAME_BALANCE_MANIFEST に従って js/data/<chunk>.<hash>.js から必要になった時に読み込む。
+ * 従来の一括形式 (マニフェスト無し) では全セクション読み込み済みとして扱う。
+ */
+const BalanceLoader = {
+    manifest: (typeof GAME_BALANCE_MANIFEST !== 'undefined') ? GAME_BALANCE_MANIFEST : null,
+    loaded: {},    // chunk name -> true
+    pending: {},   // chunk name -> Promise
+    listeners: [], // { section, callback }
+
+    // セクションを含むチャンク名 (boot / 一括形式なら null)
+    chunkOf: (section) => {
+        if (!BalanceLoader.manifest) return null;
+        const chunks = BalanceLoader.manifest.chunks;
+        for (const name in chunks) {
+            if (chunks[name].sections.includes(section)) return name;
+        }
+        return null;
+    },
+
+    isLoaded: (sections) => {
+        return sections.every(s => {
+            const chunk = BalanceLoader.chunkOf(s);
+            return !chunk || BalanceLoader.loaded[chunk];
+        });
+    },
+
+    // 指定セクションを含むチャンクを読み込む (Promise)
+    require: (sections) => {
+        const chunks = new Set();
+        sections.forEach(s => {
+            const chunk = BalanceLoader.chunkOf(s);
+            if (chunk && !BalanceLoader.loaded[chunk]) chunks.add(chunk);
+        });
+        return Promise.all([...chunks].map(BalanceLoader.load));
+    },
+
+    load: (name) => {
+        if (BalanceLoader.loaded[name]) return Promise.resolve();
+        if (BalanceLoader.pending[name]) return BalanceLoader.pending[name];
+
+        const entry = BalanceLoader.manifest.chunks[name];
+        const promise = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = entry.file;
+            script.async = true;
+            script.onload = () => {
+                if (BalanceLoader.loaded[name]) resolve();
+                else reject(new Error(`Balance chunk ${entry.file} did not define "${name}"`));
+            };
+            script.onerror = () => reject(new Error(`Failed to load balance chunk ${entry.file}`));
+            document.head.appendChild(script);
+        });
+        BalanceLoader.pending[name] = promise;
+        // 失敗したら次回の require で再試行できるようにする
+        promise.catch(() => { delete BalanceLoader.pending[name]; });
+        return promise;
+    },
+
+    // 起動後、空いた時間に残りのチャンクを先読みする
+    preload: () => {
+        if (!BalanceLoader.manifest) return;
+        Object.keys(BalanceLoader.manifest.chunks).forEach(name => {
+            BalanceLoader.load(name).catch(e => console.error('[BalanceLoader]', e));
+        });
+    },
+
+    // チャンクファイルから呼ばれる
+    define: (name, sections) => {
+        Object.keys(sections).forEach(key => {
+            let value = sections[key];
+            const existing = GAME_BALANCE_DATA[key];
+            // 起動時にコード側で注入されたエントリ (upgrade_config.js の UPGRADE_TABLE など) を優先してマージ
+            if (existing && typeof existing === 'object' && value && typeof value === 'object') {
+                value = Object.assign(value, existing);
+            }
+            GAME_BALANCE_DATA[key] = value;
+            // settings.js は起動時に GAME_BALANCE_DATA を展開コピーしているので、こちらにも反映する
+            if (typeof GAME_SETTINGS !== 'undefined') GAME_SETTINGS[key] = value;
+        });
+        BalanceLoader.loaded[name] = true;
+        console.log(`[BalanceLoader] Loaded chunk "${name}": ${Object.keys(sections).join(', ')}`);
+
+        BalanceLoader.listeners.forEach(l => {
+            if (sections[l.section] !== undefined) l.callback();
+        });
+    },
+
+    // セクションが後から読み込まれた時に callback を呼ぶ (読み込み済みなら何もしない)
+    onLoad: (section, callback) => {
+        if (BalanceLoader.isLoaded([section])) return;
+        BalanceLoader.listeners.push({ section, callback });
+    }
+};
+
+window.addEventListener('load', () => {
+    if (window.requestIdleCallback) window.requestIdleCallback(() => BalanceLoader.preload());
+    else setTimeout(() => BalanceLoader.preload(), 0);
+});
@@ -0,0 +1,127 @@
+/**
+ * バランスデータのホットリロード (開発用)
+ * update_settings.py は settings_data.js を書くたびに、前回ビルドからの差分 (JSON Patch) を
+ * js/settings_patch.js に追記する。index.html?hot で開くとそのファイルを読み直し (tools/dev_server.py なら
+ * 再ビルドの通知を受けた時、それ以外は定期的に)、実行中の GAME_BALANCE_DATA (と GAME_SETTINGS) をその場で書き換える。ミッションの状態はそのまま。
+ * 出現済みの敵などは生成時に値をコピーしているので、変更は次に生成されたものから反映される。
+ */
+const BalancePatch = {
+    version: (typeof GAME_BALANCE_VERSION !== 'undefined') ? GAME_BALANCE_VERSION : null,
+    url: 'js/settings_patch.js',
+    eventsUrl: '/__events',
+    interval: 1000,
+    listeners: [],
+    timer: null,
+    source: null,
+    warned: null,
+
+    // js/settings_patch.js から呼ばれる: { version, patches: [{ base, target, ops, chunks? }] }
+    receive: (history) => {
+        if (BalancePatch.version === history.version) return;
+        const byBase = {};
+        history.patches.forEach(p => { byBase[p.base] = p; });
+        const applied = [];
+        let current = BalancePatch.version;
+        for (let step = 0; current !== history.version && byBase[current] && step < history.patches.length; step++) {
+            const patch = byBase[current];
+            BalancePatch.applyOps(patch.ops);
+            if (patch.chunks) BalancePatch.updateChunks(patch.chunks);
+            applied.push(...patch.ops);
+            current = patch.target;
+        }
+        if (current !== history.version) {
+            if (BalancePatch.warned !== history.version) {
+                console.warn(`[BalancePatch] No patch path from ${BalancePatch.version} to ${history.version}; reload the page`);
+                BalancePatch.warned = history.version;
+            }
+            return;
+        }
+        BalancePatch.version = current;
+        console.log(`[BalancePatch] Applied ${applied.length} change(s) -> ${current}`,
+            applied.map(op => op.path).slice(0, 20));
+        BalancePatch.listeners.forEach(callback => callback(applied));
+    },
+
+    applyOps: (ops) => {
+        ops.forEach(op => {
+            const path = op.path.split('/').slice(1).map(p => p.replace(/~1/g, '/').replace(/~0/g, '~'));
+            const section = path[0];
+            // まだ読み込んでいないチャンク (--chunked) のセクションは、読み込み時に新しいファイルを取る
+            if (typeof BalanceLoader !== 'undefined' && !BalanceLoader.isLoaded([section])) return;
+            BalancePatch.applyTo(GAME_BALANCE_DATA, path, op);
+            // settings.js が展開コピーしたセクション (PLAYER, PHYSICS など) はコピー側にも当てる
+            if (typeof GAME_SETTINGS !== 'undefined') {
+                if (path.length === 1 || (GAME_SETTINGS[section] && GAME_SETTINGS[section] !== GAME_BALANCE_DATA[section])) {
+                    BalancePatch.applyTo(GAME_SETTINGS, path, op);
+                }
+            }
+        });
+    },
+
+    applyTo: (root, path, op) => {
+        let target = root;
+        for (let i = 0; i < path.length - 1; i++) {
+            target = target[path[i]];
+            if (target === undefined || target === null) return;
+        }
+        const key = path[path.length - 1];
+        if (op.op === 'remove') delete target[key];
+        else target[key] = op.value;
+    },
+
+    updateChunks: (chunks) => {
+        if (typeof BalanceLoader === 'undefined' || !BalanceLoader.manifest) return;
+        Object.keys(chunks).forEach(name => {
+            if (!BalanceLoader.loaded[name]) BalanceLoader.manifest.chunks[name] = chunks[name];
+        });
+    },
+
+    // 変更が当たるたびに callback(ops) を呼ぶ
+    onApply: (callback) => {
+        BalancePatch.listeners.push(callback);
+    },
+
+    // settings_patch.js を読み直す (script タグなので file:// でも動く)
+    poll: () => {
+        const script = document.createElement('script');
+        script.src = `${BalancePatch.url}?t=${Date.now()}`;
+        script.onload = script.onerror = () => script.remove();
+        document.head.appendChild(script);
+    },
+
+    // tools/dev_server.py 経由なら再ビルドの通知 (Server-Sent Events) を受けた時だけ読み直す。
+    // それ以外 (file:// や他のサーバー) は interval ごとに読み直す。
+    watch: () => {
+        if (BalancePatch.timer || BalancePatch.source) return;
+        const startPolling = () => {
+            BalancePatch.timer = setInterval(BalancePatch.poll, BalancePatch.interval);
+            console.log(`[BalancePatch] Polling ${BalancePatch.url} (version ${BalancePatch.version})`);
+        };
+        if (!window.EventSource || !window.location.protocol.startsWith('http')) {
+            startPolling();
+            return;
+        }
+        const source = new EventSource(BalancePatch.eventsUrl);
+        source.addEventListener('hello', e => {
+            // 接続していない間に再ビルドされていれば追いつく
+            if (JSON.parse(e.data).version !== BalancePatch.version) BalancePatch.poll();
+        });
+        source.addEventListener('balance', () => BalancePatch.poll());
+        source.addEventListener('build-error', e => {
+            console.error('[BalancePatch] update_settings.py failed:\n' + JSON.parse(e.data).output.join('\n'));
+        });
+        source.onerror = () => {
+            // /__events が無いサーバー
+            if (source.readyState === EventSource.CLOSED) {
+                BalancePatch.source = null;
+                startPolling();
+            }
+        };
+        BalancePatch.source = source;
+        console.log(`[BalancePatch] Listening for rebuilds on ${BalancePatch.eventsUrl} (version ${BalancePatch.version})`);
+    }
+};
+
+if (new URLSearchParams(window.location.search).has('hot')) {
+    window.addEventListener('load', () => BalancePatch.watch());
+}
@@ -49,6 +49,17 @@ class FloatingText {
     }
 }
 
+// 各画面が必要とする (起動時には読み込まない) バランスデータのセクション
+const STATE_DATA_SECTIONS = {
+    [GAME_STATE.MENU]: ['UPGRADE_TABLE'],
+    [GAME_STATE.UPGRADE]: ['UPGRADE_TABLE', 'PART_TEMPLATES', 'MATERIALS'],
+    [GAME_STATE.GRID_MODIFY]: ['UPGRADE_TABLE', 'PART_TEMPLATES', 'MATERIALS', 'HANGAR_GRID'],
+    [GAME_STATE.MISSION_SELECT]: ['WEATHER'],
+    [GAME_STATE.INGAME]: ['UPGRADE_TABLE', 'PART_TEMPLATES', 'MATERIALS', 'DROP_ITEMS',
+        'WEATHER', 'ENEMY_WEAPONS', 'MOVEMENT_PATTERNS', 'MOVEMENT_TABLES',
+        'DROP_TABLES', 'DROP_ALIAS', 'SPAWN_SCHEDULES'],
+};
+
 class GameEngine {
     constructor() {
         this.canvas = document.getElementById('gameCanvas');
@@ -56,9 +67,12 @@ class GameEngine {
         this.canvas.width = GAME_SETTINGS.CANVAS_WIDTH;
         this.canvas.height = GAME_SETTINGS.CANVAS_HEIGHT;
 
-        // Player Sprite
-        this.playerSprite = new Image();
-        this.playerSprite.src = "assets/png/playership01.png";
+        // Player Sprite (アトラス js/sprite_atlas.js が無いときだけ個別の PNG を読む)
+        this.playerSprite = null;
+        if (typeof SPRITE_ATLAS === 'undefined' || !SPRITE_ATLAS.frames.playership01) {
+            this.playerSprite = new Image();
+            this.playerSprite.src = "assets/png/playership01.png";
+        }
 
         this.data = SaveManager.load() || SaveManager.getInitialData();
         this.currentMission = null;
@@ -136,6 +150,19 @@ class GameEngine {
     }
 
     changeState(newState) {
+        // 分割形式のバランスデータ: この画面で使うセクションが未読込なら読み込んでから遷移する
+        const sections = STATE_DATA_SECTIONS[newState];
+        if (sections && !BalanceLoader.isLoaded(sections)) {
+            console.log(`[GameEngine] Waiting for balance data: ${sections.join(', ')}`);
+            BalanceLoader.require(sections)
+                .then(() => this.changeState(newState))
+                .catch(e => {
+                    console.error(e);
+                    alert("データの読み込みに失敗しました。再読み込みしてください。");
+                });
+            return;
+        }
+
         console.log(`[GameEngine] changeState: ${this.currentState} -> ${newState}`);
         this.currentState = newState;
 
@@ -327,6 +354,8 @@ class GameEngine {
         this.playState.floatingTexts = [];
         this.playState.collectedItems = {};
         this.playState.frameCount = 0;
+        this.playState.spawnCursor = SpawnSchedule.start(this.currentMission);
+        FrameTrace.markMissionStart();
         this.playState.boostTimer = 0;
         this.playState.isBraking = false;
         this.playState.elapsedSeconds = 0;
@@ -348,6 +377,11 @@ class GameEngine {
 
     pickWeather() {
         const tableId = this.currentMission.weatherTable || "EASY";
+        const aliasTables = GAME_BALANCE_DATA.MISSION_DATA.WEATHER_ALIAS;
+        if (aliasTables && aliasTables[tableId]) {
+            const picked = pickAlias(aliasTables[tableId]);
+            return GAME_SETTINGS.WEATHER[picked] || GAME_SETTINGS.WEATHER.CLEAR;
+        }
         const table = GAME_BALANCE_DATA.MISSION_DATA.WEATHER_TABLES[tableId];
         // Probability Pick
         const rand = Math.floor(Math.random() * 100);
@@ -378,7 +412,11 @@ class GameEngine {
         if (this.fatalError) return;
 
         try {
-            this.update(); this.draw();
+            FrameTrace.begin();
+            this.update();
+            this.draw();
+            FrameTrace.lap('draw');
+            FrameTrace.end(this);
             requestAnimationFrame(() => this.gameLoop());
         } catch (e) {
             console.error(e);
@@ -492,10 +530,13 @@ class GameEngine {
             }
         }
 
+        FrameTrace.lap('player');
         this.updateEntities(weather);
         this.updateEntities(weather);
         this.updateFloatingTexts();
+        FrameTrace.lap('texts');
         this.updateIngameGUI();
+        FrameTrace.lap('hud');
     }
 
     createParticles(weather) {
@@ -518,51 +559,41 @@ class GameEngine {
         const stars = mission.stars || 1;
         const params = GAME_BALANCE_DATA.MISSION_DATA.DIFFICULTY_PARAMS[stars] || {};
 
-        const shieldMod = params.shieldMod || 1.0;
         const tierTag = params.enemyTier || "Tier1"; // e.g. "Tier1"
 
-        // 2. Filter Enemies by Tier
-        // We stored enemies in GAME_BALANCE_DATA.ENEMIES (Object)
-        // We can create a quick lookup list if not exists, or filter every time (optimize later)
-        const candidates = Object.values(GAME_BALANCE_DATA.ENEMIES).filter(e => {
-            // Check 'tier' field we added in migration, or fallback to parsing ID?
-            // Migration added 'Tier' column but did we put it in the dict?
-            // Yes, update_settings.py put row properties in.
-            // But let's verify key. 'Tier' vs 'tier'. Python script used lower case keys for standard props,
-            // but for dynamic props... wait, I used `row['ID']`, `row['Name']` etc.
-            // I did NOT explicitly add "tier": row['Tier'] to the `ENEMIES` dict in the tool!
-            // I added it to the `TIERS` list.
-            // Let's use `mid` or just pick from `GAME_SETTINGS.DEBRIS.TIERS` which IS filtered?
-            // Wait, `DEBRIS.TIERS` was reconstructed.
-            return true;
-        }).filter(e => {
-            // Fallback: if we didn't store tier in ENEMIES dict, check DEBRIS.TIERS
-            return true;
-        });
+        // 2. Pick an enemy of this Tier
+        // DEBRIS.TIER_INDEX (Tier -> [enemy ID]) is prebuilt by update_settings.py
+        const debris = GAME_BALANCE_DATA.DEBRIS || {};
+        let ids = debris.TIER_INDEX ? debris.TIER_INDEX[tierTag] : null;
+        if (!ids && !debris.TIER_INDEX && debris.TIERS) {
+            // Older settings_data.js without the index
+            ids = debris.TIERS.filter(t => t.tier === tierTag).map(t => t.id);
+        }
 
-        // Actually, let's use the `DEBRIS.TIERS` list which `update_settings.py` generates.
-        // It has {id, tier, hp, ...}
-        const availableTiers = (GAME_BALANCE_DATA.DEBRIS && GAME_BALANCE_DATA.DEBRIS.TIERS)
-            ? GAME_BALANCE_DATA.DEBRIS.TIERS.filter(t => t.tier === tierTag)
-            : [];
+        if (!ids || ids.length === 0) return; // No enemies for this tier?
+
+        const x = Math.random() * (this.canvas.width - 40) + 20;
+        this.spawnEnemy(ids[Math.floor(Math.random() * ids.length)], null, x);
+    }
 
-        if (availableTiers.length === 0) return; // No enemies for this tier?
+    spawnEnemy(id, mpId, x) {
+        const mission = this.currentMission || {};
+        const params = GAME_BALANCE_DATA.MISSION_DATA.DIFFICULTY_PARAMS[mission.stars || 1] || {};
 
-        const tierMeta = availableTiers[Math.floor(Math.random() * availableTiers.length)];
         // Get full data from ENEMIES dict for extra props like movement, drop
-        const fullData = GAME_BALANCE_DATA.ENEMIES[tierMeta.id];
-
-        const x = Math.random() * (this.canvas.width - 40) + 20;
+        const fullData = GAME_BALANCE_DATA.ENEMIES[id];
+        if (!fullData) return;
 
-        const enemy = new Enemy(fullData, fullData.id, x, -50);
+        const enemy = new Enemy(fullData, fullData.id, x, -50, mpId);
         // Apply scaling
-        enemy.applyModifiers(shieldMod, 1.0); // ShieldMod from mission
+        enemy.applyModifiers(params.shieldMod || 1.0, 1.0); // ShieldMod from mission
 
         this.playState.enemies.push(enemy);
     }
 
     updateEntities(weather) {
         this.playState.particles = this.playState.particles.filter(p => { p.update(); return p.life > 0; });
+        FrameTrace.lap('particles');
 
         // Bullets
         for (let i = this.playState.bullets.length - 1; i >= 0; i--) {
@@ -574,6 +605,7 @@ class GameEngine {
             }
             if (b.y < -50) this.playState.bullets.splice(i, 1);
         }
+        FrameTrace.lap('bullets');
 
         // Items
         if (!this.playState.items) this.playState.items = [];
@@ -589,9 +621,14 @@ class GameEngine {
 
             return !item.markedForDeletion;
         });
+        FrameTrace.lap('items');
 
         // Spawn Enemies
-        if (this.playState.frameCount % (GAME_SETTINGS.ENEMY.SPAWN_INTERVAL || 60) === 0) {
+        if (this.playState.spawnCursor) {
+            // ビルド済みの出現表 (SPAWN_SCHEDULES) のカーソルを進めるだけ
+            SpawnSchedule.advance(this.playState.spawnCursor, this.playState.frameCount,
+                (id, mpId, x) => this.spawnEnemy(id, mpId, x));
+        } else if (this.playState.frameCount % (GAME_SETTINGS.ENEMY.SPAWN_INTERVAL || 60) === 0) {
             this.spawnDebris();
         }
 
@@ -611,7 +648,17 @@ class GameEngine {
                 const dtId = en.dtId;
                 const lotteryCount = en.dropCount || 1;
 
-                if (dtId && GAME_BALANCE_DATA.DROP_TABLES && GAME_BALANCE_DATA.DROP_TABLES[dtId]) {
+                if (dtId && GAME_BALANCE_DATA.DROP_ALIAS && GAME_BALANCE_DATA.DROP_ALIAS[dtId]) {
+                    // Exclusive テーブル (DropTables の Exclusive 列) だけ alias テーブルがある:
+                    // 1回の抽選で O(1) に最大1個 (null = ドロップ無し)。それ以外は下で項目ごとに独立して判定する
+                    const alias = GAME_BALANCE_DATA.DROP_ALIAS[dtId];
+                    for (let c = 0; c < lotteryCount; c++) {
+                        const dropId = pickAlias(alias);
+                        if (dropId !== null) {
+                            this.spawnLoot(en.x + (Math.random() - 0.5) * 40, en.y + (Math.random() - 0.5) * 40, dropId);
+                        }
+                    }
+                } else if (dtId && GAME_BALANCE_DATA.DROP_TABLES && GAME_BALANCE_DATA.DROP_TABLES[dtId]) {
                     const table = GAME_BALANCE_DATA.DROP_TABLES[dtId];
                     for (let c = 0; c < lotteryCount; c++) {
                         table.forEach(drop => {
@@ -632,6 +679,7 @@ class GameEngine {
                 this.playState.enemies.splice(i, 1);
             }
         }
+        FrameTrace.lap('enemies');
 
         // Missile Update
         this.playState.missiles.forEach((m, idx) => {
@@ -704,6 +752,7 @@ class GameEngine {
                 });
             }
         });
+        FrameTrace.lap('missiles');
 
         // Elapsed
         this.playState.elapsedSeconds += 1 / 60;
@@ -855,28 +904,6 @@ class GameEngine {
         });
     }
 
-    spawnDebris() {
-        const tiers = GAME_SETTINGS.DEBRIS.TIERS;
-        if (!tiers) return;
-        const tier = tiers[Math.floor(Math.random() * tiers.length)];
-
-        // Lookup full data for drops using updated IDs (ENxxx)
-        // Ensure GAME_BALANCE_DATA.ENEMIES exists
-        const fullData = (GAME_BALANCE_DATA.ENEMIES && GAME_BALANCE_DATA.ENEMIES[tier.id]) ? GAME_BALANCE_DATA.ENEMIES[tier.id] : null;
-        const drops = fullData ? fullData.drops : [];
-
-        this.playState.enemies.push({
-            x: Math.random() * this.canvas.width,
-            y: -50,
-            hp: tier.hp,
-            baseSpeed: tier.speed,
-            homing: tier.homing || 0,
-            color: tier.color,
-            tierId: tier.id,
-            drops: drops
-        });
-    }
-
     spawnLoot(x, y, dropId) {
         if (!GAME_SETTINGS.ECONOMY || !GAME_SETTINGS.ECONOMY.ITEMS) return;
 
@@ -1091,10 +1118,12 @@ class GameEngine {
         this.ctx.restore();
 
         // 機体 (Sprite)
-        if (this.playerSprite && this.playerSprite.complete) {
-            // Draw centered. Assuming 461KB image is large, scale to approx 64x64 or 80x80
-            const drawW = 80;
-            const drawH = 80;
+        // Draw centered. Assuming 461KB image is large, scale to approx 64x64 or 80x80
+        const drawW = 80;
+        const drawH = 80;
+        if (SpriteAtlas.draw(this.ctx, 'playership01', -drawW / 2, -drawH / 2, drawW, drawH)) {
+            // アトラスから描画済み
+        } else if (this.playerSprite && this.playerSprite.complete) {
             this.ctx.drawImage(this.playerSprite, -drawW / 2, -drawH / 2, drawW, drawH);
         } else {
             // Fallback to Grid if image not loaded
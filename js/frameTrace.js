@@ -0,0 +1,152 @@
+/**
+ * フレーム時間のトレース (index.html?trace または ?trace=<フレーム数>)
+ * gameLoop の1フレームごとに、処理ごとの時間 (10µs 単位) と敵・弾・パーティクルなどの数、星数・天候を
+ * 固定長のレコードにしてリングバッファ (既定 216000 フレーム = 60fps で約1時間) に書く。
+ * F9 か FrameTrace.download() で .ftrace ファイルに書き出し、tools/frame_trace.py で集計する。
+ *
+ * ファイル: "FTRC" u16 版 u16 レコード長 u32 JSON長 | JSON ヘッダー (名前の表など) | レコード (古い順)
+ * レコード (little-endian, RECORD_SIZE バイト):
+ *   u32 frameCount, u32 開始からの ms, u16 x TIMINGS.length, u16 x COUNTS.length, u8 星数, u8 天候, u8 flags, u8 予備
+ */
+const FrameTrace = {
+    VERSION: 1,
+    TIME_UNIT_US: 10,
+    // 処理の区切り (lap の引数)。interval は前のフレームの開始からの間隔 (rAF の間隔)
+    TIMINGS: ['interval', 'player', 'particles', 'bullets', 'items', 'enemies', 'missiles', 'texts', 'hud', 'draw'],
+    COUNTS: ['enemies', 'bullets', 'missiles', 'particles', 'items', 'texts'],
+    DEFAULT_CAPACITY: 216000,
+    FLAG_MISSION_START: 1,
+
+    enabled: false,
+    capacity: 0,
+    buffer: null,
+    view: null,
+    written: 0,
+    start: 0,
+    frameStart: 0,
+    last: 0,
+    acc: null,
+    weathers: [],     // 天候キーの表 (レコードの天候はこの添字)。初めて見たキーを足していく
+    startedAt: null,
+    missionStarted: false,
+
+    // 処理名 -> TIMINGS の添字
+    T: {},
+
+    init: (capacity) => {
+        FrameTrace.RECORD_SIZE = 8 + FrameTrace.TIMINGS.length * 2 + FrameTrace.COUNTS.length * 2 + 4;
+        FrameTrace.TIMINGS.forEach((name, i) => { FrameTrace.T[name] = i; });
+        FrameTrace.capacity = capacity || FrameTrace.DEFAULT_CAPACITY;
+        FrameTrace.buffer = new ArrayBuffer(FrameTrace.capacity * FrameTrace.RECORD_SIZE);
+        FrameTrace.view = new DataView(FrameTrace.buffer);
+        FrameTrace.acc = new Float64Array(FrameTrace.TIMINGS.length);
+        // --chunked では WEATHER は stage チャンクで後から届くので、ここでは分かる分だけ (残りは end() で足す)
+        FrameTrace.weathers = Object.keys((typeof GAME_BALANCE_DATA !== 'undefined' && GAME_BALANCE_DATA.WEATHER) || {});
+        FrameTrace.start = performance.now();
+        FrameTrace.startedAt = new Date().toISOString();
+        FrameTrace.enabled = true;
+        window.addEventListener('keydown', e => { if (e.key === 'F9') FrameTrace.download(); });
+        console.log(`[FrameTrace] Recording up to ${FrameTrace.capacity} frames (${(FrameTrace.buffer.byteLength / 1048576).toFixed(1)} MB); F9 or FrameTrace.download() to export`);
+    },
+
+    // gameLoop の先頭
+    begin: () => {
+        if (!FrameTrace.enabled) return;
+        const now = performance.now();
+        FrameTrace.acc.fill(0);
+        if (FrameTrace.frameStart) FrameTrace.acc[0] = now - FrameTrace.frameStart;
+        FrameTrace.frameStart = now;
+        FrameTrace.last = now;
+    },
+
+    // 前の lap (か begin) からの時間を name の処理に足す (updateEntities は2回呼ばれるので合計になる)
+    lap: (name) => {
+        if (!FrameTrace.enabled) return;
+        const now = performance.now();
+        FrameTrace.acc[FrameTrace.T[name]] += now - FrameTrace.last;
+        FrameTrace.last = now;
+    },
+
+    // 依頼の開始 (initIngame)。次のレコードに FLAG_MISSION_START を立てる
+    markMissionStart: () => {
+        FrameTrace.missionStarted = true;
+    },
+
+    // gameLoop の最後。INGAME のフレームだけ記録する
+    end: (engine) => {
+        if (!FrameTrace.enabled || engine.currentState !== GAME_STATE.INGAME) return;
+        const size = FrameTrace.RECORD_SIZE;
+        const v = FrameTrace.view;
+        let o = (FrameTrace.written % FrameTrace.capacity) * size;
+        const ps = engine.playState;
+        v.setUint32(o, ps.frameCount >>> 0, true);
+        v.setUint32(o + 4, Math.floor(FrameTrace.frameStart - FrameTrace.start) >>> 0, true);
+        o += 8;
+        const unit = FrameTrace.TIME_UNIT_US / 1000;
+        for (let i = 0; i < FrameTrace.acc.length; i++, o += 2) {
+            v.setUint16(o, Math.min(65535, Math.round(FrameTrace.acc[i] / unit)), true);
+        }
+        const counts = [ps.enemies, ps.bullets, ps.missiles, ps.particles, ps.items, ps.floatingTexts];
+        for (let i = 0; i < counts.length; i++, o += 2) {
+            v.setUint16(o, Math.min(65535, counts[i] ? counts[i].length : 0), true);
+        }
+        const weather = FrameTrace.weatherIndex(engine.currentWeather);
+        v.setUint8(o, (engine.currentMission && engine.currentMission.stars) || 0);
+        v.setUint8(o + 1, weather < 0 ? 255 : weather);
+        v.setUint8(o + 2, FrameTrace.missionStarted ? FrameTrace.FLAG_MISSION_START : 0);
+        v.setUint8(o + 3, 0);
+        FrameTrace.missionStarted = false;
+        FrameTrace.written++;
+    },
+
+    // 天候 -> weathers の添字 (初めてのキーは表に足す。export() はその時点の表を書く)
+    weatherIndex: (weather) => {
+        if (!weather || !weather.Key) return -1;
+        let i = FrameTrace.weathers.indexOf(weather.Key);
+        if (i < 0 && FrameTrace.weathers.length < 255) i = FrameTrace.weathers.push(weather.Key) - 1;
+        return i;
+    },
+
+    // ヘッダー + レコード (古い順) の Blob
+    export: () => {
+        const size = FrameTrace.RECORD_SIZE;
+        const count = Math.min(FrameTrace.written, FrameTrace.capacity);
+        const header = JSON.stringify({
+            build: (typeof GAME_BALANCE_VERSION !== 'undefined') ? GAME_BALANCE_VERSION : null,
+            userAgent: navigator.userAgent,
+            startedAt: FrameTrace.startedAt,
+            timeUnitUs: FrameTrace.TIME_UNIT_US,
+            timings: FrameTrace.TIMINGS,
+            counts: FrameTrace.COUNTS,
+            weathers: FrameTrace.weathers,
+            records: count,
+            dropped: FrameTrace.written - count
+        });
+        const json = new TextEncoder().encode(header);
+        const prefix = new DataView(new ArrayBuffer(12));
+        [70, 84, 82, 67].forEach((c, i) => prefix.setUint8(i, c)); // "FTRC"
+        prefix.setUint16(4, FrameTrace.VERSION, true);
+        prefix.setUint16(6, size, true);
+        prefix.setUint32(8, json.length, true);
+        const bytes = new Uint8Array(FrameTrace.buffer);
+        const head = FrameTrace.written > FrameTrace.capacity ? (FrameTrace.written % FrameTrace.capacity) * size : 0;
+        const parts = [prefix, json, bytes.subarray(head, count * size)];
+        if (head) parts.push(bytes.subarray(0, head));
+        return new Blob(parts, { type: 'application/octet-stream' });
+    },
+
+    download: () => {
+        if (!FrameTrace.enabled) return;
+        const a = document.createElement('a');
+        a.href = URL.createObjectURL(FrameTrace.export());
+        a.download = `frametrace-${FrameTrace.startedAt.replace(/[:.]/g, '-')}.ftrace`;
+        a.click();
+        setTimeout(() => URL.revokeObjectURL(a.href), 1000);
+        console.log(`[FrameTrace] Exported ${Math.min(FrameTrace.written, FrameTrace.capacity)} frame(s)`);
+    }
+};
+
+{
+    const param = new URLSearchParams(window.location.search).get('trace');
+    if (param !== null) FrameTrace.init(parseInt(param, 10) || 0);
+}
@@ -4,15 +4,124 @@
  */
 const GridManager = {
     // パーツ定義 (settings_data.js から取得 + WEAPONSも統合)
+    // 元のセクションが差し替わった時 (チャンクの読み込み, ホットリロード) だけ作り直す
+    _templates: null,
+    _templateSources: [],
     get PART_TEMPLATES() {
-        return Object.assign({}, GAME_BALANCE_DATA.WEAPONS || {}, GAME_BALANCE_DATA.PART_TEMPLATES || {});
+        const sources = [GAME_BALANCE_DATA.WEAPONS, GAME_BALANCE_DATA.PART_TEMPLATES];
+        if (!GridManager._templates || sources.some((s, i) => s !== GridManager._templateSources[i])) {
+            GridManager._templates = Object.assign({}, sources[0] || {}, sources[1] || {});
+            GridManager._templateSources = sources;
+        }
+        return GridManager._templates;
     },
 
     GRID_MAX_SIZE: 10,
     CELL_UNLOCK_PRICE: 500, // 1マスあたりの価格
 
+    // ビットボード: マス (r, c) = ビット r * size + c。パーツを置ける位置ごとのマスクは
+    // tools/hangar_grid.py がビルド時に HANGAR_GRID に (16進文字列で) 焼き込んでいる。
+    // 100 ビットを 32 ビット整数 4 つ (下位から) に分けて持ち、判定は整数の AND だけで済ませる。
+    MASK_WORDS: 4,
+    _masks: new Map(), // 16進文字列 -> [w0, w1, w2, w3]
+    _unlocked: { cells: null, length: -1, mask: null },
+    _occupied: [0, 0, 0, 0],
+    _placements: { grid: null, parts: {} },
+
+    // ホットリロードで HANGAR_GRID がその場で書き換わった時に展開済みの表を捨てる
+    clearMaskCache: () => {
+        GridManager._placements = { grid: null, parts: {} };
+        GridManager._templates = null;
+    },
+
+    toMask: (hex) => {
+        let mask = GridManager._masks.get(hex);
+        if (mask === undefined) {
+            mask = [];
+            for (let k = 0; k < GridManager.MASK_WORDS; k++) {
+                const end = hex.length - k * 8;
+                mask.push(end > 0 ? parseInt(hex.slice(Math.max(0, end - 8), end), 16) | 0 : 0);
+            }
+            GridManager._masks.set(hex, mask);
+        }
+        return mask;
+    },
+
+    // (row, col) に置いた時に占めるマス。置けない位置 (グリッド外, SHIP_LAYOUT の Void に掛かる) は false、
+    // HANGAR_GRID が無い (古い settings_data.js / 未読み込み) か知らないパーツは null
+    placementMask: (partType, row, col) => {
+        const grid = GAME_BALANCE_DATA.HANGAR_GRID;
+        if (!grid) return null;
+        if (GridManager._placements.grid !== grid) GridManager._placements = { grid, parts: {} };
+        let table = GridManager._placements.parts[partType];
+        if (table === undefined) {
+            const part = grid.parts[partType];
+            // アンカー位置 r * size + c -> マスク (置けない位置は false) の表に展開しておく
+            table = part ? new Array(grid.size * grid.size).fill(false) : null;
+            if (part) Object.keys(part.placements).forEach(index => { table[index] = GridManager.toMask(part.placements[index]); });
+            GridManager._placements.parts[partType] = table;
+        }
+        if (!table) return null;
+        if (row < 0 || row >= grid.size || col < 0 || col >= grid.size) return false;
+        return table[row * grid.size + col];
+    },
+
+    // 置かれているパーツのマス。置ける位置に無いもの (レイアウト変更前に置かれたパーツなど) は形をずらして作る
+    equippedMask: (p) => {
+        const mask = GridManager.placementMask(p.type, p.r, p.c);
+        if (mask !== false) return mask;
+        const grid = GAME_BALANCE_DATA.HANGAR_GRID;
+        const part = grid.parts[p.type];
+        if (p.r < 0 || p.c < 0 || p.r + part.h > grid.size || p.c + part.w > grid.size) return null;
+        return GridManager.toMask((BigInt('0x' + part.shape) << BigInt(p.r * grid.size + p.c)).toString(16));
+    },
+
+    unlockedMask: (gridData) => {
+        const cache = GridManager._unlocked;
+        const cells = gridData.unlockedCells;
+        if (cache.cells !== cells || cache.length !== cells.length) {
+            const size = GAME_BALANCE_DATA.HANGAR_GRID.size;
+            const mask = [0, 0, 0, 0];
+            cells.forEach(cell => {
+                if (cell.r < 0 || cell.r >= size || cell.c < 0 || cell.c >= size) return;
+                const bit = cell.r * size + cell.c;
+                mask[bit >> 5] |= 1 << (bit & 31);
+            });
+            GridManager._unlocked = { cells, length: cells.length, mask };
+        }
+        return GridManager._unlocked.mask;
+    },
+
+    // 装備中のパーツ (movingPartIndex を除く) が占めるマスを out に入れる。マスクを作れないパーツがあれば false
+    occupiedMask: (gridData, movingPartIndex = -1, out = [0, 0, 0, 0]) => {
+        out.fill(0);
+        const parts = gridData.equippedParts;
+        for (let idx = 0; idx < parts.length; idx++) {
+            if (idx === movingPartIndex) continue;
+            const partMask = GridManager.equippedMask(parts[idx]);
+            if (partMask === null) return false;
+            for (let k = 0; k < GridManager.MASK_WORDS; k++) out[k] |= partMask[k];
+        }
+        return true;
+    },
+
     // 配置検証 (Shape対応 V5)
     isValidPlacement: (gridData, partType, row, col, movingPartIndex = -1) => {
+        const mask = GridManager.placementMask(partType, row, col);
+        if (mask === false) return false;
+        const occupied = GridManager._occupied;
+        if (mask === null || !GridManager.occupiedMask(gridData, movingPartIndex, occupied)) {
+            return GridManager.isValidPlacementByCells(gridData, partType, row, col, movingPartIndex);
+        }
+        const unlocked = GridManager.unlockedMask(gridData);
+        for (let k = 0; k < GridManager.MASK_WORDS; k++) {
+            if ((mask[k] & ~unlocked[k]) | (mask[k] & occupied[k])) return false;
+        }
+        return true;
+    },
+
+    // マスごとの判定 (HANGAR_GRID が無い時)
+    isValidPlacementByCells: (gridData, partType, row, col, movingPartIndex = -1) => {
         const template = GridManager.PART_TEMPLATES[partType];
         if (!template) return false;
 
@@ -196,3 +305,5 @@ const GridManager = {
         return { success: false };
     }
 };
+
+if (typeof BalancePatch !== 'undefined') BalancePatch.onApply(() => GridManager.clearMaskCache());
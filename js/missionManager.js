@@ -15,21 +15,29 @@ const MissionManager = {
 
         // Determine Difficulty Probabilities
         const scaling = GAME_BALANCE_DATA.MISSION_DATA.DIFFICULTY_SCALING;
-        let probs = scaling[0].probs;
+        let band = 0;
         for (let i = 0; i < scaling.length; i++) {
             if (totalStats >= scaling[i].minStat) {
-                probs = scaling[i].probs;
+                band = i;
             }
         }
+        const probs = scaling[band].probs;
+        // Prebuilt alias table for this band (update_settings.py)
+        const aliasTables = GAME_BALANCE_DATA.MISSION_DATA.DIFFICULTY_ALIAS;
+        const alias = aliasTables ? aliasTables[band] : null;
 
         for (let i = 0; i < 3; i++) {
             // Select Stars based on probability
-            const rand = Math.floor(Math.random() * 100);
             let stars = 1;
-            let cum = 0;
-            for (let s in probs) {
-                cum += probs[s];
-                if (rand < cum) { stars = parseInt(s); break; }
+            if (alias) {
+                stars = pickAlias(alias);
+            } else {
+                const rand = Math.floor(Math.random() * 100);
+                let cum = 0;
+                for (let s in probs) {
+                    cum += probs[s];
+                    if (rand < cum) { stars = parseInt(s); break; }
+                }
             }
 
             const params = GAME_BALANCE_DATA.MISSION_DATA.DIFFICULTY_PARAMS[stars];
@@ -153,3 +153,14 @@ const GAME_STATE = {
 };
 
 const SAVE_KEY = 'HTML5_SHOOTER_SAVE_DATA_V5';
+
+/**
+ * alias テーブル (update_settings.py がビルド時に生成) から1つ抽選する。
+ * 乱数1回・配列参照のみで、テーブルの大きさに関係なく O(1)。
+ * table = { values: [...], prob: [...], alias: [...] }
+ */
+function pickAlias(table) {
+    const u = Math.random() * table.values.length;
+    const i = u | 0;
+    return (u - i) < table.prob[i] ? table.values[i] : table.values[table.alias[i]];
+}
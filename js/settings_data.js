@@ -539,7 +539,32 @@ const GAME_BALANCE_DATA = {
                 "shield": 0,
                 "speed": 1.0
             }
-        ]
+        ],
+        "TIER_INDEX": {
+            "Tier1": [
+                "EN001",
+                "EN002",
+                "EN003",
+                "EN004",
+                "EN005",
+                "EN006",
+                "EN007",
+                "EN008",
+                "EN009",
+                "EN010",
+                "EN011",
+                "EN012",
+                "EN013",
+                "EN014",
+                "EN015",
+                "EN016",
+                "EN017",
+                "EN018",
+                "EN019",
+                "EN020",
+                "EN021"
+            ]
+        }
     },
     "PART_TEMPLATES": {
         "WeaponOS": {
@@ -583,6 +608,218 @@ const GAME_BALANCE_DATA = {
             "UpgradeCost": 800
         }
     },
+    "HANGAR_GRID": {
+        "size": 10,
+        "layout": "fc7f1fc1e03000000",
+        "initial": "1c0700000000000",
+        "parts": {
+            "BeamGun": {
+                "shape": "401",
+                "h": 2,
+                "w": 1,
+                "placements": {
+                    "24": "401000000",
+                    "25": "802000000",
+                    "33": "80200000000",
+                    "34": "100400000000",
+                    "35": "200800000000",
+                    "36": "401000000000",
+                    "42": "10040000000000",
+                    "43": "20080000000000",
+                    "44": "40100000000000",
+                    "45": "80200000000000",
+                    "46": "100400000000000",
+                    "47": "200800000000000",
+                    "48": "401000000000000",
+                    "52": "4010000000000000",
+                    "53": "8020000000000000",
+                    "54": "10040000000000000",
+                    "55": "20080000000000000",
+                    "56": "40100000000000000",
+                    "57": "80200000000000000"
+                }
+            },
+            "Missile": {
+                "shape": "100401",
+                "h": 3,
+                "w": 1,
+                "placements": {
+                    "24": "100401000000",
+                    "25": "200802000000",
+                    "33": "20080200000000",
+                    "34": "40100400000000",
+                    "35": "80200800000000",
+                    "36": "100401000000000",
+                    "42": "4010040000000000",
+                    "43": "8020080000000000",
+                    "44": "10040100000000000",
+                    "45": "20080200000000000",
+                    "46": "40100400000000000",
+                    "47": "80200800000000000"
+                }
+            },
+            "Bomb": {
+                "shape": "c03",
+                "h": 2,
+                "w": 2,
+                "placements": {
+                    "24": "c03000000",
+                    "33": "180600000000",
+                    "34": "300c00000000",
+                    "35": "601800000000",
+                    "42": "300c0000000000",
+                    "43": "60180000000000",
+                    "44": "c0300000000000",
+                    "45": "180600000000000",
+                    "46": "300c00000000000",
+                    "47": "601800000000000",
+                    "52": "c030000000000000",
+                    "53": "18060000000000000",
+                    "54": "300c0000000000000",
+                    "55": "60180000000000000",
+                    "56": "c0300000000000000"
+                }
+            },
+            "TwinBeam": {
+                "shape": "c03",
+                "h": 2,
+                "w": 2,
+                "placements": {
+                    "24": "c03000000",
+                    "33": "180600000000",
+                    "34": "300c00000000",
+                    "35": "601800000000",
+                    "42": "300c0000000000",
+                    "43": "60180000000000",
+                    "44": "c0300000000000",
+                    "45": "180600000000000",
+                    "46": "300c00000000000",
+                    "47": "601800000000000",
+                    "52": "c030000000000000",
+                    "53": "18060000000000000",
+                    "54": "300c0000000000000",
+                    "55": "60180000000000000",
+                    "56": "c0300000000000000"
+                }
+            },
+            "Laser": {
+                "shape": "300c03",
+                "h": 3,
+                "w": 2,
+                "placements": {
+                    "24": "300c03000000",
+                    "33": "60180600000000",
+                    "34": "c0300c00000000",
+                    "35": "180601800000000",
+                    "42": "c0300c0000000000",
+                    "43": "18060180000000000",
+                    "44": "300c0300000000000",
+                    "45": "60180600000000000",
+                    "46": "c0300c00000000000"
+                }
+            },
+            "WeaponOS": {
+                "shape": "c03",
+                "h": 2,
+                "w": 2,
+                "placements": {
+                    "24": "c03000000",
+                    "33": "180600000000",
+                    "34": "300c00000000",
+                    "35": "601800000000",
+                    "42": "300c0000000000",
+                    "43": "60180000000000",
+                    "44": "c0300000000000",
+                    "45": "180600000000000",
+                    "46": "300c00000000000",
+                    "47": "601800000000000",
+                    "52": "c030000000000000",
+                    "53": "18060000000000000",
+                    "54": "300c0000000000000",
+                    "55": "60180000000000000",
+                    "56": "c0300000000000000"
+                }
+            },
+            "Collector": {
+                "shape": "100401",
+                "h": 3,
+                "w": 1,
+                "placements": {
+                    "24": "100401000000",
+                    "25": "200802000000",
+                    "33": "20080200000000",
+                    "34": "40100400000000",
+                    "35": "80200800000000",
+                    "36": "100401000000000",
+                    "42": "4010040000000000",
+                    "43": "8020080000000000",
+                    "44": "10040100000000000",
+                    "45": "20080200000000000",
+                    "46": "40100400000000000",
+                    "47": "80200800000000000"
+                }
+            },
+            "Shield": {
+                "shape": "401",
+                "h": 2,
+                "w": 1,
+                "placements": {
+                    "24": "401000000",
+                    "25": "802000000",
+                    "33": "80200000000",
+                    "34": "100400000000",
+                    "35": "200800000000",
+                    "36": "401000000000",
+                    "42": "10040000000000",
+                    "43": "20080000000000",
+                    "44": "40100000000000",
+                    "45": "80200000000000",
+                    "46": "100400000000000",
+                    "47": "200800000000000",
+                    "48": "401000000000000",
+                    "52": "4010000000000000",
+                    "53": "8020000000000000",
+                    "54": "10040000000000000",
+                    "55": "20080000000000000",
+                    "56": "40100000000000000",
+                    "57": "80200000000000000"
+                }
+            },
+            "ItemEff": {
+                "shape": "1",
+                "h": 1,
+                "w": 1,
+                "placements": {
+                    "24": "1000000",
+                    "25": "2000000",
+                    "33": "200000000",
+                    "34": "400000000",
+                    "35": "800000000",
+                    "36": "1000000000",
+                    "42": "40000000000",
+                    "43": "80000000000",
+                    "44": "100000000000",
+                    "45": "200000000000",
+                    "46": "400000000000",
+                    "47": "800000000000",
+                    "48": "1000000000000",
+                    "52": "10000000000000",
+                    "53": "20000000000000",
+                    "54": "40000000000000",
+                    "55": "80000000000000",
+                    "56": "100000000000000",
+                    "57": "200000000000000",
+                    "58": "400000000000000",
+                    "62": "4000000000000000",
+                    "63": "8000000000000000",
+                    "64": "10000000000000000",
+                    "65": "20000000000000000",
+                    "66": "40000000000000000",
+                    "67": "80000000000000000"
+                }
+            }
+        }
+    },
     "MATERIALS": {
         "TypeA": {
             "ID": "TypeA",
@@ -5972,162 +6209,656 @@ const GAME_BALANCE_DATA = {
         "MPID001": {
             "ID": "MPID001",
             "Name": "直進(上から下)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID002": {
             "ID": "MPID002",
             "Name": "直進(下から上)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": -1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID003": {
             "ID": "MPID003",
             "Name": "直進(右から左)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": -1,
+            "VY": 0.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID004": {
             "ID": "MPID004",
             "Name": "直進(左から右)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 1,
+            "VY": 0.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID005": {
             "ID": "MPID005",
             "Name": "ジグザグ(上から下)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Wave",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 1,
+            "AmpY": 0,
+            "Frequency": 0.05,
+            "Phase": 0.0
         },
         "MPID006": {
             "ID": "MPID006",
             "Name": "ジグザグ(下から上)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Wave",
+            "VX": 0,
+            "VY": -1.0,
+            "AmpX": 1,
+            "AmpY": 0,
+            "Frequency": 0.05,
+            "Phase": 0.0
         },
         "MPID007": {
             "ID": "MPID007",
             "Name": "ジグザグ(右から左)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Wave",
+            "VX": -1,
+            "VY": 0.0,
+            "AmpX": 0,
+            "AmpY": 1,
+            "Frequency": 0.05,
+            "Phase": 0.0
         },
         "MPID008": {
             "ID": "MPID008",
             "Name": "ジグザグ(左から右)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Wave",
+            "VX": 1,
+            "VY": 0.0,
+            "AmpX": 0,
+            "AmpY": 1,
+            "Frequency": 0.05,
+            "Phase": 0.0
         },
         "MPID009": {
             "ID": "MPID009",
             "Name": "ホーミング(上から下)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Homing",
+            "VX": 0,
+            "VY": 0.5,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID010": {
             "ID": "MPID010",
             "Name": "ホーミング(下から上)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Homing",
+            "VX": 0,
+            "VY": 0.5,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID011": {
             "ID": "MPID011",
             "Name": "ホーミング(右から左)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Homing",
+            "VX": 0,
+            "VY": 0.5,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID012": {
             "ID": "MPID012",
             "Name": "ホーミング(左から右)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Homing",
+            "VX": 0,
+            "VY": 0.5,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID013": {
             "ID": "MPID013",
             "Name": "リフレクト(上から下)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Reflect",
+            "VX": 1,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID014": {
             "ID": "MPID014",
             "Name": "リフレクト(下から上)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID015": {
             "ID": "MPID015",
             "Name": "リフレクト(右から左)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID016": {
             "ID": "MPID016",
             "Name": "リフレクト(左から右)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID017": {
             "ID": "MPID017",
             "Name": "ウェーブ(上から下)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Wave",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 2,
+            "AmpY": 0,
+            "Frequency": 0.1,
+            "Phase": 1.570796326794897
         },
         "MPID018": {
             "ID": "MPID018",
             "Name": "ウェーブ(下から上)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID019": {
             "ID": "MPID019",
             "Name": "ウェーブ(右から左)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID020": {
             "ID": "MPID020",
             "Name": "ウェーブ(左から右)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID021": {
             "ID": "MPID021",
             "Name": "スパイラル(上から下)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Wave",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 2,
+            "AmpY": 0,
+            "Frequency": 0.1,
+            "Phase": 1.570796326794897
         },
         "MPID022": {
             "ID": "MPID022",
             "Name": "スパイラル(下から上)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID023": {
             "ID": "MPID023",
             "Name": "スパイラル(右から左)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID024": {
             "ID": "MPID024",
             "Name": "スパイラル(左から右)",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID025": {
             "ID": "MPID025",
             "Name": "対面1",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID026": {
             "ID": "MPID026",
             "Name": "対面2",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID027": {
             "ID": "MPID027",
             "Name": "対面3",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID028": {
             "ID": "MPID028",
             "Name": "対面4",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID029": {
             "ID": "MPID029",
             "Name": "方円1",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID030": {
             "ID": "MPID030",
             "Name": "方円2",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID031": {
             "ID": "MPID031",
             "Name": "方円3",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
         },
         "MPID032": {
             "ID": "MPID032",
             "Name": "方円4",
-            "Logic": "TODO"
+            "Logic": "TODO",
+            "Kind": "Linear",
+            "VX": 0,
+            "VY": 1.0,
+            "AmpX": 0,
+            "AmpY": 0,
+            "Frequency": 0.0,
+            "Phase": 0.0
+        }
+    },
+    "MOVEMENT_TABLES": {
+        "waves": [
+            {
+                "length": 377,
+                "data": "AABmBscMIRNuGaof0yXjK9gxrDddPedCRUh2TXVSP1fRWylgQ2QdaLRrBm8SctR0THd3eVV743wifhB/rX/4f/F/mH/ufvN9pnwKeyB56HZkdJVxfm4ga31nmGN0XxJbdlajUZxMY0f9QW08tjbcMOMqziSiHmIYEhK3C1UF7/6K+Cny0uuH5U3fKNkc0y3NXse0wTG82raysbus+qdxoySfFJtFl7mTc5Bzjb2KUog0hmOE4oKxgdCAQYAEgBiAfoA2gT+CmYNChTmHfokPjOqODZJ3lSWZFJ1Doa+lVKowr0C0gLntvoTEQcoh0B/WONxo4qro/O5Z9bz7IgKHCOYOPBWEG7oh2yfjLc0zljk6P7ZEBUomTxNUy1hKXY5hk2VXaddsEnAFc691DXgfeuJ7Vn16fk1/z3//f91/aX+jfo19Jnxwemt4GXZ8c5VwZm3xaThmPmIEXo9Z4VT8T+NKm0UnQIk6xjThLt8owiKOHEkW9Q+XCTMDzfxp9gvwt+ly4z7dIdcf0TrLd8XZv2W6HbUEsB+rcab8ocKdyJkPlpqSa4+EjOeJlYeQhdqDc4JdgZeAI4ABgDGAs4CGgaqCHoThhfOHUYr7jO6PKZOplm2acp62ojWn7avasPu1SrvGwGrGM8wd0iXYRt585MTqGvF59979RASnCgQRVheYHcgj4SnfL781fDsTQYBGwEvQUKxVUVq9Xuxi22aJavNtFnHxc4J2x3i+emd8wX3KfoJ/6H/8f79/MH9Pfh59nXvMea53Q3WNco1vR2y7aOxk3GCPXAZYRVNOTiZJz0NMPqI40zLkLNgmsyB5Gi4U1w12BxEBq/pJ9O7tnude4TLbHdUkz0rJk8MDvp24ZLNdroqp7qSMoGicg5jglIKRa46cixiJ4Ib2hFqDDYISgWiAD4AIgFOA8IDegR2Dq4SJhrSILIvujfqQTJTjl72b158vpMGoi62Ksru3Gb2jwlTIKM4d1C3aVuCS5t/sOfOa+Q=="
+            },
+            {
+                "length": 377,
+                "data": "/39bf3J9SHrldVRwpGnmYS1ZkU8pRRA6Yi4+IsIVDwlE/IPv7eKg1r7KY7+utLmqn6F2mVOSSYxnh7mDSYEdgDmAm4FAhCKIN41xk8GaE6NUrGq2PcGwzKbYAeWi8Wb+LwvcF0skXjD0O/JGOlGyWkJj1WpWcbV25XrafY1/+n8gfwF9onkMdUpvbGiDYKNX4k1bQyc4ZCwvIKcT7gYj+mft2uCd1M/Ijr33siWpMqAzmD6RZIu0hjuDAYELgF2A9YHQhOaILI6WlBKcjqT0rSy4G8Omzq/aGOfB84kATw3zGVUmVTLVPbZI3VIwXJdk/mtPcn13eXs5frZ/7X/cfod883grdDhuLGcZXxFWLkyIQTo2YiodHosRzAQB+Evryd6d0uTGvrtGsZeny573ljCQh4oKhsWCwYACgIuAWYJphbKJKo/DlWudD6aar/K5/cSg0LvcMenh9asCbg8JHF0oSjSxP3VKelSoXeZlH21Bcz14BHyPftZ/1n+PfgR8PXhBcx9t5mWoXXpUdUqxP0o0XSgJHG4PqwLh9THpu9yg0P3E8rmarw+ma53DlSqPsolphVmCi4ACgMGAxYIKhoeKMJD3lsuel6dGsb675Mad0sneS+sB+MwEixEdHmIqOjaIQS5MEVYZXyxnOG4rdPN4h3zcfu1/tn85fnl7fXdPcv5rl2QwXN1StkjVPVUyVSbzGU8NiQDB8xjnr9qmzhvDLLj0rY6kEpyWlCyO5ojQhPWBXYALgAGBO4O0hmSLPpEzmDKgJan3so69z8id1NrgZ+0j+u4GpxMvIGQsJzhbQ+JNo1eDYGxoSm8MdaJ5AX0gf/p/jX/afeV6tXZWcdVqQmOyWjpR8kb0O14wSyTcFy8LZv6i8QHlptiwzD3BarZUrBOjwZpxkzeNIohAhJuBOYAdgEmBuYNnh0mMU5J2mZ+huaqutGO/vsqg1u3ig+9E/A8JwhU+ImIuEDopRZFPLVnmYaRpVHDldUh6cn1bfw=="
+            }
+        ],
+        "patterns": {
+            "MPID001": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID002": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": -1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID003": {
+                "kind": 0,
+                "vx": -1.0,
+                "vy": 0.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID004": {
+                "kind": 0,
+                "vx": 1.0,
+                "vy": 0.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID005": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 1.0,
+                "ampY": 0.0,
+                "wave": 0
+            },
+            "MPID006": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": -1.0,
+                "ampX": 1.0,
+                "ampY": 0.0,
+                "wave": 0
+            },
+            "MPID007": {
+                "kind": 0,
+                "vx": -1.0,
+                "vy": 0.0,
+                "ampX": 0.0,
+                "ampY": 1.0,
+                "wave": 0
+            },
+            "MPID008": {
+                "kind": 0,
+                "vx": 1.0,
+                "vy": 0.0,
+                "ampX": 0.0,
+                "ampY": 1.0,
+                "wave": 0
+            },
+            "MPID009": {
+                "kind": 1,
+                "vx": 0.0,
+                "vy": 0.5,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID010": {
+                "kind": 1,
+                "vx": 0.0,
+                "vy": 0.5,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID011": {
+                "kind": 1,
+                "vx": 0.0,
+                "vy": 0.5,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID012": {
+                "kind": 1,
+                "vx": 0.0,
+                "vy": 0.5,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID013": {
+                "kind": 2,
+                "vx": 1.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID014": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID015": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID016": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID017": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 2.0,
+                "ampY": 0.0,
+                "wave": 1
+            },
+            "MPID018": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID019": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID020": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID021": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 2.0,
+                "ampY": 0.0,
+                "wave": 1
+            },
+            "MPID022": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID023": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID024": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID025": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID026": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID027": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID028": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID029": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID030": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID031": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            },
+            "MPID032": {
+                "kind": 0,
+                "vx": 0.0,
+                "vy": 1.0,
+                "ampX": 0.0,
+                "ampY": 0.0,
+                "wave": -1
+            }
         }
     },
     "DROP_TABLES": {
@@ -6170,6 +6901,7 @@ const GAME_BALANCE_DATA = {
             }
         ]
     },
+    "DROP_ALIAS": {},
     "MISSION_DATA": {
         "DIFFICULTY_SCALING": [
             {
@@ -6223,6 +6955,96 @@ const GAME_BALANCE_DATA = {
                 }
             }
         ],
+        "DIFFICULTY_ALIAS": [
+            {
+                "values": [
+                    1,
+                    2
+                ],
+                "prob": [
+                    1.0,
+                    0.4
+                ],
+                "alias": [
+                    0,
+                    0
+                ]
+            },
+            {
+                "values": [
+                    1,
+                    2,
+                    3
+                ],
+                "prob": [
+                    1.0,
+                    0.5000000000000002,
+                    0.30000000000000004
+                ],
+                "alias": [
+                    0,
+                    0,
+                    1
+                ]
+            },
+            {
+                "values": [
+                    1,
+                    2,
+                    3
+                ],
+                "prob": [
+                    0.8999999999999999,
+                    1.0,
+                    0.8999999999999999
+                ],
+                "alias": [
+                    1,
+                    1,
+                    1
+                ]
+            },
+            {
+                "values": [
+                    1,
+                    2,
+                    3,
+                    4
+                ],
+                "prob": [
+                    0.4,
+                    1.0,
+                    0.8000000000000003,
+                    0.8
+                ],
+                "alias": [
+                    2,
+                    1,
+                    1,
+                    2
+                ]
+            },
+            {
+                "values": [
+                    2,
+                    3,
+                    4,
+                    5
+                ],
+                "prob": [
+                    0.8,
+                    1.0,
+                    0.8,
+                    0.4
+                ],
+                "alias": [
+                    2,
+                    1,
+                    1,
+                    2
+                ]
+            }
+        ],
         "DIFFICULTY_PARAMS": {
             "1": {
                 "dist": [
@@ -6294,6 +7116,458 @@ const GAME_BALANCE_DATA = {
                 "SQUALL": 0,
                 "HELL": 0
             }
+        },
+        "WEATHER_ALIAS": {
+            "EASY": {
+                "values": [
+                    "CLEAR",
+                    "RAIN"
+                ],
+                "prob": [
+                    1.0,
+                    0.2
+                ],
+                "alias": [
+                    0,
+                    0
+                ]
+            },
+            "NORMAL": {
+                "values": [
+                    "CLEAR",
+                    "RAIN"
+                ],
+                "prob": [
+                    1.0,
+                    0.4
+                ],
+                "alias": [
+                    0,
+                    0
+                ]
+            },
+            "HARD": {
+                "values": [
+                    "CLEAR",
+                    "RAIN"
+                ],
+                "prob": [
+                    1.0,
+                    0.6
+                ],
+                "alias": [
+                    0,
+                    0
+                ]
+            }
+        }
+    },
+    "SPAWN_SCHEDULES": {
+        "period": 3600,
+        "stages": [
+            [
+                1,
+                300.0
+            ],
+            [
+                2,
+                600.0
+            ],
+            [
+                3,
+                900.0
+            ],
+            [
+                4,
+                1200.0
+            ],
+            [
+                5,
+                1500.0
+            ],
+            [
+                6,
+                1800.0
+            ],
+            [
+                7,
+                2100.0
+            ],
+            [
+                8,
+                2400.0
+            ],
+            [
+                9,
+                2700.0
+            ],
+            [
+                10,
+                3000.0
+            ],
+            [
+                11,
+                3300.0
+            ]
+        ],
+        "enemies": [
+            "EN021",
+            "EN009",
+            "EN012",
+            "EN017",
+            "EN001",
+            "EN011",
+            "EN020",
+            "EN010",
+            "EN003",
+            "EN018",
+            "EN005",
+            "EN008",
+            "EN014",
+            "EN016",
+            "EN007",
+            "EN019",
+            "EN013",
+            "EN015",
+            "EN004",
+            "EN002",
+            "EN006"
+        ],
+        "patterns": [
+            "MPID001"
+        ],
+        "timelines": {
+            "1-1": [
+                {
+                    "seed": 1844494161,
+                    "count": 120,
+                    "data": "PAAAmgUAAQAyPAIAmAQAAgCjAzwDANEEAAMAnwM8BACgAgAFAKUCPAYARQAHAIQEPAgAggYACQCbATwKAJsCAAYAtgE8BwD/BAAKAMIDPAUA4QIACwBZPAwA3gMADQCbBDwAAO4FAA4AjAU8DQC1BQAAAIMBPA0A1AMACQDYBTwDAJ0DAAwAdTwJAP8DAAIAiAQ8DwCIBAAQAIMGPBEA1AUAEgDRATwHAOQFAAUAoAE8AgA9AAoA2AE8EAD+AwAGAKsEPAMAqQEAEQDwBDwNALEFAAwA9AE8CAD4BQAMAIIBPBMAygMABAC4AjwEAN4BABQAqwI8DADkAgAEAJAFPAgAmQMAEwCLAzwSAPsEAAwA2wM8AQDEBQAHAOYDPAoAnQUAAgD2AjwCAPAEAAIAxwE8FADXAQAHAMEBPAEAqQUAEQDgBTwAAO4CAAAAezwBAKEDAAUA2AQ8AwDGAwACAPQFPA4AhAIAAwCLATwPAJwDAAkA1gU8AAB5AAoAjQI8EwDzBQAAAIMCPAgA5QEACwDmAzwNALwEABMAODwIAOoBAAcA6AE8EQD5AwAIALgFPA4A2AIACQDxAjwPANYBAA8A+AM8AwA+AAAApgE8EwDFBAAAAG08CgDeBQAGAPAEPA0A7QMAFACDBjwDAOgEAAcArAM8DgCwAwAFAPUFPBMAhwQADACiBTwDAPgFAA0A3gQ8EgC6AQABAIYDPAMAFgANAOoFPAUAbwAJAJoCPAIA9gMAAwCRAjwMALEEAAgAlQE8AADDAwAUAIIC"
+                },
+                {
+                    "seed": 1166571977,
+                    "count": 120,
+                    "data": "PAIAlAMAAABqPA4AogIAAQCBBjwDAOcCABAA8AI8DgCYAwAOAIgGPAYAzQEAEgC0BTwFAI4EAAsAtAM8CwD0BQAQAPAEPAgArQMACwDqBTwOAIwCAAcAzwU8EgC5BQAPAHE8BQBsAAYAuwQ8DACiAwAFANEEPAIAuwQABwCQBDwAAN4EAAsAnQI8CgC8AgAPAOICPAEAnwQADwBAPAoASgAAAI4DPAMAkAEAEgCAATwSAKABAAQAiwY8EwBrABEAvwQ8EQCwBQABAJ4FPA0A0QQAEwCVATwLANQDAAEArQQ8BACYAgACAKYCPAoAhQIAAgD4BTwIAL8FAAwAlwM8EACwBQANAPwFPAYA1wMABADCAzwJAJUFAAYAqAU8BwBuABEA/wM8AACfBQAKAIYFPBEAgwMABAD9ATwJAO8FAAYA5wQ8BgDHAgAMAN0DPAgAlAIAAgCAAjwLAO4FABEA9QU8BAC+BAAJAG88DQDYAwAPAHk8BQCbAgAQAFw8DwCfAwAMAEU8CwC9BAAUAIcGPAsA1AMAEgC7ATwQAKQDAAUAlgE8DgC3BQAGAIMGPA0AnwEACQDvAzwPAOoDAA4AHzwFAPYDAAMAzQQ8EACmBQANAJIEPAMAmAMAAABSPAoA4gEADADSATwGANgCAAAA0AI8DQBpAA8A7gI8BQCHBgANAKIDPAcAjAUACgCIBjwIAMgEAAsAmQE8BADKBAASAJwDPBEArgUABQDGBDwNANsCABAAjQU8EgCnBQASAJQBPAgAgAMADwDMAw=="
+                },
+                {
+                    "seed": 1881553267,
+                    "count": 120,
+                    "data": "PAEAqQUAAQAbPAQA0AUAAADgATwUAPcFAAAAwAI8AwCxAwAFAIMCPA0AbgALANEFPAsAgAQABwB0PAcAtwIABACABjwIAMkFAAUA9AM8DACyAQAHACQ8CwCUBAAJAJEDPBQAhgEABwCaAzwNAMQFAAYA/QE8EgCWAQACAIkFPAoA8wEAEgCMBTwCANcFAAoAygU8AgCcBAAQAPYDPAwAGQANANMCPAMAjgQACADiBTwTAJ4EAAQAiAE8BgC+AQAGAPoFPAUAFwALAIQGPAwA1AQABwD0AzwLAIMEAAIAtAU8BwDNAgAOAIkFPA4APQAKAP0BPBIAlgQAEQB6PA4A6QUADgDTAjwGAJQEAAoAxAQ8BwCNAwAPAF88AgCwBQAEAP4BPBMAsgQAEgDTAzwAAOwBAAQAjAI8CQDNBQACAD88CgCCAgAUAM0DPBMArgEAFACsBTwIAMUEAAYAVTwAALoEAAYA1gE8BwA6AAkAygE8AQDMBAAMANkCPA4AnQUAEAD5BTwIACwAEgDtAzwMAIEFAAQAhwY8DwD6AgAJAIIGPBQAhAQACgDRATwQAIEEAAAAqgI8DACpBAAGAI0CPA0A8QEADQDgBDwAANkDABEAvQI8FACKBAAPANEBPA4AkwQAAgDvBTwTAPADAAEAiAM8DACmBAAAAMQEPAoAkgMACgChATwIAI0FAAMA5gE8AgDsAgAEAMoEPAEArgMAAQBNPA4AdwARAKEFPAMAXgAUAPMFPBQA9AIABgC9AzwKAJwDAAQAuwE="
+                },
+                {
+                    "seed": 1081821763,
+                    "count": 120,
+                    "data": "PBQA3AUADQC0BDwMAM8EAAQA3gM8BQCIAQAKAOYCPA4AugUAFACmATwJANsDAAIAoQE8DgBQABQAiAU8DADFBQAMAKADPAsAKgAEAPsBPAYAOQANAPgCPAIAtQIAAwCaAjwQAK4CAA0AhwU8BwB0AAgA7AI8AgCnAwABAKQFPAMA2QIABQB6PBMAgAMAEwCEAzwJAKABAAMAfDwOANMCAAsA8gE8EgCpAgATALYEPBAA7wMADADGBDwRANoDABAAZTwRAJ4EAAIA4wM8FABvAAYA0wU8AQCLBQAPAIoDPBIAgAMAEgCxBTwGAJgEAAQAFzwAAOEBABMA7wM8EgD4AgAQAIwFPA4AwgEABABEPA8ArQQADwAoPBEA+wEABQBLPBIA9gEAAgCTBTwCAPABAAsA4wE8AwDNAwARAOABPAEA2wIABQCpAzwUAPUFABIAkwQ8AwCjAgACAPoDPAEA3gIABgD3ATwFAPADAAUAogE8BADHAQAHAPMDPAUAPwAFAK8DPAsAyQUADwD7ATwRAPoDAAcAygM8EQDkBAALAIMCPAUAhAYAEACxBDwEAIgBAA4AgwI8BgBOAAsAxwQ8DADWBQAPAF88BwCqAQAOACw8AQBnABMAzAM8DQDPAwAJALQDPBAA2gEAAwD4BDwCAMIBAAcApAI8AACIBQARAPcDPAsAhwMADgDmAzwRAKsCAA4AWTwDAKkBAAUA6gQ8FACgAgADAPwFPAgA8AQAAgCVBTwFAPcFABQAtgM8EwC/BAAIAFs="
+                }
+            ],
+            "2-1": [
+                {
+                    "seed": 601248287,
+                    "count": 120,
+                    "data": "PA4AaAAUAKsFPAUA6AMABgCIAjwTAMgCABEAyAQ8DwDwBQAIAJMBPBIApwIADwCZBTwSAL4CAA8AoAI8BACrBQAGALEDPAgAogMADADEAjwEAFwABADIBDwCAKoCAAEAWzwMANoBAAwAzAI8AgD2AgAEAM8BPAgA1gQADgDYBDwRAIMGABMA8gM8CACQBQAJAHw8EgDbBAANANUCPBQA3wIACgBEPAYAbgAOALUEPAMA0wIACQA4PAwAzQUAAgB0PA0AtAIACQDvAzwQAIQEAAkA6gQ8EADsAgAAAJwEPAoAzAMADwDJAjwLAOYDAAcAvwU8EwDmAQAFANEEPAQA5QEAAwBNPA4AvQUADwBdPAUAowEAEgCFBTwBAJMEAAIAqwU8EwDeBAAEAPUFPBAAtgQABADJBDwOAJsCAA4AhAQ8AwCmBQAMAGI8CAC/AgAAAMYCPBQA9gIABwBaPAUA5AIABwD9BDwRANMCABIA7gM8FABNAAoA9gM8FAC/AQAKAOwCPAwASwANAPIDPAUAGQAUAO0FPAcAjwEABgCQATwEAOEBAAkAjwM8DwCtAQAMAOYDPAEAOwAPAIYDPBIApgMAAwDeBTwHAPoDAAoAlwU8AADzAQAHAIIFPAoA3wUAAgDuBTwQAMoEAAoA4AI8BgClAQAUAKoBPBIAwQQACwDvAjwPAOkEAAYA4AI8DwCXBAATALgEPA8A8wIAFACdAjwFAEkAAADZAzwIAP0CAA0AmQI8AgDlAgAJAO0DPAMAlwQAAwCBAQ=="
+                },
+                {
+                    "seed": 1247145716,
+                    "count": 120,
+                    "data": "PBEAtQIABACVAzwJAMEEABAAjwQ8AwCxAQARANwDPAQAGQAPAEI8BwCHAQAJAJQFPA8AlgIAAQChBDwUAJgBAAwA4wM8DwDfAQAKAKEFPAAAHAAEAKMEPAsAtwIAEwCHAjwHALADAA4AmAI8EACIBQAEAJ4FPA8ARQAUADQ8DgBDAAoAhwQ8EAC2AgAQAIwEPA8ANwAEAK4EPBIAjQMAAQDoAzwGAPgBAAMA1AQ8CgCpBAAPAMwEPBAA9AUACQDSATwBAOsBAAQARjwCABgACACIATwCAMMEABAAtgM8CACIAwATAMgEPBMApgQADwDBAzwCANwDAAUAgAM8EgCABAAEAJQCPBMA+gIAAwClATwUAEYADwDiAzwLAIMFAAwA9AQ8BACbAQAAAJ4BPBQAjwMABADCBDwOAIwCAA8AvwU8DgA5AAsA4gI8AQCqAwAEANsCPAcA4gEAEgD4AjwHAJwDAAQAowE8CQD0BAAQAI0FPBAA1AQAEgCeAzwSAGcAFAAePAYApgQAEgCiATwDALgEAAIAigE8FAC2AgAFAI8BPAwArgMABAC4ATwQAIsEAAIAjAQ8BgCYBQAHAM0DPAcAogMACQC9AjwFAPABAAYA/QM8AQDWBAADAPUEPBMA4gEAEgC3ATwGANoFAAQA5gM8DgCzAwAUAIMFPAQAvgMACADRAzwPAKQEAAsArgQ8EwD1AQAJAFY8DAD7AwAUABs8AwBNAAkAzQU8CQCcBQALAPMCPA8AogQAAwCWBDwUAKMFAAcAoAI="
+                },
+                {
+                    "seed": 1403768662,
+                    "count": 120,
+                    "data": "PAQA5QEABwCKBDwJAEYADAAhPA4AvQUAAgCmBDwLANsDAAcAngQ8AgDnBQAFAIwDPA8A3AQADgD+BTwPAIkCAA4AWjwBAHoAAwDbAjwHAJwCABIA1wE8BQDZBAASAMAFPAQA9gIAEgDSBDwPAF0AEADwAzwHAKoFAA4A2QQ8EgC3AwAOAPsBPAQAwgQACwC2ATwHAEAADwCVAzwFAPQBAAgAiwU8AwDBAQAAALQFPAUAjQEACgCuAzwGAKgFABMApQU8AADPAwAIAIYCPAQA/wEACACJBjwFAKoBAAMA8AE8BwClAgADAP8BPBIAmQMAAQDnBTwIANMEAA0AVTwAAIEFAAAANTwSAJQFAAMAugE8AACHBQAJALAFPBAAngQAAwDNAzwEAPECAA0AgwI8BQCgBAAPACA8AAAzAA8A9wM8EwCsAgASANsDPA8ARAAGAOIEPAIAoQQAFADHAjwDAI8EAAkA+wM8CgDgAQAHAIIFPAQA7wQAAQCHBDwDAP8EABQA8QU8CACbBQAGAO4FPBMAvQUABACxBTwNAPoDABQAkQM8CwCxAwASAPYBPAAAYQABACI8DACPBQADAMIEPA4AbwAKAOsEPAcAswMAAQCPATwDAIkBABMA+QQ8DgCQBQASAKsEPAoAiwMACgA1PAsAhQUAAwC6BTwLAP8CAAUA0AI8CgD6AwARAJcEPAIAfwACAIIGPAAAiQUAAAD5BTwPAOABAAIA9QU8EgC5AQANALIFPAYA1gUAAgCQATwQAGkAEADiAw=="
+                },
+                {
+                    "seed": 1278123863,
+                    "count": 120,
+                    "data": "PAoAiwUADQDTBDwCAIwFAAgAwgU8CwBzAAgA5gM8BADAAgAUAOMCPA8A1AQABQDiBTwFAF0ACQCtBTwIAOECAAYA9QI8AQDLAQACAJ4BPAcAxAEADgCVAzwLAOABAA4A/wE8EwCLAwAOAMoCPAQA1gIAAAC1ATwGALADAAIAjgE8CwCjAQADAD08BgCRBAAMAOYFPAIAtgIAAgA1PAwA0QEACwDrAzwAAOoDAAAAqgI8DQDPBAAKAPEBPAcA4wIADQBtPBIAugMACACIAjwEAOgBAAsA1gM8BAC8AgACABQ8CQCaAwATAFg8EgDjAQAIAOwDPBIA9gIADQDbAjwTACQAEADtBTwIAIUCABMA3wQ8BwBwAAsALjwCANEFABIA6wQ8DQBUAAEA0AU8DwCoAQAEANkFPBAAvAIAEQCiAjwMAI4FAAcA+AQ8DwCGBAAEAM4EPAMAfgAEADA8DgDlAgAHAMgFPA0AwQQADADXAzwTAL4DAAMApwQ8DwDDBQAUAJkDPA4AqwIACADgAzwLAKIEAA0AoQE8EgDlAQAUANYCPAUAugIADADsATwUAIMBAAcAjwE8DQCDBAAUALYEPAYAtQUADACuAzwRAOYBAAUAnAU8DwCjBQAFAJADPA0A9wIABwDnATwUAJ8BAAkAhQY8EABqABQAqAM8AgDTBQAMAIYGPA4AxwMAAADYAzwBAGgADwDlATwJAIcDAAsAODwHALQCAAsA3wE8AwDvAwADAPMDPAAATQAOAIECPAwAiQQAEQBA"
+                }
+            ],
+            "2-2": [
+                {
+                    "seed": 531818920,
+                    "count": 120,
+                    "data": "PAUAlAMAAABRPAMA+wEADgCRAjwNALICAAAAqgI8FABJABEA3QI8EwDyBAAOALwFPBMAuwMADwCrBDwIAMkDAAwA/wE8EgD+BQABAOwCPAoA1gEACgCvBDwRAIkGAAkAmgU8CADJAgAPANQDPAwAhgIACwDoAjwCAPcDABAA5wE8DADbAwASAK0CPAoAygIAFACHAzwCANIFAAIApQI8DADOAwAGAOYBPAUA8QEACwDrBTwDAKYCABAAmQU8BACZAQADANUEPAAA5wQAAgD1ATwJAO4BABMA+gQ8EgDsAgAFAPoCPA0AmAUAAACIBTwOANoEABQAFTwIAOwEAAkAGjwKAJMFABIAsQI8AACTAgAUABk8DAD7AwAEAL0EPAIArAMAEACoBTwNALgFAAUAuAM8AACvBAAGACI8AQCrAwAMAIEBPA8AjAEADwDTAzwPAD4ACwC0AzwMAIsFAAEAKjwAAIMCAAwAoQE8EwD3BQAEAPwBPBIA4QUAAQAZPAgA+AQADAD+AzwSAOIBABQAoQM8FADABAAHAIYDPBQATgABANsDPAUAiwQACwCYAzwFAPADAAsAkgM8EgC1AwABAK0CPA4A5wUADgCZAjwNAP0CAAUA0wM8BAA7AAsAwAI8EACfAwAOANgDPBIA1QUABgC/AjwOANEEABMAvAU8AADTBQARAKUEPAQA3gUABwD7BTwSAPMCAA8A7QI8AwCCAQAMAOYDPAMAuQIABgCzAzwRAJIBABMA4gI8EwCCAwAUAJMBPBQAsAMAAgCaBA=="
+                },
+                {
+                    "seed": 362275195,
+                    "count": 120,
+                    "data": "PBEATAAJAM8EPAAA1wIADwC8ATwBANoBABEA5wE8DAD+AwADAPECPA4AQwAJAPcFPAEAKAAOAJoBPA0AkgMAEgCDBjwPAHkAAQCJBTwRAJADAAoAtgU8DgC+BQARAKQDPBMA7gEACwCqAjwQAFIACgBmPBAAqAIACACbATwLADgAAACAAzwFAMwBAAQAxAQ8BwC2AQAJAJYEPAIAjgUAAwCKAjwEALgCAAUA7gI8FACLBgARAOkDPA4AsAUACAC0AjwEAIwEABAA7QE8CADDBQANANcDPAgAwgIACQDgAjwJAOoBAAkAjQQ8CwClAgARALQBPBQAsgIAAACEATwDAGYAAADBBTwNAJwFAAwAzgU8AADgBAADABw8AwDJBQAIAPgEPBEAxgEABADuATwJAD4ADQCxBDwSAKwDAA8AoQE8AQBHAAEAhAE8BADqAwAFAKoCPAEA/wUABwDzBTwRANEEAAoAgwE8DgDEAgABAKUBPAAAFAAGAIAFPBQAlgEADgAaPBQAuQMABgD1BTwIAJoCAA8AoQI8CgCgBAAGAH08BgC7AwAJANADPA8AYQAHAFI8EwD6BAAGAJgDPAQAmwUACgDoAjwPAOQEAA8A2gI8AAC2AwAGAOUCPBIAygUACQCCAjwIAKgDAAIAJTwRANgBAA4AmwI8BgAaAAUA4QE8DgC3BAAKAKwEPBEA2wQAEwDlAzwFAJQEAAUA+wI8CACFBgASAL4BPAwAlgMAEQCSAjwIAP0BAAUAHjwNANwDAAoA/AQ="
+                },
+                {
+                    "seed": 1571499175,
+                    "count": 120,
+                    "data": "PBMAkgEAAAD0AzwKAJgDAAUAsgE8BQCkBAAOAMkBPBMA7AUAEACCBjwUAGQACgCVAzwDAMMDAA0AaTwEALAFABEAezwSAJoFAA4AwgE8FACfBQASAIYBPAgAcwAJAHs8DgCmBQAFAOwDPAMApgIACgB8PAMA9wUAFADUAjwCAKUFAAkA8gM8BgCoAgAGALwBPAIAcQAKAKAFPAoAgAQAAwCbBDwTAIoDABIAmwM8AgC2BAANAJcCPAsArAUAEwBvPAwA3QMADQCtBTwGAJQCAAMAgAQ8BQCKBQAOAJkBPBAAkwIAAADKAzwFAJEBAAYAcTwMADYABgCDATwKAOwBAAcAhQI8DwAhABQAngI8BgDUAwADALUFPBIA6QEABgCyBTwBAN4EAAMA2AI8BAD5AwAIAO4BPA4AlgQAEACAAzwHAJIBABQAhgY8CgAqAAgAYzwDAFsAAgDOBDwBAM0BABIApQE8BgCCAQAQAM8FPAwAkAQAEgDoAzwSAKsBABQA6gM8BACGAQAPAKUFPAsAGAAPAM0FPAwAtAUABACsAzwIAJUDABQA5gM8EgCfBAARAKsBPAoA2AIAEgCeAzwHANMCAAkAxgM8BACdAQAPAIgCPAkAjAIABgCSBTwPALUEAAMAwQI8DAAkAA8AuQE8FACHAwAOALMFPBEAuwUADgBoPAsAoAMAAgCFBTwIAKIDAAwATDwCAJQFAAYAkAI8AwCoBAAIANUEPAQA8QUAAwDpAjwLABsACABAPAwA8gMACwDhBA=="
+                },
+                {
+                    "seed": 268958283,
+                    "count": 120,
+                    "data": "PAYAygMABAD7BDwOAPIBAAAA/QQ8EgCoAwAIAMMDPAgAdQAFAFc8EACWAQAHAI4BPA4AmgUABwDyBDwNAJ4FAAMA7AI8EQDVAwAEAFc8AgBOAAQAwAQ8AACMBAADAIMBPAMAgQEACADtBTwAAIwEAAoAuwM8BwCfBQAMAJcFPAAA7gEABQCJBDwOAPEEABIAlQU8AgCbAgATAJcEPA0ApAQAAQCkATwFAK8FAAMAwgM8EwDRAwAUAOkFPBAA2gUAFADTBDwRAIAEAAcAhwI8DABfAA8AogM8AAA8ABQA4gI8DwDCAgALAK8DPA0ApwUADwDbAzwEAJ8FAAMA4wE8AADQBAACAP0CPBIA0AMAAwCaBTwMAD4AFADMAjwQAPQCAAoAwwE8AgBnAA8AbDwFAEEABAD/ATwGAJkBABIAhgM8DgDZAQAMAPACPBQAkwEADADFATwSAI0FAAAAywU8EACsBQAEANMEPBAAzAMAFAC8AjwSABcAEAD7BTwQAMsCAAgAUDwEALkEABEAkQI8AgCtAgAQAPMCPAkA+QQABgA4PBAAzwIACACvBDwUAOgFAAUAHTwCALsEABIAhgE8AgC/BQANACI8CADGAQAPAPQBPBQAZwAMABQ8CQC3BAALAMcDPAoArgQACgC3BDwSAE8ACADLBDwHAIoFABMAxgI8AADwAgACANACPBEAgAQAEQDXAjwRANoFAAkAmAU8CADHBQAQANgFPA4ArQIABAAcPAYA6QQAEwCCBTwUAJ8BABQAgAY="
+                }
+            ],
+            "3-2": [
+                {
+                    "seed": 634131339,
+                    "count": 120,
+                    "data": "PAQA4AMADADDAjwHAOoDAAgAxAQ8BADMBAARAI8EPAIA5QMADADEAjwTAD8ACwCeBTwHAKACAAgA5wM8BQCBBgANAP0CPBQA1gMACQCjBDwQABoADQAwPBIA9wQAEgDjAzwOAJwCAA8AhQM8CQD1AQAEAKoEPA8A5gMADAD0BTwAAIECAAIA3QM8FAD/AwAMALsBPAYA9gUADgCEAjwEAIUCAAIA3QE8DgC7BAADACo8CADNAwABANsFPAYA/AUAFADFATwSAJYBAA4AhwM8EAChBAAEAIgBPAYAKQACAL0CPAMA8wMABwD+AjwDAPcFAAsAigY8BADfAQARAPADPA0A7wEACACxAzwPAPQFAAMAsAQ8BwBJABQAkwE8AAD1AQAOAOICPAgAsQMAAgDABTwDALQFAAwAlQU8EwCVAgAJAOYCPAQAvwUACwDjBTwAAKIBAA8AwwQ8EACGAwAAAJ8FPAcASAANAIsCPAwAjAMAEgDXBTwGAJgDAA4AgAM8CACLBAAFAJMBPA4AiwQABwCuBDwRAJsBAAYAVDwCAOIFAAYA4AE8EwDaAwAAANcEPA0A6wUACgC0BTwSAIAEAA4AlwU8BwDhAQAJAPYBPAcA+wQACQDhBDwHAMUBAA0AuwU8BADnAwASAPwDPBAA1gQABQCnAzwAAJUBABQAngE8BwDTBAAKAMkBPAIA4AUADgC0BDwTAIIDAAUA0wE8DQDcBQAOAOkBPBIApwQAFACeBTwSAOoEAAcA0gE8CAD+AQAPAP0BPBIAdwAFAOkC"
+                },
+                {
+                    "seed": 123568514,
+                    "count": 120,
+                    "data": "PAQAHQAKANsEPBAAuAUACQCQBDwAAJcEAAUALzwCAJcDABEA4QU8BAD4BAAJALoDPAMA0QIADgCLBTwIAPMCAAEAGTwRAGwABgDaAzwQAO8EAAQAzAM8EwDtAgARANUBPBIA0gUAAwCWAjwGAPEFABMAwAI8AQC1AgAMAKQDPAUApgUABQBJPAIA9wQAAACuBDwUADQAAwCPATwSAP0BAAoA5AI8BQCBAgAAAN8EPA8A5AIACACZATwRAMAEAAoAnwQ8AQCwBQATAGg8EADZBQAUAO4DPAwAiAUABADSAjwGAKYFAA4AnQE8FAC5AQAKAMQEPBMA6QUADgCaATwQAIQDAAcAwgE8EgDFBAAHAP4BPAcAxgUAEgCqBDwOAMoDAAUA4wQ8CQD1BAARALgCPBAA5gIAAgDVBDwIAIEGABAAigQ8AQC2AgAFACA8EADNAwABAPsBPAMAhgQAEACzAzwDAIMFAAQAKTwUAD4ADADCBDwBAJ4FAAwAgwE8CgCAAwAPAIwBPBEAvwIADQDdAzwGAJkBABAA/QM8EQCfAQAHAKsCPA4ANQAKAMgEPA8AtgIAAQDAATwPAD0AEgC6AzwAAPkCAA0A6gI8CwCRAwAFAPACPBIAGwAAANUEPAQAxwMAEwDMBTwTAOwDABEA6gE8BwDZAgAAAPoEPAkAbQAPAJQFPAUAPAAHAKcFPAwAiAMABwDxAzwAAPsBAAcAsAI8EADdBAABAOMFPAcA+AMADADiAjwLALwFABQArgI8CgDSAQARAEc="
+                },
+                {
+                    "seed": 1502734252,
+                    "count": 120,
+                    "data": "PAQAqgEAEwCAAjwMAN0BAA4AyQQ8AQD7AQANALsBPAQAggUADQClAzwIAPAEAAUA0AI8DwDSBAAGANkDPAcAhQIADAD+BTwCAOYCAA8AwgU8AwDsAQAMAPwBPBIA6wMACAAYPAMAwgQACgCEBDwRAMcCAAIAgAM8AgCLBQAIAI8BPA8AlAMAEQCMAjwGANMEABQAGTwMADgABAC3AjwMAG8ABwDhBTwQAOUBAAwA7wU8EADmAgAFAOQEPAQA4QEAEABIPAQAoQQADQDwATwMALEEAAsArwQ8AgDHBQAJAJEEPAwAsgUABAD3BDwDAP0EAAUA6gQ8DwD5AgARANcBPAwAtwMAAgDEATwNAM4DAA8AhgU8AAChBAAJAFA8DgDjAwAAANkFPA4AjAUACQCIAzwMANkBABIA8wQ8EwCTAgAJAN0EPAcAXQATAJ0EPAoAkgIAEwCtAjwPAIUBAAwAowI8BQDGAQAHAMcFPBEArwIACACXAjwQANsFABMAlQM8EQBtABQAlQQ8CAAaAAUApgQ8CwDUAwATAOQFPAsAvwMABwDPATwPAJEFAAwA4wI8AADNBQATAO0FPAkA3wMAAwCzATwUACEADAChATwFAI8FABQAlQE8DADfAQATANIFPBMA1wIABwCHBjwTAIoCAAgAlQM8BwCtAgASANMBPA0AegAUAOQFPA0AzgUADgCbATwUAIEBAAcA5wQ8AgCBBAAJAN0BPAMA3gIABQDKBDwQAPQFAA8AmQM8AAA9AAoA3wE8EQDBBQADAK0E"
+                },
+                {
+                    "seed": 1577565900,
+                    "count": 120,
+                    "data": "PAoAnwMADwBXPAQA7gQAAADOAjwHAOkDAAUA2QU8BACNAwAKAL0FPBIA2AUAFAAmPBIA1QQAFACwAjwPAOIEAA8AhQU8AADdBAAEAJkBPAAAnwMADQDNBDwLALYBABAANDwSAJcEAAwAjgU8AACJBAALAMwDPAsAcQAQANMCPAYA9gMADgDCBDwFALwDABEA1AM8EQCgAQAEAGg8AgCDBAAJALYFPAAAhgYAAgCOAjwFAFgADwCTATwGAIABAAEAgAI8BQB8AAQAuQU8EACBBgASAMMEPAgAuQIABwCUAjwMAG0ACgDhAzwOANABABEAqAQ8CwCaBQAFANUEPAgAtwMABwDyBTwFAJYCABQA7wE8CwDSAwACAO4EPAsAzgQABQCkAzwTAOYFABEAKTwPAMkBAAYA2wM8AgCYAQAFAPwFPA8AjwIACgCxAzwOABgACQCABTwTANsEAAwAvQM8AwDJAwAUANUCPBAA8AQAEwDsAzwPAJUFABAAkQI8EgB8ABIA7wM8DwCOAwAHAK8DPBIAkQMACQDZAzwLANQBAAcAlQE8BwDiAgARAKoBPAsA9AIACADGBTwCAIcCAAUAZDwDAMsFAAUAswM8BwCbAgAHAPgBPAoATAANANkFPAQAVAAJAJYEPBMA4wEABgCjAzwUAPwDAAsAmgU8DwC7AQAFAGQ8FABRAAsArwE8DACMAQAJAN0CPAIA5AMAAACxBDwSAEUAEACZATwUAMUFAAUAcjwQAHcAEgCGBjwAAEcADgDrAg=="
+                }
+            ],
+            "3-3": [
+                {
+                    "seed": 307052867,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 556721158,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 923419113,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 626522578,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "4-3": [
+                {
+                    "seed": 2061000614,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 812210574,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 187796477,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1586889043,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "5-3": [
+                {
+                    "seed": 369121960,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 961769592,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 236908960,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1877285235,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "5-4": [
+                {
+                    "seed": 186318325,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 363764423,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 827470515,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 640869681,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "6-4": [
+                {
+                    "seed": 379329965,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 899940049,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1311594176,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 384873708,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "7-4": [
+                {
+                    "seed": 1858392045,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1873704688,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1502065359,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1599836876,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "8-4": [
+                {
+                    "seed": 365518782,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 2045846882,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1719827301,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 981002122,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "9-4": [
+                {
+                    "seed": 562319023,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 25230686,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 269354877,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 695549483,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "9-5": [
+                {
+                    "seed": 1996688065,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 843143571,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 819931660,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1661163618,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "10-5": [
+                {
+                    "seed": 662351564,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 508381925,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1736952231,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 1835853254,
+                    "count": 0,
+                    "data": ""
+                }
+            ],
+            "11-5": [
+                {
+                    "seed": 1807271958,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 943429339,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 578176007,
+                    "count": 0,
+                    "data": ""
+                },
+                {
+                    "seed": 35709237,
+                    "count": 0,
+                    "data": ""
+                }
+            ]
         }
     }
 };
+const GAME_BALANCE_VERSION = "01d7d057c234";
@@ -18,19 +18,21 @@ window.SoundManager = {
     currentBgmKey: null,
     _loadingKeys: {},
 
-    // SE Pooling (HTML5 Audio for simplicity & compatibility)
+    // SE: オーディオスプライト (js/sound_sprite.js) を1回だけ取得・デコードし、区間を再生する。
+    // スプライトが無い / 取得できない (file:// など) 場合は従来どおり HTML5 Audio のプールで再生する。
+    spriteBuffer: null,
     SES: {
-        CLICK: { url: 'sounds/click.wav', poolSize: 5, pool: [] },
-        BUY: { url: 'sounds/buy.wav', poolSize: 5, pool: [] },
-        SHOOT: { url: 'sounds/shoot.wav', poolSize: 10, pool: [] },
-        HIT: { url: 'sounds/hit.wav', poolSize: 10, pool: [] },
-        MISSILE: { url: 'sounds/missile.wav', poolSize: 5, pool: [] },
-        EXPLOSION: { url: 'sounds/explosion.wav', poolSize: 10, pool: [] },
-        COLLECT: { url: 'sounds/collect.wav', poolSize: 10, pool: [] },
-        ERROR: { url: 'sounds/error.wav', poolSize: 3, pool: [] },
-        UPGRADE: { url: 'sounds/upgrade.wav', poolSize: 3, pool: [] },
-        PLACE: { url: 'sounds/click.wav', poolSize: 5, pool: [] },
-        SELL: { url: 'sounds/buy.wav', poolSize: 5, pool: [] }
+        CLICK: { url: 'sounds/click.wav', sprite: 'click', poolSize: 5, pool: [] },
+        BUY: { url: 'sounds/buy.wav', sprite: 'buy', poolSize: 5, pool: [] },
+        SHOOT: { url: 'sounds/shoot.wav', sprite: 'shoot', poolSize: 10, pool: [] },
+        HIT: { url: 'sounds/hit.wav', sprite: 'hit', poolSize: 10, pool: [] },
+        MISSILE: { url: 'sounds/missile.wav', sprite: 'missile', poolSize: 5, pool: [] },
+        EXPLOSION: { url: 'sounds/explosion.wav', sprite: 'explosion', poolSize: 10, pool: [] },
+        COLLECT: { url: 'sounds/collect.wav', sprite: 'collect', poolSize: 10, pool: [] },
+        ERROR: { url: 'sounds/error.wav', sprite: 'error', poolSize: 3, pool: [] },
+        UPGRADE: { url: 'sounds/upgrade.wav', sprite: 'upgrade', poolSize: 3, pool: [] },
+        PLACE: { url: 'sounds/click.wav', sprite: 'click', poolSize: 5, pool: [] },
+        SELL: { url: 'sounds/buy.wav', sprite: 'buy', poolSize: 5, pool: [] }
     },
 
     BGM_PATHS: {
@@ -51,10 +53,17 @@ window.SoundManager = {
                 this.bgmGainNode = this.ctx.createGain();
                 this.bgmGainNode.connect(this.ctx.destination);
                 this.bgmGainNode.gain.value = this.masterVolume * 0.5;
+                this.seGainNode = this.ctx.createGain();
+                this.seGainNode.connect(this.ctx.destination);
+                this.seGainNode.gain.value = this.masterVolume * 0.4;
 
                 console.log("[SoundManager] Web Audio API Initialized");
 
-                this.initPools(); // SE Pools
+                if (typeof SOUND_SPRITE !== 'undefined' && window.location.protocol !== 'file:') {
+                    this.loadSprite();
+                } else {
+                    this.initPools(); // SE Pools
+                }
 
                 // Start loading all BGMs
                 this.loadAllBGM();
@@ -121,6 +130,25 @@ window.SoundManager = {
         if (this.currentBgmKey === key) this.playBGM(key, true);
     },
 
+    async loadSprite() {
+        try {
+            const res = await fetch(SOUND_SPRITE.url);
+            if (!res.ok) throw new Error(`Fetch error: ${res.status}`);
+            this.spriteBuffer = await this.ctx.decodeAudioData(await res.arrayBuffer());
+            console.log(`[SoundManager] SE sprite decoded: ${SOUND_SPRITE.url}`);
+        } catch (e) {
+            console.warn(`[SoundManager] SE sprite failed (${e.message}). Using HTML5 Audio pools.`);
+            this.initPools();
+        }
+    },
+
+    // HTML5 プールの音量。スプライトは音ごとに音量を揃えてある (SOUND_SPRITE の gain) ので、
+    // 元の WAV を鳴らす時も同じ倍率をかけてどちらの経路でも同じ大きさにする (volume は 1 まで)
+    seVolume(se) {
+        const region = typeof SOUND_SPRITE !== 'undefined' && SOUND_SPRITE.sounds[se.sprite];
+        return Math.min(1, this.masterVolume * 0.4 * ((region && region.gain) || 1));
+    },
+
     initPools() {
         Object.keys(this.SES).forEach(key => {
             const se = this.SES[key];
@@ -128,7 +156,7 @@ window.SoundManager = {
             se.pool = [];
             for (let i = 0; i < (se.poolSize || 3); i++) {
                 const audio = new Audio(se.url);
-                audio.volume = this.masterVolume * 0.4;
+                audio.volume = this.seVolume(se);
                 audio.preload = 'auto';
                 se.pool.push(audio);
             }
@@ -142,11 +170,14 @@ window.SoundManager = {
         if (this.bgmGainNode) {
             this.bgmGainNode.gain.setTargetAtTime(val * 0.5, this.ctx.currentTime, 0.1);
         }
+        if (this.seGainNode) {
+            this.seGainNode.gain.setTargetAtTime(val * 0.4, this.ctx.currentTime, 0.01);
+        }
         // Update HTML5 BGM
         Object.values(this.bgmObjects).forEach(a => { if (!a.paused) a.volume = val * 0.5; });
         // Update HTML5 SE Pools
         Object.values(this.SES).forEach(se => {
-            se.pool.forEach(a => a.volume = val * 0.4);
+            se.pool.forEach(a => a.volume = this.seVolume(se));
         });
     },
 
@@ -232,7 +263,18 @@ window.SoundManager = {
     play(key) {
         if (!this.enabled || this.masterVolume <= 0) return;
         const se = this.SES[key];
-        if (!se || !se.pool) return;
+        if (!se) return;
+
+        const region = this.spriteBuffer && SOUND_SPRITE.sounds[se.sprite];
+        if (region) {
+            if (this.ctx.state === 'suspended') this.ctx.resume();
+            const source = this.ctx.createBufferSource();
+            source.buffer = this.spriteBuffer;
+            source.connect(this.seGainNode);
+            source.start(0, region.offset, region.duration);
+            return;
+        }
+        if (!se.pool) return;
 
         let audio = se.pool.find(a => a.paused);
         if (!audio) {
@@ -243,7 +285,7 @@ window.SoundManager = {
             }
         }
         if (audio) {
-            audio.volume = this.masterVolume * 0.4;
+            audio.volume = this.seVolume(se);
             audio.play().catch(e => { });
         }
     }
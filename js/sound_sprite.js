@@ -0,0 +1,55 @@
+// Automatically generated by tools/build_audio_sprite.py
+const SOUND_SPRITE = {
+    "url": "sounds/sfx.38d3545c0e.wav",
+    "hash": "38d3545c0e",
+    "rate": 44100,
+    "channels": 2,
+    "bytes": 626648,
+    "sounds": {
+        "buy": {
+            "offset": 0.0,
+            "duration": 0.290385,
+            "gain": 1.1717
+        },
+        "click": {
+            "offset": 0.340385,
+            "duration": 0.078662,
+            "gain": 1.3774
+        },
+        "collect": {
+            "offset": 0.469048,
+            "duration": 0.49093,
+            "gain": 1.7728
+        },
+        "error": {
+            "offset": 1.009977,
+            "duration": 0.120385,
+            "gain": 0.6154
+        },
+        "explosion": {
+            "offset": 1.180363,
+            "duration": 0.736599,
+            "gain": 0.6761
+        },
+        "hit": {
+            "offset": 1.966961,
+            "duration": 0.022948,
+            "gain": 0.575
+        },
+        "missile": {
+            "offset": 2.039909,
+            "duration": 0.6178,
+            "gain": 1.4477
+        },
+        "shoot": {
+            "offset": 2.70771,
+            "duration": 0.056576,
+            "gain": 0.781
+        },
+        "upgrade": {
+            "offset": 2.814286,
+            "duration": 0.687891,
+            "gain": 1.2923
+        }
+    }
+};
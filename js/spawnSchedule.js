@@ -0,0 +1,97 @@
+/**
+ * 敵の出現スケジュール (GAME_BALANCE_DATA.SPAWN_SCHEDULES, tools/spawn_schedules.py がビルド時に生成)
+ * ステージ × 星数ごとにシード付きで引いておいた出現表を、依頼の seed でバリエーションを選んで先頭から順に進める。
+ * 同じステージ・星数・seed なら毎回同じ敵が同じ位置に出る (index.html?seed=123 で seed を固定できる)。
+ * 表は base64 の符号なし LEB128 で届くので、初めて使う時に配列に展開してキャッシュする。
+ */
+const SpawnSchedule = {
+    timelines: {},
+
+    // 依頼の距離以上で一番短いステージ (無ければ最後)
+    stageFor: (distance) => {
+        const stages = GAME_BALANCE_DATA.SPAWN_SCHEDULES.stages;
+        for (let i = 0; i < stages.length; i++) {
+            if (stages[i][1] >= distance) return stages[i][0];
+        }
+        return stages[stages.length - 1][0];
+    },
+
+    // { frames, enemies, patterns, x } (frames は表の先頭からのフレーム数)
+    decode: (entry) => {
+        const bytes = atob(entry.data);
+        const values = [];
+        let v = 0, shift = 0;
+        for (let i = 0; i < bytes.length; i++) {
+            const b = bytes.charCodeAt(i);
+            v += (b & 0x7f) * Math.pow(2, shift);
+            if (b & 0x80) {
+                shift += 7;
+            } else {
+                values.push(v);
+                v = 0; shift = 0;
+            }
+        }
+        const n = entry.count;
+        const timeline = {
+            frames: new Int32Array(n), enemies: new Uint16Array(n), patterns: new Uint16Array(n), x: new Float32Array(n)
+        };
+        let frame = 0;
+        for (let i = 0; i < n; i++) {
+            frame += values[i * 4];
+            timeline.frames[i] = frame;
+            timeline.enemies[i] = values[i * 4 + 1];
+            timeline.patterns[i] = values[i * 4 + 2];
+            timeline.x[i] = values[i * 4 + 3];
+        }
+        return timeline;
+    },
+
+    // seed (負の値もありうる) -> バリエーションの添字。Python の % と同じく 0..count-1 (spawn_schedules.variant_index)
+    variantIndex: (seed, count) => ((seed % count) + count) % count,
+
+    // 依頼の出現カーソル。SPAWN_SCHEDULES が無い (古い settings_data.js) か表が無ければ null
+    start: (mission) => {
+        const schedules = GAME_BALANCE_DATA.SPAWN_SCHEDULES;
+        if (!schedules) return null;
+        const forced = new URLSearchParams(window.location.search).get('seed');
+        if (forced !== null) mission.seed = parseInt(forced, 10) || 0;
+        if (mission.seed === undefined) mission.seed = Math.floor(Math.random() * 0x7fffffff);
+        if (mission.stage === undefined) mission.stage = SpawnSchedule.stageFor(mission.distance || 0);
+
+        const key = `${mission.stage}-${mission.stars || 1}`;
+        const variants = schedules.timelines[key];
+        if (!variants || variants.length === 0) return null;
+        const variant = SpawnSchedule.variantIndex(mission.seed, variants.length);
+        const cacheKey = `${key}/${variant}`;
+        if (!SpawnSchedule.timelines[cacheKey]) {
+            SpawnSchedule.timelines[cacheKey] = SpawnSchedule.decode(variants[variant]);
+        }
+        console.log(`[SpawnSchedule] Stage ${mission.stage} ★${mission.stars || 1} seed ${mission.seed} (variant ${variant})`);
+        return { timeline: SpawnSchedule.timelines[cacheKey], period: schedules.period, index: 0, base: 0 };
+    },
+
+    // frame までに出る敵を順に callback(enemyId, mpId, x) に渡す (表の最後まで来たら period 後ろから繰り返す)
+    advance: (cursor, frame, callback) => {
+        const t = cursor.timeline;
+        const n = t.frames.length;
+        if (n === 0) return;
+        const schedules = GAME_BALANCE_DATA.SPAWN_SCHEDULES;
+        while (cursor.base + t.frames[cursor.index] <= frame) {
+            const i = cursor.index;
+            callback(schedules.enemies[t.enemies[i]], schedules.patterns[t.patterns[i]], t.x[i]);
+            if (++cursor.index === n) {
+                cursor.index = 0;
+                cursor.base += cursor.period;
+            }
+        }
+    },
+
+    clearCache: () => {
+        SpawnSchedule.timelines = {};
+    }
+};
+
+// 出現表の入れ替え (ホットリロード) は次の依頼から反映する
+if (typeof BalancePatch !== 'undefined') {
+    BalancePatch.onApply(() => SpawnSchedule.clearCache());
+}
@@ -0,0 +1,40 @@
+// スプライトアトラス (tools/build_atlas.py が生成する js/sprite_atlas.js の SPRITE_ATLAS を使う)
+// フレームは余白をカット済みなので、draw() は描画先の矩形 (元画像全体の位置) にオフセットを戻して描く。
+window.SpriteAtlas = {
+    pages: [],
+
+    load() {
+        if (typeof SPRITE_ATLAS === 'undefined') return;
+        this.pages = SPRITE_ATLAS.pages.map(page => {
+            const img = new Image();
+            img.src = page.file;
+            return img;
+        });
+    },
+
+    has(name) {
+        if (typeof SPRITE_ATLAS === 'undefined') return false;
+        const frame = SPRITE_ATLAS.frames[name];
+        const page = frame && this.pages[frame.page];
+        return !!(page && page.complete && page.naturalWidth > 0);
+    },
+
+    // モデル名 (Enemies シートの Model) に対応するフレーム名の一覧
+    modelFrames(model) {
+        if (typeof SPRITE_ATLAS === 'undefined') return [];
+        return SPRITE_ATLAS.models[model] || [];
+    },
+
+    // (x, y, w, h) は元画像全体を描く矩形。描けなければ false を返す (呼び出し側でフォールバック)
+    draw(ctx, name, x, y, w, h) {
+        if (!this.has(name)) return false;
+        const frame = SPRITE_ATLAS.frames[name];
+        const sx = w / frame.size.w;
+        const sy = h / frame.size.h;
+        ctx.drawImage(this.pages[frame.page], frame.x, frame.y, frame.w, frame.h,
+            x + frame.trim.x * sx, y + frame.trim.y * sy, frame.trim.w * sx, frame.trim.h * sy);
+        return true;
+    }
+};
+
+SpriteAtlas.load();
@@ -0,0 +1,242 @@
+// Automatically generated by tools/build_atlas.py
+const SPRITE_ATLAS = {
+    "pixelRatio": 1,
+    "pages": [
+        {
+            "file": "assets/atlas/sprites-0.04c123612d.png",
+            "w": 256,
+            "h": 256
+        }
+    ],
+    "frames": {
+        "EnemyShipS001": {
+            "page": 0,
+            "x": 35,
+            "y": 229,
+            "w": 29,
+            "h": 25,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 5.6,
+                "y": 9.2,
+                "w": 29.067,
+                "h": 25.467
+            }
+        },
+        "EnemyShipS002": {
+            "page": 0,
+            "x": 71,
+            "y": 225,
+            "w": 30,
+            "h": 28,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 5.2,
+                "y": 4.4,
+                "w": 29.733,
+                "h": 28.267
+            }
+        },
+        "EnemyShipS003": {
+            "page": 0,
+            "x": 0,
+            "y": 116,
+            "w": 39,
+            "h": 36,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 0.4,
+                "y": 0.0,
+                "w": 38.667,
+                "h": 35.6
+            }
+        },
+        "EnemyShipS004": {
+            "page": 0,
+            "x": 71,
+            "y": 190,
+            "w": 26,
+            "h": 33,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 7.333,
+                "y": 4.267,
+                "w": 26.4,
+                "h": 33.067
+            }
+        },
+        "debris001": {
+            "page": 0,
+            "x": 39,
+            "y": 74,
+            "w": 35,
+            "h": 38,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 2.133,
+                "y": 0.8,
+                "w": 35.2,
+                "h": 38.267
+            }
+        },
+        "debris002": {
+            "page": 0,
+            "x": 0,
+            "y": 74,
+            "w": 37,
+            "h": 40,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 1.246,
+                "y": 0.0,
+                "w": 37.37,
+                "h": 39.562
+            }
+        },
+        "debris003": {
+            "page": 0,
+            "x": 0,
+            "y": 193,
+            "w": 33,
+            "h": 37,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 3.467,
+                "y": 0.933,
+                "w": 33.2,
+                "h": 37.067
+            }
+        },
+        "debris004": {
+            "page": 0,
+            "x": 0,
+            "y": 154,
+            "w": 36,
+            "h": 37,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 1.733,
+                "y": 1.2,
+                "w": 35.6,
+                "h": 37.467
+            }
+        },
+        "debris005": {
+            "page": 0,
+            "x": 38,
+            "y": 154,
+            "w": 33,
+            "h": 34,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 3.333,
+                "y": 2.933,
+                "w": 33.067,
+                "h": 34.4
+            }
+        },
+        "debris006": {
+            "page": 0,
+            "x": 74,
+            "y": 0,
+            "w": 34,
+            "h": 38,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 3.867,
+                "y": 1.067,
+                "w": 33.6,
+                "h": 38.267
+            }
+        },
+        "debris007": {
+            "page": 0,
+            "x": 35,
+            "y": 193,
+            "w": 34,
+            "h": 34,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 3.2,
+                "y": 2.8,
+                "w": 34.267,
+                "h": 34.267
+            }
+        },
+        "debris008": {
+            "page": 0,
+            "x": 41,
+            "y": 114,
+            "w": 32,
+            "h": 34,
+            "size": {
+                "w": 40,
+                "h": 40
+            },
+            "trim": {
+                "x": 3.867,
+                "y": 2.667,
+                "w": 32.0,
+                "h": 34.267
+            }
+        },
+        "playership01": {
+            "page": 0,
+            "x": 0,
+            "y": 0,
+            "w": 72,
+            "h": 72,
+            "size": {
+                "w": 80,
+                "h": 80
+            },
+            "trim": {
+                "x": 0.0,
+                "y": 0.0,
+                "w": 72.429,
+                "h": 72.328
+            }
+        }
+    },
+    "models": {
+        "EnemyShip": [
+            "EnemyShipS001",
+            "EnemyShipS002",
+            "EnemyShipS003",
+            "EnemyShipS004"
+        ]
+    }
+};
@@ -108,7 +108,7 @@ class ShipEditor {
             } else {
                 const p = data.equippedParts.find(p => p.id === partId);
                 if (!p) return;
-                if (GridManager.isValidPlacement(data, p.type, r, c, partId)) {
+                if (GridManager.isValidPlacement(data, p.type, r, c, data.equippedParts.indexOf(p))) {
                     p.r = r; p.c = c;
                     SaveManager.save(this.data);
                     this.engine.renderGridUI();
@@ -112,7 +112,7 @@
     }
 
     // Generate Table
-    GAME_SETTINGS.PART_UPGRADE_TABLE = (() => {
+    const buildPartUpgradeTable = () => {
         const table = {};
 
         // Merge definitions (Weapons + Parts + Player Stats Placeholders)
@@ -207,6 +207,15 @@
         Object.assign(GAME_BALANCE_DATA.UPGRADE_TABLE, table); // Merge so Engine's getVal finds it
 
         return table;
-    })();
+    };
+
+    GAME_SETTINGS.PART_UPGRADE_TABLE = buildPartUpgradeTable();
+
+    // 分割形式のデータでは PART_TEMPLATES / UPGRADE_TABLE が後から届くので、届いた時点で作り直す
+    if (typeof BalanceLoader !== 'undefined') {
+        BalanceLoader.onLoad('PART_TEMPLATES', () => {
+            GAME_SETTINGS.PART_UPGRADE_TABLE = buildPartUpgradeTable();
+        });
+    }
 
 })();
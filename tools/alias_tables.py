@@ -0,0 +1,96 @@
+"""
+Walker / Vose の alias 法によるサンプリングテーブル
+
+重み付き抽選 (ドロップ・天候・ミッションの星数) を、ランタイムで乱数1回 + 配列参照2回の
+O(1) で引けるように、ビルド時に alias テーブルへ変換する。
+
+出力形式 (JSON):
+    {"values": [...], "prob": [...], "alias": [...]}
+
+JS 側の引き方 (settings.js の pickAlias):
+    u = Math.random() * n; i = u | 0;
+    (u - i) < prob[i] ? values[i] : values[alias[i]]
+"""
+
+def build_alias(values, weights):
+    """Vose's alias method. Returns {"values", "prob", "alias"} or None when there is nothing to draw.
+
+    Outcomes with zero weight are dropped (they can never be drawn).
+    """
+    pairs = [(v, float(w)) for v, w in zip(values, weights) if w > 0]
+    if not pairs:
+        return None
+    values = [v for v, _ in pairs]
+    total = sum(w for _, w in pairs)
+    n = len(pairs)
+    scaled = [w * n / total for _, w in pairs]
+
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = (scaled[l] + scaled[s]) - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    # 残りは浮動小数点誤差で 1.0 付近に残ったもの
+    for i in small + large:
+        prob[i] = 1.0
+        alias[i] = i
+
+    return {"values": values, "prob": prob, "alias": alias}
+
+def alias_probabilities(table):
+    """The exact distribution an alias table draws from: {value: probability}."""
+    n = len(table["values"])
+    result = {}
+    for i, value in enumerate(table["values"]):
+        result[value] = result.get(value, 0.0) + table["prob"][i] / n
+        other = table["values"][table["alias"][i]]
+        result[other] = result.get(other, 0.0) + (1.0 - table["prob"][i]) / n
+    return result
+
+# --- Source distributions (the runtime's previous sampling rules) ---
+
+def cumulative_percent_distribution(weights, default):
+    """Distribution of the runtime's cumulative scan over integer percentages.
+
+    `rand = Math.floor(Math.random() * 100)` picks the first key with rand < cumulative sum;
+    when no key is hit the result is `default`. Entries past 100% are unreachable.
+    Returns (values, probabilities) including the `default` fall-through.
+    """
+    values, probs = [], []
+    cum = 0
+    for value, weight in weights.items():
+        lower = min(cum, 100)
+        cum += weight
+        upper = min(max(cum, lower), 100)
+        values.append(value)
+        probs.append((upper - lower) / 100)
+    rest = 1.0 - sum(probs)
+    if rest > 1e-12:
+        values.append(default)
+        probs.append(rest)
+    return values, probs
+
+def drop_distribution(drops):
+    """Distribution of one drop lottery, or None if the rates can't form one draw (sum > 1).
+
+    Each entry keeps its own rate; the remainder is `None` (no drop).
+    """
+    total = sum(d["rate"] for d in drops)
+    if total > 1.0 + 1e-9:
+        return None
+    values = [d["id"] for d in drops] + [None]
+    probs = [d["rate"] for d in drops] + [max(0.0, 1.0 - total)]
+    return values, probs
+
+def merge_outcomes(values, probs):
+    """Sums probabilities of repeated outcomes (e.g. the same item listed twice)."""
+    merged = {}
+    for v, p in zip(values, probs):
+        merged[v] = merged.get(v, 0.0) + p
+    return list(merged.keys()), list(merged.values())
@@ -0,0 +1,171 @@
+"""
+GAME_BALANCE_DATA の差分パッチ (ホットリロード用)
+
+前回ビルドと今回ビルドの GAME_BALANCE_DATA を構造ごとに比較し、変わったパスだけを
+JSON Patch (RFC 6902 の add / replace / remove, パスは JSON Pointer) にする。
+
+    {"op": "replace", "path": "/ENEMIES/EnemyS003/hp", "value": 120}
+
+比較はキー単位: dict は同じキーどうし、レコードの配列 (ID / Level などのキーを持つ dict の配列) は
+キーの並びが同じなら同じ位置どうしを比べ、並びが変わった配列は丸ごと置き換える。等しい部分木は
+== (C 実装) で1回で読み飛ばすので、変更の無いセクションの中までは降りない。
+
+update_settings.py が settings_data.js を書くたびに前回との差分を js/settings_patch.js に追記し
+(直近 HISTORY_LIMIT 件)、ゲーム側の js/balancePatch.js (index.html?hot) がそれを読み込んで
+実行中の GAME_BALANCE_DATA をその場で書き換える。パッチには前後のバージョン
+(GAME_BALANCE_VERSION) が付いているので、途中のビルドを読み逃しても順に当てられる。
+
+    python tools/balance_patch.py old/settings_data.js js/settings_data.js   # 2つのビルドの差分を表示
+"""
+import argparse
+import json
+import math
+import os
+import time
+from collections.abc import Mapping
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PATCH_JS_PATH = os.path.join(BASE_DIR, "../js/settings_patch.js")
+HISTORY_PATH = os.path.join(BASE_DIR, ".build_cache", "balance_patches.json")
+HISTORY_LIMIT = 20
+# レコードの配列のキーとみなす列 (先頭から順に、全要素が一意な値を持つ最初のもの)
+KEY_FIELDS = ("ID", "id", "Level", "DTID", "StatType", "name")
+
+# --- Diff ---
+
+def pointer(path):
+    """JSON Pointer for a path of keys / indices ('~' and '/' escaped)."""
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in path)
+
+def parse_pointer(text):
+    return [p.replace("~1", "/").replace("~0", "~") for p in text.split("/")[1:]]
+
+def _same_leaf(a, b):
+    if type(a) is not type(b) and (isinstance(a, bool) or isinstance(b, bool)):
+        return False
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return a == b
+
+def record_keys(items):
+    """Key of each record in a list of dicts, or None if the list is not keyed."""
+    if not items or not all(isinstance(item, Mapping) for item in items):
+        return None
+    for field in KEY_FIELDS:
+        keys = [item.get(field) for item in items]
+        if None not in keys and len(set(map(repr, keys))) == len(keys):
+            return keys
+    return None
+
+def _diff(old, new, path, ops):
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": pointer(path + [key]), "value": value})
+                continue
+            before = old[key]
+            if before is not value and not (type(before) is type(value) and before == value):
+                _diff(before, value, path + [key], ops)
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": pointer(path + [key])})
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        if len(old) == len(new):
+            old_keys = record_keys(old)
+            if old_keys is None or old_keys == record_keys(new):
+                for i, (a, b) in enumerate(zip(old, new)):
+                    if a is not b and not (type(a) is type(b) and a == b):
+                        _diff(a, b, path + [i], ops)
+                return
+        ops.append({"op": "replace", "path": pointer(path), "value": new})
+        return
+    if not _same_leaf(old, new):
+        ops.append({"op": "replace", "path": pointer(path), "value": new})
+
+def diff(old, new):
+    """JSON Patch operations turning `old` into `new` (both {section: value})."""
+    ops = []
+    _diff(old, new, [], ops)
+    return ops
+
+def apply(data, ops):
+    """Applies the operations in place (the Python twin of BalancePatch.applyOps) and returns `data`."""
+    for op in ops:
+        path = parse_pointer(op["path"])
+        target = data
+        for part in path[:-1]:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        last = int(path[-1]) if isinstance(target, list) else path[-1]
+        if op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = op["value"]
+    return data
+
+def describe(op):
+    """ENEMIES.EnemyS003.hp style label of an operation."""
+    parts = parse_pointer(op["path"])
+    label = parts[0] if parts else ""
+    for part in parts[1:]:
+        label += f"[{part}]" if part.isdigit() else f".{part}"
+    return f"{op['op']} {label}"
+
+# --- History / settings_patch.js ---
+
+def load_history():
+    try:
+        with open(HISTORY_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+def record_patch(base, target, ops, chunks=None):
+    """Appends one build's patch to the history and rewrites js/settings_patch.js; returns its size in bytes."""
+    patch = {"base": base, "target": target, "ops": ops}
+    if chunks:
+        patch["chunks"] = chunks
+    # バージョンごとに出るパッチは1つだけにして、ゲーム側がたどる道筋を一意にする
+    history = [p for p in load_history() if p["base"] != base] + [patch]
+    history = history[-HISTORY_LIMIT:]
+    os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+    with open(HISTORY_PATH, "w", encoding="utf-8") as f:
+        json.dump(history, f, ensure_ascii=False)
+    with open(PATCH_JS_PATH, "w", encoding="utf-8") as f:
+        f.write("// Automatically generated by tools/update_settings.py (see tools/balance_patch.py)\n")
+        f.write("BalancePatch.receive(" + json.dumps({"version": target, "patches": history},
+                                                     ensure_ascii=False, separators=(",", ":")) + ");\n")
+    return len(json.dumps(patch, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+def print_patch(ops, limit=20):
+    for op in ops[:limit]:
+        value = f" = {json.dumps(op['value'], ensure_ascii=False)[:60]}" if "value" in op else ""
+        print(f"    {describe(op)}{value}")
+    if len(ops) > limit:
+        print(f"    ... {len(ops) - limit} more")
+
+def main():
+    from settings_store import parse_settings_js
+    parser = argparse.ArgumentParser(description="Show the JSON Patch between two settings_data.js builds")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--json", action="store_true", help="print the patch as JSON")
+    args = parser.parse_args()
+
+    old, new = parse_settings_js(args.old)[0], parse_settings_js(args.new)[0]
+    start = time.perf_counter()
+    ops = diff(old, new)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps(ops, ensure_ascii=False, indent=2))
+        return 0
+    size = len(json.dumps(ops, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    print(f"{len(ops)} change(s), {size:,} bytes, diffed in {elapsed * 1000:.2f} ms")
+    print_patch(ops, limit=len(ops))
+    if diff(apply(json.loads(json.dumps(old)), ops), new):
+        print("  patch does not reproduce the new build")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,19 @@
+"""
+ヘッドレス・バランスシミュレーター (engine.js の INGAME ループの NumPy 版)
+
+settings_data.js と同じ変換結果 (update_settings.load_excel_data) を読み、
+星数ごとに大量のミッションをバッチで回して生存率・クリア時間・収入を集計する。
+
+    cd tools
+    python -m balance_sim --missions 20000                    # 現在の engine.js の挙動
+    python -m balance_sim --rules intended --sub Missile      # 既知の不具合を直した想定
+    python -m balance_sim --stars 1 2 --policy top --level HP=20 --json sim_report.json
+
+モジュール:
+    data    変換結果 -> NumPy 配列 (SimData)
+    sim     1フレームごとのバッチ更新 (MissionBatch, simulate, RULES)
+    runner  プロセスプールでの実行と星数別レポート
+"""
+from .data import SimData
+from .runner import print_report, run, summarize
+from .sim import POLICIES, RULES, MissionBatch, simulate
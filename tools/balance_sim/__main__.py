@@ -0,0 +1,88 @@
+import argparse
+import json
+import os
+import sys
+
+from update_settings import load_excel_data
+
+from .data import SimData
+from .runner import print_report, run, summarize
+from .sim import POLICIES, RULES
+
+def parse_levels(items):
+    levels = {}
+    for item in items or []:
+        key, _, value = item.partition("=")
+        if not value:
+            raise SystemExit(f"--level expects KEY=LEVEL, got {item!r}")
+        levels[key] = int(value)
+    return levels
+
+def parse_rules(preset, items):
+    rules = dict(RULES[preset])
+    for item in items or []:
+        key, _, value = item.partition("=")
+        if key not in rules or key == "passes" or value not in ("0", "1"):
+            raise SystemExit(f"--rule expects NAME=0|1 with NAME in "
+                             f"{', '.join(k for k in rules if k != 'passes')}, got {item!r}")
+        rules[key] = value == "1"
+    return rules
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m balance_sim",
+                                     description="Monte Carlo balance simulation of the in-game loop (engine.js)")
+    parser.add_argument("--stars", type=int, nargs="+", default=[1, 2, 3, 4, 5])
+    parser.add_argument("--missions", type=int, default=4096, help="missions per star count")
+    parser.add_argument("--batch", type=int, default=1024, help="missions simulated together in one process")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--rules", choices=sorted(RULES), default="engine")
+    parser.add_argument("--rule", action="append", metavar="NAME=0|1",
+                        help="override one flag of the --rules preset, e.g. sheet_stat_rows=1 (repeatable)")
+    parser.add_argument("--policy", choices=POLICIES, default="hold")
+    parser.add_argument("--main", default="BeamGun", help="main weapon (WEAPONS ID)")
+    parser.add_argument("--sub", default=None, help="sub weapon (Missile / Bomb)")
+    parser.add_argument("--level", action="append", metavar="KEY=LEVEL",
+                        help="UPGRADE_TABLE level, e.g. HP=10 (repeatable)")
+    parser.add_argument("--loot-range", type=float, default=None, help="override the pickup radius (Collector)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-frames", type=int, default=72000, help="give up after this many frames (20 min)")
+    parser.add_argument("--json", help="write the per-star report to this file")
+    args = parser.parse_args()
+
+    data = load_excel_data()
+    if not data:
+        return 1
+    sd = SimData(data)
+    unknown = [s for s in args.stars if s not in sd.difficulty]
+    if unknown:
+        print(f"No DIFFICULTY_PARAMS for stars {unknown}")
+        return 1
+    empty = [s for s in args.stars if len(sd.spawn_pool(s)) == 0]
+    if empty:
+        print(f"Note: no enemies in the spawn tier for stars {empty} (spawnDebris spawns nothing)")
+
+    loadout = {"main": args.main, "sub": args.sub, "levels": parse_levels(args.level), "loot_range": args.loot_range}
+    try:
+        sd.weapon(args.main), sd.weapon(args.sub)
+    except ValueError as e:
+        print(e)
+        return 1
+
+    rules = parse_rules(args.rules, args.rule)
+    jobs = args.jobs or os.cpu_count() or 1
+    results, wall = run(data, args.stars, args.missions, loadout, rules, args.policy, args.seed,
+                        args.batch, jobs, args.max_frames)
+    report = {stars: summarize(sd, r) for stars, r in results.items()}
+    changed = {k: v for k, v in rules.items() if RULES[args.rules][k] != v}
+    print(f"rules={args.rules}{f' {changed}' if changed else ''} policy={args.policy} loadout={loadout}")
+    print_report(report, wall, jobs)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"rules": rules, "policy": args.policy, "loadout": loadout, "seed": args.seed,
+                       "stars": report}, f, ensure_ascii=False, indent=2)
+        print(f"Report written to {args.json}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+シミュレーション用のデータ展開
+
+update_settings.load_excel_data() の変換結果 (settings_data.js と同じ dict) を、
+バッチ計算しやすい NumPy 配列 (敵 ID・アイテム ID を添字にした表) に詰め替える。
+フィールドの読み方 (キー名・フォールバック値) は Enemy.js / Item.js / engine.js と揃えてある。
+"""
+import numpy as np
+
+from movement_patterns import KIND_PATH, decode_wave
+from spawn_schedules import decode_timeline, stage_for, variant_index
+
+CANVAS_WIDTH = 800
+CANVAS_HEIGHT = 600
+
+# engine.js / settings.js の固定値
+BASE_LERP = 0.1
+SPAWN_INTERVAL = 60
+MISSION_DIVISOR = 2000
+MISSILE_COOLDOWN = 60
+BASE_LOOT_RANGE = 40
+BASE_WEAPON_DAMAGE = 10
+BULLET_SPEED = 7
+
+# ENEMY_WEAPONS.ShotAngle
+ANGLE_DOWN = 0
+ANGLE_AIM = 1
+ANGLE_FAN = 2
+ANGLE_SPRAY = 3
+ANGLE_SPIRAL = 4
+ANGLE_MODES = {"AimPlayer": ANGLE_AIM, "Fan": ANGLE_FAN, "RandomSpray": ANGLE_SPRAY, "Spiral": ANGLE_SPIRAL}
+
+# アイテムの種類 (collectItem の分岐)
+ITEM_NONE = 0      # meta が見つからない ID (何も起きない)
+ITEM_MATERIAL = 1
+ITEM_BUFF = 2
+ITEM_HEAL = 3
+ITEM_MONEY = 4
+ITEM_STAT = 5
+ITEM_TYPES = {"BUFF": ITEM_BUFF, "HEAL": ITEM_HEAL, "MONEY": ITEM_MONEY, "STAT": ITEM_STAT}
+
+BUFFS = ["POWER", "COOLDOWN", "SPEED", "INVINCIBLE"]
+BUFF_POWER, BUFF_COOLDOWN, BUFF_SPEED, BUFF_INVINCIBLE = range(len(BUFFS))
+
+def _num(value, default):
+    """JS の `value || default` (0 / 空 / undefined は default)."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return float(default)
+    return value if value and not np.isnan(value) else float(default)
+
+class SimData:
+    """Balance data as flat arrays, indexed by enemy type / drop table / item / star."""
+
+    def __init__(self, data):
+        self.data = data
+        self.physics = data.get("PHYSICS", {})
+        self.player = data.get("PLAYER", {})
+        self.weapons = data.get("WEAPONS", {})
+        self.upgrade_table = data.get("UPGRADE_TABLE", {})
+        self._build_items()
+        self._build_drop_tables()
+        self._build_enemies()
+        self._build_missions()
+        self._build_weather()
+        self.schedules = data.get("SPAWN_SCHEDULES")
+        self.timelines = {}
+
+    # --- Items ---
+
+    def _build_items(self):
+        drop_items = self.data.get("DROP_ITEMS", {})
+        materials = self.data.get("MATERIALS", {})
+        ids = list(dict.fromkeys(list(drop_items) + list(materials)))
+        self.item_ids = ids
+        self.item_index = {item_id: i for i, item_id in enumerate(ids)}
+        n = len(ids)
+        self.item_kind = np.zeros(n, dtype=np.int8)
+        self.item_buff = np.full(n, -1, dtype=np.int8)
+        self.item_value = np.zeros(n)
+        self.item_duration = np.zeros(n)
+        # 素材の売却額 (MATERIALS.Value) は収入の参考値として別に集計する
+        self.item_price = np.zeros(n)
+        for i, item_id in enumerate(ids):
+            if item_id in drop_items:
+                meta = drop_items[item_id]
+                self.item_kind[i] = ITEM_TYPES.get(meta.get("Type"), ITEM_MATERIAL)
+                if meta.get("SubType") in BUFFS:
+                    self.item_buff[i] = BUFFS.index(meta["SubType"])
+                self.item_value[i] = float(meta.get("Value") or 0)
+                self.item_duration[i] = float(meta.get("Duration") or 0)
+            else:
+                self.item_kind[i] = ITEM_MATERIAL
+                self.item_price[i] = float(materials[item_id].get("Value") or 0)
+
+    def item(self, item_id):
+        """Item index for a drop ID; unknown IDs get their own ITEM_NONE slot (Item.js: meta = null)."""
+        if item_id not in self.item_index:
+            self.item_index[item_id] = len(self.item_ids)
+            self.item_ids.append(item_id)
+            self.item_kind = np.append(self.item_kind, ITEM_NONE)
+            self.item_buff = np.append(self.item_buff, -1)
+            for name in ("item_value", "item_duration", "item_price"):
+                setattr(self, name, np.append(getattr(self, name), 0.0))
+        return self.item_index[item_id]
+
+    # --- Drop tables ---
+    # DROP_ALIAS にあるテーブル (Exclusive) は1回の抽選で alias を1回引く (-1 = no drop)。
+    # それ以外は engine.js と同じく項目ごとに独立して判定する (drop_rate / drop_items)
+
+    def _build_drop_tables(self):
+        tables = self.data.get("DROP_TABLES", {})
+        aliases = self.data.get("DROP_ALIAS", {})
+        self.drop_ids = list(dict.fromkeys(list(tables) + list(aliases)))
+        self.drop_index = {dtid: i for i, dtid in enumerate(self.drop_ids)}
+        n = max(len(self.drop_ids), 1)
+        width = max((len(t["values"]) for t in aliases.values()), default=1)
+        self.drop_exclusive = np.zeros(n, dtype=bool)
+        self.drop_n = np.ones(n, dtype=np.int64)
+        self.drop_prob = np.ones((n, width))
+        self.drop_alias = np.zeros((n, width), dtype=np.int64)
+        self.drop_values = np.full((n, width), -1, dtype=np.int64)
+        entries = max((len(t) for t in tables.values()), default=1)
+        self.drop_rate = np.zeros((n, entries))
+        self.drop_items = np.full((n, entries), -1, dtype=np.int64)
+        for i, dtid in enumerate(self.drop_ids):
+            table = aliases.get(dtid)
+            if table is not None:
+                k = len(table["values"])
+                self.drop_exclusive[i] = True
+                self.drop_n[i] = k
+                self.drop_prob[i, :k] = table["prob"]
+                self.drop_alias[i, :k] = table["alias"]
+                self.drop_values[i, :k] = [-1 if v is None else self.item(v) for v in table["values"]]
+            else:
+                drops = tables[dtid]
+                self.drop_rate[i, :len(drops)] = [d["rate"] for d in drops]
+                self.drop_items[i, :len(drops)] = [self.item(d["id"]) for d in drops]
+
+    # --- Enemies ---
+
+    def _build_enemies(self):
+        enemies = self.data.get("ENEMIES", {})
+        tables = self.data.get("MOVEMENT_TABLES", {"waves": [], "patterns": {}})
+        weapons = self.data.get("ENEMY_WEAPONS", {})
+
+        self.waves = [decode_wave(w) for w in tables["waves"]]
+        # 最後の行は揺れ無し (wave = -1 がそのまま引ける)
+        self.wave_length = np.array([len(w) for w in self.waves] + [1], dtype=np.int64)
+        self.wave_table = np.zeros((len(self.waves) + 1, int(self.wave_length.max())))
+        for i, w in enumerate(self.waves):
+            self.wave_table[i, :len(w)] = w
+
+        self.enemy_ids = list(enemies)
+        self.enemy_index = {eid: i for i, eid in enumerate(self.enemy_ids)}
+        n = max(len(enemies), 1)
+        f = lambda: np.zeros(n)
+        self.en_hp, self.en_shield, self.en_speed, self.en_turn = f(), f(), f(), f()
+        self.en_kind = np.full(n, KIND_PATH, dtype=np.int8)
+        self.en_vx, self.en_vy, self.en_ampx, self.en_ampy = f(), f(), f(), f()
+        self.en_wave = np.full(n, -1, dtype=np.int64)
+        self.en_armed = np.zeros(n, dtype=bool)
+        self.en_cooltime, self.en_shot_speed, self.en_shot_damage = f(), f(), f()
+        self.en_shot_num = np.ones(n, dtype=np.int64)
+        self.en_angle_mode = np.zeros(n, dtype=np.int8)
+        self.en_drop = np.full(n, -1, dtype=np.int64)
+        self.en_drop_count = np.ones(n, dtype=np.int64)
+
+        self.patterns = tables["patterns"]
+        for i, (eid, row) in enumerate(enemies.items()):
+            # Enemy.js constructor
+            self.en_hp[i] = _num(row.get("hp"), 10)
+            self.en_shield[i] = float(row.get("shield") or 0)
+            self.en_speed[i] = _num(row.get("speed"), 2)
+            self.en_turn[i] = _num(row.get("turn"), 2)
+            mpid = row.get("movementPattern") or row.get("mpId") or "MPID001"
+            p = self.pattern(mpid)
+            self.en_kind[i] = p["kind"]
+            self.en_vx[i], self.en_vy[i] = p["vx"], p["vy"]
+            self.en_ampx[i], self.en_ampy[i] = p["ampX"], p["ampY"]
+            self.en_wave[i] = p["wave"]
+
+            # handleFiring: 武器が見つからなければ撃たない
+            eqid = row.get("eq") or row.get("eqId") or "EQID001"
+            wpn = weapons.get(eqid)
+            if wpn:
+                self.en_armed[i] = True
+                self.en_cooltime[i] = _num(wpn.get("Cooltime"), 60)
+                self.en_shot_speed[i] = _num(wpn.get("Speed"), 5)
+                self.en_shot_damage[i] = _num(wpn.get("Damage"), 10)
+                self.en_shot_num[i] = int(_num(wpn.get("ShotNum"), 1))
+                self.en_angle_mode[i] = ANGLE_MODES.get(wpn.get("ShotAngle") or "AimPlayer", ANGLE_DOWN)
+
+            # Enemy.js は dropTable / dtId を読む (シートの dropTableId は参照されず DropDT001 になる)
+            dtid = row.get("dropTable") or row.get("dtId") or "DropDT001"
+            self.en_drop[i] = self.drop_index.get(dtid, -1)
+            self.en_drop_count[i] = int(_num(row.get("dropCount"), 1))
+
+        tier_index = self.data.get("DEBRIS", {}).get("TIER_INDEX", {})
+        self.tier_enemies = {tier: np.array([self.enemy_index[e] for e in ids if e in self.enemy_index], dtype=np.int64)
+                             for tier, ids in tier_index.items()}
+
+    def pattern(self, mpid):
+        """MOVEMENT_TABLES.patterns[mpid] (MovementTables.get falls back to straight down)."""
+        return self.patterns.get(mpid) or {"kind": KIND_PATH, "vx": 0, "vy": 1, "ampX": 0, "ampY": 0, "wave": -1}
+
+    # --- Spawn schedules ---
+
+    def spawn_timeline(self, distance, stars, seed):
+        """Spawn timeline a mission uses (SpawnSchedule.start) as arrays, or None (nothing spawns).
+
+        Keys: frames (within one period), type (enemy index), x, and the movement fields of each entry's MPID.
+        """
+        stage = stage_for(self.schedules["stages"], distance)
+        variants = self.schedules["timelines"].get(f"{stage}-{stars}") or []
+        if not variants:
+            return None
+        key = (stage, stars, variant_index(seed, len(variants)))
+        if key not in self.timelines:
+            entries = [e for e in decode_timeline(variants[key[2]], self.schedules) if e[1] in self.enemy_index]
+            patterns = [self.pattern(e[2]) for e in entries]
+            self.timelines[key] = {
+                "frames": np.array([e[0] for e in entries], dtype=np.int64),
+                "type": np.array([self.enemy_index[e[1]] for e in entries], dtype=np.int64),
+                "x": np.array([e[3] for e in entries], dtype=np.float64),
+                "kind": np.array([p["kind"] for p in patterns], dtype=np.int8),
+                "vx": np.array([p["vx"] for p in patterns], dtype=np.float64),
+                "vy": np.array([p["vy"] for p in patterns], dtype=np.float64),
+                "ampx": np.array([p["ampX"] for p in patterns], dtype=np.float64),
+                "ampy": np.array([p["ampY"] for p in patterns], dtype=np.float64),
+                "wave": np.array([p["wave"] for p in patterns], dtype=np.int64),
+            } if entries else None
+        return self.timelines[key]
+
+    # --- Missions ---
+
+    def _build_missions(self):
+        mission = self.data.get("MISSION_DATA", {})
+        self.difficulty = {int(k): v for k, v in mission.get("DIFFICULTY_PARAMS", {}).items()}
+        self.weather_tables = mission.get("WEATHER_ALIAS", {})
+
+    def spawn_pool(self, stars):
+        """Enemy type indices spawnDebris picks from for a mission of `stars` (empty: nothing spawns)."""
+        tier = self.difficulty.get(stars, {}).get("enemyTier") or "Tier1"
+        return self.tier_enemies.get(tier, np.zeros(0, dtype=np.int64))
+
+    # --- Weather ---
+
+    def _build_weather(self):
+        weather = self.data.get("WEATHER", {})
+        self.weather_ids = list(weather) or ["CLEAR"]
+        self.weather_wind = np.array([float(weather.get(w, {}).get("WindX") or 0) for w in self.weather_ids])
+
+    def weather_alias(self, table_id):
+        """WEATHER_ALIAS[table] as index arrays (values -> weather index), or None."""
+        table = self.weather_tables.get(table_id)
+        if not table:
+            return None
+        values = np.array([self.weather_ids.index(v) if v in self.weather_ids else 0 for v in table["values"]])
+        return values, np.asarray(table["prob"]), np.asarray(table["alias"])
+
+    # --- Player ---
+
+    def upgrade_value(self, key, level):
+        """getVal() in initIngame: ValuePlus of the UPGRADE_TABLE row for `level` (0 when missing)."""
+        for row in self.upgrade_table.get(key, []):
+            if row.get("Level") == level:
+                return float(row.get("ValuePlus") or 0)
+        return 0.0
+
+    def weapon(self, weapon_id):
+        if weapon_id and weapon_id not in self.weapons:
+            raise ValueError(f"Unknown weapon {weapon_id!r} (WEAPONS: {', '.join(self.weapons)})")
+        return self.weapons.get(weapon_id) if weapon_id else None
@@ -0,0 +1,113 @@
+"""
+ミッションのモンテカルロ実行 (プロセスプール) と星数別レポート
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .data import ITEM_MATERIAL, ITEM_STAT, SimData
+from .sim import OUTCOME_CLEAR, OUTCOME_FAILED, OUTCOME_TIMEOUT, simulate
+
+# ワーカープロセスごとに1回だけ展開する
+_worker_data = None
+
+def _init_worker(data):
+    global _worker_data
+    _worker_data = SimData(data)
+
+def _run_chunk(stars, count, loadout, rules, policy, seed, max_frames):
+    return stars, simulate(_worker_data, stars, count, loadout, rules, policy, seed, max_frames)
+
+def merge_results(parts):
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+def run(data, stars_list, missions, loadout, rules="engine", policy="hold", seed=0,
+        batch=1024, jobs=None, max_frames=72000):
+    """Runs `missions` random missions per star count. Returns ({stars: results}, wall seconds)."""
+    chunks = []
+    for stars in stars_list:
+        for start in range(0, missions, batch):
+            chunks.append((stars, min(batch, missions - start)))
+    # 星数・チャンク番号ごとに独立した乱数列 (jobs を変えても結果が同じ)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    tasks = [(stars, count, loadout, rules, policy, s.generate_state(1)[0], max_frames)
+             for (stars, count), s in zip(chunks, seeds)]
+
+    jobs = jobs or min(len(tasks), os.cpu_count() or 1)
+    parts = {stars: [] for stars in stars_list}
+    start = time.perf_counter()
+    if jobs <= 1:
+        _init_worker(data)
+        for task in tasks:
+            stars, result = _run_chunk(*task)
+            parts[stars].append(result)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(data,)) as pool:
+            for stars, result in pool.map(_run_chunk, *zip(*tasks)):
+                parts[stars].append(result)
+    wall = time.perf_counter() - start
+    return {stars: merge_results(p) for stars, p in parts.items() if p}, wall
+
+def summarize(sd, results):
+    """Per-star summary: survival, time-to-clear, income, kills, drops."""
+    outcome = results["outcome"]
+    n = len(outcome)
+    clear = outcome == OUTCOME_CLEAR
+    frames = results["frames"]
+    income = results["income"]
+    real_minutes = np.maximum(frames, 1) / 60 / 60
+
+    kind = sd.item_kind[:results["collected"].shape[1]]
+    materials = results["collected"][:, kind == ITEM_MATERIAL]
+    material_value = (materials * sd.item_price[:results["collected"].shape[1]][kind == ITEM_MATERIAL]).sum(axis=1)
+    mat_ids = [i for i, k in zip(sd.item_ids, kind) if k == ITEM_MATERIAL]
+    stat_ids = [i for i, k in zip(sd.item_ids, kind) if k == ITEM_STAT]
+
+    def pct(values, q):
+        return float(np.percentile(values, q)) if len(values) else None
+
+    return {
+        "missions": n,
+        "frames": int(frames.sum()),
+        "survival": float(clear.mean()) if n else 0.0,
+        "failed": float((outcome == OUTCOME_FAILED).mean()) if n else 0.0,
+        "timeout": float((outcome == OUTCOME_TIMEOUT).mean()) if n else 0.0,
+        "clear_time": {
+            "mean": float(results["elapsed"][clear].mean()) if clear.any() else None,
+            "p50": pct(results["elapsed"][clear], 50),
+            "p90": pct(results["elapsed"][clear], 90),
+            "real_seconds_p50": pct(frames[clear] / 60, 50),
+        },
+        "target_time_mean": float(results["target_time"].mean()),
+        "income": {
+            "mean": float(income.mean()),
+            "p10": pct(income, 10),
+            "p90": pct(income, 90),
+            "per_minute": float(income.sum() / real_minutes.sum()),
+            "pickup_money": float(results["money"].mean()),
+            "material_value": float(material_value.mean()),
+        },
+        "kills": float(results["kills"].mean()),
+        "damage_taken": float(results["damage_taken"].mean()),
+        "materials": {i: float(v) for i, v in zip(mat_ids, materials.mean(axis=0)) if v},
+        "stat_items": {i: float(v) for i, v in zip(stat_ids, results["collected"][:, [sd.item_index[s] for s in stat_ids]].mean(axis=0)) if v},
+    }
+
+def print_report(report, wall, jobs):
+    total = sum(r["missions"] for r in report.values())
+    frames = sum(r["frames"] for r in report.values())
+    print(f"\n{'★':>2} {'missions':>9} {'survive':>8} {'fail':>6} {'t/o':>5} "
+          f"{'clear s p50':>11} {'p90':>7} {'target':>7} {'income':>9} {'p10':>8} {'p90':>8} "
+          f"{'/min':>8} {'kills':>6} {'mat $':>7}")
+    for stars, r in report.items():
+        ct, inc = r["clear_time"], r["income"]
+        fmt = lambda v, w, p=1: f"{v:>{w}.{p}f}" if v is not None else f"{'-':>{w}}"
+        print(f"{stars:>2} {r['missions']:>9,} {r['survival']:>8.1%} {r['failed']:>6.1%} {r['timeout']:>5.1%} "
+              f"{fmt(ct['p50'], 11)} {fmt(ct['p90'], 7)} {r['target_time_mean']:>7.1f} "
+              f"{inc['mean']:>9.1f} {fmt(inc['p10'], 8, 0)} {fmt(inc['p90'], 8, 0)} {inc['per_minute']:>8.1f} "
+              f"{r['kills']:>6.2f} {inc['material_value']:>7.1f}")
+    # missions/s は依頼の長さ (撃墜で早く終わるか) で大きく変わるので、フレーム数あたりの速さも出す
+    print(f"\n{total:,} missions in {wall:.2f}s ({total / wall:,.0f} missions/s, "
+          f"{frames / wall:,.0f} mission-frames/s = {frames / wall / 60:,.0f}x real time, {jobs} process(es))")
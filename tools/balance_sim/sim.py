@@ -0,0 +1,787 @@
+"""
+engine.js の INGAME ループ (update / updateEntities) をバッチ化した NumPy 実装
+
+同じ星数・同じ機体構成のミッション B 本を1フレームずつ同時に進める。
+敵・敵弾・ミサイル・アイテム・自機弾はミッションごとの固定幅スロット ([B, capacity] 配列) に入れ、
+足りなくなったら全行まとめて幅を倍にする。終わったミッションは結果を記録してから行ごと詰める。
+
+1フレームの処理順は engine.js と同じ:
+    update()          バフ減衰 → 速度 → (風) → 自機 Lerp → 距離 (0 でクリア) → 天候 → 射撃 → ミサイル発射
+    updateEntities()  自機弾 → アイテム → 敵スポーン → 敵 (移動・射撃・画面外・撃破ドロップ) → ミサイル/敵弾
+engine.js は updateEntities を1フレームに2回呼ぶので (RULES の passes)、敵の移動・スポーン判定・
+経過時間 (elapsedSeconds は1回につき 2/60 秒) もそのぶん進む。
+敵スポーンは SPAWN_SCHEDULES があればミッションの seed で選んだ出現表 (SpawnSchedule) をそのまま使うので、
+seed が同じならゲームと同じ敵が同じ位置・フレームに出る (無ければ spawnDebris と同じ乱数)。
+
+RULES["engine"] は現在の engine.js の挙動をそのまま再現する。"intended" は既知の不具合を直した場合の想定:
+    bullet_hits          自機弾が敵に当たる (engine.js には当たり判定が無く、ダメージ源はミサイル/ボムだけ)
+    take_damage          ダメージを Enemy.takeDamage で与える (シールド優先, HP 0 で即撃破・その場でドロップ)
+                         engine.js は hp を直接減らすだけなので、撃破数とドロップは残骸が画面外に出た時にしか数えない
+    invincible_buff      無敵バフが効く (takeDamage は buffs.INVINCIBLE > 0 を見るが、中身はオブジェクトなので常に偽)
+    enemy_weapon_damage  敵弾のダメージに ENEMY_WEAPONS.Damage を使う (engine.js は一律 10)
+    weather_wind         天候の WindX で自機が流される (engine.js は weather.wind を読むので常に 0)
+    part_weight          武器の Weight を機体重量に入れる (calculateBonuses は小文字の weight を読むので 0)
+    sheet_stat_rows      HP / ENGINE / ACCEL / BRAKE / WEAPON_OS の強化値をシートの ValuePlus から読む
+                         (upgrade_config.js が PARAM_CONFIG の行で UPGRADE_TABLE を上書きし ValuePlus が無くなるため、
+                          engine.js では maxHp が NaN になって撃墜されず、ENGINE / ACCEL の強化も効かない)
+"""
+import math
+
+import numpy as np
+
+from movement_patterns import KIND_HOMING, KIND_REFLECT
+
+from .data import (ANGLE_AIM, ANGLE_FAN, ANGLE_SPIRAL, ANGLE_SPRAY, BASE_LERP, BASE_LOOT_RANGE,
+                   BASE_WEAPON_DAMAGE, BUFF_COOLDOWN, BUFF_INVINCIBLE, BUFF_POWER, BUFF_SPEED, BULLET_SPEED,
+                   CANVAS_HEIGHT, CANVAS_WIDTH, ITEM_BUFF, ITEM_HEAL, ITEM_MATERIAL, ITEM_MONEY, ITEM_STAT,
+                   MISSILE_COOLDOWN, MISSION_DIVISOR, SPAWN_INTERVAL)
+
+RULES = {
+    "engine": {
+        "passes": 2,
+        "bullet_hits": False,
+        "take_damage": False,
+        "invincible_buff": False,
+        "enemy_weapon_damage": False,
+        "weather_wind": False,
+        "part_weight": False,
+        "sheet_stat_rows": False,
+    },
+    "intended": {
+        "passes": 2,
+        "bullet_hits": True,
+        "take_damage": True,
+        "invincible_buff": True,
+        "enemy_weapon_damage": True,
+        "weather_wind": True,
+        "part_weight": True,
+        "sheet_stat_rows": True,
+    },
+}
+
+# 自機の操作方針 (マウス目標位置)
+#   hold     初期位置 (400, 500) から動かない (マウスを動かさない場合の engine.js)
+#   top      画面上部 (速度 100% の帯) に移動して留まる
+#   collect  一番近いアイテムを追い、無ければ top と同じ位置で待つ
+POLICIES = ("hold", "top", "collect")
+TOP_TARGET = (CANVAS_WIDTH / 2, CANVAS_HEIGHT / 6)
+
+OUTCOME_TIMEOUT = 0
+OUTCOME_CLEAR = 1
+OUTCOME_FAILED = 2
+
+ENEMY_HALF_SIZE = 20     # Enemy.width / 2 (自機弾の当たり判定)
+PLAYER_HIT_RADIUS = 10
+ENEMY_SHOT_DAMAGE = 10
+MISSILE_HIT = 30
+BOMB_HIT = 40
+HOMING_RANGE = 300
+# upgrade_config.js の PARAM_CONFIG で UPGRADE_TABLE が上書きされるプレイヤーステータス
+PARAM_CONFIG_STATS = ("HP", "ENGINE", "ACCEL", "BRAKE", "WEAPON_OS")
+
+class Pool:
+    """Per-mission entity slots: `alive` plus one [missions, capacity] array per field."""
+
+    def __init__(self, rows, fields, capacity=8):
+        self.fields = fields
+        self.alive = np.zeros((rows, capacity), dtype=bool)
+        for name, dtype in fields.items():
+            setattr(self, name, np.zeros((rows, capacity), dtype=dtype))
+
+    @property
+    def capacity(self):
+        return self.alive.shape[1]
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        self.alive = np.pad(self.alive, ((0, 0), (0, extra)))
+        for name in self.fields:
+            setattr(self, name, np.pad(getattr(self, name), ((0, 0), (0, extra))))
+
+    def add(self, rows, **values):
+        """Adds one entity per entry of `rows` (a mission may get several). Returns the slot indices."""
+        if len(rows) == 0:
+            return rows
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        rank = np.empty(len(rows), dtype=np.int64)
+        rank[order] = np.arange(len(rows)) - np.searchsorted(sorted_rows, sorted_rows, side="left")
+
+        unique, inverse = np.unique(rows, return_inverse=True)
+        free = self.capacity - self.alive[unique].sum(axis=1)
+        need = np.bincount(inverse) - free
+        if need.max() > 0:
+            self._grow(max(self.capacity * 2, self.capacity + int(need.max())))
+        # 空きスロットが先頭に来るように並べ、各行の rank 番目の空きに入れる
+        free_slots = np.argsort(self.alive[unique], axis=1, kind="stable")
+        slots = free_slots[inverse, rank]
+        self.alive[rows, slots] = True
+        for name, value in values.items():
+            getattr(self, name)[rows, slots] = value
+        return slots
+
+    def trim(self, minimum=4):
+        """Drops trailing columns no mission uses (add() fills the lowest free slots first)."""
+        used = np.nonzero(self.alive.any(axis=0))[0]
+        capacity = max(int(used[-1]) + 1 if len(used) else 0, minimum)
+        if capacity < self.capacity // 2:
+            self.alive = np.ascontiguousarray(self.alive[:, :capacity])
+            for name in self.fields:
+                setattr(self, name, np.ascontiguousarray(getattr(self, name)[:, :capacity]))
+
+    def live(self):
+        """Flat indices of the live slots (into the raveled field arrays) and their mission rows."""
+        idx = np.flatnonzero(self.alive)
+        return idx, idx // self.capacity
+
+    def get(self, name, idx):
+        return getattr(self, name).ravel()[idx]
+
+    def put(self, name, idx, value):
+        getattr(self, name).ravel()[idx] = value
+
+    def kill(self, idx):
+        self.alive.ravel()[idx] = False
+
+    def keep_rows(self, keep):
+        self.alive = self.alive[keep]
+        for name in self.fields:
+            setattr(self, name, getattr(self, name)[keep])
+
+ENEMY_FIELDS = {
+    "type": np.int64, "x": np.float64, "y": np.float64, "hp": np.float64, "shield": np.float64,
+    "time": np.int64, "cooldown": np.float64, "kind": np.int8,
+    "vx": np.float64, "vy": np.float64, "ampx": np.float64, "ampy": np.float64, "wave": np.int64,
+    "rvx": np.float64, "rvy": np.float64,
+}
+SHOT_FIELDS = {"x": np.float64, "y": np.float64, "vx": np.float64, "vy": np.float64,
+               "life": np.int64, "dmg": np.float64}
+MISSILE_FIELDS = {"x": np.float64, "y": np.float64, "vx": np.float64, "vy": np.float64,
+                  "life": np.int64, "dmg": np.float64, "bomb": bool, "range": np.float64}
+ITEM_FIELDS = {"item": np.int64, "x": np.float64, "y": np.float64, "vx": np.float64, "vy": np.float64,
+               "life": np.int64}
+BULLET_FIELDS = {"x": np.float64, "y": np.float64, "dmg": np.float64, "laser": bool}
+
+def player_stats(sd, loadout, weight, rules):
+    """initIngame(): per-mission player stats for `loadout` and the missions' cargo weight (array)."""
+    levels = loadout.get("levels", {})
+    main = sd.weapon(loadout.get("main"))
+    sub = sd.weapon(loadout.get("sub"))
+    physics = sd.physics
+
+    def val(key):
+        # getVal(): 上書きされた行には ValuePlus が無く undefined (NaN として伝搬する)
+        if not rules["sheet_stat_rows"] and key in PARAM_CONFIG_STATS and sd.upgrade_table.get(key):
+            return math.nan
+        return sd.upgrade_value(key, int(levels.get(key, 0)))
+
+    part_weight = 0.0
+    if rules["part_weight"]:
+        part_weight = sum(float(w.get("Weight") or 0) for w in (main, sub) if w)
+    total_weight = part_weight + weight * 10
+    engine_power = float(sd.player.get("ENGINE", 100)) + val("ENGINE")
+    if math.isnan(engine_power) or not engine_power:
+        engine_power = 100
+    penalty = engine_power / (engine_power + np.where(total_weight > 0, total_weight, 1))
+
+    nan0 = lambda v: 0.0 if math.isnan(v) else v
+    max_speed = (float(physics.get("BASE_MAX_SPEED", 6.0)) + nan0(val("SPEED")) * 0.01) * penalty
+    accel = (float(physics.get("BASE_ACCEL", 0.05)) + nan0(val("ACCEL")) * 0.0001) * penalty
+    return {
+        "max_hp": float(sd.player.get("HP", 100)) + val("HP"),
+        "max_speed": np.where(max_speed > 0, max_speed, 5.0),
+        "accel": np.where(accel > 0, accel, 0.03),
+        "weapon_damage": BASE_WEAPON_DAMAGE + val("WEAPON_OS"),
+        "loot_range": float(loadout.get("loot_range") or BASE_LOOT_RANGE),
+        "main": main,
+        "sub": sub,
+    }
+
+def generate_missions(sd, stars, count, rng):
+    """MissionManager.generateMissions for a fixed star count: distance, weight, reward, penalty, targetTime, seed."""
+    params = sd.difficulty[stars]
+    low, high = params["dist"]
+    dist = np.floor(rng.random(count) * (high - low)) + low
+    weight = np.floor(rng.random(count) * 5) + 1
+    reward = np.floor(dist * 0.5 * params.get("rewardMod", 1.0))
+    return {
+        "distance": dist,
+        "weight": weight,
+        "reward": reward,
+        "penalty": np.floor(reward * 0.5),
+        "target_time": np.floor(dist / 12) + 20,
+        # 出現表のバリエーション (SpawnSchedule.start)
+        "seed": np.floor(rng.random(count) * 0x7fffffff),
+    }
+
+def pick_alias(rng, n, prob, alias, values):
+    """pickAlias() for arrays of tables: n / prob / alias / values are indexed per draw."""
+    u = rng.random(len(n)) * n
+    i = u.astype(np.int64)
+    rows = np.arange(len(n))
+    hit = (u - i) < prob[rows, i] if prob.ndim == 2 else (u - i) < prob[i]
+    pick = np.where(hit, i, alias[rows, i] if alias.ndim == 2 else alias[i])
+    return values[rows, pick] if values.ndim == 2 else values[pick]
+
+class MissionBatch:
+    """B missions with the same star count and loadout, advanced one engine.js frame per step()."""
+
+    def __init__(self, sd, stars, missions, loadout, rules, policy, rng):
+        self.sd = sd
+        self.stars = stars
+        self.rules = rules
+        self.policy = policy
+        self.rng = rng
+        b = len(missions["distance"])
+        self.mission_id = np.arange(b)
+        self.m = {k: np.asarray(v, dtype=np.float64) for k, v in missions.items()}
+
+        stats = player_stats(sd, loadout, self.m["weight"], rules)
+        self.stats = stats
+        self.max_hp = stats["max_hp"]
+        self.max_speed = stats["max_speed"]
+        self.accel = stats["accel"]
+        self.main = stats["main"]
+        self.sub = stats["sub"]
+        self.has_missile = bool(self.sub and self.sub.get("Type") == "Sub")
+
+        params = sd.difficulty.get(stars, {})
+        self.spawn_pool = sd.spawn_pool(stars)
+        self.schedule = self.build_schedule(sd, stars) if sd.schedules else None
+        self.shield_mod = float(params.get("shieldMod") or 1.0)
+        self.weather_alias = sd.weather_alias(params.get("weatherTable") or "EASY")
+
+        self.px = np.full(b, CANVAS_WIDTH / 2)
+        self.py = np.full(b, CANVAS_HEIGHT - 100.0)
+        self.tx, self.ty = self.px.copy(), self.py.copy()
+        self.hp = np.full(b, self.max_hp)
+        self.speed = np.zeros(b)
+        self.distance = self.m["distance"].copy()
+        self.last_weather = np.zeros(b)
+        self.weather = self.pick_weather(b)
+        self.fire_cd = np.zeros(b)
+        self.missile_cd = np.zeros(b)
+        self.buff_dur = np.zeros((b, 4))
+        self.buff_val = np.zeros((b, 4))
+        self.frame = 0
+
+        self.money = np.zeros(b)
+        self.kills = np.zeros(b, dtype=np.int64)
+        self.damage_taken = np.zeros(b)
+        self.collected = np.zeros((b, len(sd.item_ids)), dtype=np.int64)
+
+        self.enemies = Pool(b, ENEMY_FIELDS, 16)
+        self.shots = Pool(b, SHOT_FIELDS, 32)
+        self.missiles = Pool(b, MISSILE_FIELDS, 8)
+        self.items = Pool(b, ITEM_FIELDS, 16)
+        self.bullets = Pool(b, BULLET_FIELDS, 8)
+        self.pools = (self.enemies, self.shots, self.missiles, self.items, self.bullets)
+
+        self.done = np.zeros(b, dtype=bool)
+        n = b
+        self.results = {
+            "outcome": np.zeros(n, dtype=np.int8),
+            "frames": np.zeros(n, dtype=np.int64),
+            "elapsed": np.zeros(n),
+            "income": np.zeros(n),
+            "money": np.zeros(n),
+            "kills": np.zeros(n, dtype=np.int64),
+            "damage_taken": np.zeros(n),
+            "collected": np.zeros((n, len(sd.item_ids)), dtype=np.int64),
+        }
+
+    # --- Helpers ---
+
+    def build_schedule(self, sd, stars):
+        """Each mission's SPAWN_SCHEDULES timeline, concatenated; rows keep a start / length / spawned count."""
+        b = len(self.mission_id)
+        self.spawn_start = np.zeros(b, dtype=np.int64)
+        self.spawn_len = np.zeros(b, dtype=np.int64)
+        self.spawn_count = np.zeros(b, dtype=np.int64)
+        parts, offsets = [], {}
+        total = 0
+        for row, (distance, seed) in enumerate(zip(self.m["distance"], self.m["seed"])):
+            timeline = sd.spawn_timeline(distance, stars, seed)
+            if timeline is None:
+                continue
+            if id(timeline) not in offsets:
+                offsets[id(timeline)] = total
+                parts.append(timeline)
+                total += len(timeline["frames"])
+            self.spawn_start[row] = offsets[id(timeline)]
+            self.spawn_len[row] = len(timeline["frames"])
+        if not parts:
+            return None
+        schedule = {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+        schedule["period"] = int(sd.schedules["period"])
+        return schedule
+
+    def pick_weather(self, count):
+        if self.weather_alias is None:
+            return np.zeros(count, dtype=np.int64)
+        values, prob, alias = self.weather_alias
+        return pick_alias(self.rng, np.full(count, len(values)), prob, alias, values)
+
+    def elapsed_seconds(self, frames):
+        # updateEntities が elapsedSeconds を 2/60 秒ずつ進める (1フレーム passes 回)
+        return frames * self.rules["passes"] * 2 / 60
+
+    def rows_of(self, mask):
+        return np.nonzero(mask)[0]
+
+    def damage_enemies(self, idx, amount):
+        """Player damage to enemies (flat slot indices); Enemy.takeDamage (shield first) when rules.take_damage."""
+        if len(idx) == 0:
+            return
+        en = self.enemies
+        total = np.bincount(idx, weights=amount, minlength=en.alive.size)
+        hit = np.flatnonzero(total)
+        total = total[hit]
+        if self.rules["take_damage"]:
+            shield = en.get("shield", hit)
+            absorbed = np.minimum(shield, total)
+            en.put("shield", hit, shield - absorbed)
+            total = total - absorbed
+        en.put("hp", hit, en.get("hp", hit) - total)
+
+    # --- update() ---
+
+    def update_player(self):
+        self.frame += 1
+        # updateBuffs: duration は 0 になった時点で削除 (値も消える)
+        active = self.buff_dur > 0
+        self.buff_dur[active] -= 1
+        expired = active & (self.buff_dur <= 0)
+        self.buff_val[expired] = 0
+
+        zone = CANVAS_HEIGHT / 3
+        target = self.max_speed * np.where(self.py < zone, 1.0, np.where(self.py < zone * 2, 0.8, 0.5))
+        target = target * np.where(self.buff_dur[:, BUFF_SPEED] > 0, self.buff_val[:, BUFF_SPEED], 1.0)
+        friction = float(self.sd.physics.get("FRICTION", 0.98))
+        self.speed = np.where(self.speed < target, self.speed + self.accel, self.speed * friction)
+
+        if self.rules["weather_wind"]:
+            self.px += self.sd.weather_wind[self.weather]
+
+        self.apply_policy()
+        self.px += (self.tx - self.px) * BASE_LERP
+        self.py += (self.ty - self.py) * BASE_LERP
+
+        scale = float(self.sd.physics.get("MISSION_SCALE", 100))
+        self.distance -= self.speed * scale / MISSION_DIVISOR
+        cleared = (self.distance <= 0) & ~self.done
+        if cleared.any():
+            self.finish(cleared, OUTCOME_CLEAR)
+
+        traveled = self.m["distance"] - self.distance
+        change = traveled - self.last_weather >= 600
+        if change.any():
+            self.last_weather[change] = traveled[change]
+            self.weather[change] = self.pick_weather(int(change.sum()))
+
+        self.update_fire()
+        if self.has_missile:
+            self.missile_cd = np.where(self.missile_cd > 0, self.missile_cd - 1, self.missile_cd)
+            fire = self.missile_cd <= 0
+            if fire.any():
+                self.shoot_missile(self.rows_of(fire))
+                self.missile_cd[fire] = float(self.sd.physics.get("MISSILE_COOLDOWN") or MISSILE_COOLDOWN)
+
+    def apply_policy(self):
+        if self.policy == "hold":
+            return
+        self.tx[:] = TOP_TARGET[0]
+        self.ty[:] = TOP_TARGET[1]
+        if self.policy == "collect" and self.items.alive.any():
+            it = self.items
+            d = np.where(it.alive, (it.x - self.px[:, None]) ** 2 + (it.y - self.py[:, None]) ** 2, np.inf)
+            nearest = d.argmin(axis=1)
+            has = np.isfinite(d[np.arange(len(d)), nearest])
+            rows = self.rows_of(has)
+            self.tx[rows] = np.clip(it.x[rows, nearest[rows]], 0, CANVAS_WIDTH)
+            self.ty[rows] = np.clip(it.y[rows, nearest[rows]], 0, CANVAS_HEIGHT)
+
+    def update_fire(self):
+        # 自機弾はどこにも当たらないので、当たり判定が無い engine モードでは発射自体を省く
+        if not self.main or not self.rules["bullet_hits"]:
+            return
+        self.fire_cd = np.where(self.fire_cd > 0, self.fire_cd - 1, self.fire_cd)
+        fire = self.fire_cd <= 0
+        if not fire.any():
+            return
+        rows = self.rows_of(fire)
+        cd_mult = np.where(self.buff_val[rows, BUFF_COOLDOWN] > 0, self.buff_val[rows, BUFF_COOLDOWN], 1.0)
+        dmg_mult = 1.0 + self.buff_val[rows, BUFF_POWER]
+        interval = float(self.main.get("Interval") or 15)
+        self.fire_cd[rows] = interval * (1 + self.m["weight"][rows] * 0.05) * cd_mult
+        dmg = self.stats["weapon_damage"] * dmg_mult
+        x, y = self.px[rows], self.py[rows]
+        weapon = self.main.get("ID")
+        if weapon == "TwinBeam":
+            self.bullets.add(np.concatenate([rows, rows]), x=np.concatenate([x - 10, x + 10]),
+                             y=np.concatenate([y - 10, y - 10]), dmg=np.concatenate([dmg, dmg]) * 0.8, laser=False)
+        elif weapon == "Laser":
+            self.bullets.add(rows, x=x, y=y - 20, dmg=dmg * 1.5, laser=True)
+        else:
+            self.bullets.add(rows, x=x, y=y - 10, dmg=dmg, laser=False)
+
+    def shoot_missile(self, rows):
+        dmg = float(self.sub.get("effectiveDamage") or self.sub.get("Damage") or 20)
+        x, y = self.px[rows], self.py[rows]
+        if self.sub.get("ID") == "Bomb":
+            rng = float(self.sub.get("effectiveRange") or self.sub.get("Range") or 100)
+            self.missiles.add(rows, x=x, y=y, vx=0.0, vy=-3.0, life=180, dmg=dmg, bomb=True, range=rng)
+            return
+        angles = np.array([-0.3, 0.3])
+        r = np.repeat(rows, 2)
+        a = np.tile(angles, len(rows))
+        self.missiles.add(r, x=np.repeat(x, 2), y=np.repeat(y, 2), vx=np.sin(a) * 5, vy=-np.cos(a) * 5,
+                          life=180, dmg=dmg, bomb=False, range=0.0)
+
+    # --- updateEntities() ---
+
+    def update_entities(self):
+        if self.rules["bullet_hits"]:
+            self.update_bullets()
+        self.update_items()
+        if self.schedule is not None:
+            self.spawn_scheduled()
+        elif self.frame % SPAWN_INTERVAL == 0:
+            self.spawn_enemies()
+        self.update_enemies()
+        self.update_missiles()
+        self.update_shots()
+
+    def update_bullets(self):
+        bl, en = self.bullets, self.enemies
+        if not bl.alive.any():
+            return
+        bl.y -= np.where(bl.laser, 30, BULLET_SPEED + self.speed[:, None] / 2)
+        bl.alive &= bl.y >= -50
+        idx, rows = bl.live()
+        if not len(idx) or not en.alive.any():
+            return
+        # 敵 (40x40) と弾の矩形判定。ビームは最初に当たった1体で消え、レーザーは貫通する
+        laser = bl.get("laser", idx)
+        hit = (en.alive[rows]
+               & (np.abs(en.x[rows] - bl.get("x", idx)[:, None]) < ENEMY_HALF_SIZE)
+               & (np.abs(en.y[rows] - bl.get("y", idx)[:, None]) < ENEMY_HALF_SIZE))
+        hit &= laser[:, None] | (np.cumsum(hit, axis=1) == 1)
+        i, e_slot = np.nonzero(hit)
+        self.damage_enemies(rows[i] * en.capacity + e_slot, bl.get("dmg", idx)[i])
+        spent = hit.any(axis=1) & ~laser
+        bl.kill(idx[spent])
+
+    def update_items(self):
+        it = self.items
+        if not it.alive.any():
+            return
+        # 空きスロットの値は add() で上書きされるので、生死に関係なく全スロットを更新する
+        it.life -= 1
+        gone = (it.life <= 0) | (it.y > 900)
+        # Item.update (回収アームの磁力は data.parts を見るので engine.js では発動しない)
+        moving = ~gone
+        it.vy = np.minimum(it.vy + 0.1 * moving, np.where(moving, 3, np.inf))
+        it.x += it.vx * moving
+        it.y += it.vy * moving
+        it.vx *= np.where(moving, 0.98, 1.0)
+
+        dist2 = (it.x - self.px[:, None]) ** 2 + (it.y - self.py[:, None]) ** 2
+        picked = it.alive & (dist2 < self.stats["loot_range"] ** 2)
+        it.alive &= ~(picked | gone)
+        if picked.any():
+            idx = np.flatnonzero(picked)
+            self.collect(idx // it.capacity, it.get("item", idx))
+
+    def collect(self, rows, items):
+        sd = self.sd
+        kind = sd.item_kind[items]
+        mat = (kind == ITEM_MATERIAL) | (kind == ITEM_STAT)
+        np.add.at(self.collected, (rows[mat], items[mat]), 1)
+        money = kind == ITEM_MONEY
+        np.add.at(self.money, rows[money], sd.item_value[items[money]])
+        heal = kind == ITEM_HEAL
+        if heal.any():
+            amount = np.zeros(len(self.hp))
+            np.add.at(amount, rows[heal], np.floor(self.max_hp * sd.item_value[items[heal]]))
+            self.hp = np.minimum(self.max_hp, self.hp + amount)
+        # バフの重ね掛け (collectItem): 値が高い方を残し、同じ値なら長い方の時間
+        for r, i in zip(rows[kind == ITEM_BUFF], items[kind == ITEM_BUFF]):
+            b = sd.item_buff[i]
+            if b < 0:
+                continue
+            val, dur = sd.item_value[i], sd.item_duration[i] * 60
+            cur_val, cur_dur = self.buff_val[r, b], self.buff_dur[r, b]
+            if cur_dur > 0 and cur_val > val:
+                self.buff_dur[r, b] = max(cur_dur, dur)
+            elif cur_dur > 0 and cur_val == val:
+                self.buff_dur[r, b] = max(cur_dur, dur)
+            else:
+                self.buff_val[r, b], self.buff_dur[r, b] = val, dur
+
+    def spawn_enemies(self):
+        pool = self.spawn_pool
+        if len(pool) == 0:
+            return
+        sd = self.sd
+        rows = np.arange(len(self.px))
+        types = pool[(self.rng.random(len(rows)) * len(pool)).astype(np.int64)]
+        x = self.rng.random(len(rows)) * (CANVAS_WIDTH - 40) + 20
+        speed, turn = sd.en_speed[types], sd.en_turn[types]
+        self.enemies.add(
+            rows, type=types, x=x, y=-50.0,
+            hp=np.floor(sd.en_hp[types]), shield=np.floor(sd.en_shield[types] * self.shield_mod),
+            time=0, cooldown=0.0, kind=sd.en_kind[types],
+            vx=sd.en_vx[types] * speed, vy=sd.en_vy[types] * speed,
+            ampx=sd.en_ampx[types] * turn, ampy=sd.en_ampy[types] * turn, wave=sd.en_wave[types],
+            rvx=sd.en_vx[types] * turn, rvy=sd.en_vy[types] * speed)
+
+    def spawn_scheduled(self):
+        """SpawnSchedule.advance: every mission spawns the entries of its timeline that are due by this frame."""
+        sc, sd = self.schedule, self.sd
+        has = self.spawn_len > 0
+        while True:
+            length = np.where(has, self.spawn_len, 1)
+            loops, pos = np.divmod(self.spawn_count, length)
+            idx = self.spawn_start + pos
+            rows = np.nonzero(has & (loops * sc["period"] + sc["frames"][idx] <= self.frame))[0]
+            if len(rows) == 0:
+                return
+            idx = idx[rows]
+            types = sc["type"][idx]
+            speed, turn = sd.en_speed[types], sd.en_turn[types]
+            vx, vy = sc["vx"][idx], sc["vy"][idx]
+            self.enemies.add(
+                rows, type=types, x=sc["x"][idx], y=-50.0,
+                hp=np.floor(sd.en_hp[types]), shield=np.floor(sd.en_shield[types] * self.shield_mod),
+                time=0, cooldown=0.0, kind=sc["kind"][idx],
+                vx=vx * speed, vy=vy * speed,
+                ampx=sc["ampx"][idx] * turn, ampy=sc["ampy"][idx] * turn, wave=sc["wave"][idx],
+                rvx=vx * turn, rvy=vy * speed)
+            self.spawn_count[rows] += 1
+
+    def update_enemies(self):
+        en, sd = self.enemies, self.sd
+        alive = en.alive
+        if not alive.any():
+            return
+        # 空きスロットの値は add() で上書きされるので、生死に関係なく全スロットを更新する
+        en.time += 1
+
+        # handleMovement (揺れ表の最後の行は wave = -1 用のゼロ)
+        w = sd.wave_table[en.wave, en.time % sd.wave_length[en.wave]]
+        dx = en.vx + en.ampx * w
+        dy = en.vy + en.ampy * w
+        homing = en.kind == KIND_HOMING
+        if homing.any():
+            angle = np.arctan2(self.py[:, None] - en.y, self.px[:, None] - en.x)
+            v = np.hypot(en.vx, en.vy)
+            dx += (np.cos(angle) * v - dx) * homing
+            dy += (np.sin(angle) * v - dy) * homing
+        reflect = en.kind == KIND_REFLECT
+        if reflect.any():
+            dx += (en.rvx - dx) * reflect
+            dy += (en.rvy - dy) * reflect
+        en.x += dx
+        en.y += dy
+        if reflect.any():
+            en.rvx *= 1 - 2 * (reflect & ((en.x < 0) | (en.x > 600)))
+
+        # handleFiring
+        cooling = en.cooldown > 0
+        en.cooldown -= cooling
+        fire = alive & ~cooling & sd.en_armed[en.type]
+        if fire.any():
+            idx = np.flatnonzero(fire)
+            self.enemy_fire(idx, idx // en.capacity)
+
+        # 画面外 (time > 600) で削除。engine.js では hp <= 0 の残骸もここでしか消えない
+        out = (en.y > 900) | (en.y < -200) | (en.x < -100) | (en.x > 700)
+        marked = alive & out & (en.time > 600)
+        if self.rules["take_damage"]:
+            marked |= alive & (en.hp <= 0)
+        dead = marked & (en.hp <= 0)
+        if dead.any():
+            idx = np.flatnonzero(dead)
+            rows = idx // en.capacity
+            self.kills += np.bincount(rows, minlength=len(self.kills))
+            self.drop_loot(rows, en.get("type", idx), en.get("x", idx), en.get("y", idx))
+        en.alive &= ~marked
+
+    def enemy_fire(self, idx, rows):
+        en, sd = self.enemies, self.sd
+        types = en.get("type", idx)
+        num = sd.en_shot_num[types]
+        mode = sd.en_angle_mode[types]
+        x, y, t = en.get("x", idx), en.get("y", idx), en.get("time", idx)
+        base = np.where(mode == ANGLE_AIM, np.arctan2(self.py[rows] - y, self.px[rows] - x), math.pi / 2)
+        en.put("cooldown", idx, sd.en_cooltime[types])
+
+        if (num == 1).all() and (mode == ANGLE_AIM).all():
+            k, i, angle = np.arange(len(idx)), 0, base
+        else:
+            k = np.repeat(np.arange(len(idx)), num)
+            i = np.arange(len(k)) - np.repeat(np.cumsum(num) - num, num)
+            angle = base[k]
+            m = mode[k]
+            spread = math.pi / 4
+            fan = angle - spread / 2 + spread * (i / np.maximum(num[k] - 1, 1))
+            angle = np.where(m == ANGLE_FAN, fan, angle)
+            angle = np.where(m == ANGLE_SPRAY, angle + (self.rng.random(len(k)) - 0.5), angle)
+            angle = np.where(m == ANGLE_SPIRAL, angle + t[k] * 0.2 + i * 0.2, angle)
+        speed = sd.en_shot_speed[types][k]
+        dmg = sd.en_shot_damage[types][k] if self.rules["enemy_weapon_damage"] else ENEMY_SHOT_DAMAGE
+        self.shots.add(rows[k], x=x[k], y=y[k], vx=np.cos(angle) * speed, vy=np.sin(angle) * speed,
+                       life=300, dmg=dmg)
+
+    def drop_loot(self, rows, types, x, y):
+        sd = self.sd
+        table = sd.en_drop[types]
+        count = np.where(table >= 0, sd.en_drop_count[types], 0)
+        k = np.repeat(np.arange(len(rows)), count)
+        if len(k) == 0:
+            return
+        t = table[k]
+        # Exclusive テーブルは alias を1回、それ以外は項目ごとに独立して判定 (1回の抽選で複数個落ちうる)
+        items = pick_alias(self.rng, sd.drop_n[t], sd.drop_prob[t], sd.drop_alias[t], sd.drop_values[t])
+        items = np.where(sd.drop_exclusive[t], items, -1)
+        lottery, slot = np.nonzero((self.rng.random(sd.drop_rate[t].shape) < sd.drop_rate[t])
+                                   & ~sd.drop_exclusive[t][:, None])
+        k = np.concatenate([k[items >= 0], k[lottery]])
+        items = np.concatenate([items[items >= 0], sd.drop_items[t[lottery], slot]])
+        n = len(k)
+        if n == 0:
+            return
+        r = self.rng.random((4, n))
+        self.items.add(rows[k], item=items, x=x[k] + (r[0] - 0.5) * 40, y=y[k] + (r[1] - 0.5) * 40,
+                       vx=(r[2] - 0.5) * 2, vy=-3.0, life=900)
+
+    def update_missiles(self):
+        ms, en = self.missiles, self.enemies
+        if not ms.alive.any():
+            return
+        ms.life -= 1
+        ms.alive &= ms.life > 0
+        # 飛んでいるミサイルだけを1次元に並べ、同じミッションの敵 [n, 敵スロット] と総当たりする
+        idx, rows = ms.live()
+        if not len(idx):
+            return
+        x, y, vx, vy = ms.get("x", idx), ms.get("y", idx), ms.get("vx", idx), ms.get("vy", idx)
+        bomb = ms.get("bomb", idx)
+        ex, ey, ea = en.x[rows], en.y[rows], en.alive[rows]
+        n = np.arange(len(idx))
+
+        d2 = (ex - x[:, None]) ** 2 + (ey - y[:, None]) ** 2 + np.where(ea, 0, np.inf)
+        nearest = d2.argmin(axis=1)
+        steer = ~bomb & (d2[n, nearest] < HOMING_RANGE ** 2)
+        vx = vx + np.sign(ex[n, nearest] - x) * 0.2 * steer
+        x = x + vx * ~bomb
+        y = y + vy
+        ms.put("x", idx, x)
+        ms.put("y", idx, y)
+        ms.put("vx", idx, vx * np.where(bomb, 1.0, 0.95))
+
+        d2 = (ex - x[:, None]) ** 2 + (ey - y[:, None]) ** 2
+        hit = ea & (d2 < np.where(bomb, BOMB_HIT ** 2, MISSILE_HIT ** 2)[:, None])
+        if not hit.any():
+            return
+        dmg = ms.get("dmg", idx)
+        base = rows * en.capacity
+        # ミサイルは範囲内の敵それぞれに dmg、ボムは範囲内の敵1体ごとに explodeBomb (範囲 range の全敵に dmg)
+        i, e_slot = np.nonzero(hit & ~bomb[:, None])
+        self.damage_enemies(base[i] + e_slot, dmg[i])
+        if bomb.any():
+            n_hits = (hit & bomb[:, None]).sum(axis=1)
+            in_range = (n_hits > 0)[:, None] & ea & (d2 < ms.get("range", idx)[:, None] ** 2)
+            i, e_slot = np.nonzero(in_range)
+            self.damage_enemies(base[i] + e_slot, dmg[i] * n_hits[i])
+        ms.kill(idx[hit.any(axis=1)])
+
+    def update_shots(self):
+        sh = self.shots
+        if not sh.alive.any():
+            return
+        sh.life -= 1
+        sh.alive &= sh.life > 0
+        sh.x += sh.vx
+        sh.y += sh.vy
+        hit = sh.alive & ((self.px[:, None] - sh.x) ** 2 + (self.py[:, None] - sh.y) ** 2 < PLAYER_HIT_RADIUS ** 2)
+        if hit.any():
+            damage = (sh.dmg * hit).sum(axis=1)
+            if self.rules["invincible_buff"]:
+                damage = np.where(self.buff_dur[:, BUFF_INVINCIBLE] > 0, 0, damage)
+            self.hp -= damage
+            self.damage_taken += damage
+            failed = (self.hp <= 0) & ~self.done
+            if failed.any():
+                self.finish(failed, OUTCOME_FAILED)
+        out = (sh.y > CANVAS_HEIGHT + 50) | (sh.y < -50) | (sh.x < -50) | (sh.x > CANVAS_WIDTH + 50)
+        sh.alive &= ~(hit | out)
+
+    # --- Results ---
+
+    def finish(self, mask, outcome):
+        """Records the result of the missions in `mask` (renderResult / handleFailure)."""
+        ids = self.mission_id[mask]
+        res = self.results
+        res["outcome"][ids] = outcome
+        res["frames"][ids] = self.frame
+        # クリア判定は updateEntities より前なので、経過時間はこのフレームの分を含まない
+        elapsed = self.elapsed_seconds(self.frame - 1 if outcome == OUTCOME_CLEAR else self.frame)
+        res["elapsed"][ids] = elapsed
+        reward = self.m["reward"][mask]
+        if outcome == OUTCOME_CLEAR:
+            target = self.m["target_time"][mask]
+            diff = target - elapsed
+            bonus = np.floor(reward * np.minimum(0.3, diff / target))
+            reduction = np.floor(reward * np.minimum(0.2, np.abs(diff) / target))
+            income = np.where(diff > 0, reward + bonus, reward - reduction)
+        else:
+            income = -self.m["penalty"][mask]
+        res["income"][ids] = income + self.money[mask]
+        res["money"][ids] = self.money[mask]
+        res["kills"][ids] = self.kills[mask]
+        res["damage_taken"][ids] = self.damage_taken[mask]
+        res["collected"][ids] = self.collected[mask]
+        self.done |= mask
+
+    def compact(self):
+        keep = ~self.done
+        for name in ("mission_id", "px", "py", "tx", "ty", "hp", "speed", "distance", "last_weather",
+                     "weather", "fire_cd", "missile_cd", "buff_dur", "buff_val", "money", "kills",
+                     "damage_taken", "collected", "max_speed", "accel", "done"):
+            setattr(self, name, getattr(self, name)[keep])
+        if self.schedule is not None:
+            for name in ("spawn_start", "spawn_len", "spawn_count"):
+                setattr(self, name, getattr(self, name)[keep])
+        self.m = {k: v[keep] for k, v in self.m.items()}
+        for pool in self.pools:
+            pool.keep_rows(keep)
+
+    def run(self, max_frames):
+        while len(self.mission_id) and self.frame < max_frames:
+            self.update_player()
+            for _ in range(self.rules["passes"]):
+                self.update_entities()
+            if self.done.any():
+                self.compact()
+            if self.frame % SPAWN_INTERVAL == 0:
+                for pool in self.pools:
+                    pool.trim()
+        # 時間切れ (max_frames) は OUTCOME_TIMEOUT のまま
+        if len(self.mission_id):
+            ids = self.mission_id
+            self.results["frames"][ids] = self.frame
+            self.results["elapsed"][ids] = self.elapsed_seconds(self.frame)
+        return self.results
+
+def simulate(sd, stars, count, loadout, rules="engine", policy="hold", seed=0, max_frames=72000):
+    """Simulates `count` random missions of `stars`. Returns the per-mission result arrays."""
+    rules = RULES[rules] if isinstance(rules, str) else rules
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy!r} (expected {', '.join(POLICIES)})")
+    rng = np.random.default_rng(seed)
+    missions = generate_missions(sd, stars, count, rng)
+    results = MissionBatch(sd, stars, missions, loadout, rules, policy, rng).run(max_frames)
+    results.update(missions)
+    return results
@@ -0,0 +1,543 @@
+"""
+当たり判定 (ブロードフェーズ) の負荷試験
+
+engine.js の updateEntities は自機弾・ミサイルごとに全ての敵との距離を測り (O(弾数×敵数))、消えた弾や敵は
+逆順ループの中の splice で、particles / items / floatingTexts は毎フレーム .filter で作り直して取り除く。
+敵の数がどこまで増えると 16ms に収まらなくなるかを見るため、ENEMY_WEAPONS の実データ (EQID008 ガトリング
+ShotNum 15 / Cooltime 5、EQID006 スパイラルなど) で弾幕の場面を作り、同じ場面を3通りの実装で再生する:
+
+    naive  engine.js と同じ総当たり + splice / filter
+    grid   一様グリッドの空間ハッシュ (--cell px) + 入れ替え削除のプール
+    sap    x 座標で整列した敵の区間探索 (sweep and prune) + 入れ替え削除のプール
+
+当たりの判定順に依存しないよう、1発の弾は重なっている敵のうち ID の一番小さいものに当たり、ダメージは
+全ての判定の後でまとめて与える (乱数も敵 ID とフレームから決める)。なので3つの実装は同じ結果になり、
+命中数・撃破数・被弾数が食い違えば終了コード 1 になる。
+
+    python tools/bench_collisions.py
+    python tools/bench_collisions.py --scenarios EQID008 --enemies 10,50,100,200 --fire 4
+    python tools/bench_collisions.py --methods grid,sap --cell 48 --output collisions.json
+
+1フレームあたりの判定ペア数は言語によらない。時間は Python で測った値なので、ブラウザ (JIT) とは
+桁が違う。実装どうしの比と、敵の数に対する伸び方を見るためのもの。
+"""
+import argparse
+import bisect
+import json
+import math
+import statistics
+import sys
+import time
+
+from settings_store import JS_PATH, load_settings
+
+CANVAS_WIDTH = 800
+CANVAS_HEIGHT = 600
+MARGIN = 50              # 画面外に出た弾を消す余白 (engine.js の ±50)
+
+# engine.js / Enemy.js / settings.js の固定値
+BULLET_SPEED = 7
+BULLET_DAMAGE = 10
+ENEMY_HALF_SIZE = 20     # Enemy.width / 2 (自機弾の当たり判定)
+MISSILE_HIT = 30
+HOMING_RANGE = 300
+MISSILE_INTERVAL = 60
+MISSILE_LIFE = 180
+MISSILE_DAMAGE = 40
+ENEMY_SHOT_LIFE = 300
+PLAYER_HIT_RADIUS = 10
+LOOT_RANGE = 50
+PARTICLES_PER_HIT = 8
+PARTICLE_LIFE = 15
+TEXT_LIFE = 40
+ITEM_LIFE = 900
+
+METHODS = ("naive", "grid", "sap")
+
+def noise(*keys):
+    """Deterministic value in [0, 1) from integers (stands in for Math.random, independent of list order)."""
+    h = 0x9E3779B9
+    for k in keys:
+        h = ((h ^ (k & 0xFFFFFFFF)) * 0x85EBCA6B) & 0xFFFFFFFF
+        h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    return (h ^ (h >> 16)) / 4294967296.0
+
+class Weapon:
+    __slots__ = ("id", "cooltime", "num", "speed", "mode")
+
+    def __init__(self, eqid, row):
+        # Enemy.handleFiring と同じフォールバック
+        self.id = eqid
+        self.cooltime = int(row.get("Cooltime") or 60)
+        self.num = int(row.get("ShotNum") or 1)
+        self.speed = float(row.get("Speed") or 5)
+        self.mode = row.get("ShotAngle") or "AimPlayer"
+
+class Enemy:
+    __slots__ = ("id", "x", "y", "base_x", "hp", "cooldown", "time", "weapon", "alive")
+
+    def __init__(self, eid, hp, weapon):
+        self.id = eid
+        self.base_x = 40 + noise(eid, 1) * (CANVAS_WIDTH - 80)
+        self.x = self.base_x
+        self.y = 40 + noise(eid, 2) * (CANVAS_HEIGHT / 2 - 40)
+        self.hp = hp
+        self.cooldown = int(noise(eid, 3) * weapon.cooltime)
+        self.time = 0
+        self.weapon = weapon
+        self.alive = True
+
+class Body:
+    """Bullets, missiles, enemy shots, particles, texts and items: position, velocity and remaining life."""
+    __slots__ = ("x", "y", "vx", "vy", "life", "dmg", "alive")
+
+    def __init__(self, x, y, vx, vy, life, dmg=0.0):
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        self.life = life
+        self.dmg = dmg
+        self.alive = True
+
+# --- 削除 ---
+
+def splice_dead(items):
+    """engine.js: for (i = length - 1; i >= 0; i--) if (dead) splice(i, 1)."""
+    for i in range(len(items) - 1, -1, -1):
+        if not items[i].alive:
+            del items[i]
+
+def filter_dead(items):
+    """engine.js: list = list.filter(...) (a new array every frame)."""
+    return [b for b in items if b.alive]
+
+def swap_remove(items):
+    """Pool removal: the last element moves into the hole, nothing is shifted or reallocated."""
+    i = 0
+    while i < len(items):
+        if items[i].alive:
+            i += 1
+        else:
+            last = items.pop()
+            if i < len(items):
+                items[i] = last
+    return items
+
+# --- ブロードフェーズ ---
+
+class Naive:
+    """Every projectile against every enemy (engine.js)."""
+
+    def __init__(self, args):
+        self.tests = 0
+
+    def build(self, enemies, changed):
+        self.enemies = enemies
+
+    def first_hit(self, x, y, reach, circle):
+        best = None
+        for en in self.enemies:
+            self.tests += 1
+            dx, dy = en.x - x, en.y - y
+            if (dx * dx + dy * dy < reach * reach) if circle else (-reach < dx < reach and -reach < dy < reach):
+                if best is None or en.id < best.id:
+                    best = en
+        return best
+
+    def nearest(self, x, y, radius):
+        best, best_d = None, radius
+        for en in self.enemies:
+            self.tests += 1
+            d = math.hypot(en.x - x, en.y - y)
+            if d < best_d or (d == best_d and best is not None and en.id < best.id):
+                best, best_d = en, d
+        return best
+
+CELL_KEY = 1 << 12       # セル座標 (cx, cy) -> cx * CELL_KEY + cy
+
+class SpatialHash:
+    """Uniform grid rebuilt every frame; a query looks only at the cells its reach overlaps."""
+
+    def __init__(self, args):
+        self.cell = args.cell
+        self.tests = 0
+
+    def build(self, enemies, changed):
+        cells = {}
+        inv = 1.0 / self.cell
+        for en in enemies:
+            key = math.floor(en.x * inv) * CELL_KEY + math.floor(en.y * inv)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [en]
+            else:
+                bucket.append(en)
+        self.cells = cells
+
+    def _candidates(self, x0, y0, x1, y1):
+        inv = 1.0 / self.cell
+        cells = self.cells
+        cy0, cy1 = math.floor(y0 * inv), math.floor(y1 * inv) + 1
+        for cx in range(math.floor(x0 * inv), math.floor(x1 * inv) + 1):
+            for cy in range(cy0, cy1):
+                bucket = cells.get(cx * CELL_KEY + cy)
+                if bucket:
+                    yield from bucket
+
+    def first_hit(self, x, y, reach, circle):
+        best = None
+        for en in self._candidates(x - reach, y - reach, x + reach, y + reach):
+            self.tests += 1
+            dx, dy = en.x - x, en.y - y
+            if (dx * dx + dy * dy < reach * reach) if circle else (-reach < dx < reach and -reach < dy < reach):
+                if best is None or en.id < best.id:
+                    best = en
+        return best
+
+    def nearest(self, x, y, radius):
+        # 自分のセルから外側へリング状に広げ、見つかった距離より外のリングは見ない
+        best, best_d = None, radius
+        inv = 1.0 / self.cell
+        cx, cy = math.floor(x * inv), math.floor(y * inv)
+        rings = int(radius * inv) + 1
+        for ring in range(rings + 1):
+            if best is not None and (ring - 1) * self.cell > best_d:
+                break
+            for gx in range(cx - ring, cx + ring + 1):
+                edge = gx in (cx - ring, cx + ring)
+                for gy in (range(cy - ring, cy + ring + 1) if edge else (cy - ring, cy + ring)):
+                    for en in self.cells.get(gx * CELL_KEY + gy, ()):
+                        self.tests += 1
+                        d = math.hypot(en.x - x, en.y - y)
+                        if d < best_d or (d == best_d and best is not None and en.id < best.id):
+                            best, best_d = en, d
+        return best
+
+class SweepAndPrune:
+    """Enemies kept sorted by x (nearly sorted from the last frame, so the sort is cheap); queries bisect the x range."""
+
+    def __init__(self, args):
+        self.order = []
+        self.tests = 0
+
+    def build(self, enemies, changed):
+        if changed:
+            self.order = list(enemies)
+        self.order.sort(key=lambda en: en.x)
+        self.xs = [en.x for en in self.order]
+
+    def first_hit(self, x, y, reach, circle):
+        best = None
+        order = self.order
+        for i in range(bisect.bisect_right(self.xs, x - reach), bisect.bisect_left(self.xs, x + reach)):
+            en = order[i]
+            self.tests += 1
+            dx, dy = en.x - x, en.y - y
+            if (dx * dx + dy * dy < reach * reach) if circle else (-reach < dy < reach):
+                if best is None or en.id < best.id:
+                    best = en
+        return best
+
+    def nearest(self, x, y, radius):
+        # x の近い順に左右へ広げ、x の差だけで見つかった距離を超えたら止める
+        best, best_d = None, radius
+        order, xs = self.order, self.xs
+        right = bisect.bisect_left(xs, x)
+        left = right - 1
+        while left >= 0 or right < len(order):
+            if right < len(order) and (left < 0 or xs[right] - x <= x - xs[left]):
+                i, right = right, right + 1
+            else:
+                i, left = left, left - 1
+            if abs(xs[i] - x) > best_d:
+                break
+            en = order[i]
+            self.tests += 1
+            d = math.hypot(en.x - x, en.y - y)
+            if d < best_d or (d == best_d and best is not None and en.id < best.id):
+                best, best_d = en, d
+        return best
+
+BROAD_PHASES = {"naive": Naive, "grid": SpatialHash, "sap": SweepAndPrune}
+
+# --- 場面 ---
+
+class World:
+    """One scenario: `count` armed enemies held on screen, a player firing `fire` bullets per frame and missiles."""
+
+    def __init__(self, method, weapons, hps, count, args):
+        self.method = method
+        self.broad = BROAD_PHASES[method](args)
+        self.weapons = weapons
+        self.hps = hps
+        self.fire = args.fire
+        self.next_id = 0
+        self.enemies = [self.spawn() for _ in range(count)]
+        self.enemies_changed = True
+        self.bullets, self.missiles, self.shots = [], [], []
+        self.particles, self.texts, self.items = [], [], []
+        self.player = [CANVAS_WIDTH / 2, 500.0]
+        self.frame = 0
+        self.remove_time = 0.0
+        self.totals = {"hits": 0, "kills": 0, "player_hits": 0, "collected": 0}
+
+    def spawn(self):
+        eid = self.next_id
+        self.next_id += 1
+        return Enemy(eid, self.hps[eid % len(self.hps)], self.weapons[eid % len(self.weapons)])
+
+    def remove(self, items, filtered=False):
+        start = time.perf_counter()
+        if self.method != "naive":
+            items = swap_remove(items)
+        elif filtered:
+            items = filter_dead(items)
+        else:
+            splice_dead(items)
+        self.remove_time += time.perf_counter() - start
+        return items
+
+    def fire_enemy(self, en, px, py):
+        wpn = en.weapon
+        base = math.atan2(py - en.y, px - en.x) if wpn.mode == "AimPlayer" else math.pi / 2
+        for i in range(wpn.num):
+            angle = base
+            if wpn.mode == "Fan":
+                angle = base - math.pi / 8 + math.pi / 4 * (i / (wpn.num - 1 if wpn.num > 1 else 1))
+            elif wpn.mode == "RandomSpray":
+                angle += noise(en.id, en.time, i) - 0.5
+            elif wpn.mode == "Spiral":
+                angle = base + en.time * 0.2 + i * 0.2
+            self.shots.append(Body(en.x, en.y, math.cos(angle) * wpn.speed, math.sin(angle) * wpn.speed,
+                                   ENEMY_SHOT_LIFE))
+
+    def step(self, timing):
+        """One frame; adds the seconds spent in the broad phase, in removals and in the rest to timing."""
+        start = time.perf_counter()
+        self.remove_time = 0.0
+        frame = self.frame
+        player = self.player
+        player[0] = CANVAS_WIDTH / 2 + math.sin(frame * 0.02) * 300
+        px, py = player
+
+        # 自機の射撃 (横に並べて --fire 発) とミサイル (左右 2 発)
+        for i in range(self.fire):
+            offset = (i - (self.fire - 1) / 2) * 12
+            self.bullets.append(Body(px + offset, py - 10, 0.0, -BULLET_SPEED, 1, BULLET_DAMAGE))
+        if frame % MISSILE_INTERVAL == 0:
+            for angle in (-0.3, 0.3):
+                self.missiles.append(Body(px, py, math.sin(angle) * 5, -math.cos(angle) * 5, MISSILE_LIFE,
+                                          MISSILE_DAMAGE))
+
+        for p in self.particles:
+            p.x += p.vx
+            p.y += p.vy
+            p.life -= 1
+            p.alive = p.life > 0
+        self.particles = self.remove(self.particles, filtered=True)
+
+        for b in self.bullets:
+            b.y += b.vy
+            b.alive = b.y >= -MARGIN
+
+        for item in self.items:
+            item.vy = min(item.vy + 0.1, 2)
+            item.y += item.vy
+            item.life -= 1
+            if math.hypot(item.x - px, item.y - py) < LOOT_RANGE:
+                item.alive = False
+                self.totals["collected"] += 1
+            elif item.life <= 0 or item.y > CANVAS_HEIGHT + MARGIN:
+                item.alive = False
+        self.items = self.remove(self.items, filtered=True)
+
+        for en in self.enemies:
+            en.time += 1
+            en.x = en.base_x + math.sin((en.time + en.id * 37) * 0.03) * 40
+            if en.cooldown > 0:
+                en.cooldown -= 1
+            else:
+                self.fire_enemy(en, px, py)
+                en.cooldown = en.weapon.cooltime
+
+        hit_r2 = PLAYER_HIT_RADIUS * PLAYER_HIT_RADIUS
+        for s in self.shots:
+            s.x += s.vx
+            s.y += s.vy
+            s.life -= 1
+            dx, dy = px - s.x, py - s.y
+            if dx * dx + dy * dy < hit_r2:
+                s.alive = False
+                self.totals["player_hits"] += 1
+            elif (s.life <= 0 or s.y > CANVAS_HEIGHT + MARGIN or s.y < -MARGIN
+                  or s.x < -MARGIN or s.x > CANVAS_WIDTH + MARGIN):
+                s.alive = False
+        self.shots = self.remove(self.shots)
+
+        # ブロードフェーズ: 判定だけ先に全部済ませ、ダメージは後でまとめて与える
+        broad_start = time.perf_counter()
+        broad = self.broad
+        broad.build(self.enemies, self.enemies_changed)
+        self.enemies_changed = False
+        hits = []
+        for b in self.bullets:
+            if b.alive:
+                en = broad.first_hit(b.x, b.y, ENEMY_HALF_SIZE, False)
+                if en is not None:
+                    hits.append((b, en))
+        for m in self.missiles:
+            m.life -= 1
+            if m.life <= 0:
+                m.alive = False
+                continue
+            target = broad.nearest(m.x, m.y, HOMING_RANGE)
+            if target is not None:
+                dx = target.x - m.x
+                m.vx += math.copysign(0.2, dx) if dx else 0.0
+            m.x += m.vx
+            m.y += m.vy
+            m.vx *= 0.95
+            en = broad.first_hit(m.x, m.y, MISSILE_HIT, True)
+            if en is not None:
+                hits.append((m, en))
+            elif m.y < -MARGIN:
+                m.alive = False
+        broad_time = time.perf_counter() - broad_start
+
+        for shot, en in hits:
+            shot.alive = False
+            en.hp -= shot.dmg
+            self.totals["hits"] += 1
+            for k in range(PARTICLES_PER_HIT):
+                self.particles.append(Body(shot.x, shot.y, (noise(en.id, frame, k) - 0.5) * 6,
+                                           (noise(frame, en.id, k) - 0.5) * 6, PARTICLE_LIFE))
+            self.texts.append(Body(en.x, en.y, 0.0, -1.0, TEXT_LIFE))
+        killed = 0
+        for en in self.enemies:
+            if en.hp <= 0:
+                en.alive = False
+                killed += 1
+                self.items.append(Body(en.x, en.y, 0.0, -3.0, ITEM_LIFE))
+        if killed:
+            # 撃破した数だけ補充する (ID は通し番号なので、並び順が違ってもどの実装でも同じ敵が出る)
+            self.totals["kills"] += killed
+            self.enemies = self.remove(self.enemies)
+            self.enemies.extend(self.spawn() for _ in range(killed))
+            self.enemies_changed = True
+        self.bullets = self.remove(self.bullets)
+        self.missiles = self.remove(self.missiles)
+
+        for t in self.texts:
+            t.y += t.vy
+            t.life -= 1
+            t.alive = t.life > 0
+        self.texts = self.remove(self.texts, filtered=True)
+
+        self.frame += 1
+        total = time.perf_counter() - start
+        timing["broad"] += broad_time
+        timing["remove"] += self.remove_time
+        timing["rest"] += total - broad_time - self.remove_time
+        return total
+
+    def counts(self):
+        return {"enemies": len(self.enemies), "bullets": len(self.bullets) + len(self.missiles),
+                "enemy_shots": len(self.shots), "effects": len(self.particles) + len(self.texts) + len(self.items)}
+
+def run_case(method, weapons, hps, count, args):
+    world = World(method, weapons, hps, count, args)
+    timing = {"broad": 0.0, "remove": 0.0, "rest": 0.0}
+    for _ in range(args.warmup):
+        world.step(timing)
+    world.broad.tests = 0
+    timing = {"broad": 0.0, "remove": 0.0, "rest": 0.0}
+    frames = []
+    peak = {}
+    for _ in range(args.frames):
+        frames.append(world.step(timing))
+        for k, v in world.counts().items():
+            peak[k] = max(peak.get(k, 0), v)
+    frames.sort()
+    return {
+        "method": method,
+        "enemies": count,
+        "tests_per_frame": world.broad.tests / args.frames,
+        "broad_ms": timing["broad"] / args.frames * 1000,
+        "remove_ms": timing["remove"] / args.frames * 1000,
+        "rest_ms": timing["rest"] / args.frames * 1000,
+        "frame_ms_p50": statistics.median(frames) * 1000,
+        "frame_ms_p95": frames[min(int(len(frames) * 0.95), len(frames) - 1)] * 1000,
+        "peak": peak,
+        "totals": dict(world.totals),
+    }
+
+def scenario_weapons(data, name):
+    """Weapons for a scenario: one ENEMY_WEAPONS ID, several joined with '+', or 'mix' (all of them)."""
+    table = data.get("ENEMY_WEAPONS", {})
+    ids = list(table) if name == "mix" else name.split("+")
+    unknown = [i for i in ids if i not in table]
+    if unknown:
+        raise SystemExit(f"Unknown enemy weapon {', '.join(unknown)} (ENEMY_WEAPONS: {', '.join(table)})")
+    return [Weapon(i, table[i]) for i in ids]
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress test collision broad phases on bullet-hell scenarios")
+    parser.add_argument("--scenarios", default="EQID008,EQID006,mix",
+                        help="comma separated ENEMY_WEAPONS IDs ('A+B' mixes weapons, 'mix' uses all of them)")
+    parser.add_argument("--enemies", default="10,20,40,80", help="comma separated enemy counts")
+    parser.add_argument("--methods", default=",".join(METHODS), help=f"comma separated ({', '.join(METHODS)})")
+    parser.add_argument("--fire", type=int, default=2, help="player bullets per frame")
+    parser.add_argument("--cell", type=float, default=64, help="spatial hash cell size (px)")
+    parser.add_argument("--frames", type=int, default=240, help="measured frames per case")
+    parser.add_argument("--warmup", type=int, default=180, help="frames before measuring (bullets fill the screen)")
+    parser.add_argument("--budget-ms", type=float, default=1000 / 60, help="frame budget to flag")
+    parser.add_argument("--js", default=JS_PATH, help="settings_data.js to read ENEMY_WEAPONS / ENEMIES from")
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args()
+
+    methods = args.methods.split(",")
+    unknown = set(methods) - set(METHODS)
+    if unknown:
+        parser.error(f"unknown method(s) {', '.join(sorted(unknown))}")
+    counts = [int(n) for n in args.enemies.split(",")]
+    data = load_settings(args.js)
+    hps = [float(row.get("hp") or 10) for row in data.get("ENEMIES", {}).values()] or [10.0]
+
+    results = []
+    mismatch = False
+    for name in args.scenarios.split(","):
+        weapons = scenario_weapons(data, name)
+        print(f"\n{name}: " + ", ".join(f"{w.id} {w.mode} x{w.num}/{w.cooltime}f" for w in weapons)
+              + f"; player {args.fire} bullet(s)/frame, {args.frames} frames after {args.warmup}")
+        print(f"{'enemies':>8} {'method':<6} {'shots':>7} {'effects':>8} {'pair tests':>11} {'broad ms':>9} "
+              f"{'remove ms':>10} {'rest ms':>8} {'p50 ms':>8} {'p95 ms':>8}")
+        over = {}
+        for count in counts:
+            reference = None
+            for method in methods:
+                r = run_case(method, weapons, [hp for hp in hps], count, args)
+                r["scenario"] = name
+                results.append(r)
+                flag = ""
+                if r["frame_ms_p95"] > args.budget_ms:
+                    flag = "  over budget"
+                    over.setdefault(method, count)
+                print(f"{count:>8} {method:<6} {r['peak']['enemy_shots']:>7,} {r['peak']['effects']:>8,} "
+                      f"{r['tests_per_frame']:>11,.0f} {r['broad_ms']:>9.3f} "
+                      f"{r['remove_ms']:>10.3f} {r['rest_ms']:>8.3f} "
+                      f"{r['frame_ms_p50']:>8.3f} {r['frame_ms_p95']:>8.3f}{flag}")
+                if reference is None:
+                    reference = r
+                elif r["totals"] != reference["totals"]:
+                    mismatch = True
+                    print(f"  MISMATCH: {method} {r['totals']} != {reference['method']} {reference['totals']}")
+        print(f"  p95 over {args.budget_ms:.1f} ms from: "
+              + ", ".join(f"{m} {over[m]} enemies" if m in over else f"{m} never" for m in methods))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 1 if mismatch else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
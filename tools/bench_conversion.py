@@ -0,0 +1,77 @@
+"""
+UpgradeTable 変換のベンチマーク (iterrows 版 vs 列指向版)
+
+合成した UpgradeTable (デフォルト 100,000 行) を両方の実装で変換し、
+JSON 出力が一致することを確認した上で処理時間を比較する。
+
+    python tools/bench_conversion.py --rows 100000
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from update_settings import NumpyEncoder, build_upgrade_table
+
+STAT_TYPES = ["HP", "ENGINE", "ACCEL", "BRAKE", "WEAPON_OS", "BeamGun", "Missile", "Bomb", "TwinBeam", "Laser"]
+MATERIALS = ["TypeA", "TypeB", "TypeC", "ItemG", "ItemK"]
+
+def make_upgrade_sheet(rows, seed=0):
+    """Synthetic UpgradeTable with the same columns (and empty MaterialID cells) as the real sheet."""
+    rng = np.random.default_rng(seed)
+    levels = np.arange(rows) % 101
+    material = np.array(rng.choice(MATERIALS, rows), dtype=object)
+    material[levels % 10 != 0] = np.nan
+    return pd.DataFrame({
+        "StatType": np.repeat(STAT_TYPES, -(-rows // len(STAT_TYPES)))[:rows],
+        "Level": levels,
+        "ValuePlus": levels * 10,
+        "Cost": (500 * 1.06 ** levels).astype(np.int64),
+        "MaterialID": material,
+        "MaterialCount": levels // 10,
+    })
+
+def build_upgrade_table_iterrows(df):
+    """The previous implementation, kept here as the reference."""
+    upgrades = {}
+    for _, row in df.iterrows():
+        stat = row['StatType']
+        if stat not in upgrades: upgrades[stat] = []
+        upgrades[stat].append(row.dropna().to_dict())
+    return upgrades
+
+def timed(func, df, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark UpgradeTable sheet-to-dict conversion")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_upgrade_sheet(args.rows)
+    print(f"UpgradeTable: {len(df):,} rows x {len(df.columns)} columns")
+
+    t_old, old = timed(build_upgrade_table_iterrows, df, args.repeat)
+    t_new, new = timed(build_upgrade_table, df, args.repeat)
+
+    same = json.dumps(old, indent=4, ensure_ascii=False, cls=NumpyEncoder) == \
+        json.dumps(new, indent=4, ensure_ascii=False, cls=NumpyEncoder)
+
+    print(f"  iterrows : {t_old * 1000:9.1f} ms")
+    print(f"  columnar : {t_new * 1000:9.1f} ms")
+    print(f"  speedup  : {t_old / t_new:9.1f}x")
+    print(f"  identical JSON: {'yes' if same else 'NO'}")
+    return 0 if same else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,229 @@
+"""
+tools/dev_server.py の負荷試験
+
+同じプロセス内でサーバーを空きポートに立て、--clients 本の keep-alive 接続から --requests 回ずつ
+ゲームの読み込みに近い組み合わせ (index.html, settings_data.js (gzip), 各 js, 効果音スプライト,
+アトラス, BGM の Range 要求) を並行して要求する。2回目以降の要求の --revalidate の割合には前回の
+ETag を If-None-Match で付ける (再読み込み時のブラウザと同じ)。あわせて --subscribers 本の
+Server-Sent Events 接続を張り、再ビルド通知が全タブに届くまでの時間を測る。
+最後に、読めないワークブック (壊れた xlsx) で update_settings.py を走らせたときに、タブへ balance ではなく
+build-error が届くことを確認する (--no-build-check で省略)。ルートの外を指すパス (.., ドライブ名) が
+404 になることも確かめる。
+
+    python tools/bench_dev_server.py
+    python tools/bench_dev_server.py --clients 500 --requests 20 --subscribers 200
+
+クライアントとサーバーが同じイベントループで動くので、数値は下限の目安 (別プロセスのブラウザならもっと速い)。
+"""
+import argparse
+import asyncio
+import glob
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+from dev_server import BASE_DIR, ROOT_DIR, DevServer
+
+def game_paths():
+    """URL paths a page load of index.html requests (hashed assets looked up on disk)."""
+    paths = ["/index.html", "/js/settings_data.js", "/js/engine.js", "/js/Enemy.js", "/js/soundManager.js",
+             "/css/style.css"]
+    for pattern in ("sounds/sfx.*.wav", "assets/atlas/*.png"):
+        paths += ["/" + os.path.relpath(p, ROOT_DIR).replace(os.sep, "/")
+                  for p in glob.glob(os.path.join(ROOT_DIR, pattern))]
+    return [p for p in paths if os.path.exists(os.path.join(ROOT_DIR, p.lstrip("/")))]
+
+RANGE_PATH = "/sounds/Shooter_IngameA.mp3"
+
+async def request(reader, writer, path, headers):
+    """One GET on a keep-alive connection; returns (status, headers, body length)."""
+    lines = [f"GET {path} HTTP/1.1", "Host: localhost", "Accept-Encoding: gzip, deflate, br"]
+    lines += [f"{k}: {v}" for k, v in headers.items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    response = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            response[name.strip().lower()] = value.strip()
+    length = int(response.get("content-length", 0))
+    if length:
+        await reader.readexactly(length)
+    return int(status_line.split(" ")[1]), response, length
+
+async def client(port, paths, count, revalidate, results, rng):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 20)
+    etags = {}
+    try:
+        for _ in range(count):
+            path = rng.choice(paths)
+            headers = {}
+            if path == RANGE_PATH:
+                start = rng.randrange(0, 1 << 20)
+                headers["Range"] = f"bytes={start}-{start + 65535}"
+            elif path in etags and rng.random() < revalidate:
+                headers["If-None-Match"] = etags[path]
+            start = time.perf_counter()
+            try:
+                status, response, length = await request(reader, writer, path, headers)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                results["errors"].append(f"{path}: {e!r}")
+                break
+            results["latency"].append(time.perf_counter() - start)
+            results["status"][status] = results["status"].get(status, 0) + 1
+            results["bytes"] += length
+            if "etag" in response:
+                etags[path] = response["etag"]
+    finally:
+        writer.close()
+
+async def subscriber(port, ready, received):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /__events HTTP/1.1\r\nHost: localhost\r\nAccept: text/event-stream\r\n\r\n")
+    await writer.drain()
+    try:
+        await reader.readuntil(b"event: hello")
+        await reader.readuntil(b"\n\n")
+        ready.release()
+        await reader.readuntil(b"event: balance")
+        received.append(time.perf_counter())
+    finally:
+        writer.close()
+
+# ルートの外・隠しファイルを指すパス (Windows では /D:/x が D:x になる)
+OUTSIDE_PATHS = ["/../README.md", "/%2e%2e/README.md", "/D:/secret.txt", "/C%3A/Windows/win.ini",
+                 "/js/..%5C..%5Csecret.txt", "/.git/config"]
+
+async def check_outside_paths(port):
+    """Paths outside the served root that did not get 404 (empty = all rejected)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    leaked = []
+    try:
+        for path in OUTSIDE_PATHS:
+            status, _, _ = await request(reader, writer, path, {})
+            if status != 404:
+                leaked.append(f"{path} -> {status}")
+    finally:
+        writer.close()
+    print(f"  outside-root paths: {len(OUTSIDE_PATHS) - len(leaked)}/{len(OUTSIDE_PATHS)} rejected with 404")
+    return leaked
+
+async def next_event(port, ready):
+    """Name of the first event after `hello` on a new SSE connection."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /__events HTTP/1.1\r\nHost: localhost\r\nAccept: text/event-stream\r\n\r\n")
+    await writer.drain()
+    try:
+        await reader.readuntil(b"event: hello")
+        await reader.readuntil(b"\n\n")
+        ready.release()
+        while True:
+            line = (await reader.readline()).decode("utf-8").strip()
+            if line.startswith("event: "):
+                return line[len("event: "):]
+    finally:
+        writer.close()
+
+async def check_build_error(dev, port):
+    """Runs a copy of the converter against a corrupt workbook; True if the tabs got `build-error`."""
+    with tempfile.TemporaryDirectory(prefix="bench_dev_server_") as workdir:
+        tools = os.path.join(workdir, "tools")
+        shutil.copytree(BASE_DIR, tools, ignore=shutil.ignore_patterns("__pycache__", ".build_cache", "bench_results",
+                                                                     "profile"))
+        with open(os.path.join(workdir, "game_balance_new.xlsx"), "wb") as f:
+            f.write(b"not a zip file (half-saved workbook)")
+        ready = asyncio.Semaphore(0)
+        watcher = asyncio.create_task(next_event(port, ready))
+        await ready.acquire()
+        converter, dev.converter = dev.converter, os.path.join(tools, "update_settings.py")
+        try:
+            ok = await dev.rebuild(["game_balance_new.xlsx"])
+        finally:
+            dev.converter = converter
+        event = await asyncio.wait_for(watcher, 30)
+    print(f"  corrupt workbook: rebuild {'succeeded' if ok else 'failed'}, tabs received `{event}`")
+    return not ok and event == "build-error"
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+async def run(args):
+    dev = DevServer(watch=False, quiet=True)
+    server = await dev.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    paths = game_paths() + ([RANGE_PATH] if os.path.exists(os.path.join(ROOT_DIR, RANGE_PATH.lstrip("/"))) else [])
+    print(f"Server on port {port}; {len(paths)} paths, {args.clients} clients x {args.requests} requests, "
+          f"{args.subscribers} SSE subscribers")
+
+    leaked = await check_outside_paths(port)
+    ready = asyncio.Semaphore(0)
+    received = []
+    subscribers = [asyncio.create_task(subscriber(port, ready, received)) for _ in range(args.subscribers)]
+    for _ in range(args.subscribers):
+        await ready.acquire()
+
+    results = {"latency": [], "status": {}, "bytes": 0, "errors": []}
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, paths, args.requests, args.revalidate, results,
+                                  random.Random(rng.random())) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    sent = time.perf_counter()
+    notified = dev.broadcast("balance", {"version": "bench"})
+    await asyncio.wait_for(asyncio.gather(*subscribers), 30)
+    fanout = max(received) - sent if received else None
+    build_error_ok = await check_build_error(dev, port) if args.build_check else True
+    # サーバー側の SSE ハンドラーが切断を見て終わるまで待つ
+    for _ in range(500):
+        if not dev.subscribers:
+            break
+        await asyncio.sleep(0.01)
+
+    server.close()
+    await server.wait_closed()
+
+    latency = results["latency"]
+    total = len(latency)
+    print(f"  {total:,} requests in {elapsed:.2f}s = {total / elapsed:,.0f} req/s, "
+          f"{results['bytes'] / elapsed / (1 << 20):,.1f} MiB/s")
+    if latency:
+        print(f"  latency ms: p50 {percentile(latency, 0.5) * 1000:.2f}  p95 {percentile(latency, 0.95) * 1000:.2f}  "
+              f"p99 {percentile(latency, 0.99) * 1000:.2f}  max {max(latency) * 1000:.2f}  "
+              f"mean {statistics.mean(latency) * 1000:.2f}")
+    print(f"  status: {', '.join(f'{k}: {v:,}' for k, v in sorted(results['status'].items()))}")
+    if fanout is not None:
+        print(f"  SSE: notified {notified} subscriber(s), all received in {fanout * 1000:.1f} ms")
+    for error in results["errors"][:10]:
+        print(f"  error: {error}")
+    expected = args.clients * args.requests
+    ok = not results["errors"] and total == expected and len(received) == args.subscribers
+    if not ok:
+        print(f"  FAILED: {total}/{expected} requests, {len(received)}/{args.subscribers} notifications")
+    if not build_error_ok:
+        print("  FAILED: a failed update_settings.py run was not reported as build-error")
+    for path in leaked:
+        print(f"  FAILED: served outside the root: {path}")
+    return 0 if ok and build_error_ok and not leaked else 1
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test tools/dev_server.py with concurrent local clients")
+    parser.add_argument("--clients", type=int, default=200, help="concurrent keep-alive connections")
+    parser.add_argument("--requests", type=int, default=50, help="requests per connection")
+    parser.add_argument("--subscribers", type=int, default=100, help="Server-Sent Events connections")
+    parser.add_argument("--revalidate", type=float, default=0.5,
+                        help="share of repeat requests sent with If-None-Match")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-build-check", dest="build_check", action="store_false",
+                        help="skip the corrupt-workbook build-error check")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+"""
+settings_data.js の出力形式の比較 (サイズとパース時間)
+
+現在の形式 (indent=4) と、--minify / --compact (UPGRADE_TABLE 列形式) の組み合わせを
+同じデータから生成して比較する。node が PATH にあれば、ブラウザに近い条件として
+スクリプトの評価 + UPGRADE_TABLE 全展開までの時間も測る。
+
+    python tools/bench_output_format.py
+"""
+import argparse
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from update_settings import load_excel_data, render_js
+
+VARIANTS = [
+    ("pretty (current)", False, False),
+    ("minified", False, True),
+    ("compact", True, False),
+    ("compact + minified", True, True),
+]
+
+# 評価後に UPGRADE_TABLE を全行展開し、結果を JSON にして返す (正しさの確認にも使う)
+NODE_SCRIPT = r"""
+const fs = require('fs');
+const vm = require('vm');
+// node -e の場合、追加の引数は process.argv[1] から始まる
+const files = JSON.parse(process.argv[1]);
+const repeat = parseInt(process.argv[2], 10);
+const out = {};
+for (const [name, path] of Object.entries(files)) {
+    const src = fs.readFileSync(path, 'utf8');
+    let best = Infinity, snapshot = null;
+    for (let i = 0; i < repeat; i++) {
+        const ctx = {};
+        const t0 = process.hrtime.bigint();
+        vm.runInNewContext(src + '\nthis.__data = GAME_BALANCE_DATA;', ctx);
+        const table = ctx.__data.UPGRADE_TABLE || {};
+        for (const stat of Object.keys(table)) table[stat].length;
+        const ms = Number(process.hrtime.bigint() - t0) / 1e6;
+        best = Math.min(best, ms);
+        snapshot = JSON.stringify(ctx.__data);
+    }
+    out[name] = { ms: best, snapshot };
+}
+process.stdout.write(JSON.stringify(out));
+"""
+
+def json_part(src):
+    start = src.index('{')
+    end = src.index(';\n', start)
+    return src[start:end]
+
+def python_parse_ms(src, repeat):
+    body = json_part(src)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        json.loads(body)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def node_eval(sources, repeat):
+    node = shutil.which("node")
+    if not node:
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {}
+        for i, (name, src) in enumerate(sources.items()):
+            path = os.path.join(tmp, f"variant{i}.js")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(src)
+            files[name] = path
+        result = subprocess.run([node, "-e", NODE_SCRIPT, json.dumps(files), str(repeat)],
+                                capture_output=True, text=True, encoding="utf-8", check=True)
+    return json.loads(result.stdout)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare settings_data.js output formats")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = load_excel_data()
+    if not data:
+        return 1
+
+    sources = {name: render_js(data, columnar=columnar, minify=minify) for name, columnar, minify in VARIANTS}
+    node = node_eval(sources, args.repeat)
+
+    base = len(sources[VARIANTS[0][0]].encode("utf-8"))
+    print(f"\n{'format':<20} {'lines':>7} {'bytes':>10} {'gzip':>9} {'size':>6} {'json.loads':>11} {'node eval':>10}")
+    for name, src in sources.items():
+        raw = src.encode("utf-8")
+        node_ms = f"{node[name]['ms']:8.2f}ms" if node else "       n/a"
+        print(f"{name:<20} {src.count(chr(10)):>7} {len(raw):>10,} {len(gzip.compress(raw)):>9,} "
+              f"{len(raw) / base:>5.0%} {python_parse_ms(src, args.repeat):>9.2f}ms {node_ms:>10}")
+
+    if node:
+        reference = node[VARIANTS[0][0]]["snapshot"]
+        same = all(v["snapshot"] == reference for v in node.values())
+        print(f"\nDecoded GAME_BALANCE_DATA identical across formats: {'yes' if same else 'NO'}")
+        return 0 if same else 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
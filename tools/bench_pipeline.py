@@ -0,0 +1,195 @@
+"""
+データパイプラインのベンチマーク (合成ワークブックの倍率ごと)
+
+make_synthetic_workbook.py で 1×, 10×, 100× (--scales) のワークブックを作り、update_settings.py と
+同じ段階を1つずつ計測する:
+
+    migration      schema_migrations.migrate_workbook (最新版なのでヘッダー確認だけ)
+    excel_load     シート XML の読み込み + excel_loader.load_sheets
+    conversion     SECTIONS の各ビルダー (ビルドキャッシュは使わない)
+    validation     validate_data.validate_data
+    js_generation  update_settings.render_js + 書き出し
+    upgrade_export export_upgrade_table.export (xlsx)
+
+時間は --repeat 回の最小値、メモリは別に1回 tracemalloc を有効にして測ったピーク
+(Python のアロケーションのみ)。結果は JSON (既定 tools/bench_results/pipeline-<commit>.json)
+に保存し、--compare で以前の結果と比べる (--threshold より遅くなった段階があれば終了コード 1)。
+
+    python tools/bench_pipeline.py
+    python tools/bench_pipeline.py --scales 1,10,100,1000 --repeat 1
+    python tools/bench_pipeline.py --compare tools/bench_results/pipeline-abc1234.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from excel_loader import load_sheets
+from export_upgrade_table import export
+from make_synthetic_workbook import TEMPLATE_PATH, copy_id, make_workbook
+from schema_migrations import migrate_workbook
+from update_settings import SECTIONS, PrefetchedWorkbook, read_sheet_xml, render_js
+from upgrade_curves import load_param_config
+from validate_data import validate_data
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BASE_DIR, "bench_results")
+
+class Pipeline:
+    """One workbook run through the stages; each stage reads what the previous ones left."""
+
+    def __init__(self, path, workdir, scale, jobs=1):
+        self.path = path
+        self.workdir = workdir
+        self.scale = scale
+        self.jobs = jobs
+        self.frames = self.data = None
+
+    def migration(self):
+        migrate_workbook(self.path)
+
+    def excel_load(self):
+        self.sheet_names = list(read_sheet_xml(self.path))
+        self.frames = load_sheets(self.path, self.sheet_names, jobs=self.jobs)[0]
+
+    def conversion(self):
+        xls = PrefetchedWorkbook(self.sheet_names, self.frames)
+        data = {}
+        for _, _, builder in SECTIONS:
+            data.update(builder(xls))
+        self.data = data
+
+    def validation(self):
+        self.report = validate_data(self.data)
+
+    def js_generation(self):
+        with open(os.path.join(self.workdir, "settings_data.js"), "w", encoding="utf-8") as f:
+            f.write(render_js(self.data))
+
+    def upgrade_export(self):
+        # 複製したパーツにも元の PARAM_CONFIG を割り当てる
+        config = load_param_config()
+        config.update({copy_id(k, n): v for k, v in list(config.items()) for n in range(1, self.scale)})
+        export(self.data, config, [os.path.join(self.workdir, "upgrade_table_gen.xlsx")])
+
+STAGES = ["migration", "excel_load", "conversion", "validation", "js_generation", "upgrade_export"]
+
+def run_stage(pipeline, stage, repeat):
+    """Best wall time of `repeat` runs, then one run under tracemalloc for the peak."""
+    best = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            getattr(pipeline, stage)()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        tracemalloc.start()
+        try:
+            getattr(pipeline, stage)()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {"seconds": best, "peak_mb": peak / (1024 * 1024)}
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(scales, repeat, jobs, workdir):
+    results = []
+    for scale in scales:
+        path = os.path.join(workdir, f"balance_x{scale}.xlsx")
+        start = time.perf_counter()
+        rows = make_workbook(path, scale, template=TEMPLATE_PATH)
+        generate = time.perf_counter() - start
+        print(f"\n{scale}x: {os.path.getsize(path):,} bytes, {sum(rows.values()):,} rows "
+              f"(generated in {generate:.1f}s)")
+        pipeline = Pipeline(path, workdir, scale, jobs)
+        stages = {}
+        for stage in STAGES:
+            stages[stage] = r = run_stage(pipeline, stage, repeat)
+            print(f"  {stage:<15} {r['seconds'] * 1000:10.1f} ms  {r['peak_mb']:8.1f} MB")
+        if not pipeline.report["ok"]:
+            print(f"  warning: validation reported {pipeline.report['errors']} error(s)")
+        results.append({"scale": scale, "rows": rows, "workbook_bytes": os.path.getsize(path),
+                        "references": pipeline.report["references"], "stages": stages})
+    return results
+
+def compare(results, baseline, threshold):
+    """Prints current / baseline per stage; returns the number of stages slower than `threshold`."""
+    old = {r["scale"]: r for r in baseline["results"]}
+    slower = 0
+    print(f"\nCompared with {baseline.get('commit') or '?'} ({baseline.get('date', '?')}):")
+    for r in results:
+        if r["scale"] not in old:
+            continue
+        for stage, s in r["stages"].items():
+            before = old[r["scale"]]["stages"].get(stage)
+            if not before or not before["seconds"]:
+                continue
+            ratio = s["seconds"] / before["seconds"]
+            mark = ""
+            if ratio > threshold:
+                mark = "  SLOWER"
+                slower += 1
+            print(f"  {r['scale']:>5}x {stage:<15} {before['seconds'] * 1000:10.1f} -> "
+                  f"{s['seconds'] * 1000:10.1f} ms  x{ratio:5.2f}{mark}")
+    return slower
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the balance data pipeline on synthetic workbooks")
+    parser.add_argument("--scales", default="1,10,100", help="comma-separated scale factors (e.g. 1,10,100,1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage (best is kept)")
+    parser.add_argument("--jobs", type=int, default=1, help="sheet loading processes (see update_settings --jobs)")
+    parser.add_argument("--output", help="results JSON (default: tools/bench_results/pipeline-<commit>.json)")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    parser.add_argument("--keep", help="directory for the generated workbooks and outputs (default: temporary)")
+    args = parser.parse_args()
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+
+    commit = git_commit()
+    if args.keep:
+        os.makedirs(args.keep, exist_ok=True)
+        results = run(scales, args.repeat, args.jobs, args.keep)
+    else:
+        with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as workdir:
+            results = run(scales, args.repeat, args.jobs, workdir)
+
+    report = {
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "jobs": args.jobs,
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"pipeline-{commit or 'nogit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
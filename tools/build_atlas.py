@@ -0,0 +1,296 @@
+"""
+スプライト PNG のテクスチャアトラス生成
+
+assets/png/*.png を
+    1. 透明な余白をカット
+    2. ゲーム内の描画サイズ (DRAW_SIZES, --pixel-ratio 倍) に縮小
+    3. 2 のべき乗サイズのアトラス (最大 MAX_SIZE, 入りきらなければ複数枚) に MaxRects で詰める
+して assets/atlas/sprites-<n>.<hash>.png と js/sprite_atlas.js (SPRITE_ATLAS, 中身は JSON) に書き出す。
+マニフェストのフレームはファイル名 (debris001_300x300.png → "debris001")、models は Enemies シートの
+Model 名 → フレーム名の一覧 (Model と同名の PNG、無ければ Model 名で始まる PNG すべて)。
+
+    python tools/build_atlas.py              # 変わった PNG だけ処理し直す
+    python tools/build_atlas.py --force      # 全部作り直す
+    python tools/build_atlas.py --pixel-ratio 2
+
+切り出したフレームは tools/.build_cache/atlas/ にキャッシュし、PNG のサイズ・mtime (変わっていれば
+SHA-256) が同じならそのまま使う。何も変わっていなければアトラスも書き直さない。
+描画側は js/spriteAtlas.js の SpriteAtlas.draw() (余白カット分のオフセットを戻して描く)。
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+
+from PIL import Image
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.join(BASE_DIR, "..")
+SOURCE_DIR = os.path.join(ROOT_DIR, "assets/png")
+ATLAS_DIR = os.path.join(ROOT_DIR, "assets/atlas")
+MANIFEST_PATH = os.path.join(ROOT_DIR, "js/sprite_atlas.js")
+CACHE_DIR = os.path.join(BASE_DIR, ".build_cache", "atlas")
+ATLAS_PREFIX = "sprites-"
+HASH_LENGTH = 10
+
+# ゲーム内の描画サイズ (engine.js の playerSprite 80x80, Enemy.js の width/height 40)
+DRAW_SIZES = [
+    (r"^playership", (80, 80)),
+    (r"^EnemyShip", (40, 40)),
+    (r"^debris", (40, 40)),
+]
+MAX_SIZE = 2048
+PADDING = 2
+# この値以下のアルファは透明とみなして切り落とす
+ALPHA_THRESHOLD = 0
+
+def frame_name(path):
+    """debris001_300x300.png -> debris001 (the size suffix is dropped)."""
+    return re.sub(r"_\d+x\d+$", "", os.path.splitext(os.path.basename(path))[0])
+
+def draw_size(name, image_size):
+    for pattern, size in DRAW_SIZES:
+        if re.search(pattern, name):
+            return size
+    return image_size
+
+# --- Frames ---
+
+def make_frame(path, pixel_ratio=1):
+    """Trimmed, downscaled RGBA image plus its placement inside the draw box (draw units)."""
+    image = Image.open(path).convert("RGBA")
+    name = frame_name(path)
+    width, height = draw_size(name, image.size)
+    alpha = image.getchannel("A").point(lambda a: 255 if a > ALPHA_THRESHOLD else 0)
+    box = alpha.getbbox() or (0, 0, 1, 1)
+    sx, sy = width / image.width, height / image.height
+    trim = {"x": box[0] * sx, "y": box[1] * sy, "w": (box[2] - box[0]) * sx, "h": (box[3] - box[1]) * sy}
+    pixels = (max(round(trim["w"] * pixel_ratio), 1), max(round(trim["h"] * pixel_ratio), 1))
+    frame = image.crop(box).resize(pixels, Image.LANCZOS)
+    return frame, {"size": {"w": width, "h": height}, "trim": {k: round(v, 3) for k, v in trim.items()}}
+
+# --- Packing (MaxRects, best short side fit) ---
+
+class MaxRects:
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.free = [(0, 0, width, height)]
+
+    def insert(self, w, h):
+        best = None
+        for fx, fy, fw, fh in self.free:
+            if w <= fw and h <= fh:
+                score = (min(fw - w, fh - h), max(fw - w, fh - h))
+                if best is None or score < best[0]:
+                    best = (score, fx, fy)
+        if best is None:
+            return None
+        _, x, y = best
+        self._split(x, y, w, h)
+        return x, y
+
+    def _split(self, x, y, w, h):
+        free = []
+        for fx, fy, fw, fh in self.free:
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                free.append((fx, fy, fw, fh))
+                continue
+            if x > fx:
+                free.append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                free.append((x + w, fy, fx + fw - x - w, fh))
+            if y > fy:
+                free.append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                free.append((fx, y + h, fw, fy + fh - y - h))
+        # 他の空き領域に含まれる領域を除く
+        self.free = [a for i, a in enumerate(free)
+                     if not any(i != j and b[0] <= a[0] and b[1] <= a[1] and a[0] + a[2] <= b[0] + b[2]
+                                and a[1] + a[3] <= b[1] + b[3] and (a != b or j < i)
+                                for j, b in enumerate(free))]
+
+def _pack_page(sizes, width, height):
+    packer = MaxRects(width, height)
+    placed = {}
+    for name, (w, h) in sizes:
+        pos = packer.insert(w + PADDING, h + PADDING)
+        if pos is None:
+            return placed, False
+        placed[name] = pos
+    return placed, True
+
+def _pot(n):
+    return 1 << max(n - 1, 0).bit_length()
+
+def pack(sizes, max_size=MAX_SIZE):
+    """[(name, (w, h))] -> [(page_w, page_h, {name: (x, y)})], each page the smallest power of two that fits."""
+    remaining = sorted(sizes, key=lambda item: (max(item[1]), item[1][0] * item[1][1]), reverse=True)
+    for name, (w, h) in remaining:
+        if w + PADDING > max_size or h + PADDING > max_size:
+            raise ValueError(f"{name} ({w}x{h}) does not fit in a {max_size}x{max_size} atlas")
+    pages = []
+    while remaining:
+        area = sum((w + PADDING) * (h + PADDING) for _, (w, h) in remaining)
+        width = height = min(_pot(int(area ** 0.5)), max_size)
+        width = max(width, _pot(max(w for _, (w, _h) in remaining) + PADDING))
+        height = max(height, _pot(max(h for _, (_w, h) in remaining) + PADDING))
+        while True:
+            placed, complete = _pack_page(remaining, width, height)
+            if complete or (width >= max_size and height >= max_size):
+                break
+            if width <= height and width < max_size:
+                width *= 2
+            else:
+                height *= 2
+        pages.append((width, height, placed))
+        remaining = [item for item in remaining if item[0] not in placed]
+    return pages
+
+# --- Incremental build ---
+
+def _file_state(path):
+    st = os.stat(path)
+    return {"bytes": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def _sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def load_state():
+    try:
+        with open(os.path.join(CACHE_DIR, "state.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(state):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(os.path.join(CACHE_DIR, "state.json"), "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+def _unchanged(entry, path):
+    if not entry or not os.path.exists(os.path.join(CACHE_DIR, entry["frame_file"])):
+        return False
+    state = _file_state(path)
+    if state["bytes"] != entry.get("bytes"):
+        return False
+    return state["mtime_ns"] == entry["mtime_ns"] or _sha256(path) == entry["sha256"]
+
+def model_frames(models, frames):
+    """{Model: [frame names]}: the frame named like the model, else every frame starting with it."""
+    result = {}
+    for model in models:
+        if model in frames:
+            result[model] = [model]
+        else:
+            result[model] = sorted(name for name in frames if name.startswith(model))
+    return result
+
+def enemy_models():
+    """Model names of the Enemies sheet (from the generated settings_data.js)."""
+    from settings_store import load_settings
+    try:
+        data = load_settings()
+    except (OSError, ValueError):
+        return []
+    return sorted({e.get("model") for e in data.get("ENEMIES", {}).values() if e.get("model")})
+
+def build(force=False, pixel_ratio=1, max_size=MAX_SIZE):
+    """Updates the atlas; returns (manifest or None if nothing changed, {name: 'cached'|'built'})."""
+    params = {"pixel_ratio": pixel_ratio, "max_size": max_size, "padding": PADDING, "draw_sizes": DRAW_SIZES}
+    state = {} if force else load_state()
+    if state.get("params") != json.loads(json.dumps(params)):
+        state = {}
+    sources = sorted(glob.glob(os.path.join(SOURCE_DIR, "*.png")))
+    old = state.get("sources", {})
+    status, entries, frames = {}, {}, {}
+    for path in sources:
+        name = frame_name(path)
+        key = os.path.basename(path)
+        if _unchanged(old.get(key), path):
+            entries[key] = entry = dict(old[key], **_file_state(path))
+            frames[name] = Image.open(os.path.join(CACHE_DIR, entry["frame_file"])).convert("RGBA")
+            status[name] = "cached"
+            continue
+        frame, placement = make_frame(path, pixel_ratio)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        frame_file = f"{name}.png"
+        frame.save(os.path.join(CACHE_DIR, frame_file))
+        entries[key] = dict(_file_state(path), sha256=_sha256(path), frame_file=frame_file, name=name, **placement)
+        frames[name] = frame
+        status[name] = "built"
+
+    models = enemy_models()
+    outputs_exist = all(os.path.exists(os.path.join(ROOT_DIR, p)) for p in state.get("outputs", [])) \
+        and os.path.exists(MANIFEST_PATH)
+    if (state.get("outputs") and outputs_exist and set(entries) == set(old)
+            and all(s == "cached" for s in status.values()) and state.get("models") == models):
+        # touch されただけの PNG は mtime を更新しておく (次回はハッシュ計算を省く)
+        save_state(dict(state, sources=entries))
+        return None, status
+
+    pages = pack([(name, frame.size) for name, frame in frames.items()], max_size)
+    manifest = {"pixelRatio": pixel_ratio, "pages": [], "frames": {}, "models": model_frames(models, frames)}
+    by_name = {e["name"]: e for e in entries.values()}
+    for index, (width, height, placed) in enumerate(pages):
+        atlas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        for name, (x, y) in placed.items():
+            atlas.paste(frames[name], (x, y))
+            w, h = frames[name].size
+            manifest["frames"][name] = {"page": index, "x": x, "y": y, "w": w, "h": h,
+                                        "size": by_name[name]["size"], "trim": by_name[name]["trim"]}
+        data = atlas.tobytes()
+        digest = hashlib.sha256(data + f"{width}x{height}".encode()).hexdigest()[:HASH_LENGTH]
+        file_name = f"{ATLAS_PREFIX}{index}.{digest}.png"
+        path = os.path.join(ATLAS_DIR, file_name)
+        if not os.path.exists(path):
+            os.makedirs(ATLAS_DIR, exist_ok=True)
+            atlas.save(path, optimize=True)
+        manifest["pages"].append({"file": f"assets/atlas/{file_name}", "w": width, "h": height})
+    manifest["frames"] = dict(sorted(manifest["frames"].items()))
+
+    current = {os.path.basename(p["file"]) for p in manifest["pages"]}
+    for old_page in glob.glob(os.path.join(ATLAS_DIR, f"{ATLAS_PREFIX}*.png")):
+        if os.path.basename(old_page) not in current:
+            os.remove(old_page)
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        f.write("// Automatically generated by tools/build_atlas.py\n")
+        # file:// でも読めるように JSON をスクリプトとして埋め込む (settings_data.js と同じ)
+        f.write("const SPRITE_ATLAS = " + json.dumps(manifest, indent=4) + ";\n")
+
+    save_state({"params": params, "sources": entries, "models": models,
+                "outputs": [p["file"] for p in manifest["pages"]]})
+    return manifest, status
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack assets/png/*.png into power-of-two texture atlases")
+    parser.add_argument("--force", action="store_true", help="ignore the frame cache")
+    parser.add_argument("--pixel-ratio", type=float, default=1, help="atlas pixels per draw unit (2 = HiDPI)")
+    parser.add_argument("--max-size", type=int, default=MAX_SIZE, help="largest atlas page (power of two)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest, status = build(args.force, args.pixel_ratio, args.max_size)
+    built = [name for name, s in status.items() if s == "built"]
+    print(f"{len(status)} sprite(s): {len(built)} processed, {len(status) - len(built)} cached "
+          f"({time.perf_counter() - start:.2f}s)")
+    if manifest is None:
+        print(f"Atlas up to date ({os.path.relpath(MANIFEST_PATH, ROOT_DIR)})")
+        return 0
+
+    sources = sorted(glob.glob(os.path.join(SOURCE_DIR, "*.png")))
+    before = sum(os.path.getsize(p) for p in sources)
+    after = sum(os.path.getsize(os.path.join(ROOT_DIR, p["file"])) for p in manifest["pages"])
+    for page in manifest["pages"]:
+        print(f"  {page['file']} ({page['w']}x{page['h']})")
+    print(f"  today : {len(sources)} PNG files, {before:,} bytes")
+    print(f"  atlas : {len(manifest['pages'])} file(s), {after:,} bytes, {len(manifest['frames'])} frames")
+    for model, names in manifest["models"].items():
+        print(f"  model {model}: {', '.join(names) if names else '(no sprite)'}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
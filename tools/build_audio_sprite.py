@@ -0,0 +1,269 @@
+"""
+効果音のオーディオスプライト生成
+
+sounds/*.wav (効果音) を読み、
+    1. 前後の無音をカット (SILENCE_DB 以下, 端に短いフェード)
+    2. 音量を揃える (RMS を全クリップの平均 (dB) に, ピークは PEAK_DB まで)
+    3. サンプリングレートを揃える (FFT リサンプル)
+して1本の 16bit WAV (sounds/sfx.<hash>.wav) に並べ、各音の位置を js/sound_sprite.js の
+SOUND_SPRITE (offset / duration 秒) に書き出す。SoundManager はこの1ファイルだけを取得・デコードし、
+AudioBufferSourceNode.start(0, offset, duration) で区間を再生する。
+
+揃える先は既定で元のクリップの RMS の平均なので、効果音全体の音量 (BGM とのバランス) は変わらない。
+各音にかけたゲインは SOUND_SPRITE の gain (倍率) に残し、スプライトを使えない時の HTML5 Audio のプールも
+同じ倍率で鳴らす (どちらで読み込まれても同じ音量になる)。
+
+    python tools/build_audio_sprite.py                # 生成 + 現状との比較
+    python tools/build_audio_sprite.py --rate 22050   # レートを下げてサイズを削る
+
+WAV は標準の wave モジュールで読む。wave が扱えない IEEE float (format 3) / WAVE_FORMAT_EXTENSIBLE は
+RIFF チャンクを直接読む。ファイル名に内容のハッシュが入るので、変わらなければ URL (ブラウザのキャッシュ) も変わらない。
+"""
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+import struct
+import wave
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.join(BASE_DIR, "..")
+SOUNDS_DIR = os.path.join(ROOT_DIR, "sounds")
+SOUND_MANAGER_PATH = os.path.join(ROOT_DIR, "js/soundManager.js")
+MANIFEST_PATH = os.path.join(ROOT_DIR, "js/sound_sprite.js")
+SPRITE_PREFIX = "sfx."
+HASH_LENGTH = 10
+
+RATE = 44100
+SILENCE_DB = -50.0
+TARGET_RMS_DB = None   # None = 元のクリップの RMS (dB) の平均
+PEAK_DB = -1.0
+FADE_SECONDS = 0.002
+GAP_SECONDS = 0.05
+
+# --- Reading ---
+
+def _pcm_to_float(raw, width):
+    if width == 1:
+        return (np.frombuffer(raw, np.uint8).astype(np.float64) - 128) / 128
+    if width == 3:
+        b = np.frombuffer(raw, np.uint8).reshape(-1, 3).astype(np.int32)
+        x = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+        return ((x << 8) >> 8) / float(1 << 23)
+    dtype = {2: "<i2", 4: "<i4"}[width]
+    return np.frombuffer(raw, dtype).astype(np.float64) / float(1 << (8 * width - 1))
+
+def _read_riff(path):
+    """(format tag, channels, rate, bits, data bytes) straight from the RIFF chunks."""
+    with open(path, "rb") as f:
+        riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave_id != b"WAVE":
+            raise ValueError(f"{path}: not a RIFF/WAVE file")
+        fmt = data = None
+        while fmt is None or data is None:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path}: missing fmt or data chunk")
+            chunk_id, size = struct.unpack("<4sI", header)
+            body = f.read(size + (size & 1))[:size]
+            if chunk_id == b"fmt ":
+                fmt = struct.unpack("<HHIIHH", body[:16])
+                if fmt[0] == 0xFFFE:  # WAVE_FORMAT_EXTENSIBLE: 本当の形式は SubFormat GUID の先頭 2 バイト
+                    fmt = (struct.unpack("<H", body[24:26])[0],) + fmt[1:]
+            elif chunk_id == b"data":
+                data = body
+    tag, channels, rate, _, _, bits = fmt
+    return tag, channels, rate, bits, data
+
+def read_wav(path):
+    """Returns (samples [frames, channels] float64 in -1..1, rate)."""
+    try:
+        with wave.open(path, "rb") as w:
+            channels, width, rate = w.getnchannels(), w.getsampwidth(), w.getframerate()
+            raw = w.readframes(w.getnframes())
+        samples = _pcm_to_float(raw, width)
+    except wave.Error:
+        tag, channels, rate, bits, raw = _read_riff(path)
+        if tag == 3:
+            samples = np.frombuffer(raw[:len(raw) - len(raw) % (bits // 8)], {32: "<f4", 64: "<f8"}[bits])
+            samples = samples.astype(np.float64)
+        elif tag == 1:
+            samples = _pcm_to_float(raw[:len(raw) - len(raw) % (bits // 8)], bits // 8)
+        else:
+            raise ValueError(f"{path}: unsupported WAV format {tag}")
+    frames = len(samples) // channels
+    return samples[:frames * channels].reshape(frames, channels), rate
+
+# --- Processing ---
+
+def db(value):
+    return 20 * np.log10(max(value, 1e-12))
+
+def trim_silence(x, rate, threshold_db=SILENCE_DB, fade=FADE_SECONDS):
+    """Cuts leading/trailing samples below the threshold and fades the new edges."""
+    level = np.abs(x).max(axis=1)
+    loud = np.flatnonzero(level > 10 ** (threshold_db / 20))
+    if not len(loud):
+        return x[:0]
+    x = x[loud[0]:loud[-1] + 1].copy()
+    n = min(int(rate * fade), len(x) // 2)
+    if n:
+        ramp = np.linspace(0, 1, n, endpoint=False)[:, None]
+        x[:n] *= ramp
+        x[len(x) - n:] *= ramp[::-1]
+    return x
+
+def rms_db(x):
+    return db(np.sqrt(np.mean(x ** 2))) if len(x) else None
+
+def normalize(x, target_db, peak_db=PEAK_DB):
+    """Scales to the target RMS, limited so the peak stays at or below peak_db. Returns (x, gain_db)."""
+    if not len(x):
+        return x, 0.0
+    gain = min(target_db - rms_db(x), peak_db - db(np.abs(x).max()))
+    return x * 10 ** (gain / 20), gain
+
+def resample(x, rate, target):
+    """Band-limited resampling of a whole clip (FFT zero-padding / truncation)."""
+    if rate == target or not len(x):
+        return x
+    n_out = max(int(round(len(x) * target / rate)), 1)
+    spectrum = np.fft.rfft(x, axis=0)
+    bins = n_out // 2 + 1
+    if bins <= len(spectrum):
+        spectrum = spectrum[:bins]
+    else:
+        spectrum = np.vstack([spectrum, np.zeros((bins - len(spectrum), x.shape[1]), spectrum.dtype)])
+    return np.fft.irfft(spectrum, n_out, axis=0) * (n_out / len(x))
+
+def is_dual_mono(clips, tolerance_db=-60.0):
+    """True when every clip's channels are (nearly) identical, so the sprite can be mono."""
+    limit = 10 ** (tolerance_db / 20)
+    return all(c.shape[1] == 1 or np.abs(c - c[:, :1]).max() <= limit for c in clips)
+
+# --- Sprite ---
+
+def build_sprite(paths, rate=RATE, gap=GAP_SECONDS, mono=None, target_db=TARGET_RMS_DB):
+    """Processes the clips and lays them out end to end.
+
+    target_db=None normalizes to the mean RMS (dB) of the trimmed clips, so the average loudness stays the same.
+    Returns (samples [frames, channels] float, {name: region}, [per-clip report], target dB).
+    """
+    trimmed = {}
+    for path in paths:
+        x, src_rate = read_wav(path)
+        trimmed[path] = (trim_silence(x, src_rate), src_rate, len(x) / src_rate)
+    if target_db is None:
+        levels = [rms_db(x) for x, _, _ in trimmed.values() if len(x)]
+        target_db = float(np.mean(levels)) if levels else PEAK_DB
+
+    clips, gains, report = {}, {}, []
+    for path, (x, src_rate, original) in trimmed.items():
+        name = os.path.splitext(os.path.basename(path))[0]
+        x, gain = normalize(x, target_db)
+        x = resample(x, src_rate, rate)
+        clips[name] = x
+        gains[name] = gain
+        report.append({"name": name, "file": os.path.relpath(path, ROOT_DIR), "bytes": os.path.getsize(path),
+                       "rate": src_rate, "channels": x.shape[1], "seconds": original,
+                       "trimmed": len(x) / rate, "gain_db": gain})
+
+    if mono is None:
+        mono = is_dual_mono(clips.values())
+    channels = 1 if mono else max(c.shape[1] for c in clips.values())
+    gap_frames = int(round(gap * rate))
+    regions, parts, offset = {}, [], 0
+    for name, x in clips.items():
+        x = x.mean(axis=1, keepdims=True) if mono else np.repeat(x, channels // x.shape[1], axis=1)
+        regions[name] = {"offset": round(offset / rate, 6), "duration": round(len(x) / rate, 6),
+                         "gain": round(10 ** (gains[name] / 20), 4)}
+        parts += [x, np.zeros((gap_frames, channels))]
+        offset += len(x) + gap_frames
+    samples = np.vstack(parts) if parts else np.zeros((0, channels))
+    return samples, regions, report, target_db
+
+def encode_wav(samples, rate):
+    """16-bit PCM WAV bytes."""
+    pcm = np.clip(np.round(samples * 32767), -32768, 32767).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(samples.shape[1])
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+def write_sprite(wav_bytes, regions, rate, channels):
+    """Writes sounds/sfx.<hash>.wav (removing older sprites) and js/sound_sprite.js; returns the sprite path."""
+    digest = hashlib.sha256(wav_bytes).hexdigest()[:HASH_LENGTH]
+    file_name = f"{SPRITE_PREFIX}{digest}.wav"
+    for old in glob.glob(os.path.join(SOUNDS_DIR, f"{SPRITE_PREFIX}*.wav")):
+        if os.path.basename(old) != file_name:
+            os.remove(old)
+    path = os.path.join(SOUNDS_DIR, file_name)
+    with open(path, "wb") as f:
+        f.write(wav_bytes)
+
+    manifest = {"url": f"sounds/{file_name}", "hash": digest, "rate": rate, "channels": channels,
+                "bytes": len(wav_bytes), "sounds": regions}
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        f.write("// Automatically generated by tools/build_audio_sprite.py\n")
+        f.write("const SOUND_SPRITE = " + json.dumps(manifest, indent=4) + ";\n")
+    return path
+
+def sound_pools(path=SOUND_MANAGER_PATH):
+    """{key: (url, poolSize)} from SoundManager.SES (what the HTML5 pools load today)."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    return {key: (url, int(size)) for key, url, size in
+            re.findall(r"(\w+):\s*\{\s*url:\s*'([^']+)',\s*(?:sprite:\s*'[^']*',\s*)?poolSize:\s*(\d+)", source)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack sounds/*.wav into one audio sprite + js/sound_sprite.js")
+    parser.add_argument("--rate", type=int, default=RATE, help="sample rate of the sprite")
+    parser.add_argument("--gap", type=float, default=GAP_SECONDS, help="silence between clips (seconds)")
+    parser.add_argument("--target-db", type=float, default=TARGET_RMS_DB,
+                        help="RMS level to normalize to (default: the clips' mean, keeping today's loudness)")
+    channels = parser.add_mutually_exclusive_group()
+    channels.add_argument("--mono", dest="mono", action="store_true", default=None, help="always downmix")
+    channels.add_argument("--stereo", dest="mono", action="store_false", help="keep stereo even for dual-mono clips")
+    args = parser.parse_args()
+
+    paths = sorted(p for p in glob.glob(os.path.join(SOUNDS_DIR, "*.wav"))
+                   if not os.path.basename(p).startswith(SPRITE_PREFIX))
+    if not paths:
+        print(f"No WAV files in {SOUNDS_DIR}")
+        return 1
+    samples, regions, report, target_db = build_sprite(paths, args.rate, args.gap, args.mono, args.target_db)
+    wav_bytes = encode_wav(samples, args.rate)
+    path = write_sprite(wav_bytes, regions, args.rate, samples.shape[1])
+
+    print(f"Normalized to {target_db:.1f} dBFS RMS")
+    print(f"{'sound':<10} {'bytes':>9} {'rate':>6} {'sec':>7} {'trimmed':>8} {'gain dB':>8} {'offset':>8}")
+    for r in report:
+        print(f"{r['name']:<10} {r['bytes']:>9,} {r['rate']:>6} {r['seconds']:7.3f} {r['trimmed']:8.3f} "
+              f"{r['gain_db']:+8.1f} {regions[r['name']]['offset']:8.3f}")
+
+    pools = sound_pools()
+    used = {os.path.basename(url) for url, _ in pools.values()}
+    before = sum(r["bytes"] for r in report if os.path.basename(r["file"]) in used)
+    elements = sum(size for _, size in pools.values())
+    print(f"\nWrote {os.path.relpath(path, ROOT_DIR)} ({len(wav_bytes):,} bytes, {args.rate} Hz, "
+          f"{'mono' if samples.shape[1] == 1 else 'stereo'}, {len(samples) / args.rate:.2f}s) "
+          f"and {os.path.relpath(MANIFEST_PATH, ROOT_DIR)}")
+    print(f"  today : {len(used)} WAV files, {before:,} bytes, {len(used)} fetches + decodes, "
+          f"{elements} <audio> elements in the SE pools")
+    print(f"  sprite: 1 file, {len(wav_bytes):,} bytes ({len(wav_bytes) / max(before, 1):.0%}), "
+          f"1 fetch + decode, no pools (one AudioBufferSourceNode per play)")
+    missing = [name for name in {os.path.splitext(u)[0] for u in used} if name not in regions]
+    if missing:
+        print(f"  warning: SoundManager uses sounds missing from the sprite: {', '.join(missing)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+"""
+alias テーブルの検証 (統計テスト)
+
+update_settings.py が生成する DROP_ALIAS (Exclusive のドロップ表だけ) / WEATHER_ALIAS / DIFFICULTY_ALIAS が、
+元のシートの確率 (DropTables の Rate, WeatherTables, MissionScaling) を再現しているかを確認する。
+
+1. 厳密チェック: alias テーブルが表す分布を解析的に計算し、元の確率と一致するか
+2. 統計チェック: JS の pickAlias と同じ手順で N 回抽選し、カイ二乗適合度検定を行う
+
+    python tools/check_alias_tables.py --draws 1000000
+"""
+import argparse
+import math
+
+import numpy as np
+
+from alias_tables import alias_probabilities, cumulative_percent_distribution, drop_distribution, merge_outcomes
+from update_settings import load_excel_data
+
+EXACT_TOLERANCE = 1e-9
+
+def sample_alias(table, draws, rng):
+    """Same steps as pickAlias() in js/settings.js, vectorised. Returns outcome indices."""
+    n = len(table["values"])
+    u = rng.random(draws) * n
+    i = u.astype(np.int64)
+    prob = np.asarray(table["prob"])
+    alias = np.asarray(table["alias"])
+    return np.where(u - i < prob[i], i, alias[i])
+
+def chi_square_p_value(stat, dof):
+    """Upper tail of the chi-square distribution (Wilson-Hilferty approximation)."""
+    if dof <= 0:
+        return 1.0
+    z = ((stat / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / math.sqrt(2 / (9 * dof))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def check_table(label, table, values, probs, draws, rng, alpha):
+    expected = dict(zip(*merge_outcomes(values, probs)))
+    expected = {v: p for v, p in expected.items() if p > 0}
+
+    actual = alias_probabilities(table)
+    exact_error = max(abs(actual.get(v, 0.0) - expected.get(v, 0.0)) for v in set(actual) | set(expected))
+
+    index = sample_alias(table, draws, rng)
+    counts = np.bincount(index, minlength=len(table["values"]))
+    observed = {v: int(c) for v, c in zip(table["values"], counts)}
+    stat = sum((observed.get(v, 0) - draws * p) ** 2 / (draws * p) for v, p in expected.items())
+    p_value = chi_square_p_value(stat, len(expected) - 1)
+
+    ok = exact_error <= EXACT_TOLERANCE and p_value >= alpha and set(observed) <= set(expected)
+    print(f"  {'OK ' if ok else 'NG '} {label:<28} outcomes={len(expected):>3}  max|dp|={exact_error:.1e}  "
+          f"chi2={stat:8.2f}  p={p_value:.3f}")
+    if not ok:
+        for v, p in expected.items():
+            print(f"        {str(v):<12} expected {p:.6f}  alias {actual.get(v, 0.0):.6f}  "
+                  f"sampled {observed.get(v, 0) / draws:.6f}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Check alias sampling tables against the source rates")
+    parser.add_argument("--draws", type=int, default=1_000_000)
+    parser.add_argument("--alpha", type=float, default=0.001, help="chi-square significance level")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    data = load_excel_data()
+    if not data:
+        return 1
+    rng = np.random.default_rng(args.seed)
+    mission = data.get("MISSION_DATA", {})
+    results = []
+
+    print(f"\nDrop tables ({args.draws:,} draws each)")
+    for dtid, drops in data.get("DROP_TABLES", {}).items():
+        dist = drop_distribution(drops)
+        table = data.get("DROP_ALIAS", {}).get(dtid)
+        # alias テーブルがあるのは Exclusive (Rate の合計 1 以下) のテーブルだけ。無いものは項目ごとの独立判定
+        if table is None:
+            reason = "rates sum to more than 1" if dist is None else "not Exclusive"
+            print(f"  --  {dtid:<28} {reason}, runtime rolls each entry independently")
+            continue
+        if dist is None:
+            print(f"  NG  {dtid:<28} rates sum to more than 1 but has an alias table")
+            results.append(False)
+            continue
+        results.append(check_table(dtid, table, *dist, args.draws, rng, args.alpha))
+
+    print("\nWeather tables")
+    for tid, weights in mission.get("WEATHER_TABLES", {}).items():
+        table = mission.get("WEATHER_ALIAS", {}).get(tid)
+        results.append(table is not None and check_table(
+            tid, table, *cumulative_percent_distribution(weights, "CLEAR"), args.draws, rng, args.alpha))
+
+    print("\nDifficulty bands (mission stars)")
+    aliases = mission.get("DIFFICULTY_ALIAS", [])
+    for i, band in enumerate(mission.get("DIFFICULTY_SCALING", [])):
+        table = aliases[i] if i < len(aliases) else None
+        results.append(table is not None and check_table(
+            f"minStat >= {band['minStat']}", table, *cumulative_percent_distribution(band["probs"], 1),
+            args.draws, rng, args.alpha))
+
+    failed = results.count(False)
+    print(f"\n{len(results) - failed}/{len(results)} alias tables match their source rates")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,52 +1,344 @@
+"""
+js/ 以下の JavaScript の構文チェック (字句解析ベース)
+
+1回の走査で文字列・テンプレートリテラル (${...} の入れ子を含む)・コメント・正規表現リテラルを
+トークンとして読み飛ばすので、その中身で誤検出しない。検出するもの:
+
+    - 閉じていない文字列 / テンプレート / コメント / 正規表現
+    - 括弧 ( [ { と ${ } の対応 (閉じ忘れ・余分な閉じ括弧・種類の食い違い)
+    - '.' / '?.' の後にプロパティ名が無い ('obj..prop', 'obj. )' など)
+    - JavaScript として使えない文字 (全角括弧など。全角スペースは JS でも空白なので可)
+
+node --check と違い式の文法までは見ないが、Node が無い環境でもすぐ動き、該当行・列を出す。
+
+    python tools/debug_syntax.py                 # js/**/*.js
+    python tools/debug_syntax.py js/engine.js
+    python tools/debug_syntax.py --jobs 1 --no-cache
+    python tools/debug_syntax.py --self-test     # 正規表現と除算の見分けなど、字句解析の確認
+
+結果はファイル内容の SHA-256 ごとに tools/.build_cache/js_syntax.json にキャッシュし
+(このスクリプト自体が変わったら無効)、再実行では編集したファイルだけを解析する。
+解析するファイルが多いときは ProcessPoolExecutor で CPU コア数まで並列に処理する。
+"""
+import argparse
+import bisect
+import glob
+import hashlib
+import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.normpath(os.path.join(BASE_DIR, ".."))
+JS_GLOB = os.path.join(ROOT_DIR, "js", "**", "*.js")
+CACHE_PATH = os.path.join(BASE_DIR, ".build_cache", "js_syntax.json")
+# これより少ない量 (バイト) ならプロセス起動のほうが高くつくので直列で解析する
+PARALLEL_MIN_BYTES = 1 << 20
+
+# --- Lexer ---
+
+WHITESPACE = "\t\v\f \u00a0\ufeff\u1680\u2000-\u200a\u202f\u205f\u3000"
+LINE_TERMINATORS = "\n\r\u2028\u2029"
+
+SPACE_RE = re.compile(rf"[{WHITESPACE}{LINE_TERMINATORS}]*")
+# 空白はトークンの前にまとめて読み飛ばす (ファイル末尾は空の eof)
+TOKEN_RE = re.compile(SPACE_RE.pattern + "(?:" + "|".join([
+    r"(?P<eof>\Z)",
+    r"(?P<comment>//[^\n\r\u2028\u2029]*)",
+    r"(?P<block>/\*)",
+    r"(?P<name>#?(?:[^\W\d]|\$|\\u)[\w$\u200c\u200d]*(?:\\u(?:[0-9a-fA-F]{4}|\{[0-9a-fA-F]+\})[\w$\u200c\u200d]*)*)",
+    r"(?P<number>0[xX][\da-fA-F_]+n?|0[oO][0-7_]+n?|0[bB][01_]+n?"
+    r"|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?n?)",
+    r"(?P<string>\"(?:[^\"\\\n\r]|\\(?:\r\n|[\s\S]))*\"|'(?:[^'\\\n\r]|\\(?:\r\n|[\s\S]))*')",
+    r"(?P<quote>[\"'])",
+    r"(?P<template>`)",
+    # 区切り子は最長一致 ('?.' の直後が数字なら '?' と '.5')
+    r"(?P<punct>[{}()\[\];,~:@]|\.\.\.|\?\.(?!\d)|\?\?=?|>>>?=?|<<=?|\*\*=?|&&=?|\|\|=?|[=!]==?|=>"
+    r"|\+\+|--|[-+*/%&|^<>]=?|[.?!=])",
+]) + ")")
+# テンプレートの本体: ` か ${ か (エスケープを除く) まで
+TEMPLATE_RE = re.compile(r"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*")
+# 正規表現リテラルの本体 (先頭の / の後ろから): クラス [...] の中の / は終端ではない
+REGEX_RE = re.compile(r"(?:[^\\/\[\n\r]|\\[^\n\r]|\[(?:[^\]\\\n\r]|\\[^\n\r])*\])*/[a-zA-Z]*")
+
+# この後ろの / は除算ではなく正規表現リテラルの開始
+REGEX_KEYWORDS = frozenset([
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw", "case", "do", "else",
+    "yield", "await",
+])
+# この後ろの / は除算 ('}' はブロック末尾として扱い、正規表現とみなす。後置の ++ / -- の後ろも値)
+VALUE_PUNCT = frozenset([")", "]", "++", "--"])
+OPENERS = {"(": ")", "[": "]", "{": "}", "${": "}"}
+CLOSERS = frozenset(")]}")
+
+class LexError(Exception):
+    def __init__(self, pos, message):
+        super().__init__(message)
+        self.pos = pos
+
+def tokenize(source):
+    """Yields (kind, value, offset): name, number, string, template, regex, punct, comment.
+
+    Template literals come as one 'template' token per chunk ("`...${", "}...${", "}...`") with the
+    substitutions tokenized in between. Raises LexError on an unterminated literal or comment.
+    """
+    pos = 0
+    end = len(source)
+    braces = []            # 開いている { と ${ (${ はテンプレートの開始位置。再開位置を知るため)
+    regex_ok = True
+    after_dot = False      # 直前が '.' / '?.' (次の名前はキーワードでもプロパティ名)
+    match = TOKEN_RE.match
+    while pos < end:
+        m = match(source, pos)
+        if m is None:
+            pos = SPACE_RE.match(source, pos).end()
+            raise LexError(pos, f"unexpected character {source[pos]!r}")
+        kind = m.lastgroup
+        if kind == "eof":
+            break
+        pos = m.start(kind)
+        if kind == "comment":
+            yield "comment", m.group(kind), pos
+            pos = m.end()
+            continue
+        if kind == "block":
+            close = source.find("*/", pos + 2)
+            if close < 0:
+                raise LexError(pos, "unterminated comment")
+            yield "comment", source[pos:close + 2], pos
+            pos = close + 2
+            continue
+        if kind == "quote":
+            raise LexError(pos, "unterminated string")
+        value = m.group(kind)
+        if kind == "template" or (kind == "punct" and value == "}" and braces and braces[-1] is not None):
+            start = pos
+            literal = braces.pop() if value == "}" else start
+            pos = TEMPLATE_RE.match(source, pos + 1).end()
+            if source.startswith("${", pos):
+                braces.append(literal)
+                yield "template", source[start:pos + 2], start
+                pos += 2
+                regex_ok = True
+            elif pos < end:
+                yield "template", source[start:pos + 1], start
+                pos += 1
+                regex_ok = False
+            else:
+                raise LexError(literal, "unterminated template literal")
+            continue
+        if kind == "punct":
+            if value == "/" or value == "/=":
+                if regex_ok:
+                    r = REGEX_RE.match(source, pos + 1)
+                    if r is None:
+                        raise LexError(pos, "unterminated regular expression")
+                    yield "regex", source[pos:r.end()], pos
+                    pos = r.end()
+                    regex_ok = False
+                    continue
+            elif value == "{":
+                braces.append(None)
+            elif value == "}" and braces:
+                braces.pop()
+            regex_ok = value not in VALUE_PUNCT
+        elif kind == "name":
+            regex_ok = value in REGEX_KEYWORDS and not after_dot
+        else:
+            regex_ok = False
+        after_dot = kind == "punct" and value in (".", "?.")
+        yield kind, value, pos
+        pos = m.end()
+
+# --- Checks ---
+
+def _line_col(line_starts, pos):
+    line = bisect.bisect_right(line_starts, pos)
+    return line, pos - line_starts[line - 1] + 1
+
+def check_source(source):
+    """Returns [(line, col, message)] for the problems in a JavaScript source."""
+    issues = []
+    found = []             # (offset, message)
+    stack = []             # (opener, offset)
+    after_dot = None       # '.' / '?.' の直後 (その位置)
+    try:
+        for kind, value, pos in tokenize(source):
+            if kind == "comment":
+                continue
+            if after_dot is not None:
+                dot, dot_pos = after_dot
+                after_dot = None
+                if not (kind == "name" or (dot == "?." and value in ("(", "["))):
+                    found.append((dot_pos, f"expected a property name after {dot!r}, found {value[:20]!r}"))
+            if kind == "punct":
+                if value in OPENERS:
+                    stack.append((value, pos))
+                elif value in CLOSERS:
+                    if not stack:
+                        found.append((pos, f"unexpected {value!r} (nothing to close)"))
+                    else:
+                        opener, opened = stack.pop()
+                        if OPENERS[opener] != value:
+                            line, col = _line_col(_starts(source), opened)
+                            found.append((pos, f"{value!r} does not match {opener!r} opened at {line}:{col}"))
+                elif value == "." or value == "?.":
+                    after_dot = (value, pos)
+            elif kind == "template":
+                if value.startswith("}"):
+                    # ${ までの開いたままの括弧を閉じ忘れとして報告する
+                    while stack and stack[-1][0] != "${":
+                        opener, opened = stack.pop()
+                        found.append((opened, f"{opener!r} is not closed before the end of '${{...}}'"))
+                    if stack:
+                        stack.pop()
+                if value.endswith("${"):
+                    stack.append(("${", pos + len(value) - 2))
+    except LexError as e:
+        found.append((e.pos, str(e)))
+        stack = []
+    if after_dot is not None:
+        found.append((after_dot[1], f"expected a property name after {after_dot[0]!r}, found end of file"))
+    for opener, opened in stack:
+        found.append((opened, f"{opener!r} is never closed"))
+    if found:
+        starts = _starts(source)
+        issues = [(*_line_col(starts, pos), message) for pos, message in sorted(found)]
+    return issues
+
+def _starts(source):
+    """Offsets where each line begins (\\n, \\r\\n, \\r, U+2028/2029 end a line)."""
+    return [0] + [m.end() for m in re.finditer(r"\r\n|[\n\r\u2028\u2029]", source)]
 
 def check_file(filepath):
-    print(f"Checking {filepath}...")
+    """Returns (sha256, [(line, col, message)]); module-level so worker processes can run it."""
+    with open(filepath, "rb") as f:
+        raw = f.read()
+    return hashlib.sha256(raw).hexdigest(), check_source(raw.decode("utf-8-sig"))
+
+# --- Cache / driver ---
+
+def checker_fingerprint():
+    with open(os.path.abspath(__file__), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def load_cache(fingerprint):
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return
-
-    # Simple regex for unexpected token '.'
-    # 1. '..' (but not '...')
-    # 2. ' . ' (maybe?)
-    # 3. 'obj.' at end of line? (valid in multiline)
-    # 4. '.prop' at start of line? (valid)
-    
-    # Exclude comments
-    for i, line in enumerate(lines):
-        # Remove // comments
-        clean_line = re.sub(r'//.*', '', line).strip()
-        # Remove strings (simplified)
-        clean_line = re.sub(r'"[^"]*"', '', clean_line)
-        clean_line = re.sub(r"'[^']*'", '', clean_line)
-        clean_line = re.sub(r'`[^`]*`', '', clean_line)
-        
-        # Check for '..' but not '...'
-        if '..' in clean_line and '...' not in clean_line:
-            # Check if it's a number like 0..toString() (valid)
-            # Regex for digit..word
-            if not re.search(r'\d\.\.[a-zA-Z]', clean_line):
-                 print(f"Line {i+1}: Suspicious '..' -> {line.strip()}")
-        
-        # Check for ' . ' (space dot space) - typically invalid
-        if ' . ' in clean_line:
-             print(f"Line {i+1}: Suspicious ' . ' -> {line.strip()}")
-             
-        # Check for start with . (dot) if previous line didn't end with operator?
-        # Too complex.
-        
-        # Check for `obj..prop`
-        if re.search(r'\w\.\.\w', clean_line):
-             print(f"Line {i+1}: Suspicious '..' inside word -> {line.strip()}")
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get("files", {}) if cache.get("checker") == fingerprint else {}
 
-import glob
-import os
+def save_cache(fingerprint, files):
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({"checker": fingerprint, "files": files}, f)
+
+def check_files(paths, jobs=None, use_cache=True):
+    """Returns ({path: [(line, col, message)]}, number of cached files, mode)."""
+    fingerprint = checker_fingerprint()
+    cache = load_cache(fingerprint) if use_cache else {}
+    results, entries, pending = {}, {}, []
+    for path in paths:
+        key = os.path.relpath(path, ROOT_DIR)
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        entry = cache.get(key)
+        if entry and entry["sha256"] == digest:
+            results[path] = [tuple(issue) for issue in entry["issues"]]
+            entries[key] = entry
+        else:
+            pending.append(path)
+
+    if jobs is None:
+        total = sum(os.path.getsize(p) for p in pending)
+        jobs = 1 if total < PARALLEL_MIN_BYTES else min(len(pending), os.cpu_count() or 1)
+    if jobs <= 1 or len(pending) <= 1:
+        mode = "serial"
+        checked = [check_file(p) for p in pending]
+    else:
+        mode = f"{jobs} processes"
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            checked = list(pool.map(check_file, pending, chunksize=max(len(pending) // (jobs * 4), 1)))
+    for path, (digest, issues) in zip(pending, checked):
+        results[path] = issues
+        entries[os.path.relpath(path, ROOT_DIR)] = {"sha256": digest, "issues": issues}
+
+    if use_cache and pending:
+        save_cache(fingerprint, {**cache, **entries})
+    return results, len(paths) - len(pending), mode
+
+# --- Self test ---
+
+# (ソース, 期待するメッセージの一部 (None = 問題なし))。node --check と同じ判定になるもの
+SELF_TEST_CASES = [
+    ("const z = x++ / 2;", None),
+    ("const z = x-- / 2 / y;", None),
+    ("const z = a.return / 2 / b;", None),
+    ("const z = a?.typeof / 2 / b;", None),
+    ("const z = (a) / 2 / b;", None),
+    ("const z = arr[0] / 2 / b;", None),
+    ("const t = `${a / b}` / 2;", None),
+    ("function f(s) { return /a\\/b[/]/g.test(s); }", None),
+    ("const r = typeof /x/;", None),
+    ("if (ok) { x = 1 }\n/re/.test(s);", None),
+    ("const z = ++x / 2;", None),
+    ("const r = /abc;", "unterminated regular expression"),
+    ("const s = 'abc;", "unterminated string"),
+    ("f(a, b];", "does not match"),
+    ("obj..prop;", "expected a property name"),
+]
+
+def self_test():
+    failed = 0
+    for source, expected in SELF_TEST_CASES:
+        issues = check_source(source)
+        messages = [message for _, _, message in issues]
+        ok = not issues if expected is None else any(expected in m for m in messages)
+        if not ok:
+            failed += 1
+            print(f"  FAIL {source!r}: expected {expected or 'no issues'}, got {messages or 'no issues'}")
+    print(f"{len(SELF_TEST_CASES)} lexer case(s), {failed} failure(s)")
+    return 1 if failed else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Lexer-based syntax check for the game's JavaScript")
+    parser.add_argument("paths", nargs="*", help="files or directories (default: js/**/*.js)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: auto, 1 = serial)")
+    parser.add_argument("--no-cache", action="store_true", help="re-check every file")
+    parser.add_argument("--self-test", action="store_true", help="run the built-in lexer cases and exit")
+    args = parser.parse_args()
+    if args.self_test:
+        return self_test()
+
+    paths = []
+    for p in args.paths or [JS_GLOB]:
+        if os.path.isdir(p):
+            paths.extend(glob.glob(os.path.join(p, "**", "*.js"), recursive=True))
+        else:
+            paths.extend(glob.glob(p, recursive=True) or [p])
+    paths = sorted({os.path.abspath(p) for p in paths})
+    missing = [p for p in paths if not os.path.isfile(p)]
+    if missing:
+        print(f"Not found: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    results, cached, mode = check_files(paths, args.jobs, not args.no_cache)
+    elapsed = time.perf_counter() - start
+    count = 0
+    for path in paths:
+        for line, col, message in results[path]:
+            print(f"{os.path.relpath(path)}:{line}:{col}: {message}")
+            count += 1
+    print(f"{len(paths)} file(s) checked ({cached} cached, {mode}), {count} issue(s) "
+          f"in {elapsed * 1000:.1f} ms")
+    return 1 if count else 0
 
 if __name__ == "__main__":
-    js_files = glob.glob(r"F:\MCW_HTML\shooter_game\js\*.js")
-    for js_file in js_files:
-        check_file(js_file)
+    sys.exit(main())
@@ -0,0 +1,459 @@
+"""
+開発・プレビュー用のローカルサーバー (asyncio)
+
+    python tools/dev_server.py                 # http://127.0.0.1:8000/ (プロジェクトのルートを配信)
+    python tools/dev_server.py --port 8080 --no-watch
+
+- テキスト (js / css / html / json / svg / md) は起動時と再ビルド時に gzip (brotli モジュールが
+  あれば br も) で圧縮してメモリに置き、Accept-Encoding に合わせて返す。
+- 各ファイル (圧縮形式ごと) に内容の SHA-256 から作った強い ETag を付け、If-None-Match には 304 を返す。
+  ファイル名に内容ハッシュを含むもの (sfx.<hash>.wav, sprites-0.<hash>.png, js/data/*.<hash>.js) は
+  immutable で1年キャッシュ、それ以外は毎回 ETag で再検証 (no-cache)。
+- game_balance_new.xlsx と json/ を監視し、変更が落ち着いたら (--debounce 秒) update_settings.py を実行する。
+  結果は Server-Sent Events (/__events) で開いているタブに通知する。index.html?hot で開いたタブは
+  js/balancePatch.js がこれを受けて js/settings_patch.js を読み、ページを再読み込みせずに反映する。
+
+負荷試験は tools/bench_dev_server.py。
+"""
+import argparse
+import asyncio
+import email.utils
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sys
+import time
+import urllib.parse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.normpath(os.path.join(BASE_DIR, ".."))
+CONVERTER = os.path.join(BASE_DIR, "update_settings.py")
+WATCH_PATHS = [os.path.join(ROOT_DIR, "game_balance_new.xlsx"), os.path.join(ROOT_DIR, "json")]
+SETTINGS_JS = os.path.join(ROOT_DIR, "js", "settings_data.js")
+EVENTS_PATH = "/__events"
+
+TEXT_EXTENSIONS = {".js", ".css", ".html", ".json", ".svg", ".md", ".txt", ".map"}
+CONTENT_TYPES = {
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json; charset=utf-8",
+    ".svg": "image/svg+xml; charset=utf-8",
+    ".md": "text/markdown; charset=utf-8",
+    ".txt": "text/plain; charset=utf-8",
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".png": "image/png",
+}
+# 内容ハッシュ入りのファイル名 (build_audio_sprite / build_atlas / update_settings --chunked)
+HASHED_NAME_RE = re.compile(r"\.[0-9a-f]{10}\.[a-z0-9]+$")
+# これより大きいファイルはメモリに置かず、毎回ディスクから読む
+MAX_CACHED_BYTES = 32 << 20
+# 圧縮しても得にならない小さなファイル
+MIN_COMPRESS_BYTES = 256
+MAX_HEADER_BYTES = 64 << 10
+KEEP_ALIVE_SECONDS = 15
+HEARTBEAT_SECONDS = 15
+POLL_SECONDS = 0.5
+SKIP_DIRS = {"__pycache__", "node_modules", "Cubase", "Gimp"}
+
+STATUS = {200: "OK", 206: "Partial Content", 304: "Not Modified", 400: "Bad Request", 403: "Forbidden",
+          404: "Not Found", 405: "Method Not Allowed", 416: "Range Not Satisfiable",
+          431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+
+# --- Assets ---
+
+class Asset:
+    """One file in memory: the identity body plus its precompressed variants, each with a strong ETag."""
+
+    def __init__(self, path, stat):
+        self.path = path
+        self.key = (stat.st_mtime_ns, stat.st_size)
+        ext = os.path.splitext(path)[1].lower()
+        self.content_type = CONTENT_TYPES.get(ext) or mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self.cache_control = ("public, max-age=31536000, immutable" if HASHED_NAME_RE.search(path)
+                              else "no-cache")
+        with open(path, "rb") as f:
+            body = f.read()
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        self.variants = {"identity": (body, f'"{digest}"')}
+        self.compressible = ext in TEXT_EXTENSIONS and len(body) >= MIN_COMPRESS_BYTES
+        if self.compressible:
+            self.variants["gzip"] = (gzip.compress(body, 9, mtime=0), f'"{digest}-gz"')
+            if brotli is not None:
+                self.variants["br"] = (brotli.compress(body), f'"{digest}-br"')
+
+    def pick(self, accept_encoding):
+        """(encoding, body, etag) for the request's Accept-Encoding (br > gzip > identity)."""
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and accepted.get(encoding, accepted.get("*", 0)) > 0:
+                return (encoding, *self.variants[encoding])
+        return ("identity", *self.variants["identity"])
+
+def parse_accept_encoding(value):
+    result = {}
+    for part in (value or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0
+        result[name.strip().lower()] = q
+    return result
+
+class AssetCache:
+    def __init__(self, root):
+        self.root = root
+        self.real_root = os.path.realpath(root)
+        self.assets = {}
+
+    def resolve(self, url_path):
+        """Filesystem path for a URL path, or None if it is outside the root or hidden."""
+        parts = [p for p in urllib.parse.unquote(url_path).split("/") if p]
+        # ":" は Windows のドライブ指定 (os.path.join(root, "D:", "x") は D:x になる)
+        if any(p in ("..", ".") or p.startswith(".") or "\\" in p or ":" in p or "\0" in p for p in parts):
+            return None
+        path = os.path.join(self.root, *parts)
+        try:
+            if os.path.commonpath([self.real_root, os.path.realpath(path)]) != self.real_root:
+                return None
+        except ValueError:  # 別ドライブ (Windows)
+            return None
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        return path
+
+    def cached(self, path):
+        """(asset or None if it must be (re)loaded, False for a missing file)."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.assets.pop(path, None)
+            return False
+        asset = self.assets.get(path)
+        if asset is not None and asset.key == (stat.st_mtime_ns, stat.st_size):
+            return asset
+        return None
+
+    def get(self, path):
+        """Cached asset, reloaded when the file's mtime or size changed. None for a missing file."""
+        asset = self.cached(path)
+        if asset is not None:
+            return asset or None
+        try:
+            stat = os.stat(path)
+            asset = Asset(path, stat)
+        except OSError:
+            return None
+        if stat.st_size <= MAX_CACHED_BYTES:
+            self.assets[path] = asset
+        return asset
+
+    def text_files(self):
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS]
+            for name in filenames:
+                if os.path.splitext(name)[1].lower() in TEXT_EXTENSIONS and not name.startswith("."):
+                    yield os.path.join(dirpath, name)
+
+    def precompress(self):
+        """Loads (and compresses) every text asset whose file changed; returns (files, raw, gzip bytes)."""
+        count = raw = packed = 0
+        for path in self.text_files():
+            asset = self.get(path)
+            if asset is None or not asset.compressible:
+                continue
+            count += 1
+            raw += len(asset.variants["identity"][0])
+            packed += len(asset.variants["gzip"][0])
+        return count, raw, packed
+
+# --- HTTP ---
+
+class DevServer:
+    def __init__(self, root=ROOT_DIR, watch=True, debounce=1.0, converter=CONVERTER, quiet=False):
+        self.cache = AssetCache(root)
+        self.watch = watch
+        self.debounce = debounce
+        self.converter = converter
+        self.quiet = quiet
+        self.subscribers = set()
+        self.stats = {"requests": 0, "not_modified": 0, "bytes": 0, "builds": 0}
+
+    def log(self, message):
+        if not self.quiet:
+            print(message, flush=True)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_SECONDS)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.send(writer, 431, {}, b"", close=True)
+                    break
+                keep_alive = await self.respond(head, reader, writer)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def respond(self, head, reader, writer):
+        """Answers one request; returns whether the connection stays open."""
+        try:
+            lines = head.decode("latin-1").split("\r\n")
+            method, target, version = lines[0].split(" ")
+            headers = {}
+            for line in lines[1:]:
+                if line:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            await self.send(writer, 400, {}, b"", close=True)
+            return False
+        self.stats["requests"] += 1
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        if method not in ("GET", "HEAD"):
+            await self.send(writer, 405, {"Allow": "GET, HEAD"}, b"", close=True)
+            return False
+
+        url_path = urllib.parse.urlsplit(target).path
+        if url_path == EVENTS_PATH:
+            await self.events(reader, writer)
+            return False
+        path = self.cache.resolve(url_path)
+        asset = self.cache.cached(path) if path else False
+        if asset is None:
+            # 初回・変更後の読み込み (と圧縮) はスレッドで
+            asset = await asyncio.to_thread(self.cache.get, path)
+        if not asset:
+            await self.send(writer, 404, {"Content-Type": "text/plain; charset=utf-8"},
+                            b"Not Found", head_only=method == "HEAD", close=not keep_alive)
+            return keep_alive
+
+        encoding, body, etag = asset.pick(headers.get("accept-encoding"))
+        out = {"Content-Type": asset.content_type, "ETag": etag, "Cache-Control": asset.cache_control}
+        if asset.compressible:
+            out["Vary"] = "Accept-Encoding"
+        if encoding != "identity":
+            out["Content-Encoding"] = encoding
+        else:
+            out["Accept-Ranges"] = "bytes"
+
+        if etag_matches(headers.get("if-none-match"), etag):
+            self.stats["not_modified"] += 1
+            await self.send(writer, 304, out, b"", head_only=True, close=not keep_alive)
+            return keep_alive
+        status = 200
+        if encoding == "identity" and "range" in headers:
+            byte_range = parse_range(headers["range"], len(body))
+            if byte_range is None:
+                out["Content-Range"] = f"bytes */{len(body)}"
+                await self.send(writer, 416, out, b"", close=not keep_alive)
+                return keep_alive
+            start, end = byte_range
+            out["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+            body = body[start:end + 1]
+            status = 206
+        await self.send(writer, status, out, body, head_only=method == "HEAD", close=not keep_alive)
+        return keep_alive
+
+    async def send(self, writer, status, headers, body, head_only=False, close=False):
+        lines = [f"HTTP/1.1 {status} {STATUS[status]}", "Server: shooter-dev",
+                 f"Date: {email.utils.formatdate(usegmt=True)}"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        lines.append(f"Content-Length: {len(body)}")
+        if close:
+            lines.append("Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if body and not head_only:
+            writer.write(body)
+            self.stats["bytes"] += len(body)
+        await writer.drain()
+
+    # --- Server-Sent Events ---
+
+    async def events(self, reader, writer):
+        queue = asyncio.Queue()
+        self.subscribers.add(queue)
+        # タブが閉じられたら (EOF) すぐに購読をやめる
+        closed = asyncio.ensure_future(reader.read())
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-store\r\n"
+                         b"Connection: keep-alive\r\n\r\nretry: 1000\n\n")
+            writer.write(sse_message("hello", {"version": settings_version()}))
+            await writer.drain()
+            while not closed.done():
+                message = asyncio.ensure_future(queue.get())
+                await asyncio.wait([message, closed], timeout=HEARTBEAT_SECONDS,
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if not message.done():
+                    message.cancel()
+                    if closed.done():
+                        break
+                    writer.write(b": ping\n\n")
+                else:
+                    writer.write(message.result())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            closed.cancel()
+            self.subscribers.discard(queue)
+
+    def broadcast(self, event, data):
+        message = sse_message(event, data)
+        for queue in self.subscribers:
+            queue.put_nowait(message)
+        return len(self.subscribers)
+
+    # --- Watching / rebuilding ---
+
+    def input_state(self):
+        state = {}
+        for path in WATCH_PATHS:
+            paths = [path]
+            if os.path.isdir(path):
+                paths = [os.path.join(path, n) for n in sorted(os.listdir(path)) if not n.startswith((".", "~$"))]
+            for p in paths:
+                try:
+                    st = os.stat(p)
+                except OSError:
+                    continue
+                state[p] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    async def watch_inputs(self):
+        last = self.input_state()
+        while True:
+            await asyncio.sleep(POLL_SECONDS)
+            current = self.input_state()
+            if current == last:
+                continue
+            # 保存が終わるまで (debounce 秒変化が無くなるまで) 待つ
+            while True:
+                await asyncio.sleep(self.debounce)
+                settled = self.input_state()
+                if settled == current:
+                    break
+                current = settled
+            changed = sorted(os.path.relpath(p, ROOT_DIR) for p in set(current) | set(last)
+                             if current.get(p) != last.get(p))
+            last = current
+            await self.rebuild(changed)
+
+    async def rebuild(self, changed=()):
+        self.log(f"Changed: {', '.join(changed) or '-'}; running {os.path.relpath(self.converter, ROOT_DIR)}")
+        start = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(sys.executable, self.converter, cwd=ROOT_DIR,
+                                                    stdout=asyncio.subprocess.PIPE,
+                                                    stderr=asyncio.subprocess.STDOUT)
+        output, _ = await proc.communicate()
+        seconds = time.perf_counter() - start
+        tail = output.decode("utf-8", "replace").strip().splitlines()[-8:]
+        for line in tail:
+            self.log(f"  | {line}")
+        self.stats["builds"] += 1
+        if proc.returncode != 0:
+            clients = self.broadcast("build-error", {"status": proc.returncode, "output": tail})
+            self.log(f"Build failed ({proc.returncode}) after {seconds:.1f}s; told {clients} tab(s)")
+            return False
+        await asyncio.to_thread(self.cache.precompress)
+        version = settings_version()
+        clients = self.broadcast("balance", {"version": version, "seconds": round(seconds, 2)})
+        self.log(f"Rebuilt {version} in {seconds:.1f}s; notified {clients} tab(s)")
+        return True
+
+    async def start(self, host, port):
+        start = time.perf_counter()
+        count, raw, packed = await asyncio.to_thread(self.cache.precompress)
+        self.log(f"Precompressed {count} text asset(s): {raw:,} -> {packed:,} bytes gzip"
+                 f"{' (+br)' if brotli else ''} in {time.perf_counter() - start:.2f}s")
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES, backlog=1024)
+        if self.watch:
+            self._watcher = asyncio.create_task(self.watch_inputs())
+        return server
+
+def etag_matches(header, etag):
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+def parse_range(value, length):
+    """(start, end) of a single 'bytes=' range, or None if unsatisfiable."""
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", value.strip())
+    if not match or not (match.group(1) or match.group(2)) or length == 0:
+        return None
+    if match.group(1):
+        start = int(match.group(1))
+        end = min(int(match.group(2)), length - 1) if match.group(2) else length - 1
+    else:
+        start, end = max(length - int(match.group(2)), 0), length - 1
+    return (start, end) if start <= end and start < length else None
+
+def sse_message(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+
+def settings_version():
+    """GAME_BALANCE_VERSION of the current settings_data.js (None before the first versioned build)."""
+    try:
+        with open(SETTINGS_JS, encoding="utf-8") as f:
+            source = f.read()
+    except OSError:
+        return None
+    match = re.search(r'const GAME_BALANCE_VERSION = "([0-9a-f]+)"', source)
+    return match.group(1) if match else None
+
+async def serve(args):
+    dev = DevServer(args.root, watch=not args.no_watch, debounce=args.debounce)
+    server = await dev.start(args.host, args.port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"Serving {args.root} at http://{host}:{port}/ (open index.html?hot for live balance updates)")
+    if not args.no_watch:
+        print(f"Watching {', '.join(os.path.relpath(p, ROOT_DIR) for p in WATCH_PATHS)} "
+              f"(debounce {args.debounce}s)")
+    async with server:
+        await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local dev/preview server for the game")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--root", default=ROOT_DIR, help="directory to serve (default: the project root)")
+    parser.add_argument("--no-watch", action="store_true", help="do not rebuild settings_data.js on changes")
+    parser.add_argument("--debounce", type=float, default=1.0,
+                        help="seconds the inputs must stay unchanged before rebuilding")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+"""
+ワークブックのシート読み込み (ストリーミング + 並列)
+
+pd.read_excel はシート全体のセルを一度リストに展開してから DataFrame に変換する。
+ここでは openpyxl の read-only モードで行を values_only のまま CHUNK_ROWS 行ずつ読み、
+チャンクごとに pandas と同じ TextParser で DataFrame 化して連結する。
+型推論・空セルの扱いは pd.read_excel と同じなので、変換結果は変わらない。
+
+独立したシートは ProcessPoolExecutor で並列に読み込む (ワーカーは使い回すので、起動するのは jobs 個だけ)。
+"""
+import os
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import openpyxl
+import pandas as pd
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.io.parsers import TextParser
+
+CHUNK_ROWS = 10000
+# これより小さい合計サイズ (シート XML のバイト数) ならプロセスを起動せずに直列で読む
+PARALLEL_MIN_BYTES = 1 << 20
+
+def convert_value(value):
+    """Same conversion as pandas' OpenpyxlReader._convert_cell, for values_only rows."""
+    if value is None:
+        return ""
+    if isinstance(value, str) and value in ERROR_CODES:
+        return float("nan")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        val = int(value)
+        if val == value:
+            return val
+        return float(value)
+    return value
+
+def _parse_chunk(rows, columns):
+    width = len(columns)
+    for row in rows:
+        if len(row) > width:
+            # ヘッダーより右にデータがある場合は pandas と同じく "Unnamed: n" 列を足す
+            columns = columns + [f"Unnamed: {i}" for i in range(width, len(row))]
+            width = len(columns)
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    parser = TextParser(rows, names=columns, header=None, skip_blank_lines=False)
+    return parser.read(), columns
+
+def stream_sheet(path, sheet_name, chunk_rows=CHUNK_ROWS):
+    """Reads one sheet into a DataFrame equal to pd.read_excel(path, sheet_name), chunk by chunk."""
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = wb[sheet_name]
+        ws.reset_dimensions()
+        rows = ws.iter_rows(values_only=True)
+
+        header = []
+        for raw in rows:
+            header = [convert_value(v) for v in raw]
+            break
+        while header and header[-1] == "":
+            header.pop()
+        if not header:
+            return pd.DataFrame()
+        # 列名の重複・空欄の処理は pandas に任せる
+        columns = list(TextParser([header], header=0).read().columns)
+
+        frames = []
+        chunk = []
+        blank_run = []
+        for raw in rows:
+            row = [convert_value(v) for v in raw]
+            while row and row[-1] == "":
+                row.pop()
+            if not row:
+                # 末尾の空行は捨てるので、次にデータ行が来るまで保留する
+                blank_run.append(row)
+                continue
+            if blank_run:
+                chunk.extend(blank_run)
+                blank_run = []
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                df, columns = _parse_chunk(chunk, columns)
+                frames.append(df)
+                chunk = []
+        if chunk:
+            df, columns = _parse_chunk(chunk, columns)
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        if len(frames) == 1:
+            return frames[0]
+        # チャンク間で推論結果が違った列 (例: 全部空のチャンク) を全体でもう一度推論する
+        return pd.concat(frames, ignore_index=True, sort=False).infer_objects()
+    finally:
+        wb.close()
+
+def load_sheet_task(path, sheet_name):
+    # シート自身のメモリ: 読み込み中の Python 確保量のピークを、読み込み開始時からの増分で測る
+    # (ru_maxrss はプロセスの累積なので、直列だと前のシートの分が混ざる)
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    started = time.time()
+    start, cpu = time.perf_counter(), time.process_time()
+    try:
+        df = stream_sheet(path, sheet_name)
+        seconds, cpu_seconds = time.perf_counter() - start, time.process_time() - cpu
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return sheet_name, df, {
+        "sheet": sheet_name,
+        "rows": len(df),
+        "seconds": seconds,
+        "cpu_seconds": cpu_seconds,
+        "peak_alloc_mb": (peak - base) / (1024 * 1024),
+        "started": started,
+        "pid": os.getpid(),
+    }
+
+def load_sheets(path, sheet_names, jobs=None, sheet_bytes=None):
+    """Loads the given sheets. Returns ({name: DataFrame}, [metrics per sheet], mode).
+
+    jobs=None picks serial loading for small workbooks (process start-up would dominate)
+    and up to one worker per CPU otherwise; jobs=1 forces serial.
+    """
+    sheet_names = list(sheet_names)
+    if jobs is None:
+        total = sum((sheet_bytes or {}).get(n, PARALLEL_MIN_BYTES) for n in sheet_names)
+        jobs = 1 if total < PARALLEL_MIN_BYTES else min(len(sheet_names), os.cpu_count() or 1)
+
+    frames, metrics = {}, []
+    if jobs <= 1 or len(sheet_names) <= 1:
+        for name in sheet_names:
+            _, df, m = load_sheet_task(path, name)
+            frames[name] = df
+            metrics.append(m)
+        return frames, metrics, "serial"
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(load_sheet_task, path, name) for name in sheet_names]
+        for future in futures:
+            name, df, m = future.result()
+            frames[name] = df
+            metrics.append(m)
+    return frames, metrics, f"{jobs} processes"
+
+def print_load_report(metrics, mode, wall):
+    """Per-sheet rows / time / peak Python allocation while reading that sheet (tracemalloc, measured
+    from the sheet's own start, so it excludes earlier sheets and the interpreter/library baseline)."""
+    print(f"Loaded {len(metrics)} sheet(s) in {wall:.2f}s ({mode})")
+    for m in metrics:
+        worker = f" (pid {m['pid']})" if mode != "serial" else ""
+        print(f"  {m['sheet']:<18} {m['rows']:>8} rows  {m['seconds'] * 1000:8.1f} ms  "
+              f"peak alloc {m['peak_alloc_mb']:8.1f} MB{worker}")
@@ -1,90 +1,163 @@
+"""
+強化テーブル (PART_UPGRADE_TABLE) の書き出し
 
-import pandas as pd
-import json
+upgrade_config.js の PARAM_CONFIG (initCost / lastCost / initValMult ...) から、ゲームの
+buildPartUpgradeTable() と同じ Lv0～100 のテーブルを作り、シートとして書き出す。
+計算は upgrade_curves.UpgradeCurves ([パーツ, レベル] の配列) で、パーツを BLOCK 件ずつ
+計算しては書き出すので、パーツ数が増えてもメモリ使用量は変わらない。
+
+    python tools/export_upgrade_table.py                                   # upgrade_table_gen.xlsx
+    python tools/export_upgrade_table.py -o table.csv -o table.parquet     # 形式は拡張子で決まる
+
+xlsx は openpyxl の write-only モード (行ごとに書き出し) を使う。parquet には pyarrow が必要。
+"""
+import argparse
+import contextlib
+import csv
+import importlib.util
 import os
-import math
+import sys
+import time
+
+from upgrade_curves import MAX_LEVEL, PLAYER_STATS, UPGRADE_CONFIG_PATH, UpgradeCurves, load_param_config, _js_number
+from pipeline_profile import Profiler, add_profile_arguments
+from settings_store import JS_PATH, load_settings
 
-# Path handling
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-JS_PATH = os.path.join(BASE_DIR, '../js/settings_data.js')
 OUTPUT_PATH = os.path.join(BASE_DIR, '../upgrade_table_gen.xlsx')
 
-def load_settings_data():
-    """Reads settings_data.js and extracts the GAME_BALANCE_DATA JSON object."""
-    try:
-        with open(JS_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Strip the variable declaration "const GAME_BALANCE_DATA = "
-            start_index = content.find('{')
-            end_index = content.rfind('};')
-            if start_index != -1 and end_index != -1:
-                json_str = content[start_index:end_index+1]
-                return json.loads(json_str)
-    except Exception as e:
-        print(f"Error reading settings_data.js: {e}")
-        return None
-
-def generate_table(data):
-    """Replicates upgrade_config.js logic to generate the table."""
-    parts = {}
-    if 'WEAPONS' in data:
-        parts.update(data['WEAPONS'])
-    if 'PART_TEMPLATES' in data:
-        parts.update(data['PART_TEMPLATES'])
-
-    # Overrides from upgrade_config.js
-    OVERRIDES = {
-        "Collector": { "base": 40, "scale": 20 }, 
-        "WeaponOS": { "base": 0, "scale": 5 },    
-        "Shield": { "base": 0, "scale": 2 },      
-        "ItemEff": { "base": 0, "scale": 10 },    
-        "BeamGun": { "base": 10, "scale": 2 },
-        "Missile": { "base": 20, "scale": 3 },
-        "Bomb": { "base": 30, "scale": 4 },
-        "TwinBeam": { "base": 18, "scale": 3 },
-        "Laser": { "base": 25, "scale": 5 }
-    }
-
-    all_rows = []
-
-    for img_id, p in parts.items():
-        base_cost = p.get('UpgradeCost', 1000)
-        cost_mult = 1.15
-        
-        ov = OVERRIDES.get(img_id)
-        if not ov:
-            damage = p.get('Damage', 10)
-            ov = { "base": damage, "scale": damage * 0.1 }
-
-        for lv in range(101): # 0 to 100
-            cost = math.floor(base_cost * math.pow(cost_mult, lv))
-            val = ov["base"] + (lv * ov["scale"])
-            
-            row = {
-                "PartID": img_id,
-                "Name": p.get('Name', img_id),
-                "Level": lv,
-                "Cost": cost,
-                "ValueTotal": val,
-                "MaterialID": "ItemA" if (lv % 10 == 0 and lv > 0) else "",
-                "MaterialCount": math.floor(lv / 10)
-            }
-            all_rows.append(row)
-
-    return pd.DataFrame(all_rows)
+COLUMNS = ["PartID", "Name", "Level", "Cost", "ValueTotal", "MaterialID", "MaterialCount"]
+# 1回に計算するパーツ数 (1ブロック = BLOCK × 101 行)
+BLOCK = 256
+
+def iter_blocks(data, config, block=BLOCK):
+    """Yields column dicts (COLUMNS -> list) for `block` PARAM_CONFIG keys at a time."""
+    names = {**data.get("WEAPONS", {}), **data.get("PART_TEMPLATES", {})}
+    # buildPartUpgradeTable と同じ順 (WEAPONS, PART_TEMPLATES, 能力値)
+    keys = [k for k in list(names) + list(PLAYER_STATS) if k in config]
+    levels = list(range(MAX_LEVEL + 1))
+    for start in range(0, len(keys), block):
+        curves = UpgradeCurves(data, {k: config[k] for k in keys[start:start + block]})
+        n = len(curves.keys)
+        if not n:
+            continue
+        mat = curves.material >= 0
+        yield {
+            "PartID": [k for k in curves.keys for _ in levels],
+            "Name": [names.get(k, {}).get("Name", k) for k in curves.keys for _ in levels],
+            "Level": levels * n,
+            "Cost": curves.cost.ravel().tolist(),
+            "ValueTotal": [_js_number(v) for v in curves.value.ravel().tolist()],
+            "MaterialID": [curves.material_ids[i] if m else "" for i, row in enumerate(mat) for m in row],
+            "MaterialCount": curves.material_count.ravel().tolist(),
+        }
+
+def _rows(block):
+    return zip(*(block[c] for c in COLUMNS))
+
+class XlsxWriter:
+    def __init__(self, path):
+        from openpyxl import Workbook
+        self.path = path
+        self.wb = Workbook(write_only=True)
+        self.ws = self.wb.create_sheet("UpgradeTable")
+        self.ws.append(COLUMNS)
+
+    def write(self, block):
+        for row in _rows(block):
+            self.ws.append(row)
+
+    def close(self):
+        self.wb.save(self.path)
+
+class CsvWriter:
+    def __init__(self, path):
+        self.f = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.writer(self.f)
+        self.writer.writerow(COLUMNS)
+
+    def write(self, block):
+        self.writer.writerows(_rows(block))
+
+    def close(self):
+        self.f.close()
+
+class ParquetWriter:
+    def __init__(self, path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        # ValueTotal は整数と小数が混ざるので float で持つ
+        self.schema = pa.schema([("PartID", pa.string()), ("Name", pa.string()), ("Level", pa.int32()),
+                                 ("Cost", pa.int64()), ("ValueTotal", pa.float64()),
+                                 ("MaterialID", pa.string()), ("MaterialCount", pa.int32())])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, block):
+        self.writer.write_table(self.pa.Table.from_pydict(block, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+WRITERS = {".xlsx": XlsxWriter, ".csv": CsvWriter, ".parquet": ParquetWriter}
+# 形式ごとに必要なモジュール (main() でファイルを開く前に確認する)
+REQUIRES = {".xlsx": "openpyxl", ".parquet": "pyarrow"}
+
+def export(data, config, paths, block=BLOCK):
+    """Writes the table to every path (format by extension); returns the number of rows."""
+    rows = 0
+    with contextlib.ExitStack() as stack:
+        # 1つずつ開いて登録するので、途中の形式で失敗しても開いた分は閉じられる
+        writers = []
+        for p in paths:
+            w = WRITERS[os.path.splitext(p)[1].lower()](p)
+            stack.callback(w.close)
+            writers.append(w)
+        for columns in iter_blocks(data, config, block):
+            rows += len(columns["Level"])
+            for w in writers:
+                w.write(columns)
+    return rows
 
 def main():
+    parser = argparse.ArgumentParser(description="Export the PARAM_CONFIG upgrade table (upgrade_config.js)")
+    parser.add_argument("-o", "--output", action="append",
+                        help=f"output file, .xlsx / .csv / .parquet (repeatable; default: {OUTPUT_PATH})")
+    parser.add_argument("--js", default=JS_PATH, help="settings_data.js to read part names and base values from")
+    parser.add_argument("--config", default=UPGRADE_CONFIG_PATH, help="upgrade_config.js")
+    parser.add_argument("--block", type=int, default=BLOCK, help="parts computed per block")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    profiler = Profiler.from_args(args, "export_upgrade_table")
+
+    paths = args.output or [OUTPUT_PATH]
+    for p in paths:
+        if os.path.splitext(p)[1].lower() not in WRITERS:
+            parser.error(f"unknown output format: {p} (use {', '.join(WRITERS)})")
+        module = REQUIRES.get(os.path.splitext(p)[1].lower())
+        if module and importlib.util.find_spec(module) is None:
+            parser.error(f"{p}: {os.path.splitext(p)[1]} output needs {module} (pip install {module})")
+
     print("Loading data...")
-    data = load_settings_data()
-    if not data:
-        return
+    try:
+        with profiler.stage("load"):
+            data = load_settings(args.js)
+            config = load_param_config(args.config)
+    except (OSError, ValueError) as e:
+        print(f"Error reading input: {e}")
+        return 1
 
-    print("Generating table...")
-    df = generate_table(data)
-    
-    print(f"Exporting to {OUTPUT_PATH}...")
-    df.to_excel(OUTPUT_PATH, index=False)
-    print("Done!")
+    start = time.perf_counter()
+    with profiler.stage("export") as rec:
+        rows = rec["rows"] = export(data, config, paths, args.block)
+    print(f"Exported {rows:,} rows ({rows // (MAX_LEVEL + 1)} parts) in {time.perf_counter() - start:.2f}s:")
+    for p in paths:
+        print(f"  {p}")
+    skipped = [k for k in {**data.get("WEAPONS", {}), **data.get("PART_TEMPLATES", {})} if k not in config]
+    if skipped:
+        print(f"Not in PARAM_CONFIG (no table in game): {', '.join(skipped)}")
+    profiler.finish()
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
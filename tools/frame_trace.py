@@ -0,0 +1,418 @@
+"""
+フレーム時間トレース (.ftrace) の集計
+
+index.html?trace で遊ぶと js/frameTrace.js が INGAME の1フレームごとに処理ごとの時間と敵・弾などの数を
+リングバッファに記録し、F9 (か FrameTrace.download()) で .ftrace に書き出す。このツールはそれを
+np.memmap で開いて CHUNK フレームずつ読むので、数時間ぶんのトレースでも全体をメモリに載せない。
+
+    処理ごとの p50 / p95 / p99    10µs 単位のヒストグラムから (近似ではなくその単位で正確)
+    work                           interval 以外の合計 (= update + draw にかかった時間)
+    スパイク                       work が p99 (か --spike-ms) を超えたフレーム。敵・弾などの数の平均を
+                                   全体と比べ、天候・星数の内訳と一番時間を食った処理を数える
+    条件別の work                  天候・星数・敵の数ごとの p50 / p95 / p99
+    相関                           work と各エンティティ数の相関係数
+
+--compare で別ビルドのトレース (ベースライン) と比べ、処理ごと・天候ごとの p95 が --threshold 倍より
+遅くなっていれば (かつ --min-delta-ms 以上) 終了コード 1 を返す (bench_pipeline.py と同じ)。
+トレースを複数渡すとまとめて集計する (天候は名前で突き合わせる)。
+
+    python tools/frame_trace.py frametrace-2026-10-17.ftrace
+    python tools/frame_trace.py new.ftrace --compare old.ftrace --threshold 1.2
+    python tools/frame_trace.py --synthetic /tmp/synthetic.ftrace --frames 1000000   # 動作確認用の合成トレース
+
+ファイル形式は js/frameTrace.js の先頭のコメントを参照 (ヘッダーの JSON に処理名・数の名前・天候の表が入る)。
+"""
+import argparse
+import json
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"FTRC"
+VERSION = 1
+PREFIX = struct.Struct("<4sHHI")
+CHUNK = 1 << 20
+MAX_UNITS = 1 << 18          # work のヒストグラムの上限 (10µs 単位で約 2.6 秒、超えたら上限に寄せる)
+ENEMY_BUCKETS = [0, 10, 25, 50, 100, 200, 500]
+DEFAULT_TIMINGS = ["interval", "player", "particles", "bullets", "items", "enemies", "missiles", "texts", "hud", "draw"]
+DEFAULT_COUNTS = ["enemies", "bullets", "missiles", "particles", "items", "texts"]
+UNKNOWN_WEATHER = 255
+
+# --- Format ---
+
+def record_dtype(timings, counts):
+    fields = [("frame", "<u4"), ("time_ms", "<u4")]
+    fields += [(f"t_{name}", "<u2") for name in timings]
+    fields += [(f"n_{name}", "<u2") for name in counts]
+    fields += [("stars", "u1"), ("weather", "u1"), ("flags", "u1"), ("reserved", "u1")]
+    return np.dtype(fields)
+
+def open_trace(path):
+    """(header dict, records memmap). Raises ValueError for anything that is not a .ftrace file."""
+    with open(path, "rb") as f:
+        prefix = f.read(PREFIX.size)
+        if len(prefix) < PREFIX.size:
+            raise ValueError(f"{path}: too short for a frame trace")
+        magic, version, record_size, header_len = PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a frame trace (magic {magic!r})")
+        if version != VERSION:
+            raise ValueError(f"{path}: trace version {version} (this tool reads {VERSION})")
+        header = json.loads(f.read(header_len).decode("utf-8"))
+    dtype = record_dtype(header["timings"], header["counts"])
+    if dtype.itemsize != record_size:
+        raise ValueError(f"{path}: record size {record_size} does not match its header ({dtype.itemsize})")
+    offset = PREFIX.size + header_len
+    count = (os.path.getsize(path) - offset) // record_size
+    if count == 0:
+        return header, np.zeros(0, dtype=dtype)
+    return header, np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+def write_trace(path, header, chunks):
+    """Writes a .ftrace from an iterable of record arrays (used by --synthetic)."""
+    body = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    dtype = record_dtype(header["timings"], header["counts"])
+    with open(path, "wb") as f:
+        f.write(PREFIX.pack(MAGIC, VERSION, dtype.itemsize, len(body)))
+        f.write(body)
+        for chunk in chunks:
+            f.write(chunk.astype(dtype, copy=False).tobytes())
+
+# --- Statistics ---
+
+def percentiles_from_hist(hist, qs=(50, 95, 99)):
+    """Nearest-rank percentiles (in histogram bins) of a bincount histogram."""
+    total = int(hist.sum())
+    if total == 0:
+        return [0] * len(qs)
+    cum = np.cumsum(hist)
+    return [int(np.searchsorted(cum, max(1, int(np.ceil(q / 100 * total))))) for q in qs]
+
+def enemy_bucket_labels():
+    edges = ENEMY_BUCKETS
+    return [f"{lo}-{hi - 1}" for lo, hi in zip(edges, edges[1:])] + [f"{edges[-1]}+"]
+
+class TraceStats:
+    """Streaming per-subsystem histograms and work-time breakdowns over one or more traces."""
+
+    def __init__(self, timings, counts, weathers, unit_us):
+        self.timings, self.counts, self.weathers = timings, counts, list(weathers)
+        self.unit_ms = unit_us / 1000
+        self.frames = 0
+        self.dropped = 0
+        self.builds = []
+        self.hist = {name: np.zeros(65536, dtype=np.int64) for name in timings}
+        self.work = np.zeros(MAX_UNITS, dtype=np.int64)
+        self.by = {"weather": {}, "stars": {}, "enemies": {}}
+        self.count_sum = np.zeros(len(counts))
+        self.corr = np.zeros((len(counts), 3))   # Σx, Σx², Σxy per count (y = work)
+        self.work_sum = 0.0
+        self.work_sq = 0.0
+
+    def weather_map(self, header):
+        """Lookup array: trace weather index -> index in self.weathers (names merged across traces)."""
+        lookup = np.full(256, UNKNOWN_WEATHER, dtype=np.int64)
+        for i, name in enumerate(header.get("weathers", [])):
+            if name not in self.weathers:
+                self.weathers.append(name)
+            lookup[i] = self.weathers.index(name)
+        return lookup
+
+    def work_units(self, chunk):
+        work = np.zeros(len(chunk), dtype=np.int64)
+        for name in self.timings[1:]:
+            work += chunk[f"t_{name}"]
+        return np.minimum(work, MAX_UNITS - 1)
+
+    def add_group(self, table, keys, work):
+        for key in np.unique(keys):
+            hist = table.setdefault(int(key), np.zeros(MAX_UNITS, dtype=np.int64))
+            hist += np.bincount(work[keys == key], minlength=MAX_UNITS)
+
+    def add(self, chunk, weather_lookup):
+        n = len(chunk)
+        self.frames += n
+        for name in self.timings:
+            self.hist[name] += np.bincount(chunk[f"t_{name}"], minlength=65536)
+        work = self.work_units(chunk)
+        self.work += np.bincount(work, minlength=MAX_UNITS)
+        y = work * self.unit_ms
+        self.work_sum += y.sum()
+        self.work_sq += (y * y).sum()
+        for i, name in enumerate(self.counts):
+            x = chunk[f"n_{name}"].astype(np.float64)
+            self.count_sum[i] += x.sum()
+            self.corr[i] += (x.sum(), (x * x).sum(), (x * y).sum())
+        self.add_group(self.by["weather"], weather_lookup[chunk["weather"]], work)
+        self.add_group(self.by["stars"], chunk["stars"], work)
+        if "enemies" in self.counts:
+            buckets = np.searchsorted(ENEMY_BUCKETS, chunk["n_enemies"], side="right") - 1
+            self.add_group(self.by["enemies"], buckets, work)
+
+    def ms(self, units):
+        return [round(u * self.unit_ms, 3) for u in units]
+
+    def correlations(self):
+        n = self.frames
+        out = {}
+        if n < 2:
+            return out
+        var_y = self.work_sq / n - (self.work_sum / n) ** 2
+        for i, name in enumerate(self.counts):
+            sx, sxx, sxy = self.corr[i]
+            var_x = sxx / n - (sx / n) ** 2
+            if var_x <= 0 or var_y <= 0:
+                continue
+            out[name] = round((sxy / n - (sx / n) * (self.work_sum / n)) / np.sqrt(var_x * var_y), 3)
+        return out
+
+    def group_label(self, kind, key):
+        if kind == "weather":
+            return self.weathers[key] if key < len(self.weathers) else "?"
+        if kind == "stars":
+            return f"★{key}"
+        return enemy_bucket_labels()[key]
+
+    def summary(self):
+        groups = {}
+        for kind, table in self.by.items():
+            groups[kind] = {self.group_label(kind, key): {"frames": int(hist.sum()),
+                                                          "p50_p95_p99": self.ms(percentiles_from_hist(hist))}
+                            for key, hist in sorted(table.items())}
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "builds": self.builds,
+            "timings": {name: self.ms(percentiles_from_hist(self.hist[name])) for name in self.timings},
+            "work": self.ms(percentiles_from_hist(self.work)),
+            "mean_counts": {name: round(self.count_sum[i] / max(1, self.frames), 2)
+                            for i, name in enumerate(self.counts)},
+            "correlation": self.correlations(),
+            "groups": groups,
+        }
+
+class SpikeStats:
+    """Second pass: what the frames above the spike threshold have in common."""
+
+    def __init__(self, stats, threshold_units, top):
+        self.stats = stats
+        self.threshold = threshold_units
+        self.top = top
+        self.frames = 0
+        self.count_sum = np.zeros(len(stats.counts))
+        self.weather = np.zeros(256, dtype=np.int64)
+        self.stars = np.zeros(256, dtype=np.int64)
+        self.culprit = np.zeros(len(stats.timings) - 1, dtype=np.int64)
+        self.worst = []   # (work units, trace, frame, time ms)
+
+    def add(self, chunk, weather_lookup, trace):
+        work = self.stats.work_units(chunk)
+        mask = work > self.threshold
+        spikes = chunk[mask]
+        if len(spikes) == 0:
+            return
+        self.frames += len(spikes)
+        for i, name in enumerate(self.stats.counts):
+            self.count_sum[i] += spikes[f"n_{name}"].sum(dtype=np.float64)
+        self.weather += np.bincount(weather_lookup[spikes["weather"]], minlength=256)
+        self.stars += np.bincount(spikes["stars"], minlength=256)
+        per = np.stack([spikes[f"t_{name}"] for name in self.stats.timings[1:]], axis=1)
+        self.culprit += np.bincount(per.argmax(axis=1), minlength=per.shape[1])
+        spike_work = work[mask]
+        keep = np.argsort(spike_work)[::-1][:self.top]
+        self.worst += [(int(spike_work[i]), trace, int(spikes["frame"][i]), int(spikes["time_ms"][i])) for i in keep]
+        self.worst = sorted(self.worst, reverse=True)[:self.top]
+
+    def summary(self):
+        s = self.stats
+        return {
+            "threshold_ms": round(self.threshold * s.unit_ms, 3),
+            "frames": self.frames,
+            "mean_counts": {name: round(self.count_sum[i] / max(1, self.frames), 2)
+                            for i, name in enumerate(s.counts)},
+            "weather": {s.group_label("weather", int(k)): int(v) for k, v in enumerate(self.weather) if v},
+            "stars": {f"★{k}": int(v) for k, v in enumerate(self.stars) if v},
+            "culprit": {name: int(v) for name, v in zip(s.timings[1:], self.culprit) if v},
+            "worst": [{"work_ms": round(u * s.unit_ms, 3), "trace": t, "frame": f, "time_ms": ms}
+                      for u, t, f, ms in self.worst],
+        }
+
+def analyze(paths, spike_ms=None, top=10):
+    """Two streaming passes over the traces -> summary dict (histograms, groups, spikes)."""
+    traces = [(path,) + open_trace(path) for path in paths]
+    first = traces[0][1]
+    stats = TraceStats(first["timings"], first["counts"], [], first.get("timeUnitUs", 10))
+    lookups = []
+    for path, header, records in traces:
+        if header["timings"] != stats.timings or header["counts"] != stats.counts:
+            raise ValueError(f"{path}: subsystem / count names differ from {traces[0][0]}")
+        lookups.append(stats.weather_map(header))
+        stats.dropped += int(header.get("dropped", 0))
+        stats.builds.append(header.get("build"))
+        for start in range(0, len(records), CHUNK):
+            stats.add(np.asarray(records[start:start + CHUNK]), lookups[-1])
+
+    if spike_ms is not None:
+        threshold = int(round(spike_ms / stats.unit_ms))
+    else:
+        threshold = percentiles_from_hist(stats.work, (99,))[0]
+    spikes = SpikeStats(stats, threshold, top)
+    for (path, header, records), lookup in zip(traces, lookups):
+        for start in range(0, len(records), CHUNK):
+            spikes.add(np.asarray(records[start:start + CHUNK]), lookup, os.path.basename(path))
+
+    summary = stats.summary()
+    summary["traces"] = [os.path.basename(path) for path, _, _ in traces]
+    summary["spikes"] = spikes.summary()
+    return summary
+
+# --- Report ---
+
+def fmt3(values):
+    return " ".join(f"{v:8.2f}" for v in values)
+
+def print_summary(s, budget_ms):
+    builds = ", ".join(sorted({str(b) for b in s["builds"]}))
+    print(f"{', '.join(s['traces'])}: {s['frames']:,} frame(s), build {builds}"
+          + (f", {s['dropped']:,} older frame(s) dropped by the ring buffer" if s["dropped"] else ""))
+    if not s["frames"]:
+        return
+    print(f"\n{'subsystem (ms)':<16} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, values in s["timings"].items():
+        print(f"  {name:<14} {fmt3(values)}")
+    print(f"  {'work':<14} {fmt3(s['work'])}   (budget {budget_ms:.2f})")
+
+    for kind, title in (("weather", "weather"), ("stars", "stars"), ("enemies", "enemies on screen")):
+        if not s["groups"][kind]:
+            continue
+        print(f"\nwork by {title}:")
+        for label, g in s["groups"][kind].items():
+            print(f"  {label:<14} {fmt3(g['p50_p95_p99'])}  {g['frames']:>10,} frame(s)")
+
+    if s["correlation"]:
+        print("\ncorrelation of work with entity counts: "
+              + ", ".join(f"{k} {v:+.2f}" for k, v in sorted(s["correlation"].items(), key=lambda kv: -abs(kv[1]))))
+
+    sp = s["spikes"]
+    print(f"\nspikes (work > {sp['threshold_ms']:.2f} ms): {sp['frames']:,} frame(s)")
+    if not sp["frames"]:
+        return
+    print(f"  {'count':<12} {'spike mean':>10} {'overall':>10}")
+    for name, mean in sp["mean_counts"].items():
+        print(f"  {name:<12} {mean:10.1f} {s['mean_counts'][name]:10.1f}")
+    total = sp["frames"]
+    for key, title in (("weather", "weather"), ("stars", "stars"), ("culprit", "slowest subsystem")):
+        parts = sorted(sp[key].items(), key=lambda kv: -kv[1])
+        print(f"  {title}: " + ", ".join(f"{k} {v / total:.0%}" for k, v in parts))
+    print("  worst frames:")
+    for w in sp["worst"]:
+        print(f"    {w['work_ms']:8.2f} ms  {w['trace']} frame {w['frame']} (t={w['time_ms'] / 1000:.1f}s)")
+
+def compare(current, baseline, threshold, min_delta_ms):
+    """Prints baseline -> current p50/p95/p99; returns the number of p95 regressions beyond `threshold`."""
+    rows = [(name, baseline["timings"].get(name), values) for name, values in current["timings"].items()]
+    rows.append(("work", baseline["work"], current["work"]))
+    for label, g in current["groups"]["weather"].items():
+        before = baseline["groups"]["weather"].get(label)
+        rows.append((f"work/{label}", before and before["p50_p95_p99"], g["p50_p95_p99"]))
+    slower = 0
+    print(f"\nCompared with {', '.join(baseline['traces'])} (build {', '.join(sorted({str(b) for b in baseline['builds']}))}):")
+    print(f"  {'':<16} {'p50':>17} {'p95':>17} {'p99':>17}")
+    for name, before, after in rows:
+        if not before or name == "interval":
+            continue
+        cells = " ".join(f"{b:7.2f}->{a:<7.2f}" for b, a in zip(before, after))
+        ratio = after[1] / before[1] if before[1] else float("inf") if after[1] else 1.0
+        mark = ""
+        if ratio > threshold and after[1] - before[1] >= min_delta_ms:
+            mark = "  SLOWER"
+            slower += 1
+        print(f"  {name:<16} {cells}  p95 x{ratio:5.2f}{mark}")
+    return slower
+
+# --- Synthetic traces ---
+
+def synthetic_chunks(frames, seed, slow):
+    """Plausible records for checking the tool without a browser; `slow` scales the enemy cost."""
+    rng = np.random.default_rng(seed)
+    dtype = record_dtype(DEFAULT_TIMINGS, DEFAULT_COUNTS)
+    for start in range(0, frames, CHUNK):
+        n = min(CHUNK, frames - start)
+        rec = np.zeros(n, dtype=dtype)
+        frame = np.arange(start, start + n)
+        rec["frame"] = frame % 7200 + 1
+        rec["time_ms"] = (frame * 1000 // 60) & 0xFFFFFFFF
+        weather = (frame // 3600) % 4
+        rec["weather"] = weather
+        rec["stars"] = (frame // 7200) % 5 + 1
+        rec["flags"] = (frame % 7200 == 0).astype(np.uint8)
+        enemies = rng.poisson(8 + rec["stars"] * 6)
+        particles = rng.poisson(30 + weather * 40)
+        counts = {"enemies": enemies, "bullets": rng.poisson(20, n), "missiles": rng.poisson(5 + enemies // 2),
+                  "particles": particles, "items": rng.poisson(2, n), "texts": rng.poisson(3, n)}
+        for name, values in counts.items():
+            rec[f"n_{name}"] = np.minimum(values, 65535)
+        cost = {"player": 5 + rng.exponential(2, n), "particles": particles * 0.4, "bullets": counts["bullets"] * 0.3,
+                "items": 2 + counts["items"], "enemies": enemies * 3 * slow * (1 + rng.exponential(0.3, n)),
+                "missiles": counts["missiles"] * 0.5, "texts": counts["texts"] * 0.5, "hud": 20 + rng.exponential(5, n),
+                "draw": 150 + enemies * 4 + particles * 0.8 + rng.exponential(30, n)}
+        gc = rng.random(n) < 0.002     # たまに GC のような固まり
+        cost["draw"] = cost["draw"] + gc * rng.exponential(800, n)
+        for name, values in cost.items():
+            rec[f"t_{name}"] = np.minimum(np.round(values), 65535)
+        rec["t_interval"] = np.maximum(1667, sum(rec[f"t_{k}"].astype(np.int64) for k in cost))
+        yield rec
+
+def make_synthetic(path, frames, seed, slow):
+    header = {"build": f"synthetic-{seed}", "userAgent": "frame_trace.py --synthetic", "startedAt": None,
+              "timeUnitUs": 10, "timings": DEFAULT_TIMINGS, "counts": DEFAULT_COUNTS,
+              "weathers": ["CLEAR", "RAIN", "SQUALL", "HELL"], "records": frames, "dropped": 0}
+    write_trace(path, header, synthetic_chunks(frames, seed, slow))
+    print(f"Wrote {frames:,} synthetic frame(s) to {path} ({os.path.getsize(path) / 1048576:.1f} MB)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize / compare frame-time traces exported by js/frameTrace.js")
+    parser.add_argument("traces", nargs="*", help=".ftrace file(s) of one build (analyzed together)")
+    parser.add_argument("--compare", nargs="+", metavar="TRACE", help="baseline build's .ftrace file(s)")
+    parser.add_argument("--threshold", type=float, default=1.25, help="p95 slowdown ratio reported as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="ignore p95 slowdowns smaller than this")
+    parser.add_argument("--spike-ms", type=float, help="work time counted as a spike (default: p99 of the traces)")
+    parser.add_argument("--budget-ms", type=float, default=1000 / 60, help="frame budget shown next to work")
+    parser.add_argument("--top", type=int, default=10, help="worst frames to list")
+    parser.add_argument("--json", help="also write the summary (and baseline) to this JSON file")
+    parser.add_argument("--synthetic", metavar="PATH", help="write a synthetic trace to PATH and exit")
+    parser.add_argument("--frames", type=int, default=216000, help="frames in the synthetic trace")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the synthetic trace")
+    parser.add_argument("--slow", type=float, default=1.0, help="enemy cost multiplier for the synthetic trace")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        make_synthetic(args.synthetic, args.frames, args.seed, args.slow)
+        return 0
+    if not args.traces:
+        parser.error("no trace files given")
+
+    try:
+        current = analyze(args.traces, args.spike_ms, args.top)
+        baseline = analyze(args.compare, args.spike_ms, args.top) if args.compare else None
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    print_summary(current, args.budget_ms)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"current": current, "baseline": baseline}, f, ensure_ascii=False, indent=2)
+        print(f"\nSummary written to {args.json}")
+    if baseline is not None:
+        if not baseline["frames"] or not current["frames"]:
+            print("\nNothing to compare (empty trace).")
+            return 0
+        if compare(current, baseline, args.threshold, args.min_delta_ms):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
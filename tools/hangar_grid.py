@@ -0,0 +1,392 @@
+"""
+船体グリッド (ハンガー) のビットボード表現と、装備の組み合わせのオフライン探索
+
+グリッドは GRID_SIZE x GRID_SIZE のマス (r, c) をビット r * GRID_SIZE + c に割り当てた
+100 ビットの整数で表す。パーツの形 (W, H と任意の Shape 列) も同じ表現にして、
+置ける位置ごとのマスクをビルド時に全部作っておく。配置の判定は
+    mask & ~unlocked == 0 and mask & occupied == 0
+の2回の AND で済む。
+
+Shape 列は "11/01" (行を / で区切る) か [[1, 1], [0, 1]] で書く。無ければ W x H の長方形。
+置ける位置は js/settings.js の SHIP_LAYOUT で 0 (Void) でないマスに収まるものだけ。
+
+出力 (GAME_BALANCE_DATA.HANGAR_GRID, マスクは16進文字列, ゲーム側は BigInt で読む):
+    {"size": 10, "layout": "<解放できる全マス>", "initial": "<初期マス>",
+     "parts": {ID: {"shape": "<(0, 0) に置いた時のマスク>", "h", "w",
+                    "placements": {"<r * size + c>": "<mask>"}}}}
+
+探索 (branch and bound) は、解放済みのマス集合に対して
+    value   重量上限 (--max-weight) の中で価値 (--value, 既定はマス数) が最大の組み合わせ
+    weight  価値の下限 (--min-value) を満たす中で総重量が最小の組み合わせ
+を求める。パーツは種類ごとに1つまで (ゲームと同じ)。--require のパーツは必ず載せる。
+
+    python tools/hangar_grid.py                                # 全マス解放時に一番多くのマスを埋める組み合わせ
+    python tools/hangar_grid.py --unlocked initial --require BeamGun
+    python tools/hangar_grid.py --objective weight --value Damage --min-value 60
+    python tools/hangar_grid.py --stats                        # パーツごとの置ける位置の数
+"""
+import argparse
+import json
+import os
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SETTINGS_JS_PATH = os.path.join(BASE_DIR, "../js/settings.js")
+GRID_SIZE = 10
+LAYOUT_VOID = 0
+LAYOUT_INITIAL = 2
+
+# --- Bitboards ---
+
+def cell_bit(r, c, size=GRID_SIZE):
+    return 1 << (r * size + c)
+
+def mask_cells(mask, size=GRID_SIZE):
+    """[(r, c)] of the set bits, in row-major order."""
+    cells = []
+    while mask:
+        low = mask & -mask
+        index = low.bit_length() - 1
+        cells.append(divmod(index, size))
+        mask ^= low
+    return cells
+
+def cells_mask(cells, size=GRID_SIZE):
+    mask = 0
+    for r, c in cells:
+        mask |= cell_bit(r, c, size)
+    return mask
+
+def load_ship_layout(path=SETTINGS_JS_PATH):
+    """SHIP_LAYOUT (rows of 0 = Void, 1 = unlockable, 2 = initial) from js/settings.js."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    start = source.index("[", source.index("SHIP_LAYOUT:"))
+    layout, _ = json.JSONDecoder().raw_decode(source, start)
+    return layout
+
+def layout_mask(layout, kinds=None, size=GRID_SIZE):
+    """Cells of the layout whose value is in `kinds` (default: every non-Void cell)."""
+    return cells_mask([(r, c) for r, row in enumerate(layout[:size]) for c, kind in enumerate(row[:size])
+                       if (kind != LAYOUT_VOID if kinds is None else kind in kinds)], size)
+
+def parse_shape(shape):
+    """Shape column value as rows of 0/1 ("11/01", a JSON string or a 2D list); None when absent."""
+    if shape is None or shape == "" or (isinstance(shape, float) and shape != shape):
+        return None
+    if isinstance(shape, str):
+        text = shape.strip()
+        if text.startswith("["):
+            shape = json.loads(text)
+        else:
+            return [[0 if ch == "0" else 1 for ch in row.strip()] for row in text.split("/")]
+    return [[0 if not v or v == "0" else 1 for v in row] for row in shape]
+
+def part_cells(template):
+    """[(dr, dc)] the part covers relative to its top-left anchor (GridManager と同じ w/W, h/H, shape/Shape)."""
+    w = int(template.get("w") or template.get("W") or 1)
+    h = int(template.get("h") or template.get("H") or 1)
+    shape = parse_shape(template.get("shape", template.get("Shape")))
+    if shape is None:
+        return [(dr, dc) for dr in range(h) for dc in range(w)]
+    return [(dr, dc) for dr in range(h) for dc in range(w)
+            if dr < len(shape) and dc < len(shape[dr]) and shape[dr][dc]]
+
+def placements(cells, allowed, size=GRID_SIZE):
+    """{anchor index r * size + c: mask} of every position where all cells are inside `allowed`."""
+    if not cells:
+        return {}
+    height = max(dr for dr, _ in cells) + 1
+    width = max(dc for _, dc in cells) + 1
+    shape = cells_mask(cells, size)
+    result = {}
+    for r in range(size - height + 1):
+        for c in range(size - width + 1):
+            mask = shape << (r * size + c)
+            if mask & ~allowed == 0:
+                result[r * size + c] = mask
+    return result
+
+def build_hangar_grid(templates, layout, size=GRID_SIZE):
+    """HANGAR_GRID section for the merged WEAPONS + PART_TEMPLATES templates."""
+    allowed = layout_mask(layout, size=size)
+    parts = {}
+    for part_id, template in templates.items():
+        cells = part_cells(template)
+        parts[part_id] = {
+            "shape": format(cells_mask(cells, size), "x"),
+            "h": max((dr for dr, _ in cells), default=-1) + 1,
+            "w": max((dc for _, dc in cells), default=-1) + 1,
+            "placements": {str(index): format(mask, "x") for index, mask in placements(cells, allowed, size).items()},
+        }
+    return {
+        "size": size,
+        "layout": format(allowed, "x"),
+        "initial": format(layout_mask(layout, (LAYOUT_INITIAL,), size), "x"),
+        "parts": parts,
+    }
+
+# --- Loadout search ---
+
+class Part:
+    __slots__ = ("id", "area", "value", "weight", "masks", "anchors")
+
+    def __init__(self, part_id, area, value, weight, positions):
+        self.id = part_id
+        self.area = area
+        self.value = value
+        self.weight = weight
+        self.masks = list(positions.values())
+        self.anchors = {mask: divmod(index, GRID_SIZE) for index, mask in positions.items()}
+
+def template_number(template, field):
+    value = template.get(field, template.get(field.lower()))
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if value != value else value
+
+def make_parts(templates, layout, unlocked, value_field="area", weight_field="Weight", exclude=()):
+    """Part records whose placements lie inside `unlocked` (parts with no room are kept with no masks)."""
+    allowed = layout_mask(layout) & unlocked
+    parts = []
+    for part_id, template in templates.items():
+        if part_id in exclude:
+            continue
+        cells = part_cells(template)
+        value = len(cells) if value_field == "area" else template_number(template, value_field)
+        parts.append(Part(part_id, len(cells), value, template_number(template, weight_field),
+                          placements(cells, allowed)))
+    return parts
+
+class Search:
+    """Branch and bound over which parts to equip; each candidate set is checked by a bitmask packing DFS.
+
+    価値も重量もどのパーツを載せるかだけで決まり、置き方は載るかどうかにしか効かないので、
+    外側の探索はパーツの集合 (載せる / 載せない) を分岐し、集合を広げるたびに内側の DFS で
+    実際に重ならずに置けるかを確かめる (置けない集合を含む集合は全部置けないのでそこで切る)。
+    """
+
+    def __init__(self, parts, unlocked, required=(), objective="value", max_weight=None, min_value=None):
+        self.objective = objective
+        self.max_weight = max_weight
+        self.min_value = min_value or 0
+        self.capacity = bin(unlocked).count("1")
+        # 必須パーツを先に決め、残りは目的に効く順 (良い解が早く見つかり枝刈りが効く)
+        if objective == "value":
+            order = lambda p: -p.value / max(p.area, 1)
+        else:
+            order = lambda p: p.weight / p.value if p.value > 0 else float("inf")
+        self.parts = sorted(parts, key=lambda p: (p.id not in required, order(p), p.id))
+        self.required = [p.id in required for p in self.parts]
+        self.best = None
+        self.best_score = None
+        self.nodes = 0
+        self.packings = {}
+
+    def run(self):
+        self._dfs(0, [], [], 0.0, 0.0, 0)
+        return self.best
+
+    def score(self, value, weight):
+        return (value, -weight) if self.objective == "value" else (-weight, value)
+
+    def max_extra_value(self, i, area, weight):
+        """Upper bound on the value parts[i:] can add: fractional knapsack over the free cells."""
+        free = self.capacity - area
+        candidates = [p for p in self.parts[i:] if p.value > 0 and p.masks and
+                      (self.max_weight is None or weight + p.weight <= self.max_weight)]
+        candidates.sort(key=lambda p: -p.value / max(p.area, 1))
+        bound = 0.0
+        for part in candidates:
+            if part.area <= free:
+                bound += part.value
+                free -= part.area
+            else:
+                bound += part.value * free / part.area
+                break
+        return bound
+
+    def min_extra_weight(self, i, needed):
+        """Lower bound on the weight parts[i:] must add to gain `needed` value (inf when out of reach)."""
+        if needed <= 0:
+            return 0.0
+        candidates = sorted((p for p in self.parts[i:] if p.value > 0 and p.masks),
+                            key=lambda p: p.weight / p.value)
+        weight = 0.0
+        for part in candidates:
+            if part.value >= needed:
+                return weight + part.weight * needed / part.value
+            weight += part.weight
+            needed -= part.value
+        return float("inf")
+
+    def pack(self, chosen):
+        """[(Part, mask)] placing every part without overlap, or None (memoised per part set)."""
+        key = frozenset(p.id for p in chosen)
+        if key not in self.packings:
+            # 置き場所の少ないパーツから決める
+            order = sorted(chosen, key=lambda p: (len(p.masks), -p.area))
+            result = []
+            failed = set()
+
+            def place(k, occupied):
+                self.nodes += 1
+                if k == len(order):
+                    return True
+                if (k, occupied) in failed:
+                    return False
+                for mask in order[k].masks:
+                    if not mask & occupied:
+                        result.append((order[k], mask))
+                        if place(k + 1, occupied | mask):
+                            return True
+                        result.pop()
+                failed.add((k, occupied))
+                return False
+
+            self.packings[key] = list(result) if place(0, 0) else None
+        return self.packings[key]
+
+    def _dfs(self, i, chosen, packing, value, weight, area):
+        self.nodes += 1
+        if i == len(self.parts):
+            if value >= self.min_value:
+                score = self.score(value, weight)
+                if self.best_score is None or score > self.best_score:
+                    self.best_score = score
+                    self.best = packing
+            return
+        if value + self.max_extra_value(i, area, weight) < self.min_value:
+            return
+        if self.best_score is not None:
+            if self.objective == "value":
+                if value + self.max_extra_value(i, area, weight) < self.best_score[0]:
+                    return
+            elif weight + self.min_extra_weight(i, self.min_value - value) > -self.best_score[0]:
+                return
+
+        part = self.parts[i]
+        # 重量最小化では価値の無いパーツは載せても得をしない
+        useless = self.objective == "weight" and part.value <= 0 and not self.required[i]
+        if part.masks and not useless and area + part.area <= self.capacity and \
+                (self.max_weight is None or weight + part.weight <= self.max_weight):
+            placed = self.pack(chosen + [part])
+            if placed is not None:
+                self._dfs(i + 1, chosen + [part], placed, value + part.value, weight + part.weight, area + part.area)
+        if not self.required[i]:
+            self._dfs(i + 1, chosen, packing, value, weight, area)
+
+def solve(parts, unlocked, required=(), objective="value", max_weight=None, min_value=None):
+    """Best [(Part, mask)] loadout, or None when the constraints cannot be met."""
+    return Search(parts, unlocked, required, objective, max_weight, min_value).run()
+
+# --- CLI ---
+
+def parse_unlocked(text, layout):
+    """Unlocked mask for --unlocked; raises ValueError with a message for malformed values."""
+    if text == "all":
+        return layout_mask(layout)
+    if text == "initial":
+        return layout_mask(layout, (LAYOUT_INITIAL,))
+    if text.startswith("0x"):
+        try:
+            return int(text, 16)
+        except ValueError:
+            raise ValueError(f"bad hex mask: {text}") from None
+    # "r,c r,c ..." (初期マスに追加で解放したマス)
+    cells = []
+    for item in text.replace(";", " ").split():
+        try:
+            r, c = (int(v) for v in item.split(","))
+        except ValueError:
+            raise ValueError(f"bad cell '{item}' (expected r,c)") from None
+        if not (0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE):
+            raise ValueError(f"cell '{item}' is outside the {GRID_SIZE}x{GRID_SIZE} grid")
+        cells.append((r, c))
+    return layout_mask(layout, (LAYOUT_INITIAL,)) | cells_mask(cells)
+
+def render(layout, unlocked, loadout):
+    """Text picture of the hangar: letters = parts, '.' = free, '-' = locked, blank = Void."""
+    owner = {}
+    legend = []
+    for n, (part, mask) in enumerate(loadout):
+        letter = chr(ord("A") + n)
+        legend.append(f"{letter} = {part.id}")
+        for cell in mask_cells(mask):
+            owner[cell] = letter
+    rows = []
+    for r, row in enumerate(layout):
+        if not any(row):
+            continue
+        line = ""
+        for c, kind in enumerate(row):
+            if (r, c) in owner:
+                line += owner[(r, c)]
+            elif kind == LAYOUT_VOID:
+                line += " "
+            else:
+                line += "." if unlocked & cell_bit(r, c) else "-"
+        rows.append("    " + line.rstrip())
+    return rows + ["    " + ", ".join(legend)] if legend else rows
+
+def main():
+    from settings_store import load_settings
+    parser = argparse.ArgumentParser(description="Search the best hangar loadout with bitboard placements")
+    parser.add_argument("--unlocked", default="all",
+                        help="'all' (every unlockable cell), 'initial', a hex mask or extra cells 'r,c r,c ...'")
+    parser.add_argument("--objective", choices=("value", "weight"), default="value",
+                        help="value: maximise value under --max-weight; weight: minimise weight with --min-value")
+    parser.add_argument("--value", default="area", help="template field to maximise, or 'area' (cells covered)")
+    parser.add_argument("--weight", default="Weight", help="template field used as weight")
+    parser.add_argument("--max-weight", type=float)
+    parser.add_argument("--min-value", type=float)
+    parser.add_argument("--require", default="", help="comma separated part IDs that must be equipped")
+    parser.add_argument("--exclude", default="", help="comma separated part IDs to leave out")
+    parser.add_argument("--stats", action="store_true", help="print the placement counts and exit")
+    args = parser.parse_args()
+
+    data = load_settings()
+    templates = dict(data.get("WEAPONS") or {})
+    templates.update(data.get("PART_TEMPLATES") or {})
+    layout = load_ship_layout()
+    try:
+        unlocked = parse_unlocked(args.unlocked, layout)
+    except ValueError as e:
+        parser.error(f"--unlocked: {e}")
+    required = {s for s in args.require.split(",") if s}
+    exclude = {s for s in args.exclude.split(",") if s}
+    unknown = (required | exclude) - set(templates)
+    if unknown:
+        print(f"Unknown part(s): {', '.join(sorted(unknown))}")
+        return 2
+
+    parts = make_parts(templates, layout, unlocked, args.value, args.weight, exclude)
+    cells = bin(layout_mask(layout) & unlocked).count("1")
+    if args.stats:
+        print(f"{len(parts)} parts, {cells} unlocked cell(s)")
+        for part in parts:
+            print(f"  {part.id:<12} {part.area} cell(s)  {len(part.masks):3} placement(s)  "
+                  f"value {part.value:g}  weight {part.weight:g}")
+        return 0
+
+    start = time.perf_counter()
+    search = Search(parts, layout_mask(layout) & unlocked, required, args.objective, args.max_weight, args.min_value)
+    loadout = search.run()
+    elapsed = time.perf_counter() - start
+    print(f"{len(parts)} parts over {cells} unlocked cell(s): {search.nodes:,} nodes in {elapsed * 1000:.1f} ms")
+    if loadout is None:
+        print("  no loadout satisfies the constraints")
+        return 1
+    value = sum(part.value for part, _ in loadout)
+    weight = sum(part.weight for part, _ in loadout)
+    print(f"  value ({args.value}) {value:g}, weight ({args.weight}) {weight:g}")
+    for part, mask in loadout:
+        r, c = part.anchors[mask]
+        print(f"  {part.id:<12} at r{r} c{c}")
+    print("\n".join(render(layout, unlocked, loadout)))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+"""
+ベンチマーク用の合成バランスワークブック
+
+game_balance_new.xlsx をひな形に、敵・強化表・ドロップ表・パーツの行を指定倍率まで複製した
+ワークブックを作る。シート構成と列はひな形そのままで、load_excel_data() が読む全シートが揃う。
+複製した行は ID に "_x<n>" を付け、参照 (敵 → ドロップ表など) も複製先どうしでつなぐので、
+validate_data.py のチェックも通る。SchemaVersion は最新を記録する (移行は no-op)。
+
+    python tools/make_synthetic_workbook.py --scale 100 -o /tmp/balance_x100.xlsx
+    python tools/make_synthetic_workbook.py --enemies 1000 --upgrades 10 -o big.xlsx
+
+書き込みは openpyxl の write-only モード (1000倍 = UpgradeTable 約60万行でもメモリは一定)。
+"""
+import argparse
+import os
+import shutil
+import time
+import zipfile
+
+import openpyxl
+import pandas as pd
+from openpyxl.packaging.custom import IntProperty
+from openpyxl.utils import get_column_letter
+
+from schema_migrations import SCHEMA_VERSION_PROP, latest_version
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_PATH = os.path.join(BASE_DIR, "../game_balance_new.xlsx")
+
+def copy_id(value, n):
+    """ID of the n-th copy (copy 0 is the original row)."""
+    return value if n == 0 or pd.isna(value) else f"{value}_x{n}"
+
+def _replicate(df, factor, id_columns):
+    if factor <= 1 or df.empty:
+        return df
+    copies = []
+    for n in range(factor):
+        copy = df.copy()
+        for col in id_columns:
+            if col in copy.columns:
+                copy[col] = [copy_id(v, n) for v in copy[col]]
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+def scale_frames(frames, enemies=1, upgrades=1, drops=1, parts=1):
+    """Sheets of the template with rows replicated; returns a new {sheet: DataFrame}."""
+    frames = dict(frames)
+    if "Enemies" in frames:
+        df = _replicate(frames["Enemies"], enemies, ["ID"])
+        if drops > 1 and "DropTable" in df.columns:
+            # 複製した敵は複製したドロップ表を順番に使う
+            n = len(frames["Enemies"])
+            df["DropTable"] = [copy_id(v, (i // n) % drops) for i, v in enumerate(df["DropTable"])]
+        frames["Enemies"] = df
+    if "DropTables" in frames:
+        frames["DropTables"] = _replicate(frames["DropTables"], drops, ["DTID"])
+    if "UpgradeTable" in frames:
+        frames["UpgradeTable"] = _replicate(frames["UpgradeTable"], upgrades, ["StatType"])
+    for sheet in ("Weapons", "Parts"):
+        if sheet in frames:
+            frames[sheet] = _replicate(frames[sheet], parts, ["ID"])
+    return frames
+
+def _cell(value):
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+def write_workbook(frames, path):
+    """Writes the sheets with the write-only workbook and stamps the current SchemaVersion."""
+    wb = openpyxl.Workbook(write_only=True)
+    for name, df in frames.items():
+        ws = wb.create_sheet(name)
+        ws.append(list(df.columns))
+        for row in df.itertuples(index=False, name=None):
+            ws.append([_cell(v) for v in row])
+    wb.custom_doc_props.append(IntProperty(name=SCHEMA_VERSION_PROP, value=latest_version()))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    wb.save(path)
+    add_dimensions(path, [f"A1:{get_column_letter(max(len(df.columns), 1))}{len(df) + 1}" for df in frames.values()])
+
+def add_dimensions(path, refs):
+    """Inserts <dimension ref=...> into each worksheet, as Excel does.
+
+    The write-only workbook leaves it out, and without it openpyxl's read-only mode parses the
+    whole sheet on every open just to size it, which would make the benchmark measure that instead.
+    """
+    tmp = path + ".tmp"
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            name = info.filename
+            sheet = name[len("xl/worksheets/sheet"):-len(".xml")] if name.startswith("xl/worksheets/sheet") else ""
+            with src.open(info) as fin, dst.open(info, "w") as fout:
+                if sheet.isdigit() and int(sheet) <= len(refs):
+                    head = fin.read(4096)
+                    tag = b"</sheetPr>" if b"</sheetPr>" in head else b">"
+                    at = head.index(tag) + len(tag)
+                    dimension = f'<dimension ref="{refs[int(sheet) - 1]}" />'.encode()
+                    fout.write(head[:at] + dimension + head[at:])
+                shutil.copyfileobj(fin, fout, 1 << 20)
+    os.replace(tmp, path)
+
+def make_workbook(path, scale=1, enemies=None, upgrades=None, drops=None, parts=None, template=TEMPLATE_PATH):
+    """Writes a scaled copy of `template` to `path`; returns {sheet: rows}."""
+    frames = pd.read_excel(template, sheet_name=None)
+    frames = scale_frames(frames, enemies or scale, upgrades or scale, drops or scale, parts or scale)
+    write_workbook(frames, path)
+    return {name: len(df) for name, df in frames.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a scaled synthetic balance workbook")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--scale", type=int, default=1, help="default factor for every replicated sheet")
+    parser.add_argument("--enemies", type=int, help="Enemies rows factor")
+    parser.add_argument("--upgrades", type=int, help="UpgradeTable rows factor")
+    parser.add_argument("--drops", type=int, help="DropTables rows factor")
+    parser.add_argument("--parts", type=int, help="Weapons / Parts rows factor")
+    parser.add_argument("--template", default=TEMPLATE_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = make_workbook(args.output, args.scale, args.enemies, args.upgrades, args.drops, args.parts,
+                         args.template)
+    print(f"Wrote {args.output} ({os.path.getsize(args.output):,} bytes) in {time.perf_counter() - start:.2f}s")
+    for name, n in rows.items():
+        print(f"  {name:<18} {n:>9,} rows")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+"""
+敵の移動パターン (MovementPatterns シート) のベイクと参照実装
+
+シートの各 MPID は次のパラメータで定義する:
+    Kind       Linear / Wave / Homing / Reflect
+    VX, VY     1フレームあたりの移動量 (敵の Speed 倍)
+    AmpX, AmpY 揺れの振幅 (敵の Turn 倍, Wave のみ)
+    Frequency  揺れの角速度 (rad/frame)
+    Phase      揺れの初期位相 (rad)
+
+Linear / Wave は1フレームの移動量が
+    dx = VX * speed + AmpX * turn * sin(Frequency * t + Phase)
+    dy = VY * speed + AmpY * turn * sin(Frequency * t + Phase)
+(t = 敵の経過フレーム, 1 から) で決まるので、sin の部分を1周期ぶんの表にしてビルド時に焼き込む。
+表の長さ L は Frequency * L が 2π の整数倍に (ほぼ) なるように選ぶので、t % L で継ぎ目なく繰り返せる。
+Homing / Reflect はプレイヤー位置や壁に依存するので表にはせず、種類コードだけを出力する。
+    Homing   プレイヤーへ向かって |(VX, VY)| * speed で進む
+    Reflect  初速 (VX * turn, VY * speed), 左右の壁で反射
+
+出力 (GAME_BALANCE_DATA.MOVEMENT_TABLES):
+    {"waves": [{"length": L, "data": "<base64 Int16 little-endian>"}],
+     "patterns": {MPID: {"kind": 0|1|2, "vx", "vy", "ampX", "ampY", "wave": index or -1}}}
+
+    python tools/movement_patterns.py   # 焼き込んだ表を解析式と照合する
+"""
+import argparse
+import base64
+import math
+
+import numpy as np
+
+KIND_PATH = 0
+KIND_HOMING = 1
+KIND_REFLECT = 2
+KINDS = {"Linear": KIND_PATH, "Wave": KIND_PATH, "Homing": KIND_HOMING, "Reflect": KIND_REFLECT}
+
+WAVE_SCALE = 32767
+MAX_WAVE_FRAMES = 2048
+# 表の周期から決まる実効周波数と、シートの Frequency との相対誤差の許容値
+FREQUENCY_TOLERANCE = 1e-4
+
+def wave_length(frequency):
+    """Table length L (frames) whose k whole cycles best match `frequency`. Returns (L, cycles)."""
+    period = 2 * math.pi / abs(frequency)
+    best = None
+    k = 1
+    while True:
+        length = round(k * period)
+        if length > MAX_WAVE_FRAMES:
+            break
+        if length >= 2:
+            error = abs(2 * math.pi * k / length - abs(frequency)) / abs(frequency)
+            if best is None or error < best[0]:
+                best = (error, length, k)
+            if error <= FREQUENCY_TOLERANCE:
+                break
+        k += 1
+    if best is None:
+        raise ValueError(f"Frequency {frequency} is too low to bake (period over {MAX_WAVE_FRAMES} frames)")
+    return best[1], best[2]
+
+def effective_frequency(frequency):
+    length, cycles = wave_length(frequency)
+    return math.copysign(2 * math.pi * cycles / length, frequency)
+
+def bake_wave(frequency, phase):
+    """sin(frequency * t + phase) for t = 0..L-1 as int16 (scale WAVE_SCALE)."""
+    length, _ = wave_length(frequency)
+    t = np.arange(length)
+    values = np.sin(effective_frequency(frequency) * t + phase)
+    return np.round(values * WAVE_SCALE).astype('<i2')
+
+def encode_wave(samples):
+    return {"length": int(len(samples)), "data": base64.b64encode(samples.tobytes()).decode('ascii')}
+
+def decode_wave(entry):
+    raw = np.frombuffer(base64.b64decode(entry["data"]), dtype='<i2')
+    return raw.astype(np.float64) / WAVE_SCALE
+
+def pattern_params(row):
+    """Normalises one MOVEMENT_PATTERNS record (sheet row) to floats; missing cells count as 0."""
+    def num(key):
+        value = row.get(key, 0)
+        return float(value) if value not in (None, "") else 0.0
+    return {
+        "kind": row.get("Kind", "Linear"),
+        "vx": num("VX"), "vy": num("VY"),
+        "ampX": num("AmpX"), "ampY": num("AmpY"),
+        "frequency": num("Frequency"), "phase": num("Phase"),
+    }
+
+def build_movement_tables(patterns):
+    """MOVEMENT_PATTERNS records -> MOVEMENT_TABLES (waves shared between patterns with the same shape)."""
+    waves = []
+    wave_index = {}
+    result = {}
+    for mpid, row in patterns.items():
+        p = pattern_params(row)
+        if p["kind"] not in KINDS:
+            raise ValueError(f"MovementPatterns {mpid}: unknown Kind {p['kind']!r} (expected {', '.join(KINDS)})")
+        wave = -1
+        if KINDS[p["kind"]] == KIND_PATH and (p["ampX"] or p["ampY"]) and p["frequency"]:
+            key = (p["frequency"], p["phase"])
+            if key not in wave_index:
+                wave_index[key] = len(waves)
+                waves.append(encode_wave(bake_wave(*key)))
+            wave = wave_index[key]
+        result[mpid] = {
+            "kind": KINDS[p["kind"]],
+            "vx": p["vx"], "vy": p["vy"],
+            "ampX": p["ampX"], "ampY": p["ampY"],
+            "wave": wave,
+        }
+    return {"waves": waves, "patterns": result}
+
+# --- Reference evaluator ---
+
+def analytic_steps(params, frames, speed=1.0, turn=1.0):
+    """Per-frame (dx, dy) from the sheet definition, t = 1..frames (Linear / Wave only)."""
+    t = np.arange(1, frames + 1)
+    if params["frequency"] and (params["ampX"] or params["ampY"]):
+        s = np.sin(params["frequency"] * t + params["phase"])
+    else:
+        s = np.zeros(frames)
+    return (params["vx"] * speed + params["ampX"] * turn * s,
+            params["vy"] * speed + params["ampY"] * turn * s)
+
+def baked_steps(pattern, waves, frames, speed=1.0, turn=1.0):
+    """Per-frame (dx, dy) the runtime computes from MOVEMENT_TABLES (same lookup as Enemy.js)."""
+    t = np.arange(1, frames + 1)
+    if pattern["wave"] >= 0:
+        table = waves[pattern["wave"]]
+        s = table[t % len(table)]
+    else:
+        s = np.zeros(frames)
+    return (pattern["vx"] * speed + pattern["ampX"] * turn * s,
+            pattern["vy"] * speed + pattern["ampY"] * turn * s)
+
+def check_tables(patterns, tables, frames, tolerance):
+    """Compares baked trajectories with the analytic ones. Returns the number of failing patterns."""
+    waves = [decode_wave(w) for w in tables["waves"]]
+    failed = 0
+    print(f"{'MPID':<10} {'Kind':<8} {'wave':>5} {'len':>5} {'max |step err|':>15} {'max |pos err|':>14}")
+    for mpid, row in patterns.items():
+        params = pattern_params(row)
+        pattern = tables["patterns"][mpid]
+        if pattern["kind"] != KIND_PATH:
+            print(f"{mpid:<10} {params['kind']:<8} {'-':>5} {'-':>5} {'(runtime)':>15} {'':>14}")
+            continue
+        ax, ay = analytic_steps(params, frames)
+        bx, by = baked_steps(pattern, waves, frames)
+        step_err = max(np.abs(ax - bx).max(), np.abs(ay - by).max())
+        pos_err = max(np.abs(np.cumsum(ax - bx)).max(), np.abs(np.cumsum(ay - by)).max())
+        ok = step_err <= tolerance
+        failed += not ok
+        wave, length = (pattern["wave"], len(waves[pattern["wave"]])) if pattern["wave"] >= 0 else ("-", "-")
+        print(f"{mpid:<10} {params['kind']:<8} {wave:>5} {length:>5} {step_err:>15.2e} "
+              f"{pos_err:>11.4f} px{'' if ok else '  NG'}")
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description="Check baked MOVEMENT_TABLES against the analytic pattern definitions")
+    parser.add_argument("--frames", type=int, default=1800,
+                        help="frames to evaluate (30 s; covers several table wraps and an enemy's lifetime)")
+    parser.add_argument("--tolerance", type=float, default=1e-2, help="max per-frame step error (px at speed = turn = 1)")
+    args = parser.parse_args()
+
+    from update_settings import load_excel_data
+    data = load_excel_data(only=["MOVEMENT_PATTERNS"])
+    if not data or "MOVEMENT_TABLES" not in data:
+        print("No MOVEMENT_TABLES in the converted data.")
+        return 1
+    failed = check_tables(data["MOVEMENT_PATTERNS"], data["MOVEMENT_TABLES"], args.frames, args.tolerance)
+    print(f"\n{len(data['MOVEMENT_TABLES']['waves'])} wave table(s), "
+          f"{'all patterns match' if not failed else f'{failed} pattern(s) out of tolerance'} "
+          f"over {args.frames} frames")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
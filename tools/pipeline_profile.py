@@ -0,0 +1,171 @@
+"""
+データパイプラインの計測 (--profile)
+
+各ツールの段階 (と、その中のシート・セクション) ごとに
+    wall   経過時間 (perf_counter)
+    cpu    このプロセスの CPU 時間 (process_time; 並列読み込みのシートはワーカー側の値)
+    peak   tracemalloc で見た段階中の Python メモリのピーク (段階開始時からの増分)
+    rows   処理した行数
+を記録し、段階の木を表にして表示する。同時に以下を書き出す:
+
+    <name>.trace.json   Chrome Trace Event 形式 (Perfetto / chrome://tracing / speedscope でフレームグラフ表示)
+    <name>.folded       折りたたみスタック形式 (flamegraph.pl / speedscope, 値は自己時間の µs)
+    <name>.<stage>.prof --cprofile 指定時、最も遅かったトップレベル段階の cProfile (pstats / snakeviz で表示)
+
+tracemalloc と cProfile は処理を遅くする (それぞれ 2～3 倍程度) ので、時間は相対的な目安として見ること。
+計測しないとき (NULL_PROFILER) の stage() は何もしない。
+
+    profiler = Profiler.from_args(args, "update_settings")
+    with profiler.stage("conversion") as rec:
+        ...
+        rec["rows"] = n
+    profiler.finish()
+"""
+import contextlib
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.path.join(BASE_DIR, "profile")
+
+def add_profile_arguments(parser):
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true",
+                       help="record wall/CPU time, peak memory and rows per stage; print a summary and "
+                            "write a trace (tools/profile/)")
+    group.add_argument("--profile-dir", default=PROFILE_DIR, help="where --profile writes its files")
+    group.add_argument("--cprofile", action="store_true",
+                       help="with --profile: also dump a cProfile of the slowest top-level stage")
+
+class Profiler:
+    enabled = True
+
+    def __init__(self, name, out_dir=PROFILE_DIR, cprofile=False):
+        self.name = name
+        self.out_dir = out_dir
+        self.cprofile = cprofile
+        self.records = []
+        self._stack = []
+        self._started = time.time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @classmethod
+    def from_args(cls, args, name):
+        if not getattr(args, "profile", False):
+            return NULL_PROFILER
+        return cls(name, args.profile_dir, args.cprofile)
+
+    @contextlib.contextmanager
+    def stage(self, name, rows=None):
+        """Times the block as a child of the enclosing stage; the yielded dict takes extra fields."""
+        parent = self._stack[-1] if self._stack else None
+        current, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            parent["_peak"] = max(parent["_peak"], peak)
+        tracemalloc.reset_peak()
+        rec = {"name": name, "path": (parent["path"] + [name]) if parent else [name], "depth": len(self._stack),
+               "rows": rows, "start": time.time(), "_base": current, "_peak": current}
+        self.records.append(rec)
+        self._stack.append(rec)
+        profile = None
+        if self.cprofile and parent is None:
+            profile = cProfile.Profile()
+            profile.enable()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield rec
+        except BaseException as e:
+            rec["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            rec["wall"] = time.perf_counter() - wall
+            rec["cpu"] = time.process_time() - cpu
+            if profile is not None:
+                profile.disable()
+                rec["_profile"] = profile
+            rec["_peak"] = max(rec["_peak"], tracemalloc.get_traced_memory()[1])
+            rec["peak_mb"] = (rec["_peak"] - rec["_base"]) / (1024 * 1024)
+            self._stack.pop()
+            if parent is not None:
+                parent["_peak"] = max(parent["_peak"], rec["_peak"])
+
+    def add(self, name, start, wall, cpu=None, rows=None, peak_mb=None, **extra):
+        """Records work measured elsewhere (e.g. a sheet read in a worker process) under the current stage."""
+        parent = self._stack[-1] if self._stack else None
+        self.records.append({"name": name, "path": (parent["path"] if parent else []) + [name],
+                             "depth": len(self._stack), "rows": rows, "start": start, "wall": wall,
+                             "cpu": cpu, "peak_mb": peak_mb, **extra})
+
+    # --- Output ---
+
+    def print_summary(self):
+        print(f"\nProfile ({self.name}):")
+        print(f"  {'stage':<34} {'wall ms':>10} {'cpu ms':>10} {'peak MB':>9} {'rows':>10}")
+        for rec in self.records:
+            label = ("  " * rec["depth"] + rec["name"])[:34]
+            cpu = f"{rec['cpu'] * 1000:10.1f}" if rec.get("cpu") is not None else f"{'-':>10}"
+            peak = f"{rec['peak_mb']:9.2f}" if rec.get("peak_mb") is not None else f"{'-':>9}"
+            rows = f"{rec['rows']:>10,}" if rec.get("rows") is not None else f"{'':>10}"
+            error = f"  ! {rec['error']}" if rec.get("error") else ""
+            print(f"  {label:<34} {rec['wall'] * 1000:10.1f} {cpu} {peak} {rows}{error}")
+
+    def trace_events(self):
+        """Chrome Trace Event Format ("X" complete events, µs); tid separates sheets read in parallel."""
+        events = []
+        for rec in self.records:
+            args = {k: rec[k] for k in ("rows", "cpu", "peak_mb", "error", "process") if rec.get(k) is not None}
+            events.append({"name": rec["name"], "cat": rec["path"][0], "ph": "X", "pid": 1,
+                           "tid": rec.get("tid", 1), "ts": round((rec["start"] - self._started) * 1e6),
+                           "dur": round(rec["wall"] * 1e6), "args": args})
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"tool": self.name}}
+
+    def folded(self):
+        """Collapsed stacks ("a;b;c self_µs"), self time = wall minus the children's wall."""
+        children = {}
+        for rec in self.records:
+            parent = tuple(rec["path"][:-1])
+            if parent:
+                children[parent] = children.get(parent, 0) + rec["wall"]
+        lines = []
+        for rec in self.records:
+            self_time = max(rec["wall"] - children.get(tuple(rec["path"]), 0), 0)
+            lines.append(f"{';'.join(rec['path'])} {round(self_time * 1e6)}")
+        return "\n".join(lines) + "\n"
+
+    def finish(self):
+        """Prints the summary and writes the trace files (and the cProfile dump); returns their paths."""
+        self.print_summary()
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, self.name)
+        paths = [base + ".trace.json", base + ".folded"]
+        with open(paths[0], "w", encoding="utf-8") as f:
+            json.dump(self.trace_events(), f)
+        with open(paths[1], "w", encoding="utf-8") as f:
+            f.write(self.folded())
+        profiled = [rec for rec in self.records if "_profile" in rec]
+        if profiled:
+            slowest = max(profiled, key=lambda rec: rec["wall"])
+            path = f"{base}.{slowest['name']}.prof"
+            slowest["_profile"].dump_stats(path)
+            paths.append(path)
+        print("  written: " + ", ".join(os.path.relpath(p) for p in paths))
+        return paths
+
+class _NullProfiler:
+    enabled = False
+
+    @contextlib.contextmanager
+    def stage(self, name, rows=None):
+        yield {}
+
+    def add(self, *args, **kwargs):
+        pass
+
+    def finish(self):
+        return []
+
+NULL_PROFILER = _NullProfiler()
@@ -0,0 +1,536 @@
+"""
+育成・経済のモンテカルロシミュレーター (仮想プレイヤー N 人を配列でまとめて進める)
+
+1ステップ = 1ミッション。全プレイヤーについて同時に
+    1. MissionManager.generateMissions: 強化レベル合計 (upgradeLevels) で DIFFICULTY_SCALING の帯を決め、
+       DIFFICULTY_ALIAS で星数を3件抽選 → 報酬が一番高い依頼を受ける (--stars で星数を固定)
+    2. ミッション: 成功率で成否を決め、成功は renderResult (タイムボーナス +30% / 遅延減額 -20%)、
+       失敗は handleFailure (penalty を引く, 0 未満にはならない)
+    3. ドロップ: 出現数 × 撃破・回収率 × ドロップ表の期待値 (Poisson) で素材・お金を得る
+    4. 強化: 目標 (--goal / --train) の中で、次のレベルが一番安く買えるものから資金が尽きるまで買う
+を繰り返し、目標レベルに届くまでのミッション数・プレイ時間の分布と、足りなくなる素材を集計する。
+
+強化コスト・必要素材は upgrade_config.js の PARAM_CONFIG から作る (upgrade_curves.py, ゲームと同じ表)。
+ミッションの長さは engine.js の速度・距離の式 (加速区間込み) から求め、経過時間は updateEntities の
+2回呼び出しぶん (balance_sim の passes) も再現する。--calibration に balance_sim --json の出力を渡すと、
+星数ごとの成功率と1ミッションあたりの素材・お金をシミュレーション結果で置き換える。
+
+RULES["engine"] は現在のゲームの挙動:
+    require_materials  強化に素材を要求・消費する (engine.js / ShipEditor は TODO のままで素材を見ない)
+    double_materials   拾った素材がクリア時にもう一度インベントリに足される (collectItem と renderResult の両方で加算)
+
+    python tools/progression_sim.py --goal BeamGun=50 --stars 3
+    python tools/progression_sim.py --goal BeamGun=50 --train HP=30 --rules intended --rename-materials Item=Type
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from balance_sim.data import ITEM_MATERIAL, ITEM_MONEY, SimData
+from balance_sim.sim import RULES as SIM_RULES
+from balance_sim.sim import player_stats
+from update_settings import load_excel_data
+from upgrade_curves import MAX_LEVEL, PLAYER_STATS, UpgradeCurves
+
+RULES = {
+    "engine": {"require_materials": False, "double_materials": True},
+    "intended": {"require_materials": True, "double_materials": False},
+}
+
+OFFERS = 3              # generateMissions は3件
+FAIL_FRACTION = 0.5     # 失敗したミッションは平均して半分の長さで終わるものとする
+ZONE_SPEED = {"hold": 0.5, "top": 1.0}  # 自機の位置 (画面下 / 上) の速度倍率
+
+def alias_table_arrays(tables, default):
+    """List of {"values", "prob", "alias"} (or None) as padded 2D arrays for pick_alias."""
+    width = max((len(t["values"]) for t in tables if t), default=1)
+    n = np.ones(len(tables), dtype=np.int64)
+    prob = np.ones((len(tables), width))
+    alias = np.zeros((len(tables), width), dtype=np.int64)
+    values = np.full((len(tables), width), default, dtype=np.int64)
+    for i, t in enumerate(tables):
+        if t:
+            k = len(t["values"])
+            n[i], prob[i, :k], alias[i, :k], values[i, :k] = k, t["prob"], t["alias"], t["values"]
+    return n, prob, alias, values
+
+def alias_probabilities(n, prob, alias):
+    """Exact outcome probabilities of one alias table (slot -> probability)."""
+    p = np.zeros(n)
+    for i in range(n):
+        p[i] += prob[i] / n
+        p[alias[i]] += (1 - prob[i]) / n
+    return p
+
+class Economy:
+    """Per-star mission model and upgrade targets, as arrays indexed by star / target / item."""
+
+    def __init__(self, data, sd, curves, goals, trains, args, rules):
+        self.sd = sd
+        self.rules = rules
+        mission = data.get("MISSION_DATA", {})
+        scaling = mission.get("DIFFICULTY_SCALING") or [{"minStat": 0, "probs": {1: 100}}]
+        self.min_stat = np.array([band["minStat"] for band in scaling])
+        aliases = mission.get("DIFFICULTY_ALIAS") or [None] * len(scaling)
+        self.band_alias = alias_table_arrays(aliases, 1)
+
+        top = max(sd.difficulty)
+        f = lambda: np.zeros(top + 1)
+        self.dist_low, self.dist_high, self.reward_mod = f(), f(), f()
+        for stars, p in sd.difficulty.items():
+            self.dist_low[stars], self.dist_high[stars] = p["dist"]
+            self.reward_mod[stars] = p.get("rewardMod", 1.0)
+        self.fixed_stars = args.stars
+
+        # 素材・お金: ドロップ表の期待値 (1体あたり) → 星数ごとの出現プール平均
+        self.item_ids = sd.item_ids
+        per_table = np.zeros((len(sd.drop_n), len(sd.item_ids)))
+        for t in range(len(sd.drop_n)):
+            if not sd.drop_exclusive[t]:
+                # 項目ごとの独立判定: 期待値は Rate の和
+                for item, p in zip(sd.drop_items[t], sd.drop_rate[t]):
+                    if item >= 0:
+                        per_table[t, item] += p
+                continue
+            k = int(sd.drop_n[t])
+            for slot, p in enumerate(alias_probabilities(k, sd.drop_prob[t, :k], sd.drop_alias[t, :k])):
+                if sd.drop_values[t, slot] >= 0:
+                    per_table[t, sd.drop_values[t, slot]] += p
+        self.per_spawn = np.zeros((top + 1, len(sd.item_ids)))
+        for stars in sd.difficulty:
+            pool = sd.spawn_pool(stars)
+            if len(pool):
+                yields = np.where((sd.en_drop[pool] >= 0)[:, None], per_table[sd.en_drop[pool]], 0)
+                self.per_spawn[stars] = (yields * sd.en_drop_count[pool][:, None]).mean(axis=0)
+        self.material = sd.item_kind == ITEM_MATERIAL
+        self.money_value = np.where(sd.item_kind == ITEM_MONEY, sd.item_value, 0)
+        self.loot_rate = args.loot_rate
+        self.clear_rate = np.full(top + 1, args.clear_rate)
+        self.per_mission = None
+        if args.calibration:
+            self._calibrate(args.calibration)
+
+        # 自機の速度 (ENGINE / SPEED の強化は engine.js では効かないので強化レベル 0 の値)
+        self.sim_rules = dict(SIM_RULES["engine"])
+        self.zone = ZONE_SPEED[args.policy]
+        self.scale = float(sd.physics.get("MISSION_SCALE", 1.0))
+        self.divisor = float(sd.physics.get("MISSION_DIVISOR", 2000))
+        self.loadout = {"main": args.main}
+        self.passes = self.sim_rules["passes"]
+        self.menu_seconds = args.menu_seconds
+
+        # 強化の目標 [T]: 表 (コスト・素材) はレベル方向に [T, 101]
+        self.targets = list(goals) + [k for k in trains if k not in goals]
+        self.goal_mask = np.array([k in goals for k in self.targets])
+        self.target_level = np.array([goals.get(k, trains.get(k)) for k in self.targets])
+        rows = [curves.index[k] for k in self.targets]
+        self.cost = curves.cost[rows].astype(float)
+        self.stat_mask = np.array([k in PLAYER_STATS for k in self.targets])
+        # 素材 ID を素材インデックスに (--rename-materials の読み替え後, ドロップに無いものは専用スロット)
+        def rename(mid):
+            for old, new in args.rename_materials or []:
+                if mid == old:
+                    return new
+            for old, new in args.rename_materials or []:
+                if mid and mid.startswith(old):
+                    return new + mid[len(old):]
+            return mid
+        self.required_ids = []
+        mat = np.full((len(rows), MAX_LEVEL + 1), -1, dtype=np.int64)
+        for t, r in enumerate(rows):
+            mid = rename(curves.material_ids[r])
+            if mid is None:
+                continue
+            if mid not in self.required_ids:
+                self.required_ids.append(mid)
+            mat[t] = np.where(curves.material[r] >= 0, sd.item(mid), -1)
+        # プレイヤーごとの在庫は、ドロップするか強化に要る品目だけの列 [C] で持つ
+        per_mission = self.per_mission if self.per_mission is not None else np.zeros_like(self.per_spawn)
+        n_items = len(sd.item_ids)
+        pad = lambda a: np.pad(a, [(0, 0)] * (a.ndim - 1) + [(0, n_items - a.shape[-1])])
+        self.per_spawn, per_mission = pad(self.per_spawn), pad(per_mission)
+        self.money_value = np.append(self.money_value, np.zeros(n_items - len(self.money_value)))
+        self.material = np.append(self.material, np.ones(n_items - len(self.material), dtype=bool))
+        source = self.per_spawn.any(axis=0) | per_mission.any(axis=0)
+        needed = np.zeros(n_items, dtype=bool)
+        needed[mat[mat >= 0]] = True
+        self.columns = np.flatnonzero(source | needed)
+        column = np.full(n_items, -1, dtype=np.int64)
+        column[self.columns] = np.arange(len(self.columns))
+        self.item_ids = [sd.item_ids[i] for i in self.columns]
+        self.per_spawn = self.per_spawn[:, self.columns]
+        self.per_mission = per_mission[:, self.columns] if self.per_mission is not None else None
+        self.money_value = self.money_value[self.columns]
+        self.material = self.material[self.columns]
+        self.obtainable = source[self.columns]
+        self.need_item = np.where(mat >= 0, column[mat], -1)
+        self.need_count = curves.material_count[rows]
+        self.sampled = (self.money_value > 0) & self.obtainable
+        if rules["require_materials"]:
+            self.sampled[self.need_item[self.need_item >= 0]] = True
+            self.sampled &= self.obtainable
+
+        # 入手できない素材を要求されたら、その手前のレベルで止まる (目標には届かない)
+        self.cap = self.target_level.copy()
+        self.stuck_on = [None] * len(rows)
+        if rules["require_materials"]:
+            for t in range(len(rows)):
+                lv = np.arange(1, self.target_level[t] + 1)
+                item = self.need_item[t, lv]
+                never = (item >= 0) & (self.need_count[t, lv] > 0) & ~self.obtainable[np.maximum(item, 0)]
+                if never.any():
+                    first = lv[never.argmax()]
+                    self.cap[t] = first - 1
+                    self.stuck_on[t] = self.item_ids[self.need_item[t, first]]
+
+    def _calibrate(self, path):
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        self.per_mission = np.zeros_like(self.per_spawn)
+        for stars, r in report["stars"].items():
+            s = int(stars)
+            self.clear_rate[s] = r["survival"]
+            for item_id, count in r.get("materials", {}).items():
+                self.per_mission[s, self.sd.item(item_id)] = count
+            # pickup_money はお金アイテムの合計なので、1個あたりの価値で割って件数に戻す
+            money = [i for i, v in enumerate(self.money_value) if v > 0]
+            if money and r["income"].get("pickup_money"):
+                self.per_mission[s, money[0]] = r["income"]["pickup_money"] / self.money_value[money[0]]
+
+    def total_stats(self, levels):
+        return (levels * self.stat_mask).sum(axis=1)
+
+    def offer(self, rng, levels):
+        """Stars, distance, weight and reward of the mission each player takes."""
+        n = len(levels)
+        if self.fixed_stars:
+            stars = np.full((n, 1), self.fixed_stars)
+        else:
+            # pickAlias を帯ごとの表から (2次元の添字より平坦な添字の方が速い)
+            band = np.maximum(np.searchsorted(self.min_stat, self.total_stats(levels), side="right") - 1, 0)
+            a_n, a_prob, a_alias, a_values = self.band_alias
+            width = a_prob.shape[1]
+            u = rng.random((n, OFFERS)) * a_n[band][:, None]
+            i = u.astype(np.int64)
+            flat = band[:, None] * width + i
+            hit = (u - i) < a_prob.ravel()[flat]
+            stars = a_values.ravel()[np.where(hit, flat, band[:, None] * width + a_alias.ravel()[flat])]
+        low, high = self.dist_low[stars], self.dist_high[stars]
+        dist = np.floor(rng.random(stars.shape) * (high - low)) + low
+        reward = np.floor(dist * 0.5 * self.reward_mod[stars])
+        # 報酬が一番高い依頼を受ける (重量は受けた依頼の分だけ引けば分布は同じ)
+        pick = reward.argmax(axis=1) if stars.shape[1] > 1 else np.zeros(n, dtype=np.int64)
+        flat = np.arange(n) * stars.shape[1] + pick
+        weight = np.floor(rng.random(n) * 5) + 1
+        return stars.ravel()[flat], dist.ravel()[flat], weight, reward.ravel()[flat]
+
+    def frames(self, dist, weight):
+        """Frames until distance reaches 0 (accelerate to the zone's top speed, then cruise)."""
+        stats = player_stats(self.sd, self.loadout, weight, self.sim_rules)
+        top = stats["max_speed"] * self.zone
+        accel = stats["accel"]
+        per_frame = top * self.scale / self.divisor
+        ramp = top / accel
+        ramp_dist = per_frame * ramp / 2
+        return np.where(dist > ramp_dist, ramp + (dist - ramp_dist) / per_frame,
+                        np.sqrt(2 * dist * ramp / per_frame))
+
+    def play(self, rng, stars, dist, weight, reward):
+        """Income, loot [n, items] (counts, or expected counts for items nothing depends on) and real seconds."""
+        frames = np.ceil(self.frames(dist, weight))
+        clear = rng.random(len(stars)) < self.clear_rate[stars]
+        frames = np.where(clear, frames, np.ceil(frames * FAIL_FRACTION))
+
+        # renderResult (経過時間は1フレームに passes 回ぶん進む)
+        target = np.floor(dist / 12) + 20
+        elapsed = (frames - 1) * self.passes * 2 / 60
+        diff = target - elapsed
+        bonus = np.floor(reward * np.minimum(0.3, diff / target))
+        reduction = np.floor(reward * np.minimum(0.2, np.abs(diff) / target))
+        income = np.where(diff > 0, reward + bonus, reward - reduction)
+
+        if self.per_mission is not None:
+            lam = self.per_mission[stars] * np.where(clear, 1.0, FAIL_FRACTION)[:, None]
+        else:
+            spawned = frames * self.passes / 60
+            lam = self.per_spawn[stars] * (spawned * self.loot_rate)[:, None]
+        # 判断に効く品目 (お金・要求される素材) だけ抽選し、集計だけの品目は期待値で足す
+        loot = lam
+        if self.sampled.any():
+            loot = lam.copy()
+            loot[:, self.sampled] = rng.poisson(lam[:, self.sampled])
+        return clear, income, np.floor(reward * 0.5), loot, frames / 60 + self.menu_seconds
+
+def simulate(econ, players, max_missions, seed, start_money=0):
+    rng = np.random.default_rng(seed)
+    t_count = len(econ.targets)
+    n_items = len(econ.item_ids)
+    # 進行中のプレイヤーだけを詰めて持つ。抜けたプレイヤーの状態は out に書き戻す
+    st = {
+        "id": np.arange(players),
+        "levels": np.zeros((players, t_count), dtype=np.int64),
+        "money": np.full(players, float(start_money)),
+        "inventory": np.zeros((players, n_items)),
+        "collected": np.zeros((players, n_items)),
+        "seconds": np.zeros(players),
+        "earned": np.zeros(players),
+        "failures": np.zeros(players, dtype=np.int64),
+        "blocked": np.zeros((players, n_items), dtype=np.int64),
+        "star_count": np.zeros((players, len(econ.dist_low)), dtype=np.int64),
+        "reached": np.full((players, t_count), -1, dtype=np.int64),
+        "done_at": np.full(players, -1, dtype=np.int64),
+        "done_seconds": np.full(players, np.nan),
+        "live": np.ones(players, dtype=bool),
+    }
+    out = {k: v.copy() for k, v in st.items() if k not in ("id", "live")}
+    out["stopped_at"] = np.full(players, max_missions, dtype=np.int64)
+    base = np.arange(t_count) * (MAX_LEVEL + 1)
+    cost_flat, item_flat, count_flat = econ.cost.ravel(), econ.need_item.ravel(), econ.need_count.ravel()
+    cap = econ.cap
+    require = econ.rules["require_materials"]
+
+    def next_cost(lv):
+        return np.where(lv < cap, cost_flat[base + np.minimum(lv + 1, MAX_LEVEL)], np.inf)
+
+    st["cheapest"] = next_cost(st["levels"]).min(axis=1)
+
+    def retire(mask, mission):
+        ids = st["id"][mask]
+        for k, v in out.items():
+            if k in st:
+                v[ids] = st[k][mask]
+        out["stopped_at"][ids] = mission
+        st["live"][mask] = False
+
+    for mission in range(1, max_missions + 1):
+        if not st["live"].any():
+            break
+        # 抜けたプレイヤーが 1/4 を超えたら詰める
+        if (~st["live"]).sum() * 4 > len(st["live"]):
+            keep = st["live"]
+            st = {k: v[keep] for k, v in st.items()}
+        levels, money, inventory = st["levels"], st["money"], st["inventory"]
+        n = len(money)
+        stars, dist, weight, reward = econ.offer(rng, levels)
+        clear, income, penalty, loot, secs = econ.play(rng, stars, dist, weight, reward)
+        st["star_count"][np.arange(n), stars] += 1
+        st["seconds"] += secs
+        st["failures"] += ~clear
+        gain = np.where(clear, income, 0) + loot @ econ.money_value
+        loss = np.where(clear, 0, penalty)
+        money[:] = np.maximum(0, money - loss) + gain
+        st["earned"] += gain - loss
+        mats = loot * econ.material
+        inventory += mats * np.where(clear & econ.rules["double_materials"], 2, 1)[:, None]
+        st["collected"] += mats
+
+        # 強化: 一番安い次レベルから、買えなくなるまで (表は [目標 * 101 + レベル] の平坦な添字で引く)
+        # 一番安い次レベルにも届かないプレイヤーは最初から外す
+        rows = np.flatnonzero(money >= st["cheapest"])
+        bought = np.zeros(n, dtype=bool)
+        while len(rows):
+            lv = levels[rows]
+            nxt = base + np.minimum(lv + 1, MAX_LEVEL)
+            cost = next_cost(lv)
+            ok = cost <= money[rows, None]
+            if require:
+                need_item, need = item_flat[nxt], count_flat[nxt]
+                have = np.take_along_axis(inventory[rows], np.maximum(need_item, 0), axis=1)
+                affordable = ok
+                ok = affordable & ((need_item < 0) | (have >= need))
+                # お金は足りているのに素材で止まった強化 (一番安いもの) を素材ごとに数える
+                stuck = np.where(affordable & ~ok, cost, np.inf)
+                s_rows = np.flatnonzero(np.isfinite(stuck.min(axis=1)) & ~ok.any(axis=1))
+                if len(s_rows):
+                    first = stuck[s_rows].argmin(axis=1)
+                    np.add.at(st["blocked"], (rows[s_rows], need_item[s_rows, first]), 1)
+            choice_cost = np.where(ok, cost, np.inf)
+            pick = choice_cost.argmin(axis=1)
+            k = np.arange(len(rows))
+            paid = choice_cost[k, pick]
+            buy = np.isfinite(paid)
+            if not buy.any():
+                break
+            rows, pick, paid, nxt = rows[buy], pick[buy], paid[buy], nxt[k[buy], pick[buy]]
+            money[rows] -= paid
+            levels[rows, pick] += 1
+            if require:
+                spend = item_flat[nxt] >= 0
+                np.subtract.at(inventory, (rows[spend], item_flat[nxt][spend]), count_flat[nxt][spend])
+            hit = levels[rows, pick] == econ.target_level[pick]
+            st["reached"][rows[hit], pick[hit]] = mission
+            bought[rows] = True
+        if bought.any():
+            rows = np.flatnonzero(bought)
+            st["cheapest"][rows] = next_cost(levels[rows]).min(axis=1)
+
+        goal = (levels >= econ.target_level)[:, econ.goal_mask].all(axis=1) & (st["done_at"] < 0)
+        st["done_at"][goal] = mission
+        st["done_seconds"][goal] = st["seconds"][goal]
+        # 全目標が上限 (目標レベル, または入手できない素材の手前) に届いたプレイヤーは抜ける
+        finished = st["live"] & (levels >= cap).all(axis=1)
+        if finished.any():
+            retire(finished, mission)
+
+    if st["live"].any():
+        retire(st["live"].copy(), max_missions)
+    out["missions"] = out.pop("stopped_at")
+    return out
+
+def summarize(econ, res, curves):
+    done = res["done_at"] >= 0
+    missions = res["missions"]
+
+    def pct(values, q):
+        return float(np.percentile(values, q)) if len(values) else None
+
+    def dist(values):
+        return {"p10": pct(values, 10), "p50": pct(values, 50), "p90": pct(values, 90),
+                "mean": float(values.mean()) if len(values) else None}
+
+    targets = {}
+    for t, key in enumerate(econ.targets):
+        r = res["reached"][:, t]
+        targets[key] = {"level": int(econ.target_level[t]), "reached": float((r >= 0).mean()),
+                        "stuck_on": econ.stuck_on[t], "max_level": int(econ.cap[t]),
+                        "missions": dist(r[r >= 0]),
+                        "level_p50": float(np.median(res["levels"][:, t]))}
+
+    # 目標までに要る素材と、1ミッションあたりの入手数
+    required = {}
+    for key, t in zip(econ.targets, range(len(econ.targets))):
+        items, counts = econ.need_item[t, 1:econ.target_level[t] + 1], econ.need_count[t, 1:econ.target_level[t] + 1]
+        for item, count in zip(items, counts):
+            if item >= 0:
+                required[item] = required.get(item, 0) + int(count)
+    per_mission = res["collected"].sum(axis=0) / np.maximum(missions.sum(), 1)
+    materials = {}
+    for item, count in sorted(required.items(), key=lambda kv: -kv[1] / max(per_mission[kv[0]], 1e-12)):
+        rate = float(per_mission[item])
+        materials[econ.item_ids[item]] = {
+            "required": count,
+            "per_mission": rate,
+            "missions_needed": count / rate if rate > 0 else None,
+            "obtainable": bool(econ.obtainable[item]),
+            "blocked_players": float((res["blocked"][:, item] > 0).mean()),
+            "blocked_missions": float(res["blocked"][:, item].mean()),
+        }
+    money_only = sum(curves.totals(k, 0, int(econ.target_level[t]))[0] for t, k in enumerate(econ.targets))
+    star_mix = res["star_count"].sum(axis=0)
+    return {
+        "players": len(missions),
+        "reached_goal": float(done.mean()),
+        "missions_to_goal": dist(missions[done]),
+        "hours_to_goal": dist(res["done_seconds"][done] / 3600),
+        "targets": targets,
+        "total_cost": money_only,
+        "income_per_mission": float(res["earned"].sum() / max(missions.sum(), 1)),
+        "failure_rate": float(res["failures"].sum() / max(missions.sum(), 1)),
+        "star_mix": {int(s): float(c / star_mix.sum()) for s, c in enumerate(star_mix) if c},
+        "materials": materials,
+    }
+
+def print_report(report, wall, max_missions):
+    fmt = lambda v, p=0: f"{v:,.{p}f}" if v is not None else "-"
+    print(f"\n{report['players']:,} players, up to {max_missions:,} missions each "
+          f"({wall:.2f}s, {report['players'] / max(wall, 1e-9):,.0f} players/s)")
+    mix = ", ".join(f"★{s} {share:.0%}" for s, share in report["star_mix"].items())
+    print(f"income/mission {report['income_per_mission']:,.0f}  failure {report['failure_rate']:.1%}  [{mix}]")
+    print(f"total upgrade cost {report['total_cost']:,}")
+    m, h = report["missions_to_goal"], report["hours_to_goal"]
+    print(f"\nGoal reached by {report['reached_goal']:.1%}: missions p10/p50/p90 "
+          f"{fmt(m['p10'])} / {fmt(m['p50'])} / {fmt(m['p90'])}, "
+          f"hours {fmt(h['p10'], 1)} / {fmt(h['p50'], 1)} / {fmt(h['p90'], 1)}")
+
+    print(f"\n{'Target':<10} {'Lv':>4} {'reached':>8} {'missions p50':>13} {'p90':>8} {'Lv p50':>7}")
+    for key, t in report["targets"].items():
+        stuck = f"  stops at Lv{t['max_level']} (needs {t['stuck_on']}, never dropped)" if t["stuck_on"] else ""
+        print(f"{key:<10} {t['level']:>4} {t['reached']:>8.1%} {fmt(t['missions']['p50']):>13} "
+              f"{fmt(t['missions']['p90']):>8} {t['level_p50']:>7.0f}{stuck}")
+
+    if report["materials"]:
+        print(f"\n{'Material':<10} {'needed':>7} {'/mission':>9} {'missions':>9} {'blocked':>8}  (bottleneck first)")
+        for mid, r in report["materials"].items():
+            missions = fmt(r["missions_needed"]) if r["obtainable"] else "never"
+            print(f"{mid:<10} {r['required']:>7,} {r['per_mission']:>9.3f} {missions:>9} {r['blocked_players']:>8.1%}")
+
+def parse_targets(items, default=None):
+    targets = {}
+    for item in items or default or []:
+        key, _, value = item.partition("=")
+        if not value:
+            raise SystemExit(f"expected KEY=LEVEL, got {item!r}")
+        targets[key] = min(int(value), MAX_LEVEL)
+    return targets
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Vectorized progression / economy simulation (upgrade costs vs mission income)")
+    parser.add_argument("--goal", action="append", metavar="KEY=LEVEL",
+                        help="upgrade goal, e.g. BeamGun=50 (repeatable, default BeamGun=50)")
+    parser.add_argument("--train", action="append", metavar="KEY=LEVEL",
+                        help="also buy this upgrade up to LEVEL (not part of the goal), e.g. HP=30")
+    parser.add_argument("--players", type=int, default=100_000)
+    parser.add_argument("--max-missions", type=int, default=5000)
+    parser.add_argument("--stars", type=int, default=None, help="always take missions of this star count")
+    parser.add_argument("--rules", choices=sorted(RULES), default="engine")
+    parser.add_argument("--main", default="BeamGun", help="main weapon (for the ship's weight/speed)")
+    parser.add_argument("--policy", choices=sorted(ZONE_SPEED), default="hold",
+                        help="where the ship flies (speed zone), as in balance_sim")
+    parser.add_argument("--clear-rate", type=float, default=1.0, help="mission success rate (all stars)")
+    parser.add_argument("--loot-rate", type=float, default=1.0,
+                        help="share of spawned enemies destroyed and looted (1.0 = upper bound)")
+    parser.add_argument("--calibration", help="balance_sim --json report: per-star success rate and loot")
+    parser.add_argument("--rename-materials", action="append", metavar="FROM=TO",
+                        help="read PARAM_CONFIG material ID FROM (or ID prefix) as TO, e.g. Item=Type (repeatable)")
+    parser.add_argument("--start-money", type=float, default=0)
+    parser.add_argument("--menu-seconds", type=float, default=0, help="time spent outside missions per mission")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the report to this file")
+    return parser
+
+def main():
+    args = build_parser().parse_args()
+
+    args.rename_materials = [item.partition("=")[::2] for item in args.rename_materials or []]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = load_excel_data()
+    if not data:
+        print("Failed to load game_balance.xlsx")
+        return 1
+    sd = SimData(data)
+    curves = UpgradeCurves(data)
+    goals = parse_targets(args.goal, ["BeamGun=50"])
+    trains = parse_targets(args.train)
+    unknown = [k for k in list(goals) + list(trains) if k not in curves.index]
+    if unknown:
+        print(f"No upgrade table for {', '.join(unknown)} (PARAM_CONFIG: {', '.join(curves.keys)})")
+        return 1
+    if args.stars and args.stars not in sd.difficulty:
+        print(f"No DIFFICULTY_PARAMS for {args.stars} stars")
+        return 1
+
+    econ = Economy(data, sd, curves, goals, trains, args, RULES[args.rules])
+    start = time.perf_counter()
+    res = simulate(econ, args.players, args.max_missions, args.seed, args.start_money)
+    wall = time.perf_counter() - start
+    report = summarize(econ, res, curves)
+    print(f"rules={args.rules} goal={goals} train={trains} stars={args.stars or 'generated'}"
+          f"{' calibration=' + os.path.basename(args.calibration) if args.calibration else ''}")
+    print_report(report, wall, args.max_missions)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"rules": RULES[args.rules], "goals": goals, "train": trains, "stars": args.stars,
+                       "seed": args.seed, "report": report}, f, ensure_ascii=False, indent=2)
+        print(f"Report written to {args.json}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
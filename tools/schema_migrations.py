@@ -0,0 +1,287 @@
+"""
+game_balance_new.xlsx のスキーマ移行フレームワーク
+
+- ワークブックのカスタムプロパティ "SchemaVersion" にスキーマバージョンを記録する
+- 移行処理は @migration(version, ...) で登録する
+- 何もする必要がない場合はヘッダー行だけを読んで終了し、ファイルには一切書き込まない
+- 書き込みは openpyxl でセル単位に行う (書式・数式を保持) ので、シート全体を作り直さない
+- 保存は一時ファイルに書いてから rename するので、途中で落ちても元ファイルは壊れない
+"""
+import math
+import os
+import tempfile
+
+import openpyxl
+from openpyxl.packaging.custom import IntProperty
+
+SCHEMA_VERSION_PROP = "SchemaVersion"
+
+# (version, description, applies, apply) をバージョン順に保持
+MIGRATIONS = []
+
+def migration(version, description, applies):
+    """Registers `apply(wb)` as the migration to `version`.
+
+    `applies(headers)` receives {sheet_name: header_row_tuple} and returns True when the
+    workbook still needs this migration (used for workbooks without a version stamp).
+    """
+    def register(func):
+        MIGRATIONS.append((version, description, applies, func))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return func
+    return register
+
+def latest_version():
+    return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+# --- Reading ---
+
+def read_schema(path):
+    """Returns (stamped_version or None, {sheet: header_row}) reading only the first row of each sheet."""
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        version = None
+        for prop in wb.custom_doc_props:
+            if prop.name == SCHEMA_VERSION_PROP:
+                version = int(prop.value)
+        headers = {}
+        for ws in wb.worksheets:
+            row = next(ws.iter_rows(max_row=1, values_only=True), ())
+            headers[ws.title] = tuple(c for c in row if c is not None)
+        return version, headers
+    finally:
+        wb.close()
+
+def workbook_headers(wb):
+    """{sheet: header_row} of an open (writable) workbook, in the same shape as read_schema."""
+    return {ws.title: tuple(c for c in header_row(ws) if c is not None) for ws in wb.worksheets}
+
+def pending_migrations(version, headers):
+    pending = []
+    for m_version, description, applies, func in MIGRATIONS:
+        if version is not None and m_version <= version:
+            continue
+        if not applies(headers):
+            continue
+        pending.append((m_version, description, func))
+    return pending
+
+# --- Writing ---
+
+def stamp_version(wb, version):
+    props = wb.custom_doc_props
+    # CustomPropertyList は同名の append を許さないので、既存の値を除いてから追加する
+    props.props = [p for p in props.props if p.name != SCHEMA_VERSION_PROP]
+    props.append(IntProperty(name=SCHEMA_VERSION_PROP, value=version))
+
+def atomic_save(wb, path):
+    """Saves to a temp file next to `path`, then renames it over the original."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".~migrate_", suffix=".xlsx", dir=directory)
+    os.close(fd)
+    try:
+        wb.save(tmp)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def migrate_workbook(path):
+    """Applies every pending migration. Returns the list of applied versions (empty = no-op, nothing written)."""
+    if not os.path.exists(path):
+        print("No existing file to migrate.")
+        return []
+
+    version, headers = read_schema(path)
+    pending = pending_migrations(version, headers)
+    if not pending:
+        label = f"V{version}" if version is not None else f"unstamped, matches V{latest_version()}"
+        print(f"Schema up to date ({label}), skipping migration.")
+        return []
+
+    print(f"Migrating {path}:")
+    wb = openpyxl.load_workbook(path)
+    applied = []
+    while pending:
+        m_version, description, func = pending[0]
+        print(f"  V{m_version} ({description})")
+        func(wb)
+        applied.append(m_version)
+        # 前の段階で作ったシート・列を含めて判定し直す (V6 が作った MovementPatterns に V7 も当てる)
+        pending = pending_migrations(m_version, workbook_headers(wb))
+    stamp_version(wb, applied[-1])
+    atomic_save(wb, path)
+    print(f"Migration complete (SchemaVersion = {applied[-1]}).")
+    return applied
+
+# --- Sheet helpers ---
+
+def header_row(ws):
+    return [c.value for c in ws[1]] if ws.max_row >= 1 else []
+
+def append_table(wb, sheet_name, rows):
+    ws = wb.create_sheet(sheet_name)
+    columns = list(rows[0].keys())
+    ws.append(columns)
+    for row in rows:
+        ws.append([row.get(c) for c in columns])
+    return ws
+
+def reorder_columns(ws, order):
+    """Rearranges whole columns (values and cell styles) so that column i holds header `order[i]`."""
+    headers = header_row(ws)
+    source = [headers.index(name) + 1 for name in order]
+    if source == list(range(1, len(order) + 1)):
+        return
+    snapshot = {}
+    for col in source:
+        snapshot[col] = [(cell.value, cell._style) for cell in next(ws.iter_cols(min_col=col, max_col=col, max_row=ws.max_row))]
+    for new_col, col in enumerate(source, start=1):
+        for r, (value, style) in enumerate(snapshot[col], start=1):
+            cell = ws.cell(row=r, column=new_col)
+            cell.value = value
+            cell._style = style
+
+# --- V6: EnemyWeapons / MovementPatterns / DropTables ---
+
+V6_ENEMY_DEFAULTS = [
+    ('Model', 'EnemyShip'),
+    ('Turn', 1.0),
+    ('Damage', 10),
+    ('MovementPattern', 'MPID001'),
+    ('EQ', 'EQID001'),
+    ('DropTable', 'DropDT001'),
+    ('DropCount', 1),
+]
+V6_ENEMY_ORDER = ['ID', 'Name', 'Model', 'HP', 'Speed', 'Turn', 'Damage', 'MovementPattern', 'EQ', 'DropTable', 'DropCount', 'Shield']
+
+def _v6_legacy_drop_columns(headers):
+    return [c for c in headers if isinstance(c, str) and c.startswith('Drop') and c not in ['DropTable', 'DropCount']]
+
+def _v6_enemy_order(headers):
+    existing = [c for c in V6_ENEMY_ORDER if c in headers]
+    return existing + [c for c in headers if c not in existing]
+
+def _v6_applies(headers):
+    if any(name not in headers for name in ('EnemyWeapons', 'MovementPatterns', 'DropTables')):
+        return True
+    enemies = headers.get('Enemies')
+    if enemies is None:
+        return False
+    if any(col not in enemies for col, _ in V6_ENEMY_DEFAULTS):
+        return True
+    if _v6_legacy_drop_columns(enemies):
+        return True
+    return list(enemies) != _v6_enemy_order(list(enemies))
+
+@migration(6, "EnemyWeapons, DropTables, MovementPatterns", _v6_applies)
+def migrate_to_v6(wb):
+    """Migrates existing Excel to V6 (New Data Structure: EnemyWeapons, DropTables, MovementPatterns)"""
+    # 1. Create EnemyWeapons Sheet
+    if 'EnemyWeapons' not in wb.sheetnames:
+        print("Creating EnemyWeapons sheet...")
+        append_table(wb, 'EnemyWeapons', [
+            {"ID": "EQID001", "Name": "ビームガン", "Damage": 10, "Speed": 10, "Cooltime": 30, "ShotNum": 1, "ShotAngle": "AimPlayer", "Size": "10x10"},
+            {"ID": "EQID002", "Name": "ショットガン", "Damage": 5, "Speed": 8, "Cooltime": 60, "ShotNum": 5, "ShotAngle": "Fan", "Size": "8x8"},
+            {"ID": "EQID003", "Name": "スナイパーライフル", "Damage": 30, "Speed": 25, "Cooltime": 120, "ShotNum": 1, "ShotAngle": "AimPlayer", "Size": "6x30"},
+            {"ID": "EQID004", "Name": "ロケット", "Damage": 20, "Speed": 6, "Cooltime": 90, "ShotNum": 1, "ShotAngle": "AimPlayer", "Size": "20x20"},
+            {"ID": "EQID005", "Name": "ミサイル", "Damage": 15, "Speed": 5, "Cooltime": 100, "ShotNum": 1, "ShotAngle": "Homing", "Size": "12x12"},
+            {"ID": "EQID006", "Name": "スパイラルショット", "Damage": 8, "Speed": 7, "Cooltime": 45, "ShotNum": 2, "ShotAngle": "Spiral", "Size": "10x10"},
+            {"ID": "EQID007", "Name": "ビッグガン", "Damage": 50, "Speed": 4, "Cooltime": 180, "ShotNum": 1, "ShotAngle": "AimPlayer", "Size": "60x60"},
+            {"ID": "EQID008", "Name": "ガトリングビーム", "Damage": 3, "Speed": 12, "Cooltime": 5, "ShotNum": 15, "ShotAngle": "RandomSpray", "Size": "5x5"}
+        ])
+
+    # 2. Create MovementPatterns Sheet
+    if 'MovementPatterns' not in wb.sheetnames:
+        print("Creating MovementPatterns sheet...")
+        patterns = [
+            "直進(上から下)", "直進(下から上)", "直進(右から左)", "直進(左から右)",
+            "ジグザグ(上から下)", "ジグザグ(下から上)", "ジグザグ(右から左)", "ジグザグ(左から右)",
+            "ホーミング(上から下)", "ホーミング(下から上)", "ホーミング(右から左)", "ホーミング(左から右)",
+            "リフレクト(上から下)", "リフレクト(下から上)", "リフレクト(右から左)", "リフレクト(左から右)",
+            "ウェーブ(上から下)", "ウェーブ(下から上)", "ウェーブ(右から左)", "ウェーブ(左から右)",
+            "スパイラル(上から下)", "スパイラル(下から上)", "スパイラル(右から左)", "スパイラル(左から右)",
+            "対面1", "対面2", "対面3", "対面4",
+            "方円1", "方円2", "方円3", "方円4"
+        ]
+        append_table(wb, 'MovementPatterns', [
+            {"ID": f"MPID{i+1:03d}", "Name": p_name, "Logic": "TODO"} for i, p_name in enumerate(patterns)
+        ])
+
+    # 3. Create DropTables Sheet
+    if 'DropTables' not in wb.sheetnames:
+        print("Creating DropTables sheet...")
+        # Example Data from User
+        example_items = [
+            ("TypeA", 0.3), ("TypeB", 0.2), ("TypeC", 0.02), ("PU01", 0.05),
+            ("OS01", 0.05), ("LU01", 0.05), ("SP01", 0.05), ("SD01", 0.02), ("JL01", 0.01)
+        ]
+        append_table(wb, 'DropTables', [
+            {"DTID": "DropDT001", "ItemID": item, "Rate": rate} for item, rate in example_items
+        ])
+
+    # 4. Update Enemies Sheet
+    if 'Enemies' in wb.sheetnames:
+        ws = wb['Enemies']
+
+        # Add New Columns if missing (DropCount is kept)
+        for col, default in V6_ENEMY_DEFAULTS:
+            if col in header_row(ws):
+                continue
+            new_col = ws.max_column + 1
+            ws.cell(row=1, column=new_col, value=col)
+            for r in range(2, ws.max_row + 1):
+                ws.cell(row=r, column=new_col, value=default)
+
+        # Remove old Drop columns (右から削除して列番号のずれを防ぐ)
+        headers = header_row(ws)
+        for col in sorted((headers.index(c) + 1 for c in _v6_legacy_drop_columns(headers)), reverse=True):
+            ws.delete_cols(col)
+
+        # Reorder
+        headers = [c for c in header_row(ws) if c is not None]
+        reorder_columns(ws, _v6_enemy_order(headers))
+
+# --- V7: MovementPatterns parameters ---
+
+V7_MOVEMENT_COLUMNS = ['Kind', 'VX', 'VY', 'AmpX', 'AmpY', 'Frequency', 'Phase']
+# Enemy.js の旧 if チェーンと同じ動きになる値 (ここに無い ID は旧実装のデフォルト = 直進(下))
+V7_MOVEMENT_DEFAULT = ('Linear', 0, 1, 0, 0, 0, 0)
+V7_MOVEMENT_PARAMS = {
+    'MPID001': ('Linear', 0, 1, 0, 0, 0, 0),
+    'MPID002': ('Linear', 0, -1, 0, 0, 0, 0),
+    'MPID003': ('Linear', -1, 0, 0, 0, 0, 0),
+    'MPID004': ('Linear', 1, 0, 0, 0, 0, 0),
+    'MPID005': ('Wave', 0, 1, 1, 0, 0.05, 0),
+    'MPID006': ('Wave', 0, -1, 1, 0, 0.05, 0),
+    'MPID007': ('Wave', -1, 0, 0, 1, 0.05, 0),
+    'MPID008': ('Wave', 1, 0, 0, 1, 0.05, 0),
+    'MPID009': ('Homing', 0, 0.5, 0, 0, 0, 0),
+    'MPID010': ('Homing', 0, 0.5, 0, 0, 0, 0),
+    'MPID011': ('Homing', 0, 0.5, 0, 0, 0, 0),
+    'MPID012': ('Homing', 0, 0.5, 0, 0, 0, 0),
+    'MPID013': ('Reflect', 1, 1, 0, 0, 0, 0),
+    'MPID017': ('Wave', 0, 1, 2, 0, 0.1, math.pi / 2),
+    'MPID021': ('Wave', 0, 1, 2, 0, 0.1, math.pi / 2),
+}
+
+def _v7_applies(headers):
+    patterns = headers.get('MovementPatterns')
+    return patterns is not None and any(c not in patterns for c in V7_MOVEMENT_COLUMNS)
+
+@migration(7, "MovementPatterns parameters (Kind, VX, VY, AmpX, AmpY, Frequency, Phase)", _v7_applies)
+def migrate_to_v7(wb):
+    ws = wb['MovementPatterns']
+    headers = header_row(ws)
+    id_col = headers.index('ID') + 1
+    for i, col in enumerate(V7_MOVEMENT_COLUMNS):
+        if col in headers:
+            continue
+        new_col = ws.max_column + 1
+        ws.cell(row=1, column=new_col, value=col)
+        for r in range(2, ws.max_row + 1):
+            mpid = ws.cell(row=r, column=id_col).value
+            if mpid is None:
+                continue
+            ws.cell(row=r, column=new_col, value=V7_MOVEMENT_PARAMS.get(mpid, V7_MOVEMENT_DEFAULT)[i])
@@ -0,0 +1,224 @@
+"""
+生成済みの js/settings_data.js を読むツール共通のローダー
+
+settings_data.js (と --chunked のチャンクファイル) を1回だけパースし、結果をセクションごとに
+pickle したスナップショット (.build_cache/settings_<hash>.snap) を作る。次回からは
+ファイルのサイズと mtime (変わっていれば内容の SHA-256) が一致する限りパースせず、
+スナップショットを mmap して、使われたセクションだけを復元する。
+
+    from settings_store import load_settings
+    data = load_settings()            # Mapping: data["UPGRADE_TABLE"] の時点でそのセクションだけ読む
+
+--compact の列形式の UPGRADE_TABLE は行の配列に戻してから保存する (ゲーム側の見え方と同じ)。
+
+    python tools/settings_store.py    # パースとスナップショット読み込みの時間を比較
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import time
+from collections.abc import Mapping
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+JS_PATH = os.path.join(BASE_DIR, '../js/settings_data.js')
+# update_settings.py のビルドキャッシュと同じ場所 (消しても次回作り直すだけ)
+CACHE_DIR = os.path.join(BASE_DIR, ".build_cache")
+
+MAGIC = b"GBDSNAP1"
+_HEADER = struct.Struct("<8sQ")
+
+# --- Parsing settings_data.js ---
+
+def _json_after(source, marker):
+    start = source.index(marker) + len(marker)
+    start = source.index("{", start)
+    value, _ = json.JSONDecoder().raw_decode(source, start)
+    return value
+
+def _decode_columns(packed):
+    """UPGRADE_TABLE column form ({"length", "columns"}, update_settings --compact) back to rows."""
+    if isinstance(packed, list):
+        return packed
+    names = list(packed["columns"])
+    cols = [packed["columns"][k] for k in names]
+    rows = []
+    for i in range(packed["length"]):
+        row = {}
+        for k, col in zip(names, cols):
+            v = col[i] if isinstance(col, list) else col
+            if v is not None:
+                row[k] = v
+        rows.append(row)
+    return rows
+
+def parse_settings_js(path=JS_PATH):
+    """GAME_BALANCE_DATA from settings_data.js (plain, --minify, --compact or --chunked output).
+
+    Returns (data, files): `files` are every file read, the chunk files of a --chunked build included.
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    files = [os.path.abspath(path)]
+    data = _json_after(source, "GAME_BALANCE_DATA =")
+    if "GAME_BALANCE_MANIFEST =" in source:
+        manifest = _json_after(source, "GAME_BALANCE_MANIFEST =")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+        for chunk in manifest["chunks"].values():
+            chunk_path = os.path.join(root, chunk["file"])
+            with open(chunk_path, encoding="utf-8") as f:
+                chunk_source = f.read()
+            files.append(chunk_path)
+            marker = "return chunk;\n})(" if "return chunk;" in chunk_source else "BalanceLoader.define("
+            data.update(_json_after(chunk_source, marker))
+    if "UPGRADE_TABLE" in data:
+        data["UPGRADE_TABLE"] = {stat: _decode_columns(rows) for stat, rows in data["UPGRADE_TABLE"].items()}
+    return data, files
+
+# --- Snapshot ---
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+def _file_state(path):
+    st = os.stat(path)
+    return {"path": path, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": _file_hash(path)}
+
+def snapshot_path(path=JS_PATH):
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"settings_{digest}.snap")
+
+def write_snapshot(snap_path, data, files):
+    """Header (files + section offsets) followed by one pickle per section."""
+    blobs = [(name, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)) for name, value in data.items()]
+    sections = {}
+    offset = 0
+    for name, blob in blobs:
+        sections[name] = (offset, len(blob))
+        offset += len(blob)
+    header = pickle.dumps({"files": [_file_state(p) for p in files], "sections": sections},
+                          protocol=pickle.HIGHEST_PROTOCOL)
+    os.makedirs(os.path.dirname(snap_path), exist_ok=True)
+    tmp = snap_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(header)))
+        f.write(header)
+        for _, blob in blobs:
+            f.write(blob)
+    os.replace(tmp, snap_path)
+
+def _fresh(files):
+    """True when every source file is unchanged: same size and mtime, or failing that, same content."""
+    for entry in files:
+        try:
+            st = os.stat(entry["path"])
+        except OSError:
+            return False
+        if st.st_size != entry["size"]:
+            return False
+        if st.st_mtime_ns != entry["mtime_ns"] and _file_hash(entry["path"]) != entry["sha256"]:
+            return False
+    return True
+
+class SettingsSnapshot(Mapping):
+    """Read-only GAME_BALANCE_DATA backed by a memory-mapped snapshot; sections unpickle on first access."""
+
+    def __init__(self, snap_path):
+        with open(snap_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, length = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{snap_path} is not a settings snapshot")
+        header = pickle.loads(self._mm[_HEADER.size:_HEADER.size + length])
+        self.files = header["files"]
+        self._sections = header["sections"]
+        self._base = _HEADER.size + length
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        if name not in self._loaded:
+            offset, length = self._sections[name]
+            start = self._base + offset
+            with memoryview(self._mm)[start:start + length] as view:
+                self._loaded[name] = pickle.loads(view)
+        return self._loaded[name]
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+    def loaded(self):
+        """Names of the sections materialised so far."""
+        return list(self._loaded)
+
+    def close(self):
+        self._mm.close()
+
+def load_settings(path=JS_PATH, use_cache=True):
+    """GAME_BALANCE_DATA of a generated settings_data.js, through the snapshot cache when it is fresh.
+
+    Returns a Mapping (a SettingsSnapshot, or a plain dict when use_cache is False).
+    """
+    if not use_cache:
+        return parse_settings_js(path)[0]
+    snap_path = snapshot_path(path)
+    if os.path.exists(snap_path):
+        try:
+            snapshot = SettingsSnapshot(snap_path)
+        except (OSError, ValueError, pickle.UnpicklingError, struct.error, EOFError):
+            snapshot = None
+        if snapshot is not None:
+            if _fresh(snapshot.files):
+                return snapshot
+            snapshot.close()
+    data, files = parse_settings_js(path)
+    try:
+        write_snapshot(snap_path, data, files)
+    except OSError as e:
+        print(f"Warning: could not write {snap_path}: {e}")
+        return data
+    return SettingsSnapshot(snap_path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse settings_data.js and compare with the cached snapshot")
+    parser.add_argument("--js", default=JS_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    data, files = parse_settings_js(args.js)
+    parse_time = time.perf_counter() - start
+    snap_path = snapshot_path(args.js)
+    write_snapshot(snap_path, data, files)
+
+    start = time.perf_counter()
+    snapshot = load_settings(args.js)
+    open_time = time.perf_counter() - start
+    start = time.perf_counter()
+    upgrade = snapshot["UPGRADE_TABLE"]
+    one_time = time.perf_counter() - start
+    start = time.perf_counter()
+    full = dict(snapshot)
+    all_time = time.perf_counter() - start
+
+    print(f"{args.js}: {sum(os.path.getsize(p) for p in files):,} bytes in {len(files)} file(s)")
+    print(f"  parse (json)            {parse_time * 1000:8.2f} ms")
+    print(f"  snapshot open + check   {open_time * 1000:8.2f} ms  ({snap_path}, {os.path.getsize(snap_path):,} bytes)")
+    print(f"  UPGRADE_TABLE only      {one_time * 1000:8.2f} ms  ({len(upgrade)} stats)")
+    print(f"  all {len(full)} sections        {all_time * 1000:8.2f} ms")
+    if full != data:
+        print("  MISMATCH between snapshot and parsed data")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
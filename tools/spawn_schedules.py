@@ -0,0 +1,231 @@
+"""
+敵の出現スケジュール (Stages / MissionParams / Enemies シート) のコンパイル
+
+engine.js は SPAWN_INTERVAL フレームごと (updateEntities が1フレームに2回呼ばれるので2体ずつ) に、
+依頼の星数の EnemyTier から Math.random() で敵と x 座標を選んでいた。これをビルド時に
+ステージ × 星数ごとのシード付きの出現表にしておき、ゲーム側はカーソルを進めるだけにする。
+同じ依頼 (ステージ・星数・シード) なら毎回同じ順番・同じ位置で敵が出るので、QA やヘッドレスの
+ツール (balance_sim) で同じ場面を再現できる。
+
+    ステージ   依頼の距離以上で Distance が一番短い Stages の行 (無ければ最後の行)
+    シード     Stages の Seed 列 (空なら StageLevel)。変えると表が引き直される
+    バリエーション  キーごとに VARIANTS 本。依頼の seed % 本数 で選ぶ
+
+1本の表は PERIOD フレームぶんで、それより長い依頼では繰り返す (出現のテンポは engine.js と同じ)。
+EnemyMult は engine.js で使われていないので、出現数には掛けない。
+
+出力 (GAME_BALANCE_DATA.SPAWN_SCHEDULES):
+    {"period": P, "stages": [[StageLevel, Distance], ...], "enemies": [ID, ...], "patterns": [MPID, ...],
+     "timelines": {"<StageLevel>-<stars>": [{"seed": n, "count": k, "data": "<base64>"}, ...]}}
+data は1体ごとに4つの符号なし LEB128 (前の出現からのフレーム数, enemies の添字, patterns の添字, x px)。
+
+    python tools/spawn_schedules.py                          # 全ての表を復号して元の出現と照合する
+    python tools/spawn_schedules.py --stage 3 --stars 2      # 表の中身 (QA 用)
+    python tools/spawn_schedules.py --stage 3 --stars 2 --seed 42   # 別のシードで引いた場合
+"""
+import argparse
+import base64
+import random
+
+CANVAS_WIDTH = 800
+SPAWN_INTERVAL = 60      # GAME_SETTINGS.ENEMY.SPAWN_INTERVAL
+SPAWNS_PER_INTERVAL = 2  # updateEntities が1フレームに2回呼ばれる
+SPAWN_MARGIN = 20        # x は [20, 幅 - 20)
+PERIOD = 3600            # 1本の表の長さ (フレーム, 60 秒)
+VARIANTS = 4
+
+# --- Encoding ---
+
+def encode_varints(values):
+    out = bytearray()
+    for v in values:
+        if v < 0:
+            raise ValueError(f"spawn schedule values must be non-negative, got {v}")
+        while v >= 0x80:
+            out.append((v & 0x7F) | 0x80)
+            v >>= 7
+        out.append(v)
+    return bytes(out)
+
+def decode_varints(data):
+    values, v, shift = [], 0, 0
+    for byte in data:
+        v |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(v)
+            v, shift = 0, 0
+    return values
+
+def encode_timeline(entries, enemy_index, pattern_index, seed):
+    """[(frame, enemy ID, MPID, x), ...] (frame ascending) -> {"seed", "count", "data"}."""
+    values, last = [], 0
+    for frame, eid, mpid, x in entries:
+        values += [frame - last, enemy_index[eid], pattern_index[mpid], x]
+        last = frame
+    return {"seed": seed, "count": len(entries), "data": base64.b64encode(encode_varints(values)).decode("ascii")}
+
+def decode_timeline(entry, schedules):
+    """Inverse of encode_timeline: [(frame, enemy ID, MPID, x), ...] (frames within one period)."""
+    values = decode_varints(base64.b64decode(entry["data"]))
+    entries, frame = [], 0
+    for i in range(0, len(values), 4):
+        frame += values[i]
+        entries.append((frame, schedules["enemies"][values[i + 1]], schedules["patterns"][values[i + 2]],
+                        values[i + 3]))
+    return entries
+
+# --- Compiler ---
+
+def stage_for(stages, distance):
+    """StageLevel of a mission: the shortest stage at least as long as the mission (else the longest)."""
+    for level, stage_distance in stages:
+        if stage_distance >= distance:
+            return level
+    return stages[-1][0]
+
+def stage_seed(stage):
+    seed = stage.get("Seed")
+    try:
+        return int(seed)
+    except (TypeError, ValueError):
+        return int(stage["StageLevel"])
+
+def variant_seed(seed, stars, variant):
+    return random.Random(f"{seed}:{stars}:{variant}").getrandbits(31)
+
+def compile_timeline(pool, enemies, seed, period=PERIOD):
+    """One period of spawns for a tier pool, as spawnDebris would have drawn them: [(frame, ID, MPID, x)]."""
+    rng = random.Random(seed)
+    entries = []
+    if not pool:
+        return entries
+    for frame in range(SPAWN_INTERVAL, period + 1, SPAWN_INTERVAL):
+        for _ in range(SPAWNS_PER_INTERVAL):
+            eid = pool[rng.randrange(len(pool))]
+            mpid = enemies[eid].get("movementPattern") or enemies[eid].get("mpId") or "MPID001"
+            x = SPAWN_MARGIN + rng.randrange(CANVAS_WIDTH - 2 * SPAWN_MARGIN)
+            entries.append((frame, eid, mpid, x))
+    return entries
+
+def reachable_keys(stages, difficulty):
+    """(StageLevel, stars) pairs some mission can land on, from each star count's distance range."""
+    keys = []
+    for stars, params in sorted(difficulty.items()):
+        low, high = params["dist"]
+        levels = {stage_for(stages, d) for d in (low, max(low, high - 1))}
+        levels |= {level for level, distance in stages if low <= distance < high}
+        keys += [(level, stars) for level, _ in stages if level in levels]
+    return keys
+
+def build_spawn_schedules(stages, difficulty, enemies, tier_index, variants=VARIANTS, period=PERIOD, seeds=None):
+    """STAGES records + DIFFICULTY_PARAMS + ENEMIES + DEBRIS.TIER_INDEX -> SPAWN_SCHEDULES.
+
+    seeds: optional {StageLevel: seed} overriding the Seed column (tools / QA previews).
+    """
+    rows = sorted(stages, key=lambda s: float(s["Distance"]))
+    stage_list = [[int(s["StageLevel"]), float(s["Distance"])] for s in rows]
+    seed_of = {int(s["StageLevel"]): stage_seed(s) for s in rows}
+    seed_of.update(seeds or {})
+    timelines = {}
+    for level, stars in reachable_keys(stage_list, difficulty):
+        tier = difficulty[stars].get("enemyTier") or "Tier1"
+        pool = [eid for eid in tier_index.get(tier, []) if eid in enemies]
+        timelines[f"{level}-{stars}"] = [
+            (seed, compile_timeline(pool, enemies, seed, period))
+            for seed in (variant_seed(seed_of[level], stars, v) for v in range(variants))]
+
+    used = [e for tls in timelines.values() for _, entries in tls for e in entries]
+    enemy_ids = list(dict.fromkeys(e[1] for e in used))
+    pattern_ids = list(dict.fromkeys(e[2] for e in used))
+    enemy_index = {eid: i for i, eid in enumerate(enemy_ids)}
+    pattern_index = {mpid: i for i, mpid in enumerate(pattern_ids)}
+    return {
+        "period": period,
+        "stages": stage_list,
+        "enemies": enemy_ids,
+        "patterns": pattern_ids,
+        "timelines": {key: [encode_timeline(entries, enemy_index, pattern_index, seed) for seed, entries in tls]
+                      for key, tls in timelines.items()},
+    }
+
+def variant_index(seed, count):
+    """Variant a mission seed picks: non-negative even for negative seeds (SpawnSchedule.variantIndex)."""
+    return int(seed) % count
+
+def schedule_for(schedules, distance, stars, seed):
+    """(key, timeline entry) a mission uses (same lookup as SpawnSchedule.start), or (key, None)."""
+    key = f"{stage_for(schedules['stages'], distance)}-{stars}"
+    variants = schedules["timelines"].get(key) or []
+    return key, (variants[variant_index(seed, len(variants))] if variants else None)
+
+# --- Self check ---
+
+def check_schedules(data, schedules, period):
+    """Decodes every timeline and compares it with a fresh compile. Returns the number of mismatches."""
+    difficulty = {int(k): v for k, v in data["MISSION_DATA"]["DIFFICULTY_PARAMS"].items()}
+    tier_index = data.get("DEBRIS", {}).get("TIER_INDEX", {})
+    failed = 0
+    for key, variants in schedules["timelines"].items():
+        stars = int(key.split("-")[1])
+        tier = difficulty[stars].get("enemyTier") or "Tier1"
+        pool = [eid for eid in tier_index.get(tier, []) if eid in data["ENEMIES"]]
+        for entry in variants:
+            expected = compile_timeline(pool, data["ENEMIES"], entry["seed"], period)
+            if decode_timeline(entry, schedules) != expected or entry["count"] != len(expected):
+                print(f"  {key} seed {entry['seed']}: decoded timeline differs from the compiled one")
+                failed += 1
+    return failed
+
+def print_timeline(schedules, key, variant, limit):
+    variants = schedules["timelines"].get(key)
+    if not variants:
+        print(f"No timeline for {key} (reachable: {', '.join(schedules['timelines'])})")
+        return 1
+    variant = variant_index(variant, len(variants))
+    entry = variants[variant]
+    entries = decode_timeline(entry, schedules)
+    print(f"{key} variant {variant} (seed {entry['seed']}): {len(entries)} spawn(s) "
+          f"per {schedules['period']} frames, {len(base64.b64decode(entry['data']))} bytes")
+    print(f"{'frame':>7} {'enemy':<8} {'pattern':<8} {'x':>4}")
+    for frame, eid, mpid, x in entries[:limit]:
+        print(f"{frame:>7} {eid:<8} {mpid:<8} {x:>4}")
+    if len(entries) > limit:
+        print(f"    ... {len(entries) - limit} more (--limit)")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile / inspect the SPAWN_SCHEDULES spawn timelines")
+    parser.add_argument("--stage", type=int, help="StageLevel to print")
+    parser.add_argument("--stars", type=int, help="star count to print")
+    parser.add_argument("--variant", type=int, default=0, help="variant (or a mission seed; taken modulo the count)")
+    parser.add_argument("--seed", type=int, help="recompile the stage with this seed instead of the Seed column")
+    parser.add_argument("--variants", type=int, default=VARIANTS)
+    parser.add_argument("--period", type=int, default=PERIOD, help="frames per timeline")
+    parser.add_argument("--limit", type=int, default=40, help="rows to print")
+    args = parser.parse_args()
+
+    from update_settings import load_excel_data
+    data = load_excel_data(only=["ENEMIES", "STAGES", "MISSION_DATA"])
+    if not data or "STAGES" not in data or "MISSION_DATA" not in data:
+        print("Stages / MissionParams are missing from the converted data.")
+        return 1
+    difficulty = {int(k): v for k, v in data["MISSION_DATA"]["DIFFICULTY_PARAMS"].items()}
+    seeds = {args.stage: args.seed} if args.seed is not None and args.stage is not None else None
+    schedules = build_spawn_schedules(data["STAGES"], difficulty, data["ENEMIES"],
+                                      data.get("DEBRIS", {}).get("TIER_INDEX", {}),
+                                      variants=args.variants, period=args.period, seeds=seeds)
+    if args.stage is not None and args.stars is not None:
+        return print_timeline(schedules, f"{args.stage}-{args.stars}", args.variant, args.limit)
+
+    for key, variants in schedules["timelines"].items():
+        size = sum(len(base64.b64decode(v["data"])) for v in variants)
+        print(f"  {key:<6} {len(variants)} variant(s) x {variants[0]['count']:>4} spawn(s), {size:>6,} bytes")
+    failed = check_schedules(data, schedules, args.period)
+    print(f"\n{len(schedules['timelines'])} stage x star timeline(s), "
+          f"{'all decode to the compiled spawns' if not failed else f'{failed} mismatch(es)'}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
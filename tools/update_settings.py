@@ -1,9 +1,28 @@
 import pandas as pd
+import argparse
+import contextlib
+import hashlib
 import json
 import os
+import pickle
 import sys
+import time
+import traceback
+import zipfile
+import xml.etree.ElementTree as ET
 import numpy as np
 
+import alias_tables
+from alias_tables import build_alias
+import movement_patterns
+from movement_patterns import build_movement_tables
+import hangar_grid
+import spawn_schedules
+import excel_loader
+from excel_loader import load_sheets, print_load_report
+from schema_migrations import migrate_workbook
+from pipeline_profile import NULL_PROFILER, Profiler, add_profile_arguments
+
 # Determine Base Directory (tools/)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -11,6 +30,8 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 EXCEL_PATH = os.path.join(BASE_DIR, "../game_balance_new.xlsx")
 # Output JS File Path (relative to tools/)
 JS_OUTPUT_PATH = os.path.join(BASE_DIR, "../js/settings_data.js")
+# Per-section build cache (content-hashed, safe to delete)
+CACHE_DIR = os.path.join(BASE_DIR, ".build_cache")
 
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -38,284 +59,735 @@ def parse_drops(drop_str):
         pass
     return drops
 
-def load_excel_data():
+# --- Column-oriented conversion ---
+# iterrows() は1行ごとに Series を作るので遅い。シートを一度だけ 2次元配列にして列単位で処理する。
+# df.to_numpy() は iterrows() と同じ共通 dtype で値を並べるので、出力される JSON は従来と完全に一致する。
+
+_REQUIRED = object()
+
+class SheetColumns:
+    """Column access over one sheet, with the same element types iterrows() rows would carry."""
+    def __init__(self, df):
+        self.columns = list(df.columns)
+        self.values = df.to_numpy()
+        self._index = {c: i for i, c in enumerate(self.columns)}
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, name, default=_REQUIRED):
+        """Column as an array; a missing column yields `default` for every row (like row.get)."""
+        if name in self._index:
+            return self.values[:, self._index[name]]
+        if default is _REQUIRED:
+            raise KeyError(name)
+        col = np.empty(len(self.values), dtype=object)
+        col[:] = [default] * len(self.values)
+        return col
+
+    def ints(self, name, default=_REQUIRED):
+        col = self.get(name, default)
+        # int(nan) と同様に空セルはエラーにする (astype は黙って不正な値になる)
+        if pd.isna(col).any():
+            raise ValueError(f"column '{name}' has empty cells, expected integers")
+        return col.astype(np.int64).tolist()
+
+    def floats(self, name, default=_REQUIRED):
+        return self.get(name, default).astype(np.float64).tolist()
+
+    def mapping(self, key, value):
+        """{row[key]: row[value]} for every row."""
+        return dict(zip(self.get(key).tolist(), self.get(value).tolist()))
+
+    def records(self, rows=None):
+        """row.dropna().to_dict() for every row (or the given row positions)."""
+        values = self.values if rows is None else self.values[rows]
+        mask = pd.isna(values)
+        columns = self.columns
+        if not mask.any():
+            return [dict(zip(columns, row)) for row in values.tolist()]
+        return [
+            {c: v for c, v, missing in zip(columns, row, row_mask) if not missing}
+            for row, row_mask in zip(values.tolist(), mask.tolist())
+        ]
+
+    def keyed_records(self, key):
+        """{row[key]: row.dropna().to_dict()} for every row."""
+        return dict(zip(self.get(key).tolist(), self.records()))
+
+    def groups(self, key):
+        """{value: row positions} in order of first appearance (groupby(sort=False))."""
+        codes, uniques = pd.factorize(self.get(key), use_na_sentinel=False)
+        order = np.argsort(codes, kind='stable')
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+        return dict(zip(uniques.tolist(), np.split(order, bounds)))
+
+# --- Section builders ---
+# 各ビルダーは Excel のシートを読み込み、GAME_BALANCE_DATA の断片 (dict) を返す。
+# SECTIONS の並び順がそのまま出力 JSON のキー順になる。
+
+def build_physics(xls):
+    if 'Physics' not in xls.sheet_names:
+        return {}
+    sheet = SheetColumns(xls.parse('Physics'))
+    return {'PHYSICS': sheet.mapping('Parameter', 'Value')}
+
+def build_player(xls):
+    if 'Player' not in xls.sheet_names:
+        return {}
+    sheet = SheetColumns(xls.parse('Player'))
+    return {'PLAYER': sheet.mapping('Parameter', 'Value')}
+
+def build_weapons(xls):
+    if 'Weapons' not in xls.sheet_names:
+        return {}
+    return {'WEAPONS': SheetColumns(xls.parse('Weapons')).keyed_records('ID')}
+
+def build_enemies(xls):
+    if 'Enemies' not in xls.sheet_names:
+        return {}
+    sheet = SheetColumns(xls.parse('Enemies'))
+    ids = sheet.get('ID').tolist()
+    hp = sheet.ints('HP')
+    shield = sheet.ints('Shield', 0)
+
+    enemies = {}
+    for eid, name, model, hp_, shield_, speed, turn, damage, mp, eq, dt, dc in zip(
+            ids, sheet.get('Name').tolist(), sheet.get('Model', 'EnemyShip').tolist(),
+            hp, shield, sheet.floats('Speed', 1.0), sheet.floats('Turn', 1.0),
+            sheet.ints('Damage', 10), sheet.get('MovementPattern', 'MPID001').tolist(),
+            sheet.get('EQ', 'EQID001').tolist(), sheet.get('DropTable', None).tolist(),
+            sheet.ints('DropCount', 1)):
+        enemies[eid] = {
+            "id": eid,
+            "name": name,
+            "model": model,
+            "hp": hp_,
+            "shield": shield_,
+            "speed": speed,
+            "turn": turn,
+            "damage": damage,
+            "movementPattern": mp,
+            "eqId": eq,
+            "dropTableId": dt,
+            "dropCount": dc
+        }
+
+    # Cleanup Tiers (for legacy debris spawning if needed, or remove?)
+    # Keeping for now as spawnDebris uses it
+    tiers = [
+        {"id": eid, "tier": tier_tag, "hp": hp_, "shield": shield_, "speed": speed}
+        for eid, tier_tag, hp_, shield_, speed in zip(
+            ids, sheet.get('Tier', 'Tier1').tolist(), hp, shield, sheet.floats('Speed'))
+    ]
+    # Tier -> 敵IDの索引 (spawnDebris が毎回フィルタしなくて済むように)
+    tier_index = {}
+    for t in tiers:
+        tier_index.setdefault(t["tier"], []).append(t["id"])
+    return {'ENEMIES': enemies, 'DEBRIS': {"TIERS": tiers, "TIER_INDEX": tier_index}}
+
+def build_parts(xls):
+    if 'Parts' not in xls.sheet_names:
+        return {}
+    return {'PART_TEMPLATES': SheetColumns(xls.parse('Parts')).keyed_records('ID')}
+
+def build_hangar_grid(xls):
+    # GridManager.PART_TEMPLATES と同じく WEAPONS に PART_TEMPLATES を重ねたもの
+    templates = {**build_weapons(xls).get('WEAPONS', {}), **build_parts(xls).get('PART_TEMPLATES', {})}
+    if not templates:
+        return {}
+    return {'HANGAR_GRID': hangar_grid.build_hangar_grid(templates, hangar_grid.load_ship_layout())}
+
+def build_materials(xls):
+    if 'Materials' not in xls.sheet_names:
+        return {}
+    return {'MATERIALS': SheetColumns(xls.parse('Materials')).keyed_records('ID')}
+
+def build_drop_items(xls):
+    if 'DropItems' not in xls.sheet_names:
+        return {}
+    return {'DROP_ITEMS': SheetColumns(xls.parse('DropItems')).keyed_records('ID')}
+
+def build_upgrade_table(df):
+    """UpgradeTable sheet -> {StatType: [row, ...]} (rows keep sheet order within each StatType)."""
+    sheet = SheetColumns(df)
+    return {stat: sheet.records(rows) for stat, rows in sheet.groups('StatType').items()}
+
+def build_upgrades(xls):
+    if 'UpgradeTable' in xls.sheet_names:
+        return {'UPGRADE_TABLE': build_upgrade_table(xls.parse('UpgradeTable'))}
+    elif 'Upgrades' in xls.sheet_names:
+        return {'UPGRADES_DATA': SheetColumns(xls.parse('Upgrades')).keyed_records('ID')}
+    return {}
+
+def build_weather(xls):
+    if 'Weather' not in xls.sheet_names:
+        return {}
+    return {'WEATHER': SheetColumns(xls.parse('Weather')).keyed_records('Key')}
+
+def build_stages(xls):
+    if 'Stages' not in xls.sheet_names:
+        return {}
+    df = xls.parse('Stages')
+    return {'STAGES': df.to_dict(orient='records')}
+
+def build_enemy_weapons(xls):
+    if 'EnemyWeapons' not in xls.sheet_names:
+        return {}
+    return {'ENEMY_WEAPONS': SheetColumns(xls.parse('EnemyWeapons')).keyed_records('ID')}
+
+def build_movement_patterns(xls):
+    if 'MovementPatterns' not in xls.sheet_names:
+        return {}
+    patterns = SheetColumns(xls.parse('MovementPatterns')).keyed_records('ID')
+    return {'MOVEMENT_PATTERNS': patterns, 'MOVEMENT_TABLES': build_movement_tables(patterns)}
+
+def build_drop_tables(xls):
+    if 'DropTables' not in xls.sheet_names:
+        return {}
+    sheet = SheetColumns(xls.parse('DropTables'))
+    item_ids = sheet.get('ItemID')
+    rates = sheet.get('Rate').astype(np.float64)
+    # 任意列 Exclusive: 1 の行があるテーブルは「1回の抽選で最大1個」(alias テーブルで1回引く)
+    exclusive = pd.to_numeric(pd.Series(sheet.get('Exclusive', 0)), errors='coerce').fillna(0).to_numpy() != 0
+    # Group by DTID
+    dt = {}
+    exclusive_ids = []
+    for dtid, rows in sheet.groups('DTID').items():
+        dt[dtid] = [{"id": i, "rate": r} for i, r in zip(item_ids[rows].tolist(), rates[rows].tolist())]
+        if exclusive[rows].any():
+            exclusive_ids.append(dtid)
+    return {'DROP_TABLES': dt, 'DROP_ALIAS': build_drop_alias(dt, exclusive_ids)}
+
+def build_drop_alias(drop_tables, exclusive_ids):
+    """One alias table per exclusive drop table (one draw per lottery, null = no drop).
+
+    Other tables are not listed: the runtime rolls each entry independently for them, so one
+    lottery can drop several items. Exclusive tables whose rates add up to more than 1 can't be
+    a single draw either; they are left out with a warning.
+    """
+    result = {}
+    for dtid in exclusive_ids:
+        drops = drop_tables[dtid]
+        dist = alias_tables.drop_distribution(drops)
+        if dist is None:
+            print(f"  Warning: DropTable {dtid} is Exclusive but its rates sum to more than 1; rolled per entry")
+            continue
+        table = build_alias(*alias_tables.merge_outcomes(*dist))
+        if table:
+            result[dtid] = table
+    return result
+
+def build_difficulty_params(df):
+    """MissionParams sheet -> {stars: {dist, rewardMod, shieldMod, weatherTable, enemyTier}}."""
+    sheet = SheetColumns(df)
+    params = {}
+    for stars, d_min, d_max, reward, shield, w_table, tier in zip(
+            sheet.ints('Stars'), sheet.ints('DistMin'), sheet.ints('DistMax'),
+            sheet.floats('RewardMod'), sheet.floats('ShieldMod', 1.0),
+            sheet.get('WeatherTable').tolist(), sheet.get('EnemyTier').tolist()):
+        params[stars] = {
+            "dist": [d_min, d_max],
+            "rewardMod": reward,
+            "shieldMod": shield,
+            "weatherTable": w_table,
+            "enemyTier": tier
+        }
+    return params
+
+def build_spawn_schedules(xls):
+    if not {'Stages', 'MissionParams', 'Enemies'} <= set(xls.sheet_names):
+        return {}
+    stages = build_stages(xls)['STAGES']
+    enemies = build_enemies(xls)
+    return {'SPAWN_SCHEDULES': spawn_schedules.build_spawn_schedules(
+        stages, build_difficulty_params(xls.parse('MissionParams')),
+        enemies['ENEMIES'], enemies['DEBRIS']['TIER_INDEX'])}
+
+def build_mission_data(xls):
+    mission_data = {}
+    if 'MissionScaling' in xls.sheet_names:
+        sheet = SheetColumns(xls.parse('MissionScaling'))
+        probs = zip(*(sheet.ints(f'Prob{s}', 0) for s in range(1, 6)))
+        mission_data['DIFFICULTY_SCALING'] = [
+            {"minStat": min_stat, "probs": dict(zip(range(1, 6), p))}
+            for min_stat, p in zip(sheet.ints('MinStat'), probs)
+        ]
+        # 星数の抽選 (MissionManager.generateMissions, 外れたら★1)
+        mission_data['DIFFICULTY_ALIAS'] = [
+            build_alias(*alias_tables.merge_outcomes(
+                *alias_tables.cumulative_percent_distribution(band["probs"], 1)))
+            for band in mission_data['DIFFICULTY_SCALING']
+        ]
+
+    if 'MissionParams' in xls.sheet_names:
+        mission_data['DIFFICULTY_PARAMS'] = build_difficulty_params(xls.parse('MissionParams'))
+
+    if 'WeatherTables' in xls.sheet_names:
+        sheet = SheetColumns(xls.parse('WeatherTables'))
+        columns = [(key, sheet.ints(col, 0)) for key, col in
+                   (("CLEAR", 'Clear'), ("RAIN", 'Rain'), ("SQUALL", 'Squall'), ("HELL", 'Hell'))]
+        mission_data['WEATHER_TABLES'] = {
+            tid: {key: values[i] for key, values in columns}
+            for i, tid in enumerate(sheet.get('TableID').tolist())
+        }
+        # 天候の抽選 (GameEngine.pickWeather, 外れたら CLEAR)
+        mission_data['WEATHER_ALIAS'] = {
+            tid: build_alias(*alias_tables.merge_outcomes(
+                *alias_tables.cumulative_percent_distribution(weights, "CLEAR")))
+            for tid, weights in mission_data['WEATHER_TABLES'].items()
+        }
+
+    if mission_data:
+        return {'MISSION_DATA': mission_data}
+    return {}
+
+# (セクション名, 入力シート, ビルダー)
+SECTIONS = [
+    ("PHYSICS", ("Physics",), build_physics),
+    ("PLAYER", ("Player",), build_player),
+    ("WEAPONS", ("Weapons",), build_weapons),
+    ("ENEMIES", ("Enemies",), build_enemies),
+    ("PART_TEMPLATES", ("Parts",), build_parts),
+    ("HANGAR_GRID", ("Weapons", "Parts"), build_hangar_grid),
+    ("MATERIALS", ("Materials",), build_materials),
+    ("DROP_ITEMS", ("DropItems",), build_drop_items),
+    ("UPGRADE_TABLE", ("UpgradeTable", "Upgrades"), build_upgrades),
+    ("WEATHER", ("Weather",), build_weather),
+    ("STAGES", ("Stages",), build_stages),
+    ("ENEMY_WEAPONS", ("EnemyWeapons",), build_enemy_weapons),
+    ("MOVEMENT_PATTERNS", ("MovementPatterns",), build_movement_patterns),
+    ("DROP_TABLES", ("DropTables",), build_drop_tables),
+    ("MISSION_DATA", ("MissionScaling", "MissionParams", "WeatherTables"), build_mission_data),
+    ("SPAWN_SCHEDULES", ("Stages", "MissionParams", "Enemies"), build_spawn_schedules),
+]
+
+# --- Build cache ---
+
+def read_sheet_xml(path):
+    """Returns {sheet_name: raw worksheet XML bytes} straight from the xlsx zip (no parsing)."""
+    ns = {
+        'm': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+        'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+        'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+    }
+    with zipfile.ZipFile(path) as z:
+        rels = ET.fromstring(z.read('xl/_rels/workbook.xml.rels'))
+        targets = {}
+        for rel in rels.findall('rel:Relationship', ns):
+            target = rel.get('Target')
+            # Target は "/xl/worksheets/sheet1.xml" と "worksheets/sheet1.xml" の両方がある
+            targets[rel.get('Id')] = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+
+        # 共有文字列はシート間で共通なので、各シートのハッシュに含める
+        shared = z.read('xl/sharedStrings.xml') if 'xl/sharedStrings.xml' in z.namelist() else b''
+
+        workbook = ET.fromstring(z.read('xl/workbook.xml'))
+        sheets = {}
+        for sheet in workbook.find('m:sheets', ns).findall('m:sheet', ns):
+            rid = sheet.get('{%s}id' % ns['r'])
+            sheets[sheet.get('name')] = z.read(targets[rid]) + shared
+    return sheets
+
+def builder_fingerprint():
+    """Hash of the converter source; a change to the conversion code invalidates every cached section."""
+    h = hashlib.sha256()
+    # excel_loader はビルダーが見る DataFrame を作る (型推論・空セルの扱い) ので含める
+    for module_file in (os.path.abspath(__file__), excel_loader.__file__, alias_tables.__file__,
+                        movement_patterns.__file__, hangar_grid.__file__, spawn_schedules.__file__):
+        with open(module_file, 'rb') as f:
+            h.update(f.read())
+    # HANGAR_GRID の置ける位置は js/settings.js の SHIP_LAYOUT にも依存する
+    h.update(json.dumps(hangar_grid.load_ship_layout()).encode())
+    return h.hexdigest()
+
+def section_key(sheet_xml, sheets, fingerprint):
+    h = hashlib.sha256(fingerprint.encode())
+    for name in sheets:
+        raw = sheet_xml.get(name)
+        # シートの有無もキーに含める (シート追加/削除で再生成)
+        h.update(name.encode('utf-8'))
+        h.update(b'\x01' + hashlib.sha256(raw).digest() if raw is not None else b'\x00')
+    return h.hexdigest()
+
+class PrefetchedWorkbook:
+    """What the section builders see: the workbook's sheet names plus the sheets loaded up front."""
+    def __init__(self, sheet_names, frames):
+        self.sheet_names = sheet_names
+        self.frames = frames
+
+    def parse(self, sheet_name):
+        return self.frames[sheet_name]
+
+def load_cached_section(name, key):
+    path = os.path.join(CACHE_DIR, f"{name}.pkl")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:
+        return None
+    if entry.get('key') != key:
+        return None
+    return entry['value']
+
+def store_cached_section(name, key, value):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, f"{name}.pkl")
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump({'key': key, 'value': value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+def select_sections(only=None):
+    """SECTIONS restricted to the requested section names (all of them when `only` is empty)."""
+    if not only:
+        return SECTIONS
+    known = [name for name, _, _ in SECTIONS]
+    unknown = [name for name in only if name not in known]
+    if unknown:
+        raise ValueError(f"Unknown section(s) {', '.join(unknown)}; choose from {', '.join(known)}")
+    return [s for s in SECTIONS if s[0] in only]
+
+def load_excel_data(force=False, only=None, jobs=None, profiler=NULL_PROFILER):
     if not os.path.exists(EXCEL_PATH):
         print(f"Error: {EXCEL_PATH} not found.")
         return None
 
     try:
-        xls = pd.ExcelFile(EXCEL_PATH)
+        sections = select_sections(only)
         data = {}
+        fragments = {}
+        pending = []
 
-        # 1. PHYSICS
-        if 'Physics' in xls.sheet_names:
-            df = pd.read_excel(xls, 'Physics')
-            data['PHYSICS'] = {row['Parameter']: row['Value'] for _, row in df.iterrows()}
-
-        # 2. PLAYER
-        if 'Player' in xls.sheet_names:
-            df = pd.read_excel(xls, 'Player')
-            data['PLAYER'] = {row['Parameter']: row['Value'] for _, row in df.iterrows()}
-
-        # 3. WEAPONS
-        if 'Weapons' in xls.sheet_names:
-            df = pd.read_excel(xls, 'Weapons')
-            data['WEAPONS'] = {row['ID']: row.dropna().to_dict() for _, row in df.iterrows()}
-
-        # 4. ENEMIES
-        if 'Enemies' in xls.sheet_names:
-            df = pd.read_excel(xls, 'Enemies')
-            enemies = {}
-            for _, row in df.iterrows():
-                enemies[row['ID']] = {
-                    "id": row['ID'],
-                    "name": row['Name'],
-                    "model": row.get('Model', 'EnemyShip'),
-                    "hp": int(row['HP']),
-                    "shield": int(row.get('Shield', 0)),
-                    "speed": float(row.get('Speed', 1.0)),
-                    "turn": float(row.get('Turn', 1.0)),
-                    "damage": int(row.get('Damage', 10)),
-                    "movementPattern": row.get('MovementPattern', 'MPID001'),
-                    "eqId": row.get('EQ', 'EQID001'),
-                    "dropTableId": row.get('DropTable'),
-                    "dropCount": int(row.get('DropCount', 1))
-                }
-            data['ENEMIES'] = enemies
-            
-            # Cleanup Tiers (for legacy debris spawning if needed, or remove?)
-            # Keeping for now as spawnDebris uses it
-            tiers = []
-            for _, row in df.iterrows():
-                 tier_tag = row.get('Tier', 'Tier1')
-                 tiers.append({
-                     "id": row['ID'],
-                     "tier": tier_tag,
-                     "hp": int(row['HP']),
-                     "shield": int(row.get('Shield', 0)),
-                     "speed": float(row['Speed'])
-                 })
-            data['DEBRIS'] = {"TIERS": tiers}
-
-        # 5. PARTS
-        if 'Parts' in xls.sheet_names:
-            df = pd.read_excel(xls, 'Parts')
-            data['PART_TEMPLATES'] = {row['ID']: row.dropna().to_dict() for _, row in df.iterrows()}
-            
-        # 5b. MATERIALS
-        if 'Materials' in xls.sheet_names:
-            df = pd.read_excel(xls, 'Materials')
-            data['MATERIALS'] = {row['ID']: row.dropna().to_dict() for _, row in df.iterrows()}
-            
-        # 5c. DROP ITEMS
-        if 'DropItems' in xls.sheet_names:
-            df = pd.read_excel(xls, 'DropItems')
-            data['DROP_ITEMS'] = {row['ID']: row.dropna().to_dict() for _, row in df.iterrows()}
-        
-        # 6. UPGRADES
-        if 'UpgradeTable' in xls.sheet_names:
-            df = pd.read_excel(xls, 'UpgradeTable')
-            upgrades = {}
-            for _, row in df.iterrows():
-                stat = row['StatType']
-                if stat not in upgrades: upgrades[stat] = []
-                upgrades[stat].append(row.dropna().to_dict())
-            data['UPGRADE_TABLE'] = upgrades
-        elif 'Upgrades' in xls.sheet_names: 
-            df = pd.read_excel(xls, 'Upgrades')
-            data['UPGRADES_DATA'] = {row['ID']: row.dropna().to_dict() for _, row in df.iterrows()}
-
-        # 7. WEATHER
-        if 'Weather' in xls.sheet_names:
-            df = pd.read_excel(xls, 'Weather')
-            data['WEATHER'] = {row['Key']: row.dropna().to_dict() for _, row in df.iterrows()}
-
-        # 8. STAGES
-        if 'Stages' in xls.sheet_names:
-            df = pd.read_excel(xls, 'Stages')
-            data['STAGES'] = df.to_dict(orient='records')
-            
-        # 10. NEW SHEETS (V6)
-        if 'EnemyWeapons' in xls.sheet_names:
-            df = pd.read_excel(xls, 'EnemyWeapons')
-            data['ENEMY_WEAPONS'] = {row['ID']: row.dropna().to_dict() for _, row in df.iterrows()}
-            
-        if 'MovementPatterns' in xls.sheet_names:
-            df = pd.read_excel(xls, 'MovementPatterns')
-            data['MOVEMENT_PATTERNS'] = {row['ID']: row.dropna().to_dict() for _, row in df.iterrows()}
-            
-        if 'DropTables' in xls.sheet_names:
-            df = pd.read_excel(xls, 'DropTables')
-            # Group by DTID
-            dt = {}
-            for _, row in df.iterrows():
-                dtid = row['DTID']
-                if dtid not in dt: dt[dtid] = []
-                dt[dtid].append({
-                    "id": row['ItemID'],
-                    "rate": float(row['Rate'])
-                })
-            data['DROP_TABLES'] = dt
-
-        # 9. MISSION_DATA
-        mission_data = {}
-        if 'MissionScaling' in xls.sheet_names:
-            df = pd.read_excel(xls, 'MissionScaling')
-            scaling = []
-            for _, row in df.iterrows():
-                probs = {1: int(row.get('Prob1',0)), 2: int(row.get('Prob2',0)), 3: int(row.get('Prob3',0)), 4: int(row.get('Prob4',0)), 5: int(row.get('Prob5',0))}
-                scaling.append({"minStat": int(row['MinStat']), "probs": probs})
-            mission_data['DIFFICULTY_SCALING'] = scaling
-
-        if 'MissionParams' in xls.sheet_names:
-            df = pd.read_excel(xls, 'MissionParams')
-            params = {}
-            for _, row in df.iterrows():
-                stars = int(row['Stars'])
-                params[stars] = {
-                    "dist": [int(row['DistMin']), int(row['DistMax'])],
-                    "rewardMod": float(row['RewardMod']),
-                    "shieldMod": float(row.get('ShieldMod', 1.0)), 
-                    "weatherTable": row['WeatherTable'],
-                    "enemyTier": row['EnemyTier']
-                }
-            mission_data['DIFFICULTY_PARAMS'] = params
-
-        if 'WeatherTables' in xls.sheet_names:
-            df = pd.read_excel(xls, 'WeatherTables')
-            w_tables = {}
-            for _, row in df.iterrows():
-                tid = row['TableID']
-                w_tables[tid] = {
-                    "CLEAR": int(row.get('Clear', 0)),
-                    "RAIN": int(row.get('Rain', 0)),
-                    "SQUALL": int(row.get('Squall', 0)),
-                    "HELL": int(row.get('Hell', 0))
-                }
-            mission_data['WEATHER_TABLES'] = w_tables
-        
-        if mission_data:
-            data['MISSION_DATA'] = mission_data
+        with profiler.stage("build_cache_check"):
+            sheet_xml = read_sheet_xml(EXCEL_PATH)
+            fingerprint = builder_fingerprint()
+            for name, sheets, builder in sections:
+                key = section_key(sheet_xml, sheets, fingerprint)
+                fragment = None if force else load_cached_section(name, key)
+                if fragment is None:
+                    pending.append((name, key, sheets, builder))
+                else:
+                    fragments[name] = fragment
+
+        # 再生成が必要なセクションの入力シートだけをまとめて (並列に) 読み込む
+        needed = []
+        for _, _, sheets, _ in pending:
+            needed += [s for s in sheets if s in sheet_xml and s not in needed]
+        frames = {}
+        if needed:
+            with profiler.stage("excel_load") as rec:
+                start = time.perf_counter()
+                frames, metrics, mode = load_sheets(
+                    EXCEL_PATH, needed, jobs=jobs,
+                    sheet_bytes={n: len(raw) for n, raw in sheet_xml.items()})
+                print_load_report(metrics, mode, time.perf_counter() - start)
+                rec["rows"] = sum(m["rows"] for m in metrics)
+                for m in metrics:
+                    # 並列読み込みのシートはワーカーごとに別のトラックに並べる
+                    profiler.add(m["sheet"], m["started"], m["seconds"], m["cpu_seconds"], m["rows"], m["peak_alloc_mb"],
+                                 tid=m["pid"] if mode != "serial" else 1, process=m["pid"])
+
+        xls = PrefetchedWorkbook(list(sheet_xml.keys()), frames)
+        with profiler.stage("conversion", rows=sum(len(df) for df in frames.values())) if pending \
+                else contextlib.nullcontext():
+            for name, key, sheets, builder in pending:
+                with profiler.stage(name, rows=sum(len(frames[s]) for s in sheets if s in frames)):
+                    fragment = builder(xls)
+                    store_cached_section(name, key, fragment)
+                fragments[name] = fragment
+
+        misses = [p[0] for p in pending]
+        hits = [name for name, _, _ in sections if name not in misses]
+        for name, _, _ in sections:
+            data.update(fragments[name])
+
+        print(f"Build cache: {len(hits)} hit, {len(misses)} miss" + (" (--force)" if force else ""))
+        if hits:
+            print(f"  hit : {', '.join(hits)}")
+        if misses:
+            print(f"  miss: {', '.join(misses)}")
 
         return data
 
     except Exception as e:
         print(f"Error reading Excel: {e}")
+        if profiler.enabled:
+            traceback.print_exc()
+        return None
+
+def encode_columns(rows):
+    """[row, ...] -> {"length": n, "columns": {col: [v, ...] or constant}} (struct-of-arrays).
+
+    A column that is present with the same value in every row is stored once as a scalar;
+    cells that row.dropna() removed are stored as null.
+    """
+    # 各行のキー順 (= シートの列順、空セルは抜けている) を1つの列順にまとめる
+    names = []
+    for row in rows:
+        prev = -1
+        for k in row:
+            if k not in names:
+                names.insert(prev + 1, k)
+            prev = names.index(k)
+    columns = {}
+    for k in names:
+        values = [row.get(k) for row in rows]
+        first = values[0]
+        if first is not None and all(k in row and type(row[k]) is type(first) and row[k] == first for row in rows):
+            columns[k] = first
+        else:
+            columns[k] = values
+    return {"length": len(rows), "columns": columns}
+
+# 列形式の UPGRADE_TABLE を初回アクセス時に行オブジェクトの配列へ展開する。
+# UPGRADE_TABLE[stat][lv] / .find() / .length / Object.assign() は従来どおり動く。
+UPGRADE_TABLE_ACCESSOR_JS = """(function (table) {
+    if (!table) return;
+    const define = (stat, value) => Object.defineProperty(table, stat, { value, writable: true, configurable: true, enumerable: true });
+    Object.keys(table).forEach(stat => {
+        const packed = table[stat];
+        if (Array.isArray(packed)) return;
+        Object.defineProperty(table, stat, {
+            configurable: true,
+            enumerable: true,
+            get() {
+                const names = Object.keys(packed.columns);
+                const cols = names.map(k => packed.columns[k]);
+                const isCol = cols.map(c => Array.isArray(c));
+                const rows = new Array(packed.length);
+                for (let i = 0; i < packed.length; i++) {
+                    const row = {};
+                    for (let j = 0; j < names.length; j++) {
+                        const v = isCol[j] ? cols[j][i] : cols[j];
+                        if (v !== null) row[names[j]] = v;
+                    }
+                    rows[i] = row;
+                }
+                define(stat, rows);
+                return rows;
+            },
+            set(value) { define(stat, value); }
+        });
+    });
+})"""
+
+def encode_sections(data, columnar, minify):
+    """Returns (json_body, columnar_applied) for a {section: value} dict."""
+    if columnar and 'UPGRADE_TABLE' in data:
+        data = dict(data)
+        data['UPGRADE_TABLE'] = {stat: encode_columns(rows) for stat, rows in data['UPGRADE_TABLE'].items()}
+    else:
+        columnar = False
+
+    if minify:
+        body = json.dumps(data, separators=(',', ':'), ensure_ascii=False, cls=NumpyEncoder)
+    else:
+        body = json.dumps(data, indent=4, ensure_ascii=False, cls=NumpyEncoder)
+    return body, columnar
+
+def render_js(data, columnar=False, minify=False):
+    """Returns the settings_data.js source. Defaults reproduce the classic pretty-printed output."""
+    body, columnar = encode_sections(data, columnar, minify)
+
+    js_content = "// Automatically generated from game_balance.xlsm\n"
+    js_content += "const GAME_BALANCE_DATA = " + body + ";\n"
+    if columnar:
+        js_content += UPGRADE_TABLE_ACCESSOR_JS + "(GAME_BALANCE_DATA.UPGRADE_TABLE);\n"
+    return js_content
+
+# --- Chunked output (--chunked) ---
+
+# 起動時に読まないセクション。ここに無いセクション (PHYSICS, PLAYER, WEAPONS, ENEMIES, DEBRIS,
+# MISSION_DATA など) は settings_data.js (boot) に残る。
+LAZY_CHUNKS = [
+    ("hangar", ["PART_TEMPLATES", "UPGRADE_TABLE", "HANGAR_GRID"]),
+    ("items", ["MATERIALS", "DROP_ITEMS"]),
+    ("stage", ["WEATHER", "STAGES", "ENEMY_WEAPONS", "MOVEMENT_PATTERNS", "MOVEMENT_TABLES",
+               "DROP_TABLES", "DROP_ALIAS", "SPAWN_SCHEDULES"]),
+]
+# Chunk files: js/data/<chunk>.<hash>.js (served relative to index.html as CHUNK_URL_PREFIX + name)
+CHUNK_DIR = os.path.join(BASE_DIR, "../js/data")
+CHUNK_URL_PREFIX = "js/data/"
+CHUNK_HASH_LENGTH = 10
+
+def render_chunk_js(name, sections, columnar=False, minify=False):
+    """Returns the source of one lazy chunk; it hands its sections to BalanceLoader.define()."""
+    body, columnar = encode_sections(sections, columnar, minify)
+    js_content = "// Automatically generated from game_balance.xlsm\n"
+    if columnar:
+        js_content += f"BalanceLoader.define({json.dumps(name)}, (function (chunk) {{\n"
+        js_content += UPGRADE_TABLE_ACCESSOR_JS + "(chunk.UPGRADE_TABLE);\n"
+        js_content += "return chunk;\n})(" + body + "));\n"
+    else:
+        js_content += f"BalanceLoader.define({json.dumps(name)}, " + body + ");\n"
+    return js_content
+
+def render_chunked_js(data, columnar=False, minify=False):
+    """Splits `data` into the boot file and lazy chunks.
+
+    Returns (boot_js, {file_name: chunk_js}). The boot file holds the boot sections plus
+    GAME_BALANCE_MANIFEST; chunk file names carry the content hash, so an unchanged chunk
+    keeps its URL (and browser cache) across balance updates.
+    """
+    chunked = {s for _, sections in LAZY_CHUNKS for s in sections}
+    boot = {k: v for k, v in data.items() if k not in chunked}
+
+    files = {}
+    manifest = {"boot": list(boot.keys()), "chunks": {}}
+    for name, sections in LAZY_CHUNKS:
+        present = {s: data[s] for s in sections if s in data}
+        if not present:
+            continue
+        source = render_chunk_js(name, present, columnar=columnar, minify=minify)
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:CHUNK_HASH_LENGTH]
+        file_name = f"{name}.{digest}.js"
+        files[file_name] = source
+        manifest["chunks"][name] = {
+            "file": CHUNK_URL_PREFIX + file_name,
+            "hash": digest,
+            "bytes": len(source.encode("utf-8")),
+            "sections": list(present.keys()),
+        }
+
+    boot_js = render_js(boot, columnar=columnar, minify=minify)
+    if minify:
+        boot_js += "const GAME_BALANCE_MANIFEST = " + json.dumps(manifest, separators=(',', ':')) + ";\n"
+    else:
+        boot_js += "const GAME_BALANCE_MANIFEST = " + json.dumps(manifest, indent=4) + ";\n"
+    return boot_js, files
+
+def write_chunks(files):
+    """Writes the chunk files and removes chunk files of previous builds."""
+    os.makedirs(CHUNK_DIR, exist_ok=True)
+    names = {name for name, _ in LAZY_CHUNKS}
+    for file_name in os.listdir(CHUNK_DIR):
+        chunk = file_name.split(".", 1)[0]
+        if chunk in names and file_name.endswith(".js") and file_name not in files:
+            os.remove(os.path.join(CHUNK_DIR, file_name))
+    for file_name, source in files.items():
+        path = os.path.join(CHUNK_DIR, file_name)
+        if os.path.exists(path):
+            continue  # 同じハッシュ = 同じ内容
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+        print(f"  chunk {CHUNK_URL_PREFIX}{file_name} ({len(source.encode('utf-8')):,} bytes)")
+
+# --- Hot reload patch (tools/balance_patch.py) ---
+
+VERSION_MARKER = "const GAME_BALANCE_VERSION = "
+
+def previous_build():
+    """(GAME_BALANCE_DATA, GAME_BALANCE_VERSION) of the settings_data.js about to be replaced, or None."""
+    from settings_store import load_settings
+    if not os.path.exists(JS_OUTPUT_PATH):
         return None
+    with open(JS_OUTPUT_PATH, encoding="utf-8") as f:
+        source = f.read()
+    version = None
+    if VERSION_MARKER in source:
+        version = json.JSONDecoder().raw_decode(source, source.index(VERSION_MARKER) + len(VERSION_MARKER))[0]
+    return load_settings(JS_OUTPUT_PATH), version
+
+def write_patch(previous, data, version, chunks=None):
+    """Records the JSON Patch from the previous build to this one in js/settings_patch.js."""
+    import balance_patch
+    old, base = previous
+    if base == version:
+        return
+    start = time.perf_counter()
+    # 書き出す JSON と同じ形 (numpy の値などを通常の型に) にしてから比べる
+    new = json.loads(json.dumps(data, cls=NumpyEncoder))
+    ops = balance_patch.diff(old, new)
+    elapsed = time.perf_counter() - start
+    size = balance_patch.record_patch(base, version, ops, chunks)
+    print(f"Patch {base} -> {version}: {len(ops)} change(s), {size:,} bytes (diffed in {elapsed * 1000:.1f} ms)")
+    balance_patch.print_patch(ops)
 
-def generate_js(data):
+def generate_js(data, columnar=False, minify=False, chunked=False):
     if not data:
         return
 
-    js_content = "// Automatically generated from game_balance.xlsm\n"
-    js_content += "const GAME_BALANCE_DATA = " + json.dumps(data, indent=4, ensure_ascii=False, cls=NumpyEncoder) + ";\n"
+    try:
+        previous = previous_build()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Warning: previous {JS_OUTPUT_PATH} unreadable, no hot reload patch: {e}")
+        previous = None
+
+    manifest = None
+    if chunked:
+        js_content, files = render_chunked_js(data, columnar=columnar, minify=minify)
+        write_chunks(files)
+        manifest = json.loads(js_content.split("const GAME_BALANCE_MANIFEST = ", 1)[1].rstrip().rstrip(";"))
+    else:
+        js_content = render_js(data, columnar=columnar, minify=minify)
+    # 内容のハッシュ。ホットリロードのパッチはこのバージョンどうしをつなぐ
+    version = hashlib.sha256(js_content.encode("utf-8")).hexdigest()[:12]
+    js_content += VERSION_MARKER + json.dumps(version) + ";\n"
 
     with open(JS_OUTPUT_PATH, "w", encoding="utf-8") as f:
         f.write(js_content)
     
     print(f"Successfully generated {JS_OUTPUT_PATH}")
+    if previous is not None:
+        write_patch(previous, data, version, manifest and manifest["chunks"])
 
 def create_template_excel():
     pass
 
-def migrate_to_v6():
-    """Migrates existing Excel to V6 (New Data Structure: EnemyWeapons, DropTables, MovementPatterns)"""
-    if not os.path.exists(EXCEL_PATH):
-        print("No existing file to migrate.")
-        return
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert game_balance_new.xlsx into js/settings_data.js")
+    parser.add_argument("--force", action="store_true", help="ignore the build cache and rebuild every section")
+    parser.add_argument("--only", help="comma-separated sections to load (e.g. ENEMIES,DROP_TABLES); "
+                                       "reports only, settings_data.js is not written")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes for sheet loading (default: auto, 1 = serial)")
+    parser.add_argument("--compact", action="store_true",
+                        help="store UPGRADE_TABLE as per-StatType column arrays (decoded on first access)")
+    parser.add_argument("--minify", action="store_true", help="write JSON without indentation")
+    parser.add_argument("--chunked", action="store_true",
+                        help="keep only boot sections in settings_data.js and write the rest to "
+                             "content-hashed js/data/*.js chunks loaded on demand")
+    parser.add_argument("--no-validate", action="store_true",
+                        help="write settings_data.js even if the cross-reference check reports errors")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    only = [s.strip() for s in args.only.split(",") if s.strip()] if args.only else None
+    if only:
+        try:
+            select_sections(only)
+        except ValueError as e:
+            parser.error(str(e))
+    profiler = Profiler.from_args(args, "update_settings")
 
+    os.chdir(BASE_DIR)
+    status = 0
     try:
-        print(f"Migrating {EXCEL_PATH} to V6 structure...")
-        
-        all_sheets = pd.read_excel(EXCEL_PATH, sheet_name=None)
-        
-        # 1. Create EnemyWeapons Sheet
-        if 'EnemyWeapons' not in all_sheets:
-            print("Creating EnemyWeapons sheet...")
-            weapons_data = [
-                {"ID": "EQID001", "Name": "ビームガン", "Damage": 10, "Speed": 10, "Cooltime": 30, "ShotNum": 1, "ShotAngle": "AimPlayer", "Size": "10x10"},
-                {"ID": "EQID002", "Name": "ショットガン", "Damage": 5, "Speed": 8, "Cooltime": 60, "ShotNum": 5, "ShotAngle": "Fan", "Size": "8x8"},
-                {"ID": "EQID003", "Name": "スナイパーライフル", "Damage": 30, "Speed": 25, "Cooltime": 120, "ShotNum": 1, "ShotAngle": "AimPlayer", "Size": "6x30"},
-                {"ID": "EQID004", "Name": "ロケット", "Damage": 20, "Speed": 6, "Cooltime": 90, "ShotNum": 1, "ShotAngle": "AimPlayer", "Size": "20x20"},
-                {"ID": "EQID005", "Name": "ミサイル", "Damage": 15, "Speed": 5, "Cooltime": 100, "ShotNum": 1, "ShotAngle": "Homing", "Size": "12x12"},
-                {"ID": "EQID006", "Name": "スパイラルショット", "Damage": 8, "Speed": 7, "Cooltime": 45, "ShotNum": 2, "ShotAngle": "Spiral", "Size": "10x10"},
-                {"ID": "EQID007", "Name": "ビッグガン", "Damage": 50, "Speed": 4, "Cooltime": 180, "ShotNum": 1, "ShotAngle": "AimPlayer", "Size": "60x60"},
-                {"ID": "EQID008", "Name": "ガトリングビーム", "Damage": 3, "Speed": 12, "Cooltime": 5, "ShotNum": 15, "ShotAngle": "RandomSpray", "Size": "5x5"}
-            ]
-            all_sheets['EnemyWeapons'] = pd.DataFrame(weapons_data)
-
-        # 2. Create MovementPatterns Sheet
-        if 'MovementPatterns' not in all_sheets:
-            print("Creating MovementPatterns sheet...")
-            mp_data = []
-            patterns = [
-                "直進(上から下)", "直進(下から上)", "直進(右から左)", "直進(左から右)",
-                "ジグザグ(上から下)", "ジグザグ(下から上)", "ジグザグ(右から左)", "ジグザグ(左から右)",
-                "ホーミング(上から下)", "ホーミング(下から上)", "ホーミング(右から左)", "ホーミング(左から右)",
-                "リフレクト(上から下)", "リフレクト(下から上)", "リフレクト(右から左)", "リフレクト(左から右)",
-                "ウェーブ(上から下)", "ウェーブ(下から上)", "ウェーブ(右から左)", "ウェーブ(左から右)",
-                "スパイラル(上から下)", "スパイラル(下から上)", "スパイラル(右から左)", "スパイラル(左から右)",
-                "対面1", "対面2", "対面3", "対面4",
-                "方円1", "方円2", "方円3", "方円4"
-            ]
-            for i, p_name in enumerate(patterns):
-                mp_data.append({"ID": f"MPID{i+1:03d}", "Name": p_name, "Logic": "TODO"})
-            all_sheets['MovementPatterns'] = pd.DataFrame(mp_data)
-
-        # 3. Create DropTables Sheet
-        if 'DropTables' not in all_sheets:
-            print("Creating DropTables sheet...")
-            dt_data = []
-            # Example Data from User
-            example_items = [
-                ("TypeA", 0.3), ("TypeB", 0.2), ("TypeC", 0.02), ("PU01", 0.05),
-                ("OS01", 0.05), ("LU01", 0.05), ("SP01", 0.05), ("SD01", 0.02), ("JL01", 0.01)
-            ]
-            for item, rate in example_items:
-                dt_data.append({"DTID": "DropDT001", "ItemID": item, "Rate": rate})
-            all_sheets['DropTables'] = pd.DataFrame(dt_data)
-            
-        # 4. Update Enemies Sheet
-        if 'Enemies' in all_sheets:
-            df = all_sheets['Enemies']
-            
-            # Add New Columns if missing
-            if 'Model' not in df.columns: df['Model'] = 'EnemyShip'
-            if 'Turn' not in df.columns: df['Turn'] = 1.0
-            if 'Damage' not in df.columns: df['Damage'] = 10
-            if 'MovementPattern' not in df.columns: df['MovementPattern'] = 'MPID001'
-            if 'EQ' not in df.columns: df['EQ'] = 'EQID001'
-            if 'DropTable' not in df.columns: df['DropTable'] = 'DropDT001'
-            
-            # Keep DropCount
-            if 'DropCount' not in df.columns: df['DropCount'] = 1
-
-            # Remove old Drop columns
-            cols_to_drop = [c for c in df.columns if c.startswith('Drop') and c not in ['DropTable', 'DropCount']]
-            if cols_to_drop:
-                df.drop(columns=cols_to_drop, inplace=True)
-                
-            # Reorder
-            desired_order = ['ID', 'Name', 'Model', 'HP', 'Speed', 'Turn', 'Damage', 'MovementPattern', 'EQ', 'DropTable', 'DropCount', 'Shield']
-            existing = [c for c in desired_order if c in df.columns]
-            other = [c for c in df.columns if c not in existing]
-            df = df[existing + other]
-            
-            all_sheets['Enemies'] = df
-            
-        # Write back
-        with pd.ExcelWriter(EXCEL_PATH, engine='openpyxl') as writer:
-            for sheet_name, sheet_df in all_sheets.items():
-                sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        
-        print("Migration V6 complete.")
-
+        with profiler.stage("migration"):
+            migrate_workbook(EXCEL_PATH)
     except Exception as e:
-        print(f"Migration V6 failed: {e}")
-
-if __name__ == "__main__":
-    os.chdir(BASE_DIR)
-    migrate_to_v6()
-    data = load_excel_data()
+        # 保存途中・ロック中の xlsx など。dev_server.py は終了コードで build-error を通知する
+        print(f"Migration failed: {e}")
+        status = 1
+    data = load_excel_data(force=args.force, only=only, jobs=args.jobs, profiler=profiler)
+    if data is None:
+        status = 1
     if data:
-        generate_js(data)
+        # 書き出す前に相互参照をチェック (tools/validate_data.py)
+        from validate_data import validate_data, print_report
+        with profiler.stage("validation") as rec:
+            report = validate_data(data)
+            rec["rows"] = report["references"]
+        print_report(report)
+    if data and only:
+        print(f"Loaded sections: {', '.join(data.keys())} (--only, {JS_OUTPUT_PATH} left unchanged)")
+    elif data and not report["ok"] and not args.no_validate:
+        print(f"{JS_OUTPUT_PATH} not written: fix the errors above or pass --no-validate")
+        status = 1
+    elif data:
+        with profiler.stage("js_generation"):
+            generate_js(data, columnar=args.compact, minify=args.minify, chunked=args.chunked)
+    profiler.finish()
+    sys.exit(status)
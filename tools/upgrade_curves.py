@@ -0,0 +1,132 @@
+"""
+upgrade_config.js の PARAM_CONFIG と、そこから作られる強化テーブル (Lv0～100) の NumPy 版
+
+ゲーム側 (buildPartUpgradeTable) は PARAM_CONFIG の各キーについて
+    Cost          floor(initCost * r^lv),  r = (lastCost / initCost)^(1/100)
+    ValueTotal    isAbsolute: initVal + (maxVal - initVal) * lv/100
+                  それ以外:   floor(base * mult(lv)),  mult = initValMult → maxValMult を線形補間
+                              (プレイヤー能力値 HP / ENGINE / ... は base を引いた増分)
+    MaterialID    lv が 10 の倍数の時だけ matId
+    MaterialCount floor(1 + (lastMatCount - 1) * (lv - 10) / 90)  (lv が 10 の倍数の時だけ)
+を作り、GAME_SETTINGS.PART_UPGRADE_TABLE と GAME_BALANCE_DATA.UPGRADE_TABLE の同じキーを置き換える。
+ここでは全キー × 全レベルを [キー, レベル] の配列として一度に計算する。
+
+    python tools/upgrade_curves.py            # キーごとのコスト・素材の合計を表示
+"""
+import argparse
+import json
+import os
+import re
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+UPGRADE_CONFIG_PATH = os.path.join(BASE_DIR, '../js/upgrade_config.js')
+
+MAX_LEVEL = 100
+# UpgradeManager.TARGET_STATS (upgradeLevels に入り、依頼の難易度帯を決める能力値)
+PLAYER_STATS = ("HP", "ENGINE", "ACCEL", "BRAKE", "WEAPON_OS")
+
+def load_param_config(path=UPGRADE_CONFIG_PATH):
+    """Parses the `const PARAM_CONFIG = {...};` object literal out of upgrade_config.js."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    match = re.search(r'const\s+PARAM_CONFIG\s*=\s*(\{.*?\n\s*\});', source, re.S)
+    if not match:
+        raise ValueError(f"PARAM_CONFIG not found in {path}")
+    literal = re.sub(r'//[^\n]*', '', match.group(1))
+    literal = re.sub(r'([{,]\s*)([A-Za-z_]\w*)\s*:', r'\1"\2":', literal)
+    literal = re.sub(r',(\s*[}\]])', r'\1', literal)
+    return json.loads(literal)
+
+class UpgradeCurves:
+    """PART_UPGRADE_TABLE as [key, level] arrays (keys: WEAPONS + PART_TEMPLATES + PLAYER_STATS)."""
+
+    def __init__(self, data, config=None):
+        config = load_param_config() if config is None else config
+        parts = dict(data.get("WEAPONS", {}))
+        parts.update(data.get("PART_TEMPLATES", {}))
+        for key in PLAYER_STATS:
+            parts[key] = {"ID": key, "Name": key}
+        player = data.get("PLAYER", {})
+
+        # PARAM_CONFIG に無いキーは空のテーブル (ゲーム側は ShipEditor の仮コストにフォールバック)
+        self.keys = [k for k in parts if k in config]
+        self.unconfigured = [k for k in parts if k not in config]
+        self.index = {k: i for i, k in enumerate(self.keys)}
+        self.config = config
+        k = len(self.keys)
+        col = lambda name, default=0.0: np.array([float(config[key].get(name) or default) for key in self.keys])
+
+        init_cost, last_cost = col("initCost"), col("lastCost")
+        absolute = np.array([bool(config[key].get("isAbsolute")) for key in self.keys])
+        init_val, max_val = col("initVal"), col("maxVal")
+        init_mult, max_mult = col("initValMult"), col("maxValMult")
+        last_mat = col("lastMatCount")
+        # baseVal: PLAYER の値 → 武器の Damage → initVal の順 (0 は未設定扱い)
+        base = np.array([float(player[key]) if key in player else
+                         float(parts[key].get("Damage") or 0) or float(config[key].get("initVal") or 0)
+                         for key in self.keys])
+        stat = np.array([key in PLAYER_STATS for key in self.keys])
+
+        lv = np.arange(MAX_LEVEL + 1)
+        t = (lv / MAX_LEVEL)[None, :]
+        ok = (init_cost > 0) & (last_cost > 0)
+        r = np.where(ok, (np.where(ok, last_cost, 1) / np.where(ok, init_cost, 1)) ** (1 / MAX_LEVEL), 1.0)
+        self.cost = np.floor(init_cost[:, None] * r[:, None] ** lv).astype(np.int64)
+
+        target = np.where(base > 0, base, 10)[:, None] * (init_mult[:, None] + (max_mult - init_mult)[:, None] * t)
+        value = np.floor(np.where(stat[:, None], target - base[:, None], target))
+        self.value = np.where(absolute[:, None], init_val[:, None] + (max_val - init_val)[:, None] * t, value)
+
+        milestone = (lv > 0) & (lv % 10 == 0)
+        count = np.floor(1 + (last_mat[:, None] - 1) * ((lv - 10) / 90))
+        self.material_count = np.where(milestone, count, 0).astype(np.int64)
+        self.material_ids = [config[key].get("matId") for key in self.keys]
+        self.material = np.where(milestone, np.arange(k)[:, None], -1)
+
+    def rows(self, key):
+        """The list buildPartUpgradeTable() stores for `key` (Level / Cost / ValueTotal / MaterialID / MaterialCount)."""
+        i = self.index[key]
+        return [{"Level": lv, "Cost": int(self.cost[i, lv]), "ValueTotal": _js_number(self.value[i, lv]),
+                 "MaterialID": self.material_ids[i] if self.material[i, lv] >= 0 else None,
+                 "MaterialCount": int(self.material_count[i, lv])}
+                for lv in range(MAX_LEVEL + 1)]
+
+    def totals(self, key, start=0, stop=MAX_LEVEL):
+        """Money and materials to go from level `start` to `stop`: (cost, {material: count})."""
+        i = self.index[key]
+        span = slice(start + 1, stop + 1)
+        materials = {}
+        count = int(self.material_count[i, span].sum())
+        if count:
+            materials[self.material_ids[i]] = count
+        return int(self.cost[i, span].sum()), materials
+
+def _js_number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+def main():
+    parser = argparse.ArgumentParser(description="PARAM_CONFIG upgrade curves (upgrade_config.js)")
+    parser.add_argument("--level", type=int, default=MAX_LEVEL, help="sum costs up to this level")
+    args = parser.parse_args()
+
+    from update_settings import load_excel_data
+    data = load_excel_data(only=["WEAPONS", "PART_TEMPLATES", "PLAYER"])
+    if not data:
+        return 1
+    curves = UpgradeCurves(data)
+    print(f"\n{'Key':<10} {'Lv1':>8} {f'Lv{args.level}':>10} {f'Σ cost →Lv{args.level}':>16} {'value':>8}  materials")
+    for key in curves.keys:
+        i = curves.index[key]
+        cost, materials = curves.totals(key, 0, args.level)
+        mats = ", ".join(f"{m} x{c}" for m, c in materials.items())
+        print(f"{key:<10} {curves.cost[i, 1]:>8,} {curves.cost[i, args.level]:>10,} {cost:>16,} "
+              f"{_js_number(curves.value[i, args.level]):>8}  {mats}")
+    if curves.unconfigured:
+        print(f"\nNot in PARAM_CONFIG (no table): {', '.join(curves.unconfigured)}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,502 @@
+"""
+PARAM_CONFIG (upgrade_config.js) の強化カーブの自動調整
+
+キーごとのパラメータ (initCost, lastCost, maxValMult / maxVal, lastMatCount, matId) の候補を
+--population 個ずつ [キー, 候補] の配列にして一度に評価し、交差エントロピー法 (上位 --elite の
+候補の平均・分散から次の世代を引く進化的探索, matId は選ばれた割合) で目標に一番近いものを探す。
+--restarts 回の探索を別々の種でプロセス並列に走らせ、キーごとに一番良かったものを採る。
+
+評価のモデル (progression_sim の Economy を難易度帯ごとに平均したもの, 候補によらないので最初に1回だけ):
+    - 能力値 (HP / ENGINE / ...) は強化と一緒に揃って上がるとし、レベル lv の時の能力値合計
+      lv * 5 * --stat-pace で DIFFICULTY_SCALING の帯が決まる
+    - 帯ごとに「3件の依頼から報酬が一番高いものを受ける」を --samples 回抽選し、1ミッションあたりの
+      収入 (タイムボーナス・お金のドロップ込み), 受けた依頼の星数の割合, 素材の入手数を求める
+    - レベル lv の強化には Cost[lv] / 収入(帯) ミッションかかる
+目標 (キーごとに、ずれの二乗を --weights の重みで足す):
+    missions   Lv100 までのミッション数 (--missions KEY=N, 既定は今の設定の値)
+    tiers      Lv100 までの費用のうち、何★の依頼の報酬で払う割合 (--tier-share 指定時のみ)
+    materials  素材集めのミッション数 / お金のミッション数 (--material-ratio, 既定 1.0)
+    power      Lv100 での上昇率 (%) / ミッション数 (--power KEY=X 指定時のみ, maxValMult / maxVal が動く)
+    stay       今の設定からの離れ具合 (目標で決まらないパラメータを今の値に留める)
+ミッション数・比・power は対数のずれ、tiers は割合の差の絶対値の合計を使う。
+帯は能力値の合計で決まるので、--stat-pace が 1 なら Lv20 から先は一番上の帯になり、
+tiers はほぼ Lv20 までの費用の配分 (initCost と lastCost の比) でしか動かない。
+
+結果は UpgradeTable シート (StatType, Level, ValuePlus, ValueTotal, Cost, MaterialID, MaterialCount) として
+--sheet に書き出す。--workbook なら game_balance_new.xlsx の UpgradeTable の同じ StatType の行を置き換える。
+ゲームは実行時に PARAM_CONFIG から表を作り直すので、--write-config で upgrade_config.js もそろえる。
+
+    python tools/upgrade_tuner.py --missions '*=300' --missions HP=150
+    python tools/upgrade_tuner.py --keys BeamGun,Laser --power '*=0.3' --stat-pace 0.2 --tier-share 1=0.1,2=0.2,3=0.3,4=0.4
+    python tools/upgrade_tuner.py --keys HP --missions HP=500 --workbook --write-config
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from balance_sim.data import SimData
+from pipeline_profile import Profiler, add_profile_arguments
+from progression_sim import RULES, Economy, build_parser
+from settings_store import JS_PATH, load_settings
+from upgrade_curves import MAX_LEVEL, PLAYER_STATS, UPGRADE_CONFIG_PATH, UpgradeCurves, load_param_config, _js_number
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SHEET_PATH = os.path.join(BASE_DIR, '../upgrade_table_tuned.xlsx')
+
+SHEET_COLUMNS = ["StatType", "Level", "ValuePlus", "ValueTotal", "Cost", "MaterialID", "MaterialCount"]
+TERMS = ("missions", "tiers", "materials", "power", "stay")
+DEFAULT_WEIGHTS = {"missions": 1.0, "tiers": 1.0, "materials": 0.5, "power": 0.5, "stay": 0.05}
+LEVELS = np.arange(1, MAX_LEVEL + 1)
+MILESTONES = np.arange(10, MAX_LEVEL + 1, 10)
+
+# 遺伝子 (キーごとに同じ並び): log initCost, log(lastCost / initCost), log(最大値 / 初期値), lastMatCount
+GENES = ("initCost", "costGrowth", "valueGrowth", "lastMatCount")
+LOW = np.array([np.log(10), 0.0, 0.0, 1.0])
+HIGH = np.array([np.log(1e7), np.log(1e5), np.log(50), 99.0])
+# stay の距離を測る時の目盛り (対数の遺伝子は 1 = e 倍, lastMatCount は 10 個)
+STAY_SCALE = np.array([1.0, 1.0, 1.0, 10.0])
+# 入手できない素材のずれ (log(比)^2) の上限
+UNREACHABLE = 25.0
+
+# --- Economy model ---
+
+class Model:
+    """Per-level income, star mix and material yields (candidate independent)."""
+
+    def __init__(self, data, sim_args, samples, seed, stat_pace):
+        sd = SimData(data)
+        curves = UpgradeCurves(data)
+        goals = {k: MAX_LEVEL for k in curves.keys}
+        econ = Economy(data, sd, curves, goals, {}, sim_args, RULES[sim_args.rules])
+        rng = np.random.default_rng(seed)
+
+        stat_col = [t for t, k in enumerate(econ.targets) if k in PLAYER_STATS]
+        bands = econ.min_stat if stat_col else econ.min_stat[:1]
+        self.stars = np.arange(len(econ.dist_low))
+        self.money = np.zeros(len(bands))
+        self.star_share = np.zeros((len(bands), len(self.stars)))
+        self.money_share = np.zeros((len(bands), len(self.stars)))
+        materials = econ.material & econ.obtainable & np.isin(econ.item_ids, list(data.get("MATERIALS") or {}))
+        self.material_ids = [econ.item_ids[i] for i in np.flatnonzero(materials)]
+        # 最後の列は「入手できない素材」(今の設定の matId がドロップしない時)
+        self.material_yield = np.zeros((len(bands), len(self.material_ids) + 1))
+        double = econ.rules["double_materials"]
+        for b, min_stat in enumerate(bands):
+            levels = np.zeros((samples, len(econ.targets)), dtype=np.int64)
+            if stat_col:
+                levels[:, stat_col[0]] = min_stat
+            stars, dist, weight, reward = econ.offer(rng, levels)
+            clear, income, penalty, loot, _ = econ.play(rng, stars, dist, weight, reward)
+            gain = np.where(clear, income, 0) + loot @ econ.money_value
+            net = gain - np.where(clear, 0, penalty)
+            self.money[b] = net.mean()
+            self.star_share[b] = np.bincount(stars, minlength=len(self.stars)) / samples
+            self.money_share[b] = np.bincount(stars, weights=net, minlength=len(self.stars)) / max(net.sum(), 1e-9)
+            mats = loot[:, materials] * np.where(clear & double, 2, 1)[:, None]
+            self.material_yield[b, :-1] = mats.mean(axis=0)
+
+        total = np.round(LEVELS * len(PLAYER_STATS) * stat_pace)
+        self.band = np.maximum(np.searchsorted(bands, total, side="right") - 1, 0)
+        self.income_lv = self.money[self.band]
+        self.money_share_lv = self.money_share[self.band]
+        self.yield_ms = self.material_yield[self.band[MILESTONES - 1]]
+
+    def material_index(self, mat_id):
+        return self.material_ids.index(mat_id) if mat_id in self.material_ids else len(self.material_ids)
+
+# --- Parameter space ---
+
+def config_genes(config, keys):
+    """Genes [K, G] of PARAM_CONFIG entries, with the isAbsolute flags and value bases (initVal / initValMult)."""
+    absolute = np.array([bool(config[k].get("isAbsolute")) for k in keys])
+    base = np.array([float(config[k].get("initVal" if a else "initValMult") or 0) for k, a in zip(keys, absolute)])
+    genes = []
+    for k, a, b in zip(keys, absolute, base):
+        c = config[k]
+        init_cost, last_cost = max(float(c.get("initCost") or 1), 1), float(c.get("lastCost") or 1)
+        top = float(c.get("maxVal" if a else "maxValMult") or 0)
+        genes.append([np.log(init_cost), np.log(max(last_cost / init_cost, 1)),
+                      np.log(top / b) if b > 0 and top > b else 0.0, float(c.get("lastMatCount") or 1)])
+    return np.clip(np.array(genes), LOW, HIGH), absolute, base
+
+class KeySpace:
+    """Current PARAM_CONFIG values of the tuned keys as genes, and the genes back to PARAM_CONFIG fields."""
+
+    def __init__(self, config, keys, model, tune_value):
+        self.keys = keys
+        self.config = config
+        self.current, self.absolute, self.value_base = config_genes(config, keys)
+        # 最大値は power の目標があるキーだけ動かす (初期値が 0 のキーは倍率で動かせないので固定)
+        self.fixed = np.zeros_like(self.current, dtype=bool)
+        self.fixed[:, 2] = (self.value_base <= 0) | ~tune_value
+        self.current_mat = np.array([model.material_index(config[k].get("matId")) for k in keys])
+
+    def to_config(self, genes, mats, model, digits):
+        """PARAM_CONFIG entries for the genes, costs rounded to `digits` significant figures."""
+        tuned = {}
+        for i, key in enumerate(self.keys):
+            g = np.where(self.fixed[i], self.current[i], genes[i])
+            entry = dict(self.config[key])
+            init_cost = _round_sig(np.exp(g[0]), digits)
+            entry["initCost"] = init_cost
+            entry["lastCost"] = max(_round_sig(init_cost * np.exp(g[1]), digits), init_cost)
+            top = self.value_base[i] * np.exp(g[2])
+            if not self.fixed[i, 2]:
+                entry["maxVal" if self.absolute[i] else "maxValMult"] = round(float(top), 1 if self.absolute[i] else 2)
+            entry["lastMatCount"] = int(round(g[3]))
+            if mats[i] < len(model.material_ids):
+                entry["matId"] = model.material_ids[mats[i]]
+            tuned[key] = entry
+        return tuned
+
+def _round_sig(value, digits):
+    value = float(value)
+    if value <= 0:
+        return 0
+    step = 10 ** max(int(np.floor(np.log10(value))) - digits + 1, 0)
+    return int(round(value / step) * step)
+
+# --- Scoring ---
+
+class Targets:
+    def __init__(self, missions, tier_share, material_ratio, power, weights):
+        self.missions = missions          # [K]
+        self.tier_share = tier_share      # [S] or None
+        self.material_ratio = material_ratio
+        self.power = power                # [K], nan = no target
+        self.weights = weights
+
+def evaluate(model, genes, mats):
+    """Progression measures of candidates genes [..., G] / mats [...] (arrays over the leading axes)."""
+    cost = np.floor(np.exp(genes[..., 0:1]) * np.exp(genes[..., 1:2] * (LEVELS / MAX_LEVEL)))
+    per_level = cost / model.income_lv
+    missions = per_level.sum(axis=-1)
+    share = (cost @ model.money_share_lv) / cost.sum(axis=-1)[..., None]
+    power = (np.exp(genes[..., 2]) - 1) * 100 / missions
+
+    count = np.round(genes[..., 3:4])
+    need = np.floor(1 + (count - 1) * ((MILESTONES - 10) / 90))
+    supply = model.yield_ms[:, mats]                     # [milestone, ...]
+    supply = np.moveaxis(supply, 0, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        material_missions = np.where(supply > 0, need / supply, np.inf).sum(axis=-1)
+    return {"missions": missions, "share": share, "power": power, "material_ratio": material_missions / missions}
+
+def score(model, space, targets, genes, mats):
+    """Weighted objective [K, P] (lower is better) and its terms."""
+    m = evaluate(model, genes, mats)
+    terms = {
+        "missions": np.log(m["missions"] / targets.missions[:, None]) ** 2,
+        "tiers": (np.abs(m["share"] - targets.tier_share).sum(axis=-1) ** 2 if targets.tier_share is not None
+                  else np.zeros_like(m["missions"])),
+        "power": np.nan_to_num(np.log(np.maximum(m["power"], 1e-9) / targets.power[:, None]) ** 2),
+        "stay": (((genes - space.current[:, None, :]) / STAY_SCALE) ** 2).sum(axis=-1),
+    }
+    if model.material_ids:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            err = np.log(m["material_ratio"] / targets.material_ratio) ** 2
+        terms["materials"] = np.minimum(np.nan_to_num(err, nan=UNREACHABLE, posinf=UNREACHABLE), UNREACHABLE)
+    else:
+        terms["materials"] = np.zeros_like(terms["stay"])
+    total = sum(targets.weights[t] * terms[t] for t in TERMS)
+    return total, terms, m
+
+# --- Search ---
+
+def search(model, space, targets, population, generations, elite, seed, smoothing=0.7):
+    """Cross-entropy search for every key at once; returns (genes [K, G], mats [K], score [K])."""
+    rng = np.random.default_rng(seed)
+    k_count, g_count = space.current.shape
+    m_count = len(model.material_ids)
+    free = ~space.fixed
+    mean = space.current.copy()
+    sigma = np.where(free, (HIGH - LOW) / 4, 0.0)
+    min_sigma = np.where(free, (HIGH - LOW) * 1e-3, 0.0)
+    probs = np.full((k_count, max(m_count, 1)), 1 / max(m_count, 1))
+    n_elite = max(2, int(population * elite))
+
+    best_genes = space.current.copy()
+    best_mats = space.current_mat.copy()
+    best_score = score(model, space, targets, best_genes[:, None, :], best_mats[:, None])[0][:, 0]
+    for _ in range(generations):
+        genes = mean[:, None, :] + sigma[:, None, :] * rng.standard_normal((k_count, population, g_count))
+        genes = np.clip(genes, LOW, HIGH)
+        if m_count:
+            u = rng.random((k_count, population))
+            mats = (u[..., None] > np.cumsum(probs, axis=1)[:, None, :]).sum(axis=-1)
+            mats = np.minimum(mats, m_count - 1)
+        else:
+            mats = np.repeat(space.current_mat[:, None], population, axis=1)
+        # 今までの最良をそのまま残す
+        genes[:, 0] = best_genes
+        mats[:, 0] = best_mats
+        total, _, _ = score(model, space, targets, genes, mats)
+
+        rows = np.arange(k_count)
+        first = total.argmin(axis=1)
+        better = total[rows, first] < best_score
+        best_score = np.where(better, total[rows, first], best_score)
+        best_genes[better] = genes[rows, first][better]
+        best_mats[better] = mats[rows, first][better]
+
+        top = np.argsort(total, axis=1)[:, :n_elite]
+        elite_genes = np.take_along_axis(genes, top[..., None], axis=1)
+        mean = smoothing * elite_genes.mean(axis=1) + (1 - smoothing) * mean
+        sigma = np.maximum(smoothing * elite_genes.std(axis=1) + (1 - smoothing) * sigma, min_sigma)
+        if m_count:
+            elite_mats = np.take_along_axis(mats, top, axis=1)
+            counts = (elite_mats[..., None] == np.arange(m_count)).mean(axis=1)
+            probs = smoothing * counts + (1 - smoothing) * probs
+    return best_genes, best_mats, best_score
+
+def _search_job(job):
+    return search(*job)
+
+def tune(model, space, targets, population, generations, elite, restarts, seed, jobs):
+    """Best result per key over `restarts` independent searches (run in `jobs` processes)."""
+    work = [(model, space, targets, population, generations, elite, seed + r) for r in range(restarts)]
+    if jobs > 1 and restarts > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, restarts)) as pool:
+            results = list(pool.map(_search_job, work))
+    else:
+        results = [_search_job(w) for w in work]
+    genes = np.stack([r[0] for r in results])
+    mats = np.stack([r[1] for r in results])
+    scores = np.stack([r[2] for r in results])
+    pick = scores.argmin(axis=0)
+    rows = np.arange(len(space.keys))
+    return genes[pick, rows], mats[pick, rows], scores[pick, rows]
+
+# --- Output ---
+
+def sheet_rows(data, tuned):
+    """UpgradeTable rows of the tuned PARAM_CONFIG entries (the same numbers buildPartUpgradeTable makes)."""
+    curves = UpgradeCurves(data, tuned)
+    rows = []
+    for key in curves.keys:
+        for row in curves.rows(key):
+            # engine.js は能力値の ValuePlus を、ShipEditor / GridManager は ValueTotal を読む
+            rows.append({"StatType": key, "Level": row["Level"], "ValuePlus": row["ValueTotal"],
+                         "ValueTotal": row["ValueTotal"], "Cost": row["Cost"],
+                         "MaterialID": row["MaterialID"], "MaterialCount": row["MaterialCount"]})
+    return rows
+
+def write_sheet(path, rows):
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("UpgradeTable")
+    ws.append(SHEET_COLUMNS)
+    for row in rows:
+        ws.append([row[c] for c in SHEET_COLUMNS])
+    wb.save(path)
+
+def write_workbook(path, rows):
+    """Replaces the UpgradeTable rows of the tuned StatTypes in the workbook (other rows and sheets kept)."""
+    import openpyxl
+    from schema_migrations import atomic_save, header_row
+    wb = openpyxl.load_workbook(path)
+    ws = wb["UpgradeTable"] if "UpgradeTable" in wb.sheetnames else wb.create_sheet("UpgradeTable")
+    headers = [h for h in header_row(ws) if h is not None] or ["StatType"]
+    headers += [c for c in SHEET_COLUMNS if c not in headers]
+    tuned = {}
+    for row in rows:
+        tuned.setdefault(row["StatType"], []).append(row)
+    # 置き換えるキーは元の行があった位置に入れ、シートに無かったキーは末尾に足す
+    out, kept, replaced = [], 0, set()
+    for values in ws.iter_rows(min_row=2, values_only=True):
+        row = dict(zip(headers, values))
+        stat = row.get("StatType")
+        if stat is None or stat in replaced:
+            continue
+        if stat in tuned:
+            out += tuned.pop(stat)
+            replaced.add(stat)
+        else:
+            out.append(row)
+            kept += 1
+    for stat_rows in tuned.values():
+        out += stat_rows
+    ws.delete_rows(1, ws.max_row)
+    ws.append(headers)
+    for row in out:
+        ws.append([row.get(h) for h in headers])
+    atomic_save(wb, path)
+    return kept
+
+def write_param_config(path, tuned, current):
+    """Rewrites the changed fields of each PARAM_CONFIG entry in upgrade_config.js in place."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    for key, entry in tuned.items():
+        # 変わらなかった値は元の書き方 (5.0 など) のまま残す
+        entry = {k: v for k, v in entry.items() if v != current.get(key, {}).get(k)}
+        block = re.search(r'(["\']?%s["\']?\s*:\s*\{)(.*?)(\n\s*\})' % re.escape(key), source, re.S)
+        if not block:
+            raise ValueError(f"PARAM_CONFIG entry {key} not found in {path}")
+        body = block.group(2)
+        for field in ("initCost", "lastCost", "maxValMult", "maxVal", "lastMatCount", "matId"):
+            if field not in entry:
+                continue
+            value = f'"{entry[field]}"' if isinstance(entry[field], str) else str(_js_number(entry[field]))
+            body = re.sub(r'\b(%s\s*:\s*)[^,\n}]+' % field, lambda m: m.group(1) + value, body)
+        if "maxValMult" in entry:
+            # "maxValMult: 5.0, // 500%" のコメントの末尾の % も合わせる
+            percent = round(entry["maxValMult"] * 100)
+            body = re.sub(r'(\bmaxValMult\s*:[^\n]*?)\d+(%\s*)$', lambda m: f"{m.group(1)}{percent}{m.group(2)}",
+                          body, flags=re.M)
+        source = source[:block.start(2)] + body + source[block.end(2):]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+
+def print_report(space, model, targets, before, after, tuned, scores):
+    stars = [s for s in model.stars if model.star_share[:, s].any()]
+    print(f"\n{'Key':<10} {'missions now → tuned (target)':>31} {'materials':>10} {'power %/m':>10}  "
+          + " ".join(f"★{s:<4}" for s in stars) + "  score   (★ = share of the cost paid by each star count)")
+    for i, key in enumerate(space.keys):
+        share = " ".join(f"{after['share'][i, s]:>5.0%}" for s in stars)
+        ratio = after["material_ratio"][i]
+        ratio = f"{ratio:>10.2f}" if np.isfinite(ratio) else f"{'never':>10}"
+        print(f"{key:<10} {before['missions'][i]:>10,.0f} → {after['missions'][i]:>8,.0f} "
+              f"({targets.missions[i]:>8,.0f}) {ratio} {after['power'][i]:>10.3f}  {share}  {scores[i]:.3f}")
+    if targets.tier_share is not None:
+        print(f"{'target':<10} {'':>42} " + " ".join(f"{targets.tier_share[s]:>5.0%}" for s in stars))
+
+    print(f"\n{'Key':<10} {'initCost':>10} {'lastCost':>12} {'max':>8} {'mat':>6} {'matId':>7}")
+    for key in space.keys:
+        old, new = space.config[key], tuned[key]
+        top = "maxVal" if old.get("isAbsolute") else "maxValMult"
+        for label, entry in (("", old), ("→", new)):
+            print(f"{label or key:<10} {entry.get('initCost', 0):>10,} {entry.get('lastCost', 0):>12,} "
+                  f"{entry.get(top, 0):>8} {entry.get('lastMatCount', 0):>6} {str(entry.get('matId')):>7}")
+
+# --- CLI ---
+
+def parse_pairs(items, cast=float):
+    pairs = {}
+    for item in items or []:
+        for part in item.split(","):
+            key, _, value = part.partition("=")
+            if not value:
+                raise SystemExit(f"expected KEY=VALUE, got {part!r}")
+            pairs[key.strip()] = cast(value)
+    return pairs
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune PARAM_CONFIG upgrade curves against progression targets")
+    parser.add_argument("--keys", help="comma separated PARAM_CONFIG keys to tune (default: all)")
+    parser.add_argument("--missions", action="append", metavar="KEY=N",
+                        help="missions to reach Lv100, '*' for every key (repeatable; default: current value)")
+    parser.add_argument("--tier-share", action="append", metavar="STARS=SHARE",
+                        help="share of the cost paid by missions of each star count, e.g. 1=0.1,2=0.2,3=0.3,4=0.4")
+    parser.add_argument("--material-ratio", type=float, default=1.0,
+                        help="material farming missions per money mission")
+    parser.add_argument("--power", action="append", metavar="KEY=X",
+                        help="Lv100 gain (%%) per mission, '*' for every key (tunes maxValMult / maxVal)")
+    parser.add_argument("--weights", action="append", metavar="TERM=W",
+                        help=f"objective weights ({', '.join(f'{k}={v:g}' for k, v in DEFAULT_WEIGHTS.items())})")
+    parser.add_argument("--stat-pace", type=float, default=1.0,
+                        help="player stat levels per level of the tuned key (decides the difficulty band)")
+    parser.add_argument("--rules", choices=sorted(RULES), default="intended",
+                        help="progression_sim rules for the material yields")
+    parser.add_argument("--loot-rate", type=float, default=1.0)
+    parser.add_argument("--calibration", help="balance_sim --json report: per-star success rate and loot")
+    parser.add_argument("--population", type=int, default=2048, help="candidates per key per generation")
+    parser.add_argument("--generations", type=int, default=40)
+    parser.add_argument("--elite", type=float, default=0.05, help="share of candidates the next generation is fit to")
+    parser.add_argument("--restarts", type=int, default=4, help="independent searches (one process each)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--samples", type=int, default=20_000, help="mission draws per difficulty band")
+    parser.add_argument("--digits", type=int, default=3, help="significant figures of the written costs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--js", default=JS_PATH, help="settings_data.js to read the balance data from")
+    parser.add_argument("--config", default=UPGRADE_CONFIG_PATH, help="upgrade_config.js")
+    parser.add_argument("--sheet", default=SHEET_PATH, help="write the tuned UpgradeTable sheet to this xlsx")
+    parser.add_argument("--workbook", nargs="?", const="default", metavar="XLSX",
+                        help="replace the tuned keys' rows in the UpgradeTable sheet of the workbook "
+                             "(default: game_balance_new.xlsx)")
+    parser.add_argument("--write-config", action="store_true", help="write the tuned values into upgrade_config.js")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    profiler = Profiler.from_args(args, "upgrade_tuner")
+
+    with profiler.stage("load"):
+        data = load_settings(args.js)
+        config = load_param_config(args.config)
+    keys = [k for k in UpgradeCurves(data, config).keys
+            if not args.keys or k in args.keys.split(",")]
+    unknown = set(args.keys.split(",")) - set(keys) if args.keys else set()
+    if unknown or not keys:
+        print(f"No PARAM_CONFIG entry for {', '.join(sorted(unknown)) or 'any key'}")
+        return 1
+
+    sim_args = build_parser().parse_args(["--rules", args.rules, "--loot-rate", str(args.loot_rate)]
+                                         + (["--calibration", args.calibration] if args.calibration else []))
+    sim_args.rename_materials = []
+    with profiler.stage("model"):
+        model = Model(data, sim_args, args.samples, args.seed, args.stat_pace)
+
+    # 目標 (指定の無いものは今の設定から)
+    now = evaluate(model, config_genes(config, keys)[0], np.array([model.material_index(config[k].get("matId"))
+                                                                     for k in keys]))
+    missions = parse_pairs(args.missions)
+    targets_missions = np.array([missions.get(k, missions.get("*", now["missions"][i])) for i, k in enumerate(keys)])
+    tier = None
+    if args.tier_share:
+        shares = parse_pairs(args.tier_share)
+        tier = np.array([shares.get(str(s), 0.0) for s in model.stars])
+        if tier.sum() <= 0:
+            parser.error("--tier-share must give some star count a positive share")
+        tier /= tier.sum()
+    powers = parse_pairs(args.power)
+    power = np.array([powers.get(k, powers.get("*", np.nan)) for k in keys])
+    space = KeySpace(config, keys, model, ~np.isnan(power))
+    weights = dict(DEFAULT_WEIGHTS)
+    weights.update(parse_pairs(args.weights))
+    targets = Targets(targets_missions, tier, args.material_ratio, power, weights)
+
+    income = ", ".join(f"{m:,.0f}" for m in model.money)
+    print(f"Tuning {len(keys)} key(s): income/mission by band {income}; "
+          f"obtainable materials {', '.join(model.material_ids) or 'none'}")
+    start = time.perf_counter()
+    with profiler.stage("search") as rec:
+        genes, mats, _ = tune(model, space, targets, args.population, args.generations, args.elite,
+                              args.restarts, args.seed, args.jobs)
+        rec["candidates"] = len(keys) * args.population * args.generations * args.restarts
+    elapsed = time.perf_counter() - start
+    evaluated = len(keys) * args.population * args.generations * args.restarts
+    print(f"Evaluated {evaluated:,} candidates in {elapsed:.2f}s ({evaluated / elapsed:,.0f}/s, "
+          f"{args.restarts} restart(s) on {min(args.jobs, args.restarts)} process(es))")
+
+    tuned = space.to_config(genes, mats, model, args.digits)
+    rounded = config_genes(tuned, keys)[0]
+    mats = np.array([model.material_index(tuned[k].get("matId")) for k in keys])
+    before = score(model, space, targets, space.current[:, None, :], space.current_mat[:, None])
+    after = score(model, space, targets, rounded[:, None, :], mats[:, None])
+    squeeze = lambda m: {k: v[:, 0] for k, v in m.items()}
+    print_report(space, model, targets, squeeze(before[2]), squeeze(after[2]), tuned, after[0][:, 0])
+    print(f"\nTotal score {before[0].sum():.3f} → {after[0].sum():.3f}")
+
+    with profiler.stage("write"):
+        rows = sheet_rows(data, tuned)
+        if args.sheet:
+            write_sheet(args.sheet, rows)
+            print(f"UpgradeTable sheet ({len(rows):,} rows) written to {args.sheet}")
+        if args.workbook:
+            from update_settings import EXCEL_PATH
+            path = EXCEL_PATH if args.workbook == "default" else args.workbook
+            kept = write_workbook(path, rows)
+            print(f"Replaced {len(keys)} StatType(s) in {path} (kept {kept} other row(s)); "
+                  f"run tools/update_settings.py to rebuild settings_data.js")
+        if args.write_config:
+            write_param_config(args.config, tuned, config)
+            print(f"PARAM_CONFIG updated in {args.config}")
+    profiler.finish()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,131 +1,375 @@
+"""
+GAME_BALANCE_DATA の相互参照チェック
+
+全セクションの ID を名前空間ごとの索引 (set) にまとめ、参照 (敵 → 武器・移動パターン・ドロップ表,
+ドロップ表 → アイテム, 強化表 → 素材, 依頼 → 天候表・敵ティア ...) を1回ずつ走査して照合する。
+参照の値を集めて索引との差集合を取るので、参照数に比例した時間で終わる (100万件で 1 秒未満)。
+
+update_settings.py は settings_data.js を書き出す前にこれを実行し、エラーがあれば書き出さない。
+単体でも実行できる:
+
+    python tools/validate_data.py                       # game_balance.xlsx を変換して検証
+    python tools/validate_data.py --js js/settings_data.js       # 生成済みのファイル (settings_store のキャッシュ経由)
+    python tools/validate_data.py --format junit --output validate.xml
+    python tools/validate_data.py --synthetic 1000000   # 合成データ (100万参照) で速度を測る
+
+終了コード: 0 = エラーなし, 1 = エラーあり (--strict では警告も), 2 = データを読めない
+"""
+import argparse
+import contextlib
 import json
-import os
+import random
 import sys
+import time
+from xml.sax.saxutils import escape, quoteattr
 
-def load_settings_data(filepath):
-    """Load settings_data.js and return as dict."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Strip JS variable assignment
-            # const GAME_BALANCE_DATA = { ... };
-            start = content.find('{')
-            end = content.rfind('}') + 1
-            json_str = content[start:end]
-            # Handle potential JS-only syntax like trailing commas if necessary
-            # Standard json might fail on trailing commas.
-            # But update_settings.py uses json.dumps so it should be valid JSON.
-            return json.loads(json_str)
-    except Exception as e:
-        print(f"Error loading/parsing settings_data.js: {e}")
-        return None
+from pipeline_profile import Profiler, add_profile_arguments
+from settings_store import load_settings
+
+ERROR = "error"
+WARNING = "warning"
+
+# --- ID namespaces ---
+
+def _keys(section):
+    return lambda data: data.get(section, {}).keys()
+
+def _items(data):
+    return data.get("DROP_ITEMS", {}).keys() | data.get("MATERIALS", {}).keys()
+
+def _movement_patterns(data):
+    return data.get("MOVEMENT_PATTERNS", {}).keys() | data.get("MOVEMENT_TABLES", {}).get("patterns", {}).keys()
+
+def _mission(key):
+    return lambda data: data.get("MISSION_DATA", {}).get(key, {}).keys()
+
+# 名前空間 -> (ID の集合を返す関数, 必要なセクション)
+NAMESPACES = {
+    "ENEMIES": (_keys("ENEMIES"), ("ENEMIES",)),
+    "ENEMY_WEAPONS": (_keys("ENEMY_WEAPONS"), ("ENEMY_WEAPONS",)),
+    "MOVEMENT_PATTERNS": (_movement_patterns, ("MOVEMENT_PATTERNS", "MOVEMENT_TABLES")),
+    "DROP_TABLES": (_keys("DROP_TABLES"), ("DROP_TABLES",)),
+    "ITEMS": (_items, ("DROP_ITEMS", "MATERIALS")),
+    "MATERIALS": (_keys("MATERIALS"), ("MATERIALS",)),
+    "WEATHER": (_keys("WEATHER"), ("WEATHER",)),
+    "WEATHER_TABLES": (_mission("WEATHER_TABLES"), ("MISSION_DATA",)),
+    "ENEMY_TIERS": (lambda data: data.get("DEBRIS", {}).get("TIER_INDEX", {}).keys(), ("DEBRIS",)),
+    "STARS": (lambda data: {str(k) for k in data.get("MISSION_DATA", {}).get("DIFFICULTY_PARAMS", {})},
+              ("MISSION_DATA",)),
+    "STAGES": (lambda data: {str(s.get("StageLevel")) for s in data.get("STAGES", [])}, ("STAGES",)),
+}
+
+# --- References (source section, rule, extractor -> (source path, value), target namespace, severity) ---
+
+def _field(section, *names):
+    """`data[section][id][name]` (the first of `names` that is set)."""
+    def extract(data):
+        for key, row in data.get(section, {}).items():
+            for name in names:
+                value = row.get(name)
+                if value:
+                    yield f"{section}.{key}.{name}", value
+                    break
+    return extract
+
+def _debris_tiers(data):
+    for i, row in enumerate(data.get("DEBRIS", {}).get("TIERS", [])):
+        yield f"DEBRIS.TIERS[{i}].id", row.get("id")
+
+def _tier_index(data):
+    for tier, ids in data.get("DEBRIS", {}).get("TIER_INDEX", {}).items():
+        for i, eid in enumerate(ids):
+            yield f"DEBRIS.TIER_INDEX.{tier}[{i}]", eid
+
+def _drop_tables(data):
+    for dtid, drops in data.get("DROP_TABLES", {}).items():
+        for i, drop in enumerate(drops):
+            if drop.get("id"):
+                yield f"DROP_TABLES.{dtid}[{i}].id", drop["id"]
+
+def _alias_values(section, *path):
+    def extract(data):
+        tables = data.get(section, {})
+        for key in path:
+            tables = tables.get(key, {})
+        prefix = ".".join((section,) + path)
+        for tid, table in tables.items():
+            for i, value in enumerate(table.get("values", []) if table else []):
+                if value is not None:
+                    yield f"{prefix}.{tid}.values[{i}]", str(value)
+    return extract
+
+def _upgrade_materials(data):
+    for stat, rows in data.get("UPGRADE_TABLE", {}).items():
+        for row in rows:
+            if row.get("MaterialID"):
+                yield f"UPGRADE_TABLE.{stat}[Lv{row.get('Level')}].MaterialID", row["MaterialID"]
+
+def _mission_params(name):
+    def extract(data):
+        for stars, params in data.get("MISSION_DATA", {}).get("DIFFICULTY_PARAMS", {}).items():
+            if params.get(name):
+                yield f"MISSION_DATA.DIFFICULTY_PARAMS.{stars}.{name}", params[name]
+    return extract
+
+def _weather_tables(data):
+    for tid, weights in data.get("MISSION_DATA", {}).get("WEATHER_TABLES", {}).items():
+        for key, weight in weights.items():
+            if weight:
+                yield f"MISSION_DATA.WEATHER_TABLES.{tid}.{key}", key
+
+class Reference:
+    def __init__(self, rule, sections, extract, target, severity=ERROR, hint=""):
+        self.rule = rule
+        self.sections = sections
+        self.extract = extract
+        self.target = target
+        self.severity = severity
+        self.hint = hint
+
+REFERENCES = [
+    Reference("ENEMIES.eqId -> ENEMY_WEAPONS", ("ENEMIES",), _field("ENEMIES", "eqId", "eq"), "ENEMY_WEAPONS"),
+    Reference("ENEMIES.movementPattern -> MOVEMENT_PATTERNS", ("ENEMIES",),
+              _field("ENEMIES", "movementPattern", "mpId"), "MOVEMENT_PATTERNS"),
+    Reference("ENEMIES.dropTableId -> DROP_TABLES", ("ENEMIES",),
+              _field("ENEMIES", "dropTableId", "dropTable", "dtId"), "DROP_TABLES"),
+    Reference("DEBRIS.TIERS -> ENEMIES", ("DEBRIS",), _debris_tiers, "ENEMIES"),
+    Reference("DEBRIS.TIER_INDEX -> ENEMIES", ("DEBRIS",), _tier_index, "ENEMIES"),
+    Reference("DROP_TABLES.id -> ITEMS", ("DROP_TABLES",), _drop_tables, "ITEMS"),
+    Reference("DROP_ALIAS.values -> ITEMS", ("DROP_ALIAS",), _alias_values("DROP_ALIAS"), "ITEMS"),
+    Reference("UPGRADE_TABLE.MaterialID -> MATERIALS", ("UPGRADE_TABLE",), _upgrade_materials, "MATERIALS"),
+    Reference("MISSION_DATA.weatherTable -> WEATHER_TABLES", ("MISSION_DATA",),
+              _mission_params("weatherTable"), "WEATHER_TABLES"),
+    Reference("MISSION_DATA.enemyTier -> ENEMY_TIERS", ("MISSION_DATA",), _mission_params("enemyTier"),
+              "ENEMY_TIERS", WARNING, "spawnDebris spawns nothing for this star count"),
+    Reference("MISSION_DATA.WEATHER_TABLES -> WEATHER", ("MISSION_DATA",), _weather_tables, "WEATHER"),
+    Reference("MISSION_DATA.WEATHER_ALIAS.values -> WEATHER", ("MISSION_DATA",),
+              _alias_values("MISSION_DATA", "WEATHER_ALIAS"), "WEATHER"),
+    Reference("MISSION_DATA.DIFFICULTY_ALIAS.values -> STARS", ("MISSION_DATA",),
+              lambda data: ((f"MISSION_DATA.DIFFICULTY_ALIAS[{band}].values[{i}]", str(v))
+                            for band, t in enumerate(data.get("MISSION_DATA", {}).get("DIFFICULTY_ALIAS") or [])
+                            for i, v in enumerate(t["values"] if t else [])),
+              "STARS"),
+]
+
+# --- Value checks (one pass per section; they return (severity, rule, path, value, message)) ---
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _check_values(data):
+    for wid, w in data.get("WEAPONS", {}).items():
+        dmg = w.get("Damage", 0)
+        if not _is_number(dmg) or dmg < 0:
+            yield ERROR, "WEAPONS.Damage", f"WEAPONS.{wid}.Damage", dmg, "invalid Damage"
+        if not _is_number(w.get("Speed", 0)):
+            yield ERROR, "WEAPONS.Speed", f"WEAPONS.{wid}.Speed", w.get("Speed"), "invalid Speed"
+    for eid, e in data.get("ENEMIES", {}).items():
+        hp = e.get("hp", 0)
+        if not _is_number(hp) or hp <= 0:
+            yield WARNING, "ENEMIES.hp", f"ENEMIES.{eid}.hp", hp, "invalid HP"
+        if not _is_number(e.get("speed", 0)):
+            yield ERROR, "ENEMIES.speed", f"ENEMIES.{eid}.speed", e.get("speed"), "invalid speed"
+    for wid, w in data.get("ENEMY_WEAPONS", {}).items():
+        if "Damage" not in w and "damage" not in w:
+            yield WARNING, "ENEMY_WEAPONS.Damage", f"ENEMY_WEAPONS.{wid}", None, "no Damage stat"
+    seen = set()
+    for i, stage in enumerate(data.get("STAGES", [])):
+        level = stage.get("StageLevel")
+        if level in seen:
+            yield ERROR, "STAGES.StageLevel", f"STAGES[{i}].StageLevel", level, "duplicate StageLevel"
+        seen.add(level)
+    waves = len(data.get("MOVEMENT_TABLES", {}).get("waves", []))
+    for mpid, p in data.get("MOVEMENT_TABLES", {}).get("patterns", {}).items():
+        if p.get("wave", -1) >= waves:
+            yield ERROR, "MOVEMENT_TABLES.wave", f"MOVEMENT_TABLES.patterns.{mpid}.wave", p["wave"], \
+                f"wave index out of range ({waves} tables)"
+
+# --- Validation ---
 
 def validate_data(data):
-    """Validate cross-references in GAME_BALANCE_DATA."""
-    print("--- Starting Validation ---")
-    errors = []
-    warnings = []
-
-    # 1. Check DEBRIS.TIERS -> ENEMIES
-    tiers = data.get('DEBRIS', {}).get('TIERS', [])
-    enemies = data.get('ENEMIES', {})
-    
-    print(f"Checking {len(tiers)} Tiers against {len(enemies)} Enemies...")
-    
-    for tier in tiers:
-        tid = tier.get('id')
-        if tid not in enemies:
-            errors.append(f"CRITICAL: Tier references Enemy ID '{tid}' which is missing in ENEMIES dict.")
-        else:
-            # Check Enemy Props
-            en = enemies[tid]
-            
-            # Check Drop Table
-            dtId = en.get('dtId')
-            if dtId and dtId not in data.get('DROP_TABLES', {}):
-                errors.append(f"ERROR: Enemy '{tid}' references missing DropTable '{dtId}'.")
-            
-            # Check Weapon
-            eqId = en.get('eqId')
-            if eqId and eqId not in data.get('ENEMY_WEAPONS', {}):
-                 errors.append(f"ERROR: Enemy '{tid}' references missing Weapon '{eqId}'.")
-                 
-            # Check Movement Pattern (Optional, string based switch)
-            mpId = en.get('mpId')
-            # We don't have a master list of MP IDs in JS yet, but we can verify format?
-            if mpId and not mpId.startswith('MP'):
-                 warnings.append(f"WARNING: Enemy '{tid}' has unusual MP ID '{mpId}'.")
-
-    # 2. Check DROP_TABLES -> ITEMS/MATERIALS
-    drop_tables = data.get('DROP_TABLES', {})
-    items = data.get('DROP_ITEMS', {})
-    materials = data.get('MATERIALS', {})
-    
-    print(f"Checking {len(drop_tables)} Drop Tables...")
-    
-    for dt_id, drops in drop_tables.items():
-        if not isinstance(drops, list):
-             errors.append(f"ERROR: DropTable '{dt_id}' is not a list.")
-             continue
-             
-        for drop in drops:
-            did = drop.get('id')
-            if not did: continue
-            
-            # Check if exists in ITEMS or MATERIALS
-            exists = (did in items) or (did in materials)
-            if not exists:
-                # Might be standard item hardcoded? RepairKit?
-                if did not in ['RepairKit', 'Fuel', 'Ammo']:
-                    errors.append(f"ERROR: DropTable '{dt_id}' references unknown Item '{did}'.")
-
-    # 3. Check ENEMY_WEAPONS
-    weapons = data.get('ENEMY_WEAPONS', {})
-    print(f"Checking {len(weapons)} Enemy Weapons...")
-    # Just basic check
-    for wid, w in weapons.items():
-        if 'Damage' not in w and 'damage' not in w:
-             warnings.append(f"WARNING: Weapon '{wid}' has no Damage stat.")
-             
-    # 4. Check WEAPONS (Player)
-    p_weapons = data.get('WEAPONS', {})
-    print(f"Checking {len(p_weapons)} Player Weapons...")
-    for wid, w in p_weapons.items():
-        dmg = w.get('Damage', 0)
-        if not isinstance(dmg, (int, float)) or dmg < 0:
-             errors.append(f"ERROR: Player Weapon '{wid}' has invalid Damage: {dmg}")
-        spd = w.get('Speed', 0)
-        if not isinstance(spd, (int, float)):
-             errors.append(f"ERROR: Player Weapon '{wid}' has invalid Speed: {spd}")
-
-    # 5. Check ENEMIES stats
-    print(f"Checking {len(enemies)} Enemy Stats...")
-    for eid, e in enemies.items():
-        hp = e.get('hp', 0)
-        if not isinstance(hp, (int, float)) or hp <= 0:
-             warnings.append(f"WARNING: Enemy '{eid}' has invalid HP: {hp}")
-        spd = e.get('speed', 0) # speed can be 0 (stationary)
-        if not isinstance(spd, (int, float)):
-             errors.append(f"ERROR: Enemy '{eid}' has invalid speed: {spd}")
-
-    # Report
-    print("\n--- Validation Report ---")
-    if errors:
-        print(f"Found {len(errors)} ERRORS:")
-        for e in errors:
-            print(f"  - {e}")
-    else:
-        print("No CRITICAL errors found.")
-        
-    if warnings:
-        print(f"Found {len(warnings)} WARNINGS:")
-        for w in warnings:
-            print(f"  - {w}")
+    """Checks every reference and value rule; returns a report dict (see print_report / to_junit)."""
+    start = time.perf_counter()
+    index = {}
+    for name, (ids, sections) in NAMESPACES.items():
+        if any(s in data for s in sections):
+            index[name] = ids(data)
+
+    issues = []
+    rules = {}
+    references = 0
+    for ref in REFERENCES:
+        if not any(s in data for s in ref.sections):
+            continue
+        if ref.target not in index:
+            rules[ref.rule] = {"checked": 0, "failures": 0, "skipped": f"{ref.target} not loaded"}
+            continue
+        pairs = list(ref.extract(data))
+        references += len(pairs)
+        # 値の集合と索引の差集合 (C 実装の集合演算) で見つからない ID を先に求める
+        missing = {value for _, value in pairs} - index[ref.target]
+        failures = 0
+        if missing:
+            for path, value in pairs:
+                if value in missing:
+                    failures += 1
+                    message = f"{value!r} not found in {ref.target}" + (f" ({ref.hint})" if ref.hint else "")
+                    issues.append({"severity": ref.severity, "rule": ref.rule, "path": path,
+                                   "value": value, "message": message})
+        rules[ref.rule] = {"checked": len(pairs), "failures": failures}
+
+    for severity, rule, path, value, message in _check_values(data):
+        issues.append({"severity": severity, "rule": rule, "path": path, "value": value, "message": message})
+        r = rules.setdefault(rule, {"checked": 0, "failures": 0})
+        r["failures"] += 1
+
+    errors = sum(1 for i in issues if i["severity"] == ERROR)
+    return {
+        "ok": errors == 0,
+        "errors": errors,
+        "warnings": len(issues) - errors,
+        "references": references,
+        "namespaces": {name: len(ids) for name, ids in index.items()},
+        "rules": rules,
+        "issues": issues,
+        "seconds": time.perf_counter() - start,
+    }
+
+def print_report(report, limit=50):
+    print(f"Validation: {report['references']:,} references in {len(report['rules'])} rules, "
+          f"{report['errors']} error(s), {report['warnings']} warning(s) ({report['seconds'] * 1000:.1f} ms)")
+    for i, issue in enumerate(report["issues"]):
+        if i == limit:
+            print(f"  ... {len(report['issues']) - limit} more")
+            break
+        print(f"  [{issue['severity'].upper()}] {issue['path']}: {issue['message']}")
+    for rule, r in report["rules"].items():
+        if r.get("skipped"):
+            print(f"  (skipped {rule}: {r['skipped']})")
 
-    return len(errors) == 0
+def to_junit(report):
+    """JUnit XML: one test case per rule; failures carry the offending paths."""
+    failing = {i["rule"] for i in report["issues"] if i["severity"] == ERROR}
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             f'<testsuite name="validate_data" tests="{len(report["rules"])}" '
+             f'failures="{len(failing)}" skipped="{sum(1 for r in report["rules"].values() if r.get("skipped"))}" '
+             f'time="{report["seconds"]:.6f}">']
+    by_rule = {}
+    for issue in report["issues"]:
+        by_rule.setdefault(issue["rule"], []).append(issue)
+    for rule, r in report["rules"].items():
+        lines.append(f'  <testcase classname="validate_data" name={quoteattr(rule)}>')
+        if r.get("skipped"):
+            lines.append(f'    <skipped message={quoteattr(r["skipped"])}/>')
+        elif rule in by_rule:
+            issues = by_rule[rule]
+            tag = "failure" if any(i["severity"] == ERROR for i in issues) else "system-out"
+            body = "\n".join(f"{i['severity']}: {i['path']}: {i['message']}" for i in issues)
+            if tag == "failure":
+                lines.append(f'    <failure message={quoteattr(f"{len(issues)} broken reference(s)")}>'
+                             f'{escape(body)}</failure>')
+            else:
+                lines.append(f'    <system-out>{escape(body)}</system-out>')
+        lines.append('  </testcase>')
+    lines.append('</testsuite>')
+    return "\n".join(lines) + "\n"
+
+def exit_code(report, strict=False):
+    return 1 if report["errors"] or (strict and report["warnings"]) else 0
+
+# --- Inputs ---
+
+def synthetic_data(references, seed=0, broken=10):
+    """A GAME_BALANCE_DATA-shaped dict with about `references` references and `broken` dangling ones."""
+    rng = random.Random(seed)
+    # 1体の敵につき: 武器・移動・ドロップ表 + TIERS + TIER_INDEX = 5, ドロップ表の行 2, 強化表の素材 1
+    n = max(references // 8, 1)
+    weapons = {f"EQ{i:05d}": {"ID": f"EQ{i:05d}", "Damage": 10} for i in range(1000)}
+    patterns = {f"MP{i:04d}": {"ID": f"MP{i:04d}"} for i in range(100)}
+    materials = {f"MAT{i:04d}": {"ID": f"MAT{i:04d}", "Value": 10} for i in range(200)}
+    items = {f"IT{i:04d}": {"ID": f"IT{i:04d}", "Type": "BUFF"} for i in range(200)}
+    item_ids = list(materials) + list(items)
+    tables = max(n // 10, 1)
+    drop_tables = {f"DT{t:06d}": [{"id": rng.choice(item_ids), "rate": 0.1} for _ in range(20)]
+                   for t in range(tables)}
+    w_ids, p_ids, d_ids = list(weapons), list(patterns), list(drop_tables)
+    enemies = {}
+    tiers = []
+    tier_index = {"Tier1": [], "Tier2": [], "Tier3": []}
+    for i in range(n):
+        eid = f"EN{i:07d}"
+        enemies[eid] = {"id": eid, "hp": 100, "speed": 1.0, "eqId": w_ids[i % len(w_ids)],
+                        "movementPattern": p_ids[i % len(p_ids)], "dropTableId": d_ids[i % len(d_ids)]}
+        tier = f"Tier{i % 3 + 1}"
+        tiers.append({"id": eid, "tier": tier})
+        tier_index[tier].append(eid)
+    m_ids = list(materials)
+    upgrade = {f"STAT{s}": [{"Level": lv, "Cost": lv * 10, "MaterialID": m_ids[lv % len(m_ids)], "MaterialCount": 1}
+                            for lv in range(n // 10)] for s in range(10)}
+    # 壊れた参照を混ぜる
+    keys = list(enemies)
+    for _ in range(broken):
+        enemies[rng.choice(keys)]["eqId"] = "EQ_MISSING"
+    return {
+        "ENEMIES": enemies, "ENEMY_WEAPONS": weapons, "MOVEMENT_PATTERNS": patterns,
+        "DEBRIS": {"TIERS": tiers, "TIER_INDEX": tier_index}, "DROP_TABLES": drop_tables,
+        "DROP_ITEMS": items, "MATERIALS": materials, "UPGRADE_TABLE": upgrade,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-reference validation of GAME_BALANCE_DATA")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--js", help="validate a generated settings_data.js instead of the workbook")
+    source.add_argument("--synthetic", type=int, metavar="REFS", help="validate a generated dataset of REFS references")
+    parser.add_argument("--format", choices=("text", "json", "junit"), default="text")
+    parser.add_argument("--output", help="write the json/junit report here (default: stdout)")
+    parser.add_argument("--strict", action="store_true", help="exit non-zero on warnings too")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    profiler = Profiler.from_args(args, "validate_data")
+
+    try:
+        with profiler.stage("load"):
+            data = _load(args, profiler)
+    except (OSError, ValueError) as e:
+        print(f"Could not load data: {e}", file=sys.stderr)
+        return 2
+    if not data:
+        return 2
+
+    with profiler.stage("validation") as rec:
+        report = validate_data(data)
+        rec["rows"] = report["references"]
+    with profiler.stage("report"):
+        _write_report(report, args)
+    with contextlib.redirect_stdout(sys.stderr):
+        profiler.finish()
+    return exit_code(report, args.strict)
+
+def _load(args, profiler):
+    if args.synthetic:
+        start = time.perf_counter()
+        data = synthetic_data(args.synthetic)
+        print(f"Generated synthetic data in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+        return data
+    if args.js:
+        return load_settings(args.js)
+    from update_settings import load_excel_data
+    # ビルドキャッシュのログは stderr へ (stdout は json / junit の出力先)
+    with contextlib.redirect_stdout(sys.stderr):
+        return load_excel_data(profiler=profiler)
+
+def _write_report(report, args):
+    if args.format == "text":
+        print_report(report)
+    else:
+        body = json.dumps(report, ensure_ascii=False, indent=2, default=str) if args.format == "json" else to_junit(report)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(body)
+            print(f"Report written to {args.output} ({report['errors']} error(s), {report['warnings']} warning(s))")
+        else:
+            sys.stdout.write(body)
 
 if __name__ == "__main__":
-    filepath = r"F:\MCW_HTML\shooter_game\js\settings_data.js"
-    data = load_settings_data(filepath)
-    if data:
-        validate_data(data)
+    raise SystemExit(main())